@@ -1,9 +1,39 @@
 import subprocess
 
+import pytest
+
 # It's hard to get a good reading on these in CodSpeed because they run in another process and
 # CodSpeed currently doesn't include system calls in the benchmark time.
 # TODO: Find a way to measure these in CodSpeed
 
+# Top-level commands, each of which imports its own module when invoked
+SUBCOMMANDS = [
+    "artifact",
+    "block",
+    "cloud",
+    "concurrency-limit",
+    "config",
+    "dashboard",
+    "deploy",
+    "deployment",
+    "dev",
+    "events",
+    "flow",
+    "flow-run",
+    "global-concurrency-limit",
+    "init",
+    "profile",
+    "server",
+    "shell",
+    "task",
+    "task-run",
+    "variable",
+    "work-pool",
+    "work-queue",
+    "worker",
+    "automation",
+]
+
 
 def bench_prefect_help(benchmark):
     benchmark(subprocess.check_call, ["prefect", "--help"])
@@ -19,3 +49,13 @@ def bench_prefect_short_version(benchmark):
 
 def bench_prefect_profile_ls(benchmark):
     benchmark(subprocess.check_call, ["prefect", "profile", "ls"])
+
+
+@pytest.mark.benchmark(group="cli-cold-start")
+@pytest.mark.parametrize("subcommand", SUBCOMMANDS)
+def bench_prefect_subcommand_help(benchmark, subcommand: str):
+    benchmark(
+        subprocess.check_call,
+        ["prefect", subcommand, "--help"],
+        stdout=subprocess.DEVNULL,
+    )
@@ -0,0 +1,90 @@
+"""
+Benchmarks for writing events to the database, as the event persister does each time
+it flushes. Each round writes a batch of events to a SQLite database in a temporary
+directory, so operations per second are batches per second.
+"""
+
+import asyncio
+import uuid
+from pathlib import Path
+from typing import TYPE_CHECKING, Generator
+
+import pytest
+
+from prefect.server.database import provide_database_interface
+from prefect.server.events.schemas.events import ReceivedEvent
+from prefect.server.events.storage.database import write_events
+from prefect.settings import (
+    PREFECT_API_DATABASE_CONNECTION_URL,
+    PREFECT_HOME,
+    temporary_settings,
+)
+from prefect.types._datetime import now
+
+if TYPE_CHECKING:
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+BATCH_SIZE = 1000
+
+
+def make_events() -> list[ReceivedEvent]:
+    return [
+        ReceivedEvent(
+            occurred=now("UTC"),
+            event="prefect.flow-run.Completed",
+            resource={"prefect.resource.id": f"prefect.flow-run.{uuid.uuid4()}"},
+            related=[
+                {
+                    "prefect.resource.id": f"prefect.flow.{uuid.uuid4()}",
+                    "prefect.resource.role": "flow",
+                },
+                {
+                    "prefect.resource.id": "prefect.tag.bench",
+                    "prefect.resource.role": "tag",
+                },
+            ],
+            payload={"hello": "world"},
+            id=uuid.uuid4(),
+        )
+        for _ in range(BATCH_SIZE)
+    ]
+
+
+@pytest.fixture
+def loop(tmp_path: Path) -> Generator[asyncio.AbstractEventLoop, None, None]:
+    loop = asyncio.new_event_loop()
+    with temporary_settings(
+        {
+            PREFECT_HOME: tmp_path,
+            PREFECT_API_DATABASE_CONNECTION_URL: (
+                f"sqlite+aiosqlite:///{tmp_path / 'events.db'}"
+            ),
+        }
+    ):
+        loop.run_until_complete(provide_database_interface().create_db())
+        yield loop
+    loop.close()
+
+
+async def write(events: list[ReceivedEvent]) -> None:
+    db = provide_database_interface()
+    async with db.session_context(begin_transaction=True) as session:
+        await write_events(session=session, events=events)
+
+
+@pytest.mark.benchmark(group="event-persister")
+@pytest.mark.parametrize("redelivered", [False, True])
+def bench_write_events(
+    benchmark: "BenchmarkFixture", loop: asyncio.AbstractEventLoop, redelivered: bool
+):
+    def setup():
+        events = make_events()
+        if redelivered:
+            # every event in the batch has already been written, as when a broker
+            # redelivers messages that the persister did not acknowledge in time
+            loop.run_until_complete(write(events))
+        return (events,), {}
+
+    benchmark.pedantic(
+        lambda events: loop.run_until_complete(write(events)), setup=setup, rounds=20
+    )
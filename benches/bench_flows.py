@@ -2,7 +2,7 @@
 TODO: Add benches for higher number of tasks; blocked by engine deadlocks in CI.
 """
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 import anyio
 import pytest
@@ -31,6 +31,34 @@ def bench_flow_call(benchmark: "BenchmarkFixture", options):
     benchmark(noop_flow)
 
 
+def parameters_function(x: int, y: str, z: float = 1.0, items: list[int] = []):
+    pass
+
+
+@pytest.mark.parametrize(
+    "parameters",
+    [
+        {"x": 1, "y": "foo"},
+        {"x": "1", "y": "foo", "z": 2},
+        {"x": 1, "y": "foo", "items": list(range(100))},
+    ],
+    ids=["simple", "cast", "collection"],
+)
+def bench_flow_validate_parameters(
+    benchmark: "BenchmarkFixture", parameters: dict[str, Any]
+):
+    parameters_flow = flow(parameters_function)
+    benchmark(parameters_flow.validate_parameters, parameters)
+
+
+def bench_flow_serialize_parameters(benchmark: "BenchmarkFixture"):
+    parameters_flow = flow(parameters_function)
+    benchmark(
+        parameters_flow.serialize_parameters,
+        {"x": 1, "y": "foo", "items": list(range(100))},
+    )
+
+
 # The benchmarks below this comment take too long to run with CodSpeed and are not included in the
 # CodSpeed benchmarks. They are included in the local benchmarks. These benchmarks could be improved
 # because we can only run the benchmarks with a large number of tasks once for each run which may
@@ -0,0 +1,42 @@
+"""
+Each benchmark handles a single log line, so operations per second are log lines per
+second.
+"""
+
+import logging
+import uuid
+from typing import TYPE_CHECKING
+
+import pytest
+
+from prefect import flow, get_run_logger
+from prefect.logging.handlers import APILogHandler
+from prefect.settings import PREFECT_LOGGING_TO_API_ENABLED, temporary_settings
+
+if TYPE_CHECKING:
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+
+@pytest.fixture(autouse=True)
+def enable_api_log_handler():
+    with temporary_settings({PREFECT_LOGGING_TO_API_ENABLED: True}):
+        yield
+
+
+def bench_api_log_handler_prepare(benchmark: "BenchmarkFixture"):
+    handler = APILogHandler()
+    record = logging.LogRecord(
+        "prefect.bench", logging.INFO, __file__, 1, "hello world", None, None
+    )
+    record.flow_run_id = uuid.uuid4()
+
+    benchmark(handler.prepare, record)
+
+
+def bench_flow_run_logger(benchmark: "BenchmarkFixture"):
+    @flow
+    def benchmark_flow():
+        logger = get_run_logger()
+        benchmark(logger.info, "hello world")
+
+    benchmark_flow()
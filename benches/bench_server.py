@@ -0,0 +1,50 @@
+"""
+Benchmarks for starting an ephemeral server, e.g. when running a flow locally without
+an API URL. Each round starts a server against a new database and stops it once it is
+ready to serve requests.
+"""
+
+import uuid
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+
+from prefect.server.api.server import SubprocessASGIServer
+from prefect.settings import (
+    PREFECT_API_DATABASE_CONNECTION_URL,
+    PREFECT_HOME,
+    PREFECT_SERVER_EPHEMERAL_FAST_START,
+    temporary_settings,
+)
+
+if TYPE_CHECKING:
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+
+def start_and_stop_server(database_path: Path) -> None:
+    with temporary_settings(
+        {PREFECT_API_DATABASE_CONNECTION_URL: f"sqlite+aiosqlite:///{database_path}"}
+    ):
+        server = SubprocessASGIServer()
+        server.start(timeout=120)
+        server.stop()
+
+
+@pytest.mark.timeout(600)
+@pytest.mark.benchmark(group="ephemeral-server")
+@pytest.mark.parametrize("fast_start", [False, True])
+def bench_start_ephemeral_server(
+    benchmark: "BenchmarkFixture", tmp_path: Path, fast_start: bool
+):
+    with temporary_settings(
+        {PREFECT_HOME: tmp_path, PREFECT_SERVER_EPHEMERAL_FAST_START: fast_start}
+    ):
+        # the first start creates the template database when fast start is enabled
+        start_and_stop_server(tmp_path / "warmup.db")
+
+        benchmark.pedantic(
+            start_and_stop_server,
+            setup=lambda: ((tmp_path / f"{uuid.uuid4().hex}.db",), {}),
+            rounds=5,
+        )
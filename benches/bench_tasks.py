@@ -24,6 +24,16 @@ def bench_task_call(benchmark: "BenchmarkFixture"):
     benchmark_flow()
 
 
+def bench_lightweight_task_call(benchmark: "BenchmarkFixture"):
+    noop_task = task(noop_function, lightweight=True)
+
+    @flow
+    def benchmark_flow():
+        benchmark(noop_task)
+
+    benchmark_flow()
+
+
 def bench_task_submit(benchmark: "BenchmarkFixture"):
     noop_task = task(noop_function)
 
@@ -0,0 +1,210 @@
+"""
+Load test for workers polling a work pool with many queues for scheduled runs.
+
+Creates a work pool with many prioritized queues, some of them with concurrency
+limits, fills them with scheduled and running flow runs, and then polls the pool
+from many simulated workers at once, the way `prefect worker start` does.  Reports
+the latency of the polls and how many runs they returned.
+
+Run it against a server started with `./load_testing/run-server.sh`:
+
+    python load_testing/scheduled_runs.py --queues 300 --runs 20000 --workers 20
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+from datetime import datetime, timedelta, timezone
+
+from prefect import get_client
+from prefect.client.orchestration import PrefectClient
+from prefect.client.schemas.actions import WorkPoolCreate
+from prefect.exceptions import ObjectAlreadyExists
+from prefect.states import Running, Scheduled
+
+
+async def populate(
+    client: PrefectClient,
+    pool_name: str,
+    queues: int,
+    runs: int,
+    running: int,
+    limited_queues: float,
+) -> list[str]:
+    await client.create_work_pool(
+        WorkPoolCreate(name=pool_name, type="process"), overwrite=True
+    )
+
+    queue_names: list[str] = []
+    for i in range(queues):
+        queue_name = f"queue-{i}"
+        try:
+            await client.create_work_queue(
+                name=queue_name,
+                work_pool_name=pool_name,
+                priority=i + 1,
+                concurrency_limit=(
+                    random.randint(1, 10) if random.random() < limited_queues else None
+                ),
+            )
+        except ObjectAlreadyExists:
+            pass
+        queue_names.append(queue_name)
+
+    flow_id = await client.create_flow_from_name("scheduled-runs-load-test")
+    deployment_id = await client.create_deployment(
+        flow_id=flow_id,
+        name=pool_name,
+        work_pool_name=pool_name,
+        work_queue_name=queue_names[0],
+    )
+
+    now = datetime.now(timezone.utc)
+    semaphore = asyncio.Semaphore(50)
+
+    async def create_run(i: int) -> None:
+        async with semaphore:
+            if i < running:
+                state = Running()
+            else:
+                # spread runs from an hour ago to a day from now, so that only
+                # some of them are due
+                state = Scheduled(
+                    scheduled_time=now + timedelta(minutes=random.randint(-60, 24 * 60))
+                )
+            await client.create_flow_run_from_deployment(
+                deployment_id,
+                state=state,
+                work_queue_name=random.choice(queue_names),
+            )
+
+    started = time.perf_counter()
+    await asyncio.gather(*(create_run(i) for i in range(running + runs)))
+    print(
+        f"Created {queues} queues and {running + runs} flow runs "
+        f"in {time.perf_counter() - started:.1f}s"
+    )
+    return queue_names
+
+
+async def poll(
+    client: PrefectClient,
+    pool_name: str,
+    queue_names: list[str],
+    queues_per_worker: int,
+    prefetch: timedelta,
+    interval: float,
+    until: float,
+) -> tuple[list[float], int]:
+    latencies: list[float] = []
+    returned = 0
+
+    # stagger the workers like real ones, which start at different times
+    await asyncio.sleep(random.random() * interval)
+
+    while time.perf_counter() < until:
+        started = time.perf_counter()
+        responses = await client.get_scheduled_flow_runs_for_work_pool(
+            work_pool_name=pool_name,
+            work_queue_names=(
+                random.sample(queue_names, queues_per_worker)
+                if queues_per_worker
+                else None
+            ),
+            scheduled_before=datetime.now(timezone.utc) + prefetch,
+        )
+        latencies.append(time.perf_counter() - started)
+        returned += len(responses)
+        await asyncio.sleep(interval)
+
+    return latencies, returned
+
+
+def percentile(values: list[float], percent: float) -> float:
+    return sorted(values)[min(len(values) - 1, int(len(values) * percent / 100))]
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--pool", default="scheduled-runs-load-test")
+    parser.add_argument("--queues", type=int, default=200)
+    parser.add_argument("--runs", type=int, default=10_000)
+    parser.add_argument(
+        "--running",
+        type=int,
+        default=500,
+        help="Running flow runs, which count against concurrency limits",
+    )
+    parser.add_argument(
+        "--limited-queues",
+        type=float,
+        default=0.25,
+        help="The fraction of queues with a concurrency limit",
+    )
+    parser.add_argument("--workers", type=int, default=10)
+    parser.add_argument(
+        "--queues-per-worker",
+        type=int,
+        default=0,
+        help="Poll this many random queues instead of the whole pool",
+    )
+    parser.add_argument("--prefetch", type=float, default=10.0)
+    parser.add_argument("--interval", type=float, default=1.0)
+    parser.add_argument("--duration", type=float, default=60.0)
+    parser.add_argument(
+        "--skip-populate",
+        action="store_true",
+        help="Reuse the queues and runs of a previous run",
+    )
+    args = parser.parse_args()
+
+    async with get_client() as client:
+        if args.skip_populate:
+            queue_names = [
+                queue.name
+                for queue in await client.read_work_queues(
+                    work_pool_name=args.pool, limit=args.queues
+                )
+            ]
+        else:
+            queue_names = await populate(
+                client,
+                args.pool,
+                args.queues,
+                args.runs,
+                args.running,
+                args.limited_queues,
+            )
+
+        until = time.perf_counter() + args.duration
+        results = await asyncio.gather(
+            *(
+                poll(
+                    client,
+                    args.pool,
+                    queue_names,
+                    args.queues_per_worker,
+                    timedelta(seconds=args.prefetch),
+                    args.interval,
+                    until,
+                )
+                for _ in range(args.workers)
+            )
+        )
+
+    latencies = [latency for worker, _ in results for latency in worker]
+    returned = sum(count for _, count in results)
+    print(f"{len(latencies)} polls by {args.workers} workers, {returned} runs returned")
+    print(
+        f"latency: mean {statistics.mean(latencies) * 1000:.1f}ms, "
+        f"p50 {percentile(latencies, 50) * 1000:.1f}ms, "
+        f"p95 {percentile(latencies, 95) * 1000:.1f}ms, "
+        f"p99 {percentile(latencies, 99) * 1000:.1f}ms, "
+        f"max {max(latencies) * 1000:.1f}ms"
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
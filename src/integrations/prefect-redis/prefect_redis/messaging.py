@@ -309,7 +309,10 @@ class Consumer(_Consumer):
         automatically_acknowledge: Optional[bool] = None,
         max_retries: Optional[int] = None,
         trim_every: Optional[timedelta] = None,
+        **kwargs: Any,
     ):
+        # options meant for other brokers, like `concurrency`, are accepted and
+        # ignored; Redis consumers scale out through their consumer group instead
         settings = RedisMessagingConsumerSettings()
 
         self.name = name or topic
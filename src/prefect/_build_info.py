@@ -0,0 +1,5 @@
+# Generated by versioningit
+__version__ = "0.0.0"
+__build_date__ = "2026-10-18 21:35:58.128906+00:00"
+__git_commit__ = "1319bd9f1ffe040bcc5dd5e126ec05a29af44e94"
+__dirty__ = False
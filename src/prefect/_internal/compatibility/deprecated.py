@@ -18,7 +18,6 @@ import sys
 import warnings
 from typing import TYPE_CHECKING, Any, Callable, Optional, Union
 
-import dateparser
 from pydantic import BaseModel
 from typing_extensions import ParamSpec, TypeAlias, TypeVar
 
@@ -62,6 +61,9 @@ def _coerce_datetime(
 ) -> Optional[datetime.datetime]:
     if dt is None or isinstance(dt, datetime.datetime):
         return dt
+    # dateparser is slow to import, so only import it when a string is given
+    import dateparser
+
     with warnings.catch_warnings():
         warnings.filterwarnings("ignore", category=DeprecationWarning)
         return dateparser.parse(dt)
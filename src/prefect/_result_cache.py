@@ -0,0 +1,161 @@
+"""
+A local disk cache for result payloads read from remote result storage.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import threading
+import uuid
+from pathlib import Path
+from typing import Optional
+
+from prefect.settings.context import get_current_settings
+
+
+def result_checksum(content: bytes) -> str:
+    """
+    Compute the checksum used to identify a serialized result.
+    """
+    return hashlib.sha256(content).hexdigest()
+
+
+class LocalResultCache:
+    """
+    A content-addressed cache of serialized results on the local disk.
+
+    Entries are named by the checksum of their content, so any process on the host
+    can share them without coordination and a stale entry can never be served for a
+    result that has since been overwritten. Entries are verified against their
+    checksum when read, and the least recently used entries are evicted once the
+    cache grows beyond `max_size` bytes.
+
+    The total size of the cache is scanned from disk the first time an entry is
+    added and is then tracked in memory, so the cache directory is only scanned
+    again once the tracked size crosses `max_size`. Entries added by other
+    processes are counted by that scan, which evicts down to `EVICTION_TARGET` of
+    `max_size` to leave room for the next entries.
+    """
+
+    EVICTION_TARGET = 0.9
+
+    def __init__(self, path: Path, max_size: int):
+        self.path = path
+        self.max_size = max_size
+        self._size: Optional[int] = None
+        self._size_lock = threading.Lock()
+
+    def _entry_path(self, checksum: str) -> Path:
+        return self.path / checksum
+
+    def get(self, checksum: str) -> Optional[bytes]:
+        """
+        Get the content with the given checksum, or `None` if it is not cached.
+        """
+        path = self._entry_path(checksum)
+        try:
+            content = path.read_bytes()
+        except OSError:
+            return None
+
+        if result_checksum(content) != checksum:
+            # a corrupted entry; drop it so it is downloaded again
+            path.unlink(missing_ok=True)
+            return None
+
+        try:
+            # mark the entry as recently used
+            os.utime(path)
+        except OSError:
+            pass
+        return content
+
+    def put(self, content: bytes) -> Optional[str]:
+        """
+        Add content to the cache.
+
+        Returns the checksum of the content, or `None` if the content is larger
+        than the cache.
+        """
+        if len(content) > self.max_size:
+            return None
+
+        checksum = result_checksum(content)
+        path = self._entry_path(checksum)
+        if path.exists():
+            try:
+                os.utime(path)
+            except OSError:
+                pass
+            return checksum
+
+        self.path.mkdir(parents=True, exist_ok=True)
+        # write to a temporary file first so other processes never see a partial
+        # entry
+        tmp_path = self.path / f".{checksum}.{uuid.uuid4().hex}.tmp"
+        try:
+            tmp_path.write_bytes(content)
+            os.replace(tmp_path, path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+
+        with self._size_lock:
+            if self._size is None or self._size + len(content) > self.max_size:
+                self._size = self._evict()
+            else:
+                self._size += len(content)
+        return checksum
+
+    def _evict(self) -> int:
+        """
+        Evict the least recently used entries if the cache is larger than
+        `max_size`, and return the size of the entries that remain.
+        """
+        entries: list[tuple[float, int, str]] = []
+        total_size = 0
+        with os.scandir(self.path) as it:
+            for entry in it:
+                if entry.name.startswith("."):
+                    continue
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+                total_size += stat.st_size
+
+        if total_size <= self.max_size:
+            return total_size
+
+        target_size = self.max_size * self.EVICTION_TARGET
+        for _, size, path in sorted(entries):
+            try:
+                os.unlink(path)
+            except OSError:
+                # already evicted by another process
+                pass
+            total_size -= size
+            if total_size <= target_size:
+                break
+        return total_size
+
+
+_local_caches: dict[tuple[Path, int], LocalResultCache] = {}
+_local_caches_lock = threading.Lock()
+
+
+def get_local_result_cache() -> Optional[LocalResultCache]:
+    """
+    Get the local result cache configured by the current settings, or `None` if it
+    is disabled.
+    """
+    settings = get_current_settings().results
+    if not settings.local_cache_enabled:
+        return None
+
+    key = (settings.local_cache_path, settings.local_cache_max_size)
+    with _local_caches_lock:
+        if key not in _local_caches:
+            _local_caches[key] = LocalResultCache(*key)
+        return _local_caches[key]
@@ -2,9 +2,12 @@ from __future__ import annotations
 
 import inspect
 import uuid
+from pathlib import Path
 from typing import (
     TYPE_CHECKING,
     Any,
+    Awaitable,
+    Callable,
     Generic,
     Optional,
     TypeVar,
@@ -16,6 +19,7 @@ from uuid import UUID
 from pydantic import (
     BaseModel,
     Field,
+    PrivateAttr,
     ValidationError,
     model_validator,
 )
@@ -24,7 +28,12 @@ import prefect
 from prefect.exceptions import (
     SerializationError,
 )
-from prefect.serializers import PickleSerializer, Serializer
+from prefect.serializers import (
+    ArrowSerializer,
+    PickleSerializer,
+    Serializer,
+    is_arrow_payload,
+)
 from prefect.types import DateTime
 
 if TYPE_CHECKING:
@@ -48,6 +57,12 @@ class ResultRecordMetadata(BaseModel):
     serializer: Serializer = Field(default_factory=PickleSerializer)
     prefect_version: str = Field(default=prefect.__version__)
     storage_block_id: Optional[uuid.UUID] = Field(default=None)
+    checksum: Optional[str] = Field(
+        default=None
+    )  # checksum of the serialized result, if stored separately
+    size: Optional[int] = Field(
+        default=None
+    )  # size in bytes of the serialized result, if stored separately
 
     def dump_bytes(self) -> bytes:
         """
@@ -86,11 +101,69 @@ class ResultRecordMetadata(BaseModel):
 class ResultRecord(BaseModel, Generic[R]):
     """
     A record of a result.
+
+    Records created with `ResultRecord.lazy` hold only their metadata until the
+    result is first accessed, at which point the result is loaded from storage.
     """
 
     metadata: ResultRecordMetadata
     result: R
 
+    _load_result: Optional[Callable[[], Awaitable[R]]] = PrivateAttr(default=None)
+
+    @classmethod
+    def lazy(
+        cls, metadata: ResultRecordMetadata, load_result: Callable[[], Awaitable[R]]
+    ) -> "ResultRecord[R]":
+        """
+        Create a record whose result is loaded on first access.
+
+        Args:
+            metadata: the metadata of the record
+            load_result: called to load the result the first time it is accessed
+
+        Returns:
+            ResultRecord: a record with an unloaded result
+        """
+        record = cls.model_construct(metadata=metadata)
+        record._load_result = load_result
+        return record
+
+    @property
+    def is_loaded(self) -> bool:
+        """Whether the result of this record has been loaded."""
+        return "result" in self.__dict__
+
+    async def aload_result(self) -> R:
+        """
+        Return the result of this record, loading it from storage if it has not been
+        loaded yet.
+        """
+        if not self.is_loaded:
+            self._set_loaded_result(await self._result_loader()())
+        return self.result
+
+    def _result_loader(self) -> Callable[[], Awaitable[R]]:
+        load_result = (self.__pydantic_private__ or {}).get("_load_result")
+        if load_result is None:
+            raise AttributeError(
+                f"{type(self).__name__!r} object has no attribute 'result'"
+            )
+        return load_result
+
+    def _set_loaded_result(self, result: R) -> None:
+        self.__dict__["result"] = result
+        self._load_result = None
+
+    def __getattr__(self, name: str) -> Any:
+        if name == "result":
+            from prefect.utilities.asyncutils import run_coro_as_sync
+
+            load_result = self._result_loader()
+            self._set_loaded_result(run_coro_as_sync(load_result()))
+            return self.__dict__["result"]
+        return super().__getattr__(name)  # pyright: ignore[reportAttributeAccessIssue]
+
     @property
     def expiration(self) -> DateTime | None:
         return self.metadata.expiration
@@ -103,46 +176,49 @@ class ResultRecord(BaseModel, Generic[R]):
         try:
             data = self.serializer.dumps(self.result)
         except Exception as exc:
-            extra_info = (
-                'You can try a different serializer (e.g. result_serializer="json") '
-                "or disabling persistence (persist_result=False) for this flow or task."
-            )
-            # check if this is a known issue with cloudpickle and pydantic
-            # and add extra information to help the user recover
-
-            if (
-                isinstance(exc, TypeError)
-                and isinstance(self.result, BaseModel)
-                and str(exc).startswith("cannot pickle")
-            ):
-                try:
-                    from IPython.core.getipython import get_ipython
-
-                    if get_ipython() is not None:
-                        extra_info = inspect.cleandoc(
-                            """
-                            This is a known issue in Pydantic that prevents
-                            locally-defined (non-imported) models from being
-                            serialized by cloudpickle in IPython/Jupyter
-                            environments. Please see
-                            https://github.com/pydantic/pydantic/issues/8232 for
-                            more information. To fix the issue, either: (1) move
-                            your Pydantic class definition to an importable
-                            location, (2) use the JSON serializer for your flow
-                            or task (`result_serializer="json"`), or (3)
-                            disable result persistence for your flow or task
-                            (`persist_result=False`).
-                            """
-                        ).replace("\n", " ")
-                except ImportError:
-                    pass
-            raise SerializationError(
-                f"Failed to serialize object of type {type(self.result).__name__!r} with "
-                f"serializer {self.serializer.type!r}. {extra_info}"
-            ) from exc
+            raise self._serialization_error(exc) from exc
 
         return data
 
+    def _serialization_error(self, exc: Exception) -> SerializationError:
+        extra_info = (
+            'You can try a different serializer (e.g. result_serializer="json") '
+            "or disabling persistence (persist_result=False) for this flow or task."
+        )
+        # check if this is a known issue with cloudpickle and pydantic
+        # and add extra information to help the user recover
+
+        if (
+            isinstance(exc, TypeError)
+            and isinstance(self.result, BaseModel)
+            and str(exc).startswith("cannot pickle")
+        ):
+            try:
+                from IPython.core.getipython import get_ipython
+
+                if get_ipython() is not None:
+                    extra_info = inspect.cleandoc(
+                        """
+                        This is a known issue in Pydantic that prevents
+                        locally-defined (non-imported) models from being
+                        serialized by cloudpickle in IPython/Jupyter
+                        environments. Please see
+                        https://github.com/pydantic/pydantic/issues/8232 for
+                        more information. To fix the issue, either: (1) move
+                        your Pydantic class definition to an importable
+                        location, (2) use the JSON serializer for your flow
+                        or task (`result_serializer="json"`), or (3)
+                        disable result persistence for your flow or task
+                        (`persist_result=False`).
+                        """
+                    ).replace("\n", " ")
+            except ImportError:
+                pass
+        return SerializationError(
+            f"Failed to serialize object of type {type(self.result).__name__!r} with "
+            f"serializer {self.serializer.type!r}. {extra_info}"
+        )
+
     @model_validator(mode="before")
     @classmethod
     def coerce_old_format(cls, value: dict[str, Any] | Any) -> dict[str, Any]:
@@ -174,6 +250,15 @@ class ResultRecord(BaseModel, Generic[R]):
             bytes: the serialized record
 
         """
+        if isinstance(self.serializer, ArrowSerializer):
+            # Arrow payloads are binary, so the metadata is stored in the schema
+            # metadata of the Arrow file rather than wrapping the payload in JSON
+            try:
+                return self.serializer.dumps_with_metadata(
+                    self.result, metadata=self.serialize_metadata()
+                )
+            except Exception as exc:
+                raise self._serialization_error(exc) from exc
         return (
             self.model_copy(update={"result": self.serialize_result()})
             .model_dump_json(serialize_as_any=True)
@@ -195,6 +280,12 @@ class ResultRecord(BaseModel, Generic[R]):
         Returns:
             ResultRecord: the deserialized record
         """
+        if is_arrow_payload(data):
+            metadata = cls._arrow_metadata(
+                ArrowSerializer.read_result_record_metadata(data)
+            )
+            return cls(metadata=metadata, result=metadata.serializer.loads(data))
+
         try:
             instance = cls.model_validate_json(data)
         except ValidationError:
@@ -212,6 +303,36 @@ class ResultRecord(BaseModel, Generic[R]):
             instance.result = instance.serializer.loads(instance.result.encode())
         return instance
 
+    @classmethod
+    def deserialize_from_arrow_file(cls, path: Path) -> "ResultRecord[R]":
+        """
+        Deserialize a record from a local Arrow or Parquet file written by
+        `serialize`.
+
+        The file is memory-mapped so large results are not copied into memory.
+
+        Args:
+            path: the local path of the file
+
+        Returns:
+            ResultRecord: the deserialized record
+        """
+        metadata = cls._arrow_metadata(
+            ArrowSerializer.read_result_record_metadata(path)
+        )
+        serializer = metadata.serializer
+        if not isinstance(serializer, ArrowSerializer):
+            raise SerializationError(
+                f"Expected an Arrow serializer for {path}, found {serializer.type!r}."
+            )
+        return cls(metadata=metadata, result=serializer.load_path(path))
+
+    @staticmethod
+    def _arrow_metadata(metadata: bytes | None) -> ResultRecordMetadata:
+        if metadata is None:
+            return ResultRecordMetadata(serializer=ArrowSerializer())
+        return ResultRecordMetadata.load_bytes(metadata)
+
     @classmethod
     def deserialize_from_result_and_metadata(
         cls, result: bytes, metadata: bytes
@@ -235,6 +356,8 @@ class ResultRecord(BaseModel, Generic[R]):
     def __eq__(self, other: Any | "ResultRecord[Any]") -> bool:
         if not isinstance(other, ResultRecord):
             return False
+        # access the results so lazily loaded results are available to compare
+        _ = (self.result, other.result)
         return self.model_dump(include={"metadata", "result"}) == other.model_dump(
             include={"metadata", "result"}
         )
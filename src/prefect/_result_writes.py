@@ -0,0 +1,259 @@
+"""
+Write-behind persistence for result records.
+
+When `PREFECT_RESULTS_WRITE_BEHIND` is enabled, transactions hand committed result
+records to a bounded background pipeline instead of serializing and uploading them
+on the task's thread. Flow runs wait for their pending writes before finishing so
+that failed writes are reported on the task runs that produced them.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import atexit
+import concurrent.futures
+import threading
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Optional
+from uuid import UUID
+
+from prefect.client.schemas.objects import TaskRun
+from prefect.logging import get_logger
+from prefect.settings.context import get_current_settings
+
+if TYPE_CHECKING:
+    import logging
+
+    from prefect._result_records import ResultRecord
+    from prefect.results import ResultStore
+
+
+logger: "logging.Logger" = get_logger("results")
+
+
+@dataclass
+class PendingResultWrite:
+    """
+    A result write that has been queued on the write-behind pipeline.
+    """
+
+    storage_key: str
+    future: concurrent.futures.Future[None] = field(repr=False)
+    task_run: Optional[TaskRun] = field(default=None, repr=False)
+    flow_run_id: Optional[UUID] = None
+
+    def exception(self) -> Optional[BaseException]:
+        return self.future.exception()
+
+
+class ResultWritePipeline:
+    """
+    Persists result records on a pool of background threads.
+
+    At most `max_pending` writes may be queued or in progress at once; `submit`
+    blocks until a slot is free so that producers cannot outrun storage. At most
+    `max_concurrency` writes run at the same time.
+    """
+
+    def __init__(self, max_pending: int, max_concurrency: int):
+        self.max_pending = max_pending
+        self.max_concurrency = max_concurrency
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_concurrency, thread_name_prefix="ResultWriter"
+        )
+        self._lock = threading.Lock()
+        self._pending: list[PendingResultWrite] = []
+        self._by_key: dict[str, PendingResultWrite] = {}
+
+    def submit(
+        self, store: "ResultStore", result_record: "ResultRecord[Any]"
+    ) -> PendingResultWrite:
+        """
+        Queue a result record to be persisted by the given result store.
+
+        Blocks while the pipeline is full.
+        """
+        self._slots.acquire()
+        return self._submit(store, result_record)
+
+    async def asubmit(
+        self, store: "ResultStore", result_record: "ResultRecord[Any]"
+    ) -> PendingResultWrite:
+        """
+        Queue a result record to be persisted by the given result store.
+
+        Waits without blocking the event loop while the pipeline is full.
+        """
+        if not self._slots.acquire(blocking=False):
+            acquiring = asyncio.ensure_future(asyncio.to_thread(self._slots.acquire))
+            try:
+                await asyncio.shield(acquiring)
+            except asyncio.CancelledError:
+                # the thread still takes a slot once one is free, so give it back
+                acquiring.add_done_callback(self._release_acquired_slot)
+                raise
+        return self._submit(store, result_record)
+
+    def _release_acquired_slot(self, acquiring: asyncio.Future[bool]) -> None:
+        if not acquiring.cancelled() and acquiring.exception() is None:
+            self._slots.release()
+
+    def _submit(
+        self, store: "ResultStore", result_record: "ResultRecord[Any]"
+    ) -> PendingResultWrite:
+        from prefect.context import FlowRunContext, TaskRunContext
+
+        assert result_record.metadata.storage_key is not None, (
+            "Storage key is required on result record"
+        )
+
+        # the lock holder is derived from the current thread, so it must be
+        # computed here rather than on the writer thread
+        holder = store.generate_default_holder()
+        try:
+            future = self._executor.submit(
+                store.persist_result_record, result_record, holder
+            )
+        except BaseException:
+            self._slots.release()
+            raise
+
+        task_run_context = TaskRunContext.get()
+        flow_run_context = FlowRunContext.get()
+        task_run = task_run_context.task_run if task_run_context else None
+        if task_run is not None:
+            flow_run_id = task_run.flow_run_id
+        elif flow_run_context and flow_run_context.flow_run:
+            flow_run_id = flow_run_context.flow_run.id
+        else:
+            flow_run_id = None
+
+        write = PendingResultWrite(
+            storage_key=result_record.metadata.storage_key,
+            future=future,
+            # snapshot the task run so its state can be updated if the write fails
+            task_run=task_run.model_copy() if task_run else None,
+            flow_run_id=flow_run_id,
+        )
+        with self._lock:
+            self._pending.append(write)
+            self._by_key[write.storage_key] = write
+        future.add_done_callback(lambda _: self._slots.release())
+        return write
+
+    def get_pending_write(self, storage_key: str) -> Optional[PendingResultWrite]:
+        """
+        Get the most recent write to the given storage key if it has not finished.
+        """
+        with self._lock:
+            write = self._by_key.get(storage_key)
+        if write is None or write.future.done():
+            return None
+        return write
+
+    def _pop_writes(self, flow_run_id: Optional[UUID]) -> list[PendingResultWrite]:
+        with self._lock:
+            if flow_run_id is None:
+                writes, self._pending = self._pending, []
+            else:
+                writes = [w for w in self._pending if w.flow_run_id == flow_run_id]
+                self._pending = [
+                    w for w in self._pending if w.flow_run_id != flow_run_id
+                ]
+            for write in writes:
+                if self._by_key.get(write.storage_key) is write:
+                    del self._by_key[write.storage_key]
+        return writes
+
+    def wait_for_writes(
+        self, flow_run_id: Optional[UUID] = None, timeout: Optional[float] = None
+    ) -> list[PendingResultWrite]:
+        """
+        Wait for queued writes to finish.
+
+        Args:
+            flow_run_id: Only wait for writes made by this flow run and its task
+                runs. If not provided, waits for all writes.
+            timeout: The maximum number of seconds to wait.
+
+        Returns:
+            The writes that failed, in the order they were submitted.
+        """
+        writes = self._pop_writes(flow_run_id)
+        concurrent.futures.wait([w.future for w in writes], timeout=timeout)
+        return [w for w in writes if w.future.done() and w.exception() is not None]
+
+    async def await_for_writes(
+        self, flow_run_id: Optional[UUID] = None, timeout: Optional[float] = None
+    ) -> list[PendingResultWrite]:
+        """
+        Wait for queued writes to finish without blocking the event loop.
+
+        See `wait_for_writes`.
+        """
+        writes = self._pop_writes(flow_run_id)
+        if writes:
+            await asyncio.wait(
+                [asyncio.wrap_future(w.future) for w in writes], timeout=timeout
+            )
+        return [w for w in writes if w.future.done() and w.exception() is not None]
+
+    def shutdown(self) -> None:
+        """
+        Wait for all queued writes and stop the writer threads.
+        """
+        for write in self.wait_for_writes():
+            logger.error(
+                "Failed to persist result to %r",
+                write.storage_key,
+                exc_info=write.exception(),
+            )
+        self._executor.shutdown(wait=True)
+
+
+_pipeline: Optional[ResultWritePipeline] = None
+_pipeline_lock = threading.Lock()
+
+
+def get_result_write_pipeline() -> ResultWritePipeline:
+    """
+    Get the process-wide write-behind pipeline, creating it on first use.
+    """
+    global _pipeline
+    with _pipeline_lock:
+        if _pipeline is None:
+            settings = get_current_settings().results
+            _pipeline = ResultWritePipeline(
+                max_pending=settings.write_behind_max_pending,
+                max_concurrency=settings.write_behind_max_concurrency,
+            )
+            atexit.register(_pipeline.shutdown)
+        return _pipeline
+
+
+def get_pending_result_write(storage_key: str) -> Optional[PendingResultWrite]:
+    """
+    Get an unfinished write to the given storage key, if any.
+    """
+    if _pipeline is None:
+        return None
+    return _pipeline.get_pending_write(storage_key)
+
+
+def wait_for_result_writes(flow_run_id: UUID) -> list[PendingResultWrite]:
+    """
+    Wait for the result writes of a flow run and return the ones that failed.
+    """
+    if _pipeline is None:
+        return []
+    return _pipeline.wait_for_writes(flow_run_id=flow_run_id)
+
+
+async def await_for_result_writes(flow_run_id: UUID) -> list[PendingResultWrite]:
+    """
+    Wait for the result writes of a flow run and return the ones that failed.
+    """
+    if _pipeline is None:
+        return []
+    return await _pipeline.await_for_writes(flow_run_id=flow_run_id)
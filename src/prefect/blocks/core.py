@@ -23,7 +23,6 @@ from typing import (
 )
 from uuid import UUID, uuid4
 
-from griffe import Docstring, DocstringSection, DocstringSectionKind, Parser, parse
 from packaging.version import InvalidVersion, Version
 from pydantic import (
     BaseModel,
@@ -56,7 +55,6 @@ from prefect.client.schemas.actions import (
     BlockTypeCreate,
 )
 from prefect.client.utilities import inject_client
-from prefect.events import emit_event
 from prefect.logging.loggers import disable_logger
 from prefect.plugins import load_prefect_collections
 from prefect.types import SecretDict
@@ -69,6 +67,7 @@ from prefect.utilities.pydantic import handle_secret_render
 from prefect.utilities.slugify import slugify
 
 if TYPE_CHECKING:
+    from griffe import DocstringSection
     from pydantic.main import IncEx
 
     from prefect.client.orchestration import PrefectClient, SyncPrefectClient
@@ -380,7 +379,9 @@ class Block(BaseModel, ABC):
     def __dispatch_key__(cls) -> str | None:
         if cls.__name__ == "Block":
             return None  # The base class is abstract
-        return block_schema_to_key(cls._to_block_schema())
+        # Equivalent to `block_schema_to_key(cls._to_block_schema())` without
+        # generating the block's schema, which is slow, for every block subclass
+        return cls.get_block_type_slug()
 
     @model_serializer(mode="wrap")
     def ser_model(
@@ -673,6 +674,9 @@ class Block(BaseModel, ABC):
         """
         if cls.__doc__ is None:
             return []
+
+        from griffe import Docstring, Parser, parse
+
         with disable_logger("griffe"):
             docstring = Docstring(cls.__doc__)
             parsed = parse(docstring, Parser.google)
@@ -688,6 +692,8 @@ class Block(BaseModel, ABC):
         # If no description override has been provided, find the first text section
         # and use that as the description
         if description is None and cls.__doc__ is not None:
+            from griffe import DocstringSectionKind
+
             parsed = cls._parse_docstring()
             parsed_description = next(
                 (
@@ -714,6 +720,8 @@ class Block(BaseModel, ABC):
         # section or an admonition with the annotation "example" and use that as the
         # code example
         if code_example is None and cls.__doc__ is not None:
+            from griffe import DocstringSectionKind
+
             parsed = cls._parse_docstring()
             for section in parsed:
                 # Section kind will be "examples" if Examples section heading is used.
@@ -816,6 +824,8 @@ class Block(BaseModel, ABC):
 
         resources: Optional[ResourceTuple] = block._event_method_called_resources()
         if resources:
+            from prefect.events import emit_event
+
             kind = block._event_kind()
             resource, related = resources
             emit_event(event=f"{kind}.loaded", resource=resource, related=related)
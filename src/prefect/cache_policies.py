@@ -1,4 +1,5 @@
 import inspect
+import sys
 from copy import deepcopy
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -31,15 +32,18 @@ def _register_stable_transforms() -> None:
     Some inputs do not reliably produce deterministic byte strings when serialized via
     `cloudpickle`. This utility registers stabilizing transformations of such types
     so that cache keys that utilize them are deterministic across invocations.
+
+    Transformations are only registered once the library that defines a type has been
+    imported, since no inputs can be of that type before then; this keeps `pandas`
+    from being imported with Prefect.
     """
-    try:
+    if "pandas" in sys.modules:
         import pandas as pd  # pyright: ignore
 
-        STABLE_TRANSFORMS[pd.DataFrame] = lambda df: [  # pyright: ignore
-            df[col] for col in sorted(df.columns)
-        ]
-    except (ImportError, ModuleNotFoundError):
-        pass
+        STABLE_TRANSFORMS.setdefault(
+            pd.DataFrame,  # pyright: ignore
+            lambda df: [df[col] for col in sorted(df.columns)],  # pyright: ignore
+        )
 
 
 @dataclass
@@ -365,6 +369,7 @@ class Inputs(CachePolicy):
         if not inputs:
             return None
 
+        _register_stable_transforms()
         for key, val in inputs.items():
             if key not in exclude:
                 transformer = STABLE_TRANSFORMS.get(type(val))  # type: ignore[reportUnknownMemberType]
@@ -389,8 +394,6 @@ class Inputs(CachePolicy):
         return Inputs(exclude=self.exclude + [other])
 
 
-_register_stable_transforms()
-
 INPUTS = Inputs()
 NONE = _None()
 NO_CACHE = _None()
@@ -1,31 +1,40 @@
 import prefect.settings
 from prefect.cli.root import app
 
-# Import CLI submodules to register them to the app
-# isort: split
-
-import prefect.cli.artifact
-import prefect.cli.block
-import prefect.cli.cloud
-import prefect.cli.cloud.ip_allowlist
-import prefect.cli.cloud.webhook
-import prefect.cli.shell
-import prefect.cli.concurrency_limit
-import prefect.cli.config
-import prefect.cli.dashboard
-import prefect.cli.deploy
-import prefect.cli.deployment
-import prefect.cli.dev
-import prefect.cli.events
-import prefect.cli.flow
-import prefect.cli.flow_run
-import prefect.cli.global_concurrency_limit
-import prefect.cli.profile
-import prefect.cli.server
-import prefect.cli.task
-import prefect.cli.variable
-import prefect.cli.work_pool
-import prefect.cli.work_queue
-import prefect.cli.worker
-import prefect.cli.task_run
-import prefect.events.cli.automations
+# Register CLI submodules to the app. Each module is only imported when one of its
+# commands is used, since importing all of them slows down every CLI invocation.
+app.add_lazy_command("init", "prefect.cli.deploy")
+app.add_lazy_command("deploy", "prefect.cli.deploy")
+app.add_lazy_command("artifact", "prefect.cli.artifact")
+app.add_lazy_command("block", "prefect.cli.block", aliases=["blocks"])
+app.add_lazy_command(
+    "cloud",
+    "prefect.cli.cloud",
+    "prefect.cli.cloud.ip_allowlist",
+    "prefect.cli.cloud.webhook",
+)
+app.add_lazy_command("shell", "prefect.cli.shell")
+app.add_lazy_command(
+    "concurrency-limit", "prefect.cli.concurrency_limit", aliases=["concurrency-limits"]
+)
+app.add_lazy_command("config", "prefect.cli.config")
+app.add_lazy_command("dashboard", "prefect.cli.dashboard")
+app.add_lazy_command("deployment", "prefect.cli.deployment", aliases=["deployments"])
+app.add_lazy_command("dev", "prefect.cli.dev")
+app.add_lazy_command("events", "prefect.cli.events", aliases=["event"])
+app.add_lazy_command("flow", "prefect.cli.flow", aliases=["flows"])
+app.add_lazy_command("flow-run", "prefect.cli.flow_run", aliases=["flow-runs"])
+app.add_lazy_command(
+    "global-concurrency-limit", "prefect.cli.global_concurrency_limit", aliases=["gcl"]
+)
+app.add_lazy_command("profile", "prefect.cli.profile", aliases=["profiles"])
+app.add_lazy_command("server", "prefect.cli.server")
+app.add_lazy_command("task", "prefect.cli.task")
+app.add_lazy_command("variable", "prefect.cli.variable")
+app.add_lazy_command("work-pool", "prefect.cli.work_pool")
+app.add_lazy_command("work-queue", "prefect.cli.work_queue", aliases=["work-queues"])
+app.add_lazy_command("worker", "prefect.cli.worker")
+app.add_lazy_command("task-run", "prefect.cli.task_run", aliases=["task-runs"])
+app.add_lazy_command(
+    "automation", "prefect.events.cli.automations", aliases=["automations"]
+)
@@ -4,18 +4,30 @@ Custom Prefect CLI types
 
 import asyncio
 import functools
+import importlib
+import importlib.util
+import json
+import os
 import sys
 from datetime import datetime
-from typing import Any, Callable, List, Optional
+from pathlib import Path
+from typing import Any, Callable, ClassVar, List, Optional
 
+import click
 import typer
+import typer.main
 from rich.console import Console
 from rich.theme import Theme
+from typer.core import TyperCommand, TyperGroup
+from typer.models import DefaultPlaceholder
 
+import prefect
 from prefect._internal.compatibility.deprecated import generate_deprecation_message
 from prefect.cli._utilities import with_cli_exception_handling
 from prefect.settings import PREFECT_CLI_COLORS, Setting
+from prefect.settings.context import get_current_settings
 from prefect.utilities.asyncutils import is_async_fn
+from prefect.utilities.hashing import hash_objects
 
 
 def SettingsOption(setting: Setting, *args: Any, **kwargs: Any) -> Any:
@@ -60,6 +72,152 @@ def with_deprecated_message(
     return decorator
 
 
+def _module_source_mtime(module: str) -> Optional[int]:
+    """
+    Returns the modification time of the source of a module without importing it.
+    """
+    root, *parts = module.split(".")
+    spec = importlib.util.find_spec(root)
+    if spec is None or spec.origin is None:
+        return None
+    path = Path(spec.origin).parent.joinpath(*parts)
+    for candidate in (path.with_suffix(".py"), path / "__init__.py"):
+        try:
+            return candidate.stat().st_mtime_ns
+        except OSError:
+            continue
+    return None
+
+
+def _resolve_default(value: Any) -> Any:
+    return value.value if isinstance(value, DefaultPlaceholder) else value
+
+
+class LazyTyperGroup(TyperGroup):
+    """
+    A click group for a `PrefectTyper` with lazily registered commands.
+
+    The modules that define a lazy command are imported when the command is first
+    looked up. Help for the group is rendered from a cached manifest of the lazy
+    commands, so that `--help` does not import every command module.
+    """
+
+    typer_instance: ClassVar["PrefectTyper"]
+
+    def __init__(self, **kwargs: Any):
+        super().__init__(**kwargs)
+        self._help_manifest: Optional[dict[str, dict[str, Any]]] = None
+
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        commands = super().list_commands(ctx)
+        return commands + [
+            name for name in self.typer_instance.lazy_commands if name not in commands
+        ]
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        unloaded = [
+            module
+            for module in self.typer_instance.lazy_commands.get(cmd_name, ())
+            if not self.typer_instance.lazy_module_loaded(module)
+        ]
+        if not unloaded:
+            command = super().get_command(ctx, cmd_name)
+            if command is not None or cmd_name not in self.typer_instance.lazy_commands:
+                return command
+        elif self._help_manifest is not None and cmd_name in self._help_manifest:
+            # a placeholder that only carries what is needed to list the command
+            return TyperCommand(name=cmd_name, **self._help_manifest[cmd_name])
+
+        for module in unloaded:
+            importlib.import_module(module)
+            self.typer_instance.loaded_lazy_modules.add(module)
+
+        # importing the modules registers the command with the Typer app
+        command = typer.main.get_group(self.typer_instance).commands.get(cmd_name)
+        if command is not None:
+            self.add_command(command, cmd_name)
+        return command
+
+    def format_help(self, ctx: click.Context, formatter: click.HelpFormatter) -> None:
+        lazy_commands = self.typer_instance.lazy_commands
+        if all(
+            self.typer_instance.lazy_module_loaded(module)
+            for modules in lazy_commands.values()
+            for module in modules
+        ):
+            return super().format_help(ctx, formatter)
+
+        manifest_key = self._help_manifest_key()
+        self._help_manifest = self._read_help_manifest(manifest_key)
+        try:
+            super().format_help(ctx, formatter)
+        finally:
+            cached = self._help_manifest is not None
+            self._help_manifest = None
+
+        if not cached:
+            # rendering help without a manifest loaded every lazy command
+            self._write_help_manifest(
+                manifest_key,
+                {
+                    name: {
+                        "help": command.help,
+                        "short_help": command.short_help,
+                        "hidden": command.hidden,
+                        "deprecated": command.deprecated,
+                        "rich_help_panel": _resolve_default(
+                            getattr(command, "rich_help_panel", None)
+                        ),
+                    }
+                    for name in lazy_commands
+                    if (command := self.commands.get(name)) is not None
+                },
+            )
+
+    def _help_manifest_path(self) -> Path:
+        return get_current_settings().home / "cli-manifest.json"
+
+    def _help_manifest_key(self) -> Optional[str]:
+        """
+        Identifies the lazy commands and the source of the modules that define them,
+        so that a manifest is not used once the commands have changed.
+        """
+        return hash_objects(
+            prefect.__version__,
+            {
+                name: [(module, _module_source_mtime(module)) for module in modules]
+                for name, modules in self.typer_instance.lazy_commands.items()
+            },
+        )
+
+    def _read_help_manifest(
+        self, key: Optional[str]
+    ) -> Optional[dict[str, dict[str, Any]]]:
+        if key is None:
+            return None
+        try:
+            manifest = json.loads(self._help_manifest_path().read_text())
+        except (OSError, ValueError):
+            return None
+        if not isinstance(manifest, dict) or manifest.get("key") != key:
+            return None
+        return manifest.get("commands")
+
+    def _write_help_manifest(
+        self, key: Optional[str], commands: dict[str, dict[str, Any]]
+    ) -> None:
+        if key is None:
+            return
+        path = self._help_manifest_path()
+        tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(json.dumps({"key": key, "commands": commands}))
+            os.replace(tmp_path, path)
+        except (OSError, TypeError, ValueError):
+            tmp_path.unlink(missing_ok=True)
+
+
 class PrefectTyper(typer.Typer):
     """
     Wraps commands created by `Typer` to support async functions and handle errors.
@@ -94,6 +252,39 @@ class PrefectTyper(typer.Typer):
             color_system="auto" if PREFECT_CLI_COLORS else None,
         )
 
+        self.lazy_commands: dict[str, tuple[str, ...]] = {}
+        self.loaded_lazy_modules: set[str] = set()
+
+    def add_lazy_command(
+        self, name: str, *modules: str, aliases: Optional[list[str]] = None
+    ) -> None:
+        """
+        Register a command that is defined in the given modules, which are only
+        imported once the command is used.
+
+        Importing the modules must register the command and its aliases with this
+        app, e.g. with `add_typer` or `command`.
+        """
+        if not self.lazy_commands:
+            self.info.cls = type(
+                "PrefectLazyTyperGroup", (LazyTyperGroup,), {"typer_instance": self}
+            )
+        for command_name in [name, *(aliases or [])]:
+            self.lazy_commands[command_name] = modules
+
+    def lazy_module_loaded(self, module: str) -> bool:
+        """
+        Whether a module that defines a lazy command has registered its commands.
+
+        A module that has been loaded is never imported again, even if it is removed
+        from `sys.modules`, since importing it again would register a second copy of
+        its commands, bound to a different module object than the rest of the
+        process uses.
+        """
+        if module in sys.modules:
+            self.loaded_lazy_modules.add(module)
+        return module in self.loaded_lazy_modules
+
     def add_typer(
         self,
         typer_instance: "PrefectTyper",
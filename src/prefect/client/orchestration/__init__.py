@@ -3,7 +3,7 @@ import asyncio
 import base64
 import datetime
 import ssl
-from collections.abc import Iterable
+from collections.abc import AsyncIterator, Iterable, Iterator
 from contextlib import AsyncExitStack
 from logging import Logger
 from typing import TYPE_CHECKING, Any, Literal, NoReturn, Optional, Union, overload
@@ -19,6 +19,8 @@ from packaging import version
 from starlette import status
 from typing_extensions import ParamSpec, Self, TypeVar
 
+from prefect.client.orchestration.base import aiter_pages, iter_pages
+
 from prefect.client.orchestration._artifacts.client import (
     ArtifactClient,
     ArtifactAsyncClient,
@@ -131,6 +133,8 @@ from prefect.settings import (
 from prefect.types._datetime import now
 
 if TYPE_CHECKING:
+    from prefect.events.filters import EventFilter
+    from prefect.events.schemas.events import ReceivedEvent
     from prefect.tasks import Task as TaskObject
 
 from prefect.client.base import (
@@ -156,6 +160,41 @@ def _get_type_adapter(type_: type) -> pydantic.TypeAdapter[Any]:
     return _TYPE_ADAPTER_CACHE[type_]
 
 
+def _task_run_filter_after(
+    task_run_filter: Optional[TaskRunFilter], page: Optional[list[TaskRun]]
+) -> Optional[TaskRunFilter]:
+    """
+    Narrow a task run filter to the task runs that follow the last task run of the
+    given page in `ID_DESC` order.
+    """
+    from prefect.client.schemas.filters import Operator, TaskRunFilterId
+
+    if task_run_filter is not None and task_run_filter.operator == Operator.or_:
+        raise ValueError(
+            "Iterating over task runs does not support task run filters that combine"
+            " criteria with the `or_` operator."
+        )
+    if not page:
+        return task_run_filter
+
+    task_run_filter = (
+        task_run_filter.model_copy() if task_run_filter else TaskRunFilter()
+    )
+    id_filter = (
+        task_run_filter.id.model_copy() if task_run_filter.id else TaskRunFilterId()
+    )
+    id_filter.lt_ = page[-1].id
+    task_run_filter.id = id_filter
+    return task_run_filter
+
+
+def _next_event_page_token(page: dict[str, Any]) -> Optional[str]:
+    """Extract the page token from the `next_page` link of a page of events."""
+    if not page.get("next_page"):
+        return None
+    return httpx.URL(page["next_page"]).params.get("page-token")
+
+
 @overload
 def get_client(
     httpx_settings: Optional[dict[str, Any]],
@@ -899,6 +938,91 @@ class PrefectClient(
         response = await self._client.post("/task_runs/filter", json=body)
         return _get_type_adapter(list[TaskRun]).validate_python(response.json())
 
+    async def iter_task_runs(
+        self,
+        *,
+        flow_filter: Optional[FlowFilter] = None,
+        flow_run_filter: Optional[FlowRunFilter] = None,
+        task_run_filter: Optional[TaskRunFilter] = None,
+        deployment_filter: Optional[DeploymentFilter] = None,
+        page_size: int = 200,
+    ) -> AsyncIterator[TaskRun]:
+        """
+        Iterate over all task runs matching the given criteria.
+
+        Task runs are requested a page at a time in `ID_DESC` order using keyset
+        pagination, so large histories can be scanned without offsets and without
+        holding every task run in memory. The next page is requested while the
+        current page is being consumed.
+
+        Args:
+            flow_filter: filter criteria for flows
+            flow_run_filter: filter criteria for flow runs
+            task_run_filter: filter criteria for task runs
+            deployment_filter: filter criteria for deployments
+            page_size: the number of task runs to request with each page
+
+        Yields:
+            Task Run model representations of the task runs
+        """
+
+        async def fetch_page(page: Optional[list[TaskRun]]) -> list[TaskRun]:
+            return await self.read_task_runs(
+                flow_filter=flow_filter,
+                flow_run_filter=flow_run_filter,
+                task_run_filter=_task_run_filter_after(task_run_filter, page),
+                deployment_filter=deployment_filter,
+                sort=TaskRunSort.ID_DESC,
+                limit=page_size,
+            )
+
+        async for page in aiter_pages(fetch_page, lambda page: len(page) >= page_size):
+            for task_run in page:
+                yield task_run
+
+    async def iter_events(
+        self,
+        filter: Optional["EventFilter"] = None,
+        page_size: int = 50,
+    ) -> AsyncIterator["ReceivedEvent"]:
+        """
+        Iterate over all events matching the given criteria.
+
+        Events are requested a page at a time by following the page tokens returned
+        by the API. The next page is requested while the current page is being
+        consumed.
+
+        Args:
+            filter: filter criteria for events
+            page_size: the number of events to request with each page
+
+        Yields:
+            the events matching the filter
+        """
+        from prefect.events.schemas.events import ReceivedEvent
+
+        async def fetch_page(page: Optional[dict[str, Any]]) -> dict[str, Any]:
+            if page is None:
+                response = await self._client.post(
+                    "/events/filter",
+                    json={
+                        "filter": filter.model_dump(mode="json") if filter else None,
+                        "limit": page_size,
+                    },
+                )
+            else:
+                response = await self._client.get(
+                    "/events/filter/next",
+                    params={"page-token": _next_event_page_token(page)},
+                )
+            return response.json()
+
+        async for page in aiter_pages(
+            fetch_page, lambda page: _next_event_page_token(page) is not None
+        ):
+            for event in page["events"]:
+                yield ReceivedEvent.model_validate(event)
+
     async def delete_task_run(self, task_run_id: UUID) -> None:
         """
         Delete a task run by id.
@@ -1558,6 +1682,88 @@ class SyncPrefectClient(
         response = self._client.post("/task_runs/filter", json=body)
         return _get_type_adapter(list[TaskRun]).validate_python(response.json())
 
+    def iter_task_runs(
+        self,
+        *,
+        flow_filter: Optional[FlowFilter] = None,
+        flow_run_filter: Optional[FlowRunFilter] = None,
+        task_run_filter: Optional[TaskRunFilter] = None,
+        deployment_filter: Optional[DeploymentFilter] = None,
+        page_size: int = 200,
+    ) -> Iterator[TaskRun]:
+        """
+        Iterate over all task runs matching the given criteria.
+
+        Task runs are requested a page at a time in `ID_DESC` order using keyset
+        pagination, so large histories can be scanned without offsets and without
+        holding every task run in memory.
+
+        Args:
+            flow_filter: filter criteria for flows
+            flow_run_filter: filter criteria for flow runs
+            task_run_filter: filter criteria for task runs
+            deployment_filter: filter criteria for deployments
+            page_size: the number of task runs to request with each page
+
+        Yields:
+            Task Run model representations of the task runs
+        """
+
+        def fetch_page(page: Optional[list[TaskRun]]) -> list[TaskRun]:
+            return self.read_task_runs(
+                flow_filter=flow_filter,
+                flow_run_filter=flow_run_filter,
+                task_run_filter=_task_run_filter_after(task_run_filter, page),
+                deployment_filter=deployment_filter,
+                sort=TaskRunSort.ID_DESC,
+                limit=page_size,
+            )
+
+        for page in iter_pages(fetch_page, lambda page: len(page) >= page_size):
+            yield from page
+
+    def iter_events(
+        self,
+        filter: Optional["EventFilter"] = None,
+        page_size: int = 50,
+    ) -> Iterator["ReceivedEvent"]:
+        """
+        Iterate over all events matching the given criteria.
+
+        Events are requested a page at a time by following the page tokens returned
+        by the API.
+
+        Args:
+            filter: filter criteria for events
+            page_size: the number of events to request with each page
+
+        Yields:
+            the events matching the filter
+        """
+        from prefect.events.schemas.events import ReceivedEvent
+
+        def fetch_page(page: Optional[dict[str, Any]]) -> dict[str, Any]:
+            if page is None:
+                response = self._client.post(
+                    "/events/filter",
+                    json={
+                        "filter": filter.model_dump(mode="json") if filter else None,
+                        "limit": page_size,
+                    },
+                )
+            else:
+                response = self._client.get(
+                    "/events/filter/next",
+                    params={"page-token": _next_event_page_token(page)},
+                )
+            return response.json()
+
+        for page in iter_pages(
+            fetch_page, lambda page: _next_event_page_token(page) is not None
+        ):
+            for event in page["events"]:
+                yield ReceivedEvent.model_validate(event)
+
     def set_task_run_state(
         self,
         task_run_id: UUID,
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import datetime
 from collections.abc import Iterable
 from typing import TYPE_CHECKING, Any, Union
 from uuid import UUID
@@ -11,8 +12,6 @@ from prefect.client.orchestration.base import BaseAsyncClient, BaseClient
 from prefect.exceptions import ObjectNotFound
 
 if TYPE_CHECKING:
-    import datetime
-
     from prefect.client.schemas import FlowRun
     from prefect.client.schemas.actions import (
         DeploymentCreate,
@@ -177,7 +176,7 @@ class DeploymentClient(BaseClient):
         )
 
     @deprecated_callable(
-        start_date="Jun 2025",
+        start_date=datetime.datetime(2025, 6, 1),
         help="Use pause_deployment or resume_deployment instead.",
     )
     def set_deployment_paused_state(self, deployment_id: UUID, paused: bool) -> None:
@@ -838,7 +837,7 @@ class DeploymentAsyncClient(BaseAsyncClient):
         )
 
     @deprecated_callable(
-        start_date="Jun 2025",
+        start_date=datetime.datetime(2025, 6, 1),
         help="Use pause_deployment or resume_deployment instead.",
     )
     async def set_deployment_paused_state(
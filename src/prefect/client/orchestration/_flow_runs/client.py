@@ -1,12 +1,17 @@
 from __future__ import annotations
 
-from collections.abc import Iterable
+from collections.abc import AsyncIterator, Iterable, Iterator
 from typing import TYPE_CHECKING, Any
 
 import httpx
 from typing_extensions import TypeVar
 
-from prefect.client.orchestration.base import BaseAsyncClient, BaseClient
+from prefect.client.orchestration.base import (
+    BaseAsyncClient,
+    BaseClient,
+    aiter_pages,
+    iter_pages,
+)
 from prefect.exceptions import ObjectNotFound
 
 T = TypeVar("T")
@@ -36,6 +41,34 @@ if TYPE_CHECKING:
     from prefect.types import KeyValueLabelsField
 
 
+def _flow_run_filter_after(
+    flow_run_filter: "FlowRunFilter | None", page: "list[FlowRun] | None"
+) -> "FlowRunFilter | None":
+    """
+    Narrow a flow run filter to the flow runs that follow the last flow run of the
+    given page in `ID_DESC` order.
+    """
+    from prefect.client.schemas.filters import FlowRunFilter, FlowRunFilterId, Operator
+
+    if flow_run_filter is not None and flow_run_filter.operator == Operator.or_:
+        raise ValueError(
+            "Iterating over flow runs does not support flow run filters that combine"
+            " criteria with the `or_` operator."
+        )
+    if not page:
+        return flow_run_filter
+
+    flow_run_filter = (
+        flow_run_filter.model_copy() if flow_run_filter else FlowRunFilter()
+    )
+    id_filter = (
+        flow_run_filter.id.model_copy() if flow_run_filter.id else FlowRunFilterId()
+    )
+    id_filter.lt_ = page[-1].id
+    flow_run_filter.id = id_filter
+    return flow_run_filter
+
+
 class FlowRunClient(BaseClient):
     def create_flow_run(
         self,
@@ -317,6 +350,53 @@ class FlowRunClient(BaseClient):
 
         return FlowRun.model_validate_list(response.json())
 
+    def iter_flow_runs(
+        self,
+        *,
+        flow_filter: "FlowFilter | None" = None,
+        flow_run_filter: "FlowRunFilter | None" = None,
+        task_run_filter: "TaskRunFilter | None" = None,
+        deployment_filter: "DeploymentFilter | None" = None,
+        work_pool_filter: "WorkPoolFilter | None" = None,
+        work_queue_filter: "WorkQueueFilter | None" = None,
+        page_size: int = 200,
+    ) -> "Iterator[FlowRun]":
+        """
+        Iterate over all flow runs matching the given criteria.
+
+        Flow runs are requested a page at a time in `ID_DESC` order using keyset
+        pagination, so large histories can be scanned without offsets and without
+        holding every flow run in memory.
+
+        Args:
+            flow_filter: filter criteria for flows
+            flow_run_filter: filter criteria for flow runs
+            task_run_filter: filter criteria for task runs
+            deployment_filter: filter criteria for deployments
+            work_pool_filter: filter criteria for work pools
+            work_queue_filter: filter criteria for work pool queues
+            page_size: the number of flow runs to request with each page
+
+        Yields:
+            Flow Run model representations of the flow runs
+        """
+        from prefect.client.schemas.sorting import FlowRunSort
+
+        def fetch_page(page: "list[FlowRun] | None") -> "list[FlowRun]":
+            return self.read_flow_runs(
+                flow_filter=flow_filter,
+                flow_run_filter=_flow_run_filter_after(flow_run_filter, page),
+                task_run_filter=task_run_filter,
+                deployment_filter=deployment_filter,
+                work_pool_filter=work_pool_filter,
+                work_queue_filter=work_queue_filter,
+                sort=FlowRunSort.ID_DESC,
+                limit=page_size,
+            )
+
+        for page in iter_pages(fetch_page, lambda page: len(page) >= page_size):
+            yield from page
+
     def set_flow_run_state(
         self,
         flow_run_id: "UUID | str",
@@ -767,6 +847,55 @@ class FlowRunAsyncClient(BaseAsyncClient):
 
         return FlowRun.model_validate_list(response.json())
 
+    async def iter_flow_runs(
+        self,
+        *,
+        flow_filter: "FlowFilter | None" = None,
+        flow_run_filter: "FlowRunFilter | None" = None,
+        task_run_filter: "TaskRunFilter | None" = None,
+        deployment_filter: "DeploymentFilter | None" = None,
+        work_pool_filter: "WorkPoolFilter | None" = None,
+        work_queue_filter: "WorkQueueFilter | None" = None,
+        page_size: int = 200,
+    ) -> "AsyncIterator[FlowRun]":
+        """
+        Iterate over all flow runs matching the given criteria.
+
+        Flow runs are requested a page at a time in `ID_DESC` order using keyset
+        pagination, so large histories can be scanned without offsets and without
+        holding every flow run in memory. The next page is requested while the
+        current page is being consumed.
+
+        Args:
+            flow_filter: filter criteria for flows
+            flow_run_filter: filter criteria for flow runs
+            task_run_filter: filter criteria for task runs
+            deployment_filter: filter criteria for deployments
+            work_pool_filter: filter criteria for work pools
+            work_queue_filter: filter criteria for work pool queues
+            page_size: the number of flow runs to request with each page
+
+        Yields:
+            Flow Run model representations of the flow runs
+        """
+        from prefect.client.schemas.sorting import FlowRunSort
+
+        async def fetch_page(page: "list[FlowRun] | None") -> "list[FlowRun]":
+            return await self.read_flow_runs(
+                flow_filter=flow_filter,
+                flow_run_filter=_flow_run_filter_after(flow_run_filter, page),
+                task_run_filter=task_run_filter,
+                deployment_filter=deployment_filter,
+                work_pool_filter=work_pool_filter,
+                work_queue_filter=work_queue_filter,
+                sort=FlowRunSort.ID_DESC,
+                limit=page_size,
+            )
+
+        async for page in aiter_pages(fetch_page, lambda page: len(page) >= page_size):
+            for flow_run in page:
+                yield flow_run
+
     async def set_flow_run_state(
         self,
         flow_run_id: "UUID | str",
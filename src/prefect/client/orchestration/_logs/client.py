@@ -1,8 +1,15 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Iterable, Union
+import gzip
+import json
+from typing import TYPE_CHECKING, Any, AsyncIterator, Iterable, Iterator, Union
 
-from prefect.client.orchestration.base import BaseAsyncClient, BaseClient
+from prefect.client.orchestration.base import (
+    BaseAsyncClient,
+    BaseClient,
+    aiter_pages,
+    iter_pages,
+)
 
 if TYPE_CHECKING:
     from prefect.client.schemas.actions import (
@@ -17,18 +24,70 @@ if TYPE_CHECKING:
     from prefect.client.schemas.sorting import LogSort
 
 
+def _log_filter_after(
+    log_filter: "LogFilter | None", page: "list[Log] | None"
+) -> "LogFilter | None":
+    """
+    Narrow a log filter to the logs that follow the last log of the given page in
+    `TIMESTAMP_ASC` order.
+    """
+    from prefect.client.schemas.filters import LogFilter, LogFilterCursor, Operator
+
+    if log_filter is not None and log_filter.operator == Operator.or_:
+        raise ValueError(
+            "Iterating over logs does not support log filters that combine criteria"
+            " with the `or_` operator."
+        )
+    if not page:
+        return log_filter
+
+    log_filter = log_filter.model_copy() if log_filter else LogFilter()
+    log_filter.cursor = LogFilterCursor(timestamp=page[-1].timestamp, id=page[-1].id)
+    return log_filter
+
+
+def _create_logs_request(
+    logs: Iterable[Union["LogCreate", dict[str, Any], str]], compress: bool
+) -> dict[str, Any]:
+    """
+    Build the body of a request to create logs.
+
+    Logs that have already been encoded as JSON strings are used as-is so that a
+    log is only serialized once on its way to the API.
+    """
+    from prefect.client.schemas.actions import LogCreate
+
+    encoded_logs = [
+        log
+        if isinstance(log, str)
+        else json.dumps(
+            log.model_dump(mode="json") if isinstance(log, LogCreate) else log
+        )
+        for log in logs
+    ]
+    content = f"[{', '.join(encoded_logs)}]".encode()
+    headers = {"Content-Type": "application/json"}
+    if compress:
+        content = gzip.compress(content, compresslevel=6)
+        headers["Content-Encoding"] = "gzip"
+    return {"content": content, "headers": headers}
+
+
 class LogClient(BaseClient):
-    def create_logs(self, logs: Iterable[Union["LogCreate", dict[str, Any]]]) -> None:
+    def create_logs(
+        self,
+        logs: Iterable[Union["LogCreate", dict[str, Any], str]],
+        compress: bool = False,
+    ) -> None:
         """
         Create logs for a flow or task run
-        """
-        from prefect.client.schemas.actions import LogCreate
 
-        serialized_logs = [
-            log.model_dump(mode="json") if isinstance(log, LogCreate) else log
-            for log in logs
-        ]
-        self.request("POST", "/logs/", json=serialized_logs)
+        Args:
+            logs: An iterable of `LogCreate` objects, already json-compatible dicts,
+                or logs already encoded as JSON strings
+            compress: If `True`, the request body is gzip-compressed
+        """
+        self.request("POST", "/logs/", **_create_logs_request(logs, compress))
 
     def read_logs(
         self,
@@ -53,24 +112,46 @@ class LogClient(BaseClient):
 
         return Log.model_validate_list(response.json())
 
+    def iter_logs(
+        self,
+        log_filter: "LogFilter | None" = None,
+        page_size: int = 200,
+    ) -> Iterator["Log"]:
+        """
+        Iterate over all flow and task run logs matching the given criteria.
+
+        Logs are requested a page at a time in `TIMESTAMP_ASC` order using keyset
+        pagination, so large histories can be scanned without offsets and without
+        holding every log in memory.
+        """
+        from prefect.client.schemas.sorting import LogSort
+
+        def fetch_page(page: "list[Log] | None") -> "list[Log]":
+            return self.read_logs(
+                log_filter=_log_filter_after(log_filter, page),
+                limit=page_size,
+                sort=LogSort.TIMESTAMP_ASC,
+            )
+
+        for page in iter_pages(fetch_page, lambda page: len(page) >= page_size):
+            yield from page
+
 
 class LogAsyncClient(BaseAsyncClient):
     async def create_logs(
-        self, logs: Iterable[Union["LogCreate", dict[str, Any]]]
+        self,
+        logs: Iterable[Union["LogCreate", dict[str, Any], str]],
+        compress: bool = False,
     ) -> None:
         """
         Create logs for a flow or task run
 
         Args:
-            logs: An iterable of `LogCreate` objects or already json-compatible dicts
+            logs: An iterable of `LogCreate` objects, already json-compatible dicts,
+                or logs already encoded as JSON strings
+            compress: If `True`, the request body is gzip-compressed
         """
-        from prefect.client.schemas.actions import LogCreate
-
-        serialized_logs = [
-            log.model_dump(mode="json") if isinstance(log, LogCreate) else log
-            for log in logs
-        ]
-        await self.request("POST", "/logs/", json=serialized_logs)
+        await self.request("POST", "/logs/", **_create_logs_request(logs, compress))
 
     async def read_logs(
         self,
@@ -95,3 +176,29 @@ class LogAsyncClient(BaseAsyncClient):
         from prefect.client.schemas.objects import Log
 
         return Log.model_validate_list(response.json())
+
+    async def iter_logs(
+        self,
+        log_filter: "LogFilter | None" = None,
+        page_size: int = 200,
+    ) -> AsyncIterator["Log"]:
+        """
+        Iterate over all flow and task run logs matching the given criteria.
+
+        Logs are requested a page at a time in `TIMESTAMP_ASC` order using keyset
+        pagination, so large histories can be scanned without offsets and without
+        holding every log in memory. The next page is requested while the current
+        page is being consumed.
+        """
+        from prefect.client.schemas.sorting import LogSort
+
+        async def fetch_page(page: "list[Log] | None") -> "list[Log]":
+            return await self.read_logs(
+                log_filter=_log_filter_after(log_filter, page),
+                limit=page_size,
+                sort=LogSort.TIMESTAMP_ASC,
+            )
+
+        async for page in aiter_pages(fetch_page, lambda page: len(page) >= page_size):
+            for log in page:
+                yield log
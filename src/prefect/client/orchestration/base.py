@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import asyncio
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
 from typing import TYPE_CHECKING, Any, Literal
 
-from typing_extensions import TypeAlias
+from typing_extensions import TypeAlias, TypeVar
 
 if TYPE_CHECKING:
     from httpx import AsyncClient, Client, Response
@@ -12,6 +14,8 @@ if TYPE_CHECKING:
 
 HTTP_METHODS: TypeAlias = Literal["GET", "POST", "PUT", "DELETE", "PATCH"]
 
+P = TypeVar("P")
+
 
 class BaseClient:
     server_type: "ServerType"
@@ -51,3 +55,54 @@ class BaseAsyncClient:
             path = path.format(**path_params)  # type: ignore
         request = self._client.build_request(method, path, params=params, **kwargs)
         return await self._client.send(request)
+
+
+def iter_pages(
+    fetch_page: Callable[[P | None], P],
+    has_next_page: Callable[[P], bool],
+) -> Iterator[P]:
+    """
+    Iterate over pages of results, requesting each page from the one before it.
+
+    Args:
+        fetch_page: called with the previous page (or `None` for the first page)
+            to request the next page of results
+        has_next_page: called with a page to determine if another page should be
+            requested after it
+    """
+    page = fetch_page(None)
+    while True:
+        yield page
+        if not has_next_page(page):
+            return
+        page = fetch_page(page)
+
+
+async def aiter_pages(
+    fetch_page: Callable[[P | None], Awaitable[P]],
+    has_next_page: Callable[[P], bool],
+) -> AsyncIterator[P]:
+    """
+    Iterate over pages of results, requesting each page from the one before it.
+
+    The next page is requested in the background as soon as the current page is
+    received, so the caller can work through the current page while the next one is
+    in flight. At most two pages are held in memory at a time.
+
+    Args:
+        fetch_page: called with the previous page (or `None` for the first page)
+            to request the next page of results
+        has_next_page: called with a page to determine if another page should be
+            requested after it
+    """
+    pending: asyncio.Future[P] | None = asyncio.ensure_future(fetch_page(None))
+    try:
+        while pending is not None:
+            page = await pending
+            pending = (
+                asyncio.ensure_future(fetch_page(page)) if has_next_page(page) else None
+            )
+            yield page
+    finally:
+        if pending is not None and not pending.done():
+            pending.cancel()
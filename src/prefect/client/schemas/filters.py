@@ -96,6 +96,13 @@ class FlowRunFilterId(PrefectBaseModel):
     not_any_: Optional[List[UUID]] = Field(
         default=None, description="A list of flow run ids to exclude"
     )
+    lt_: Optional[UUID] = Field(
+        default=None,
+        description=(
+            "Only include flow runs with an id less than this id. Combined with the"
+            " `ID_DESC` sort, this allows keyset pagination over flow runs."
+        ),
+    )
 
 
 class FlowRunFilterName(PrefectBaseModel):
@@ -345,6 +352,13 @@ class TaskRunFilterId(PrefectBaseModel):
     any_: Optional[List[UUID]] = Field(
         default=None, description="A list of task run ids to include"
     )
+    lt_: Optional[UUID] = Field(
+        default=None,
+        description=(
+            "Only include task runs with an id less than this id. Combined with the"
+            " `ID_DESC` sort, this allows keyset pagination over task runs."
+        ),
+    )
 
 
 class TaskRunFilterName(PrefectBaseModel):
@@ -612,6 +626,19 @@ class LogFilterTaskRunId(PrefectBaseModel):
     )
 
 
+class LogFilterCursor(PrefectBaseModel):
+    """
+    Filter for logs positioned strictly after a `(Log.timestamp, Log.id)` pair.
+
+    Combined with the `TIMESTAMP_ASC` sort, this allows keyset pagination over logs.
+    """
+
+    timestamp: DateTime = Field(
+        default=..., description="The timestamp of the last log that was read"
+    )
+    id: UUID = Field(default=..., description="The id of the last log that was read")
+
+
 class LogFilter(PrefectBaseModel, OperatorMixin):
     """Filter logs. Only logs matching all criteria will be returned"""
 
@@ -627,6 +654,10 @@ class LogFilter(PrefectBaseModel, OperatorMixin):
     task_run_id: Optional[LogFilterTaskRunId] = Field(
         default=None, description="Filter criteria for `Log.task_run_id`"
     )
+    cursor: Optional[LogFilterCursor] = Field(
+        default=None,
+        description="Only include logs after the given `(timestamp, id)` position",
+    )
 
 
 class FilterSet(PrefectBaseModel):
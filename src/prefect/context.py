@@ -372,6 +372,7 @@ class EngineContext(RunContext):
         persist_result: Whether to persist the flow run result
         task_run_dynamic_keys: Counter for task calls allowing unique keys
         observed_flow_pauses: Counter for flow pauses
+        lightweight_task_runs: Lightweight task runs that have not been reported yet
         events: Events worker to emit events
     """
 
@@ -404,6 +405,12 @@ class EngineContext(RunContext):
     # tasks and materialization
     task_run_assets: dict[UUID, set[Asset]] = Field(default_factory=dict)
 
+    # Lightweight task runs in this flow run that have not been reported yet, with
+    # the states each task run entered before its current state
+    lightweight_task_runs: list[tuple[TaskRun, list[State]]] = Field(
+        default_factory=list
+    )
+
     # Events worker to emit events
     events: Optional[EventsWorker] = None
 
@@ -42,8 +42,21 @@ from .actions import (
     ResumeAutomation,
     DeclareIncident,
 )
-from .clients import get_events_client, get_events_subscriber
-from .utilities import emit_event
+import importlib
+import sys
+from typing import TYPE_CHECKING, Any, Optional
+
+if TYPE_CHECKING:
+    from .clients import get_events_client, get_events_subscriber
+    from .utilities import emit_event
+
+# The events clients depend on `websockets`, which is slow to import and only needed
+# once events are emitted
+_public_api: dict[str, tuple[Optional[str], str]] = {
+    "emit_event": (__spec__.parent, ".utilities"),
+    "get_events_client": (__spec__.parent, ".clients"),
+    "get_events_subscriber": (__spec__.parent, ".clients"),
+}
 
 __all__ = [
     "Event",
@@ -91,3 +104,17 @@ __all__ = [
     "get_events_client",
     "get_events_subscriber",
 ]
+
+
+def __getattr__(attr_name: str) -> Any:
+    try:
+        if (dynamic_attr := _public_api.get(attr_name)) is None:
+            raise AttributeError(f"module {__name__} has no attribute {attr_name}")
+
+        package, mname = dynamic_attr
+        module = importlib.import_module(mname, package=package)
+        return getattr(module, attr_name)
+    except ModuleNotFoundError as ex:
+        mname, _, attr = (ex.name or "").rpartition(".")
+        ctx = {"name": mname, "obj": attr} if sys.version_info >= (3, 10) else {}
+        raise AttributeError(f"module {mname} has no attribute {attr}", **ctx) from ex
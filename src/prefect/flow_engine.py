@@ -31,6 +31,11 @@ from opentelemetry import propagate, trace
 from typing_extensions import ParamSpec
 
 from prefect import Task
+from prefect._result_writes import (
+    PendingResultWrite,
+    await_for_result_writes,
+    wait_for_result_writes,
+)
 from prefect.client.orchestration import PrefectClient, SyncPrefectClient, get_client
 from prefect.client.schemas import FlowRun, TaskRun
 from prefect.client.schemas.filters import FlowRunFilter
@@ -53,6 +58,7 @@ from prefect.exceptions import (
     MissingFlowError,
     Pause,
     PrefectException,
+    PrefectHTTPStatusError,
     TerminationSignal,
     UpstreamTaskError,
 )
@@ -78,6 +84,7 @@ from prefect.settings import PREFECT_DEBUG_MODE
 from prefect.settings.context import get_current_settings
 from prefect.settings.models.root import Settings
 from prefect.states import (
+    Crashed,
     Failed,
     Pending,
     Running,
@@ -105,6 +112,8 @@ from prefect.utilities.callables import (
 from prefect.utilities.collections import visit_collection
 from prefect.utilities.engine import (
     capture_sigterm,
+    emit_lightweight_task_run_events,
+    emit_task_run_state_change_event,
     link_state_to_flow_run_result,
     propose_state,
     propose_state_sync,
@@ -149,6 +158,73 @@ def load_flow_and_flow_run(flow_run_id: UUID) -> tuple[FlowRun, Flow[..., Any]]:
     return flow_run, flow
 
 
+def _crash_task_runs_for_failed_writes(
+    client: SyncPrefectClient, failed_writes: list[PendingResultWrite]
+) -> None:
+    """
+    Move the task runs whose results could not be persisted in the background to a
+    crashed state.
+    """
+    for task_run, state in _crashed_task_run_states(failed_writes):
+        try:
+            client.set_task_run_state(task_run.id, state, force=True)
+        except PrefectHTTPStatusError as exc:
+            if exc.response.status_code != 404:
+                raise
+
+
+async def _acrash_task_runs_for_failed_writes(
+    client: PrefectClient, failed_writes: list[PendingResultWrite]
+) -> None:
+    """
+    Move the task runs whose results could not be persisted in the background to a
+    crashed state.
+    """
+    for task_run, state in _crashed_task_run_states(failed_writes):
+        try:
+            await client.set_task_run_state(task_run.id, state, force=True)
+        except PrefectHTTPStatusError as exc:
+            if exc.response.status_code != 404:
+                raise
+
+
+def _crashed_task_run_states(
+    failed_writes: list[PendingResultWrite],
+) -> list[tuple[TaskRun, State]]:
+    """
+    Record a crashed state on the task run of each failed write and emit its state
+    change event.
+
+    The task run is also crashed through the API, since it has already reported
+    that it completed. A task run that has not been recorded by the API yet is
+    crashed by the event once it is.
+    """
+    crashed: list[tuple[TaskRun, State]] = []
+    for write in failed_writes:
+        task_run = write.task_run
+        if task_run is None:
+            continue
+
+        initial_state = task_run.state
+        state = Crashed(
+            message=(
+                f"Task run result could not be persisted to {write.storage_key!r}:"
+                f" {write.exception()!r}"
+            )
+        )
+        state.state_details.task_run_id = task_run.id
+        state.state_details.flow_run_id = task_run.flow_run_id
+        task_run.state = state
+        task_run.state_id = state.id
+        task_run.state_type = state.type
+        task_run.state_name = state.name
+        emit_task_run_state_change_event(
+            task_run=task_run, initial_state=initial_state, validated_state=state
+        )
+        crashed.append((task_run, state))
+    return crashed
+
+
 @dataclass
 class BaseFlowRunEngine(Generic[P, R]):
     flow: Union[Flow[P, R], Flow[P, Coroutine[Any, Any, R]]]
@@ -359,10 +435,23 @@ class FlowRunEngine(BaseFlowRunEngine[P, R]):
         _result = self.state.result(raise_on_failure=raise_on_failure, _sync=True)  # type: ignore
         return _result
 
+    def handle_result_writes(self) -> Optional[BaseException]:
+        """
+        Wait for the results this flow run persists in the background and crash the
+        task runs whose results could not be written.
+
+        Returns the error of the first failed write, if any.
+        """
+        failed_writes = wait_for_result_writes(self.flow_run.id)
+        _crash_task_runs_for_failed_writes(self.client, failed_writes)
+        return failed_writes[0].exception() if failed_writes else None
+
     def handle_success(self, result: R) -> R:
         result_store = getattr(FlowRunContext.get(), "result_store", None)
         if result_store is None:
             raise ValueError("Result store is not set")
+        if write_error := self.handle_result_writes():
+            raise write_error
         resolved_result = resolve_futures_to_states(result)
         terminal_state = run_coro_as_sync(
             return_value_to_state(
@@ -385,6 +474,7 @@ class FlowRunEngine(BaseFlowRunEngine[P, R]):
         msg: Optional[str] = None,
         result_store: Optional[ResultStore] = None,
     ) -> State:
+        self.handle_result_writes()
         context = FlowRunContext.get()
         terminal_state = cast(
             State,
@@ -600,7 +690,7 @@ class FlowRunEngine(BaseFlowRunEngine[P, R]):
             if log_prints:
                 stack.enter_context(patch_print())
             task_runner = stack.enter_context(self.flow.task_runner.duplicate())
-            stack.enter_context(
+            flow_run_context = stack.enter_context(
                 FlowRunContext(
                     flow=self.flow,
                     log_prints=log_prints,
@@ -616,6 +706,8 @@ class FlowRunEngine(BaseFlowRunEngine[P, R]):
                     else should_persist_result(),
                 )
             )
+            # lightweight task runs are reported while the flow run context is set
+            stack.callback(emit_lightweight_task_run_events, flow_run_context)
             stack.enter_context(ConcurrencyContextV1())
             stack.enter_context(ConcurrencyContext())
 
@@ -925,10 +1017,23 @@ class AsyncFlowRunEngine(BaseFlowRunEngine[P, R]):
         # is a State object.
         return await self.state.aresult(raise_on_failure=raise_on_failure)  # type: ignore
 
+    async def handle_result_writes(self) -> Optional[BaseException]:
+        """
+        Wait for the results this flow run persists in the background and crash the
+        task runs whose results could not be written.
+
+        Returns the error of the first failed write, if any.
+        """
+        failed_writes = await await_for_result_writes(self.flow_run.id)
+        await _acrash_task_runs_for_failed_writes(self.client, failed_writes)
+        return failed_writes[0].exception() if failed_writes else None
+
     async def handle_success(self, result: R) -> R:
         result_store = getattr(FlowRunContext.get(), "result_store", None)
         if result_store is None:
             raise ValueError("Result store is not set")
+        if write_error := await self.handle_result_writes():
+            raise write_error
         resolved_result = resolve_futures_to_states(result)
         terminal_state = await return_value_to_state(
             resolved_result,
@@ -948,6 +1053,7 @@ class AsyncFlowRunEngine(BaseFlowRunEngine[P, R]):
         msg: Optional[str] = None,
         result_store: Optional[ResultStore] = None,
     ) -> State:
+        await self.handle_result_writes()
         context = FlowRunContext.get()
         terminal_state = cast(
             State,
@@ -1164,7 +1270,7 @@ class AsyncFlowRunEngine(BaseFlowRunEngine[P, R]):
             if log_prints:
                 stack.enter_context(patch_print())
             task_runner = stack.enter_context(self.flow.task_runner.duplicate())
-            stack.enter_context(
+            flow_run_context = stack.enter_context(
                 FlowRunContext(
                     flow=self.flow,
                     log_prints=log_prints,
@@ -1180,6 +1286,8 @@ class AsyncFlowRunEngine(BaseFlowRunEngine[P, R]):
                     else should_persist_result(),
                 )
             )
+            # lightweight task runs are reported while the flow run context is set
+            stack.callback(emit_lightweight_task_run_events, flow_run_context)
             stack.enter_context(ConcurrencyContextV1())
             stack.enter_context(ConcurrencyContext())
 
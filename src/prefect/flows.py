@@ -42,9 +42,11 @@ from uuid import UUID
 
 import pydantic
 from exceptiongroup import BaseExceptionGroup, ExceptionGroup
+from pydantic.fields import FieldInfo
 from pydantic.v1 import BaseModel as V1BaseModel
 from pydantic.v1.decorator import ValidatedFunction as V1ValidatedFunction
 from pydantic.v1.errors import ConfigError  # TODO
+from pydantic.v1.fields import FieldInfo as V1FieldInfo
 from rich.console import Console
 from typing_extensions import Literal, ParamSpec
 
@@ -104,9 +106,6 @@ from prefect.utilities.importtools import import_object, safe_load_namespace
 from ._internal.compatibility.async_dispatch import async_dispatch, is_in_async_context
 from ._internal.pydantic.v2_schema import is_v2_type
 from ._internal.pydantic.v2_validated_func import V2ValidatedFunction
-from ._internal.pydantic.v2_validated_func import (
-    V2ValidatedFunction as ValidatedFunction,
-)
 
 if TYPE_CHECKING:
     from prefect.workers.base import BaseWorker
@@ -116,6 +115,130 @@ R = TypeVar("R")  # The return type of the user's function
 P = ParamSpec("P")  # The parameters of the flow
 F = TypeVar("F", bound="Flow[Any, Any]")  # The type of the flow
 
+# Types of parameter values that are left unchanged by validation when the value is
+# exactly of its annotated type
+SIMPLE_PARAMETER_TYPES: frozenset[type[Any]] = frozenset({str, bytes, int, float, bool})
+
+# Types of parameter values that are already JSON compatible
+JSON_PARAMETER_TYPES: frozenset[type[Any]] = frozenset(
+    {str, int, float, bool, type(None)}
+)
+
+
+class _ParameterValidation:
+    """
+    The parameter validation of a flow function, which is built from its signature
+    once and then reused for every call of the flow.
+    """
+
+    def __init__(
+        self, fn: Callable[..., Any], annotations: tuple[tuple[str, Any], ...] = ()
+    ):
+        self.annotations = annotations
+        self._validated_functions: dict[
+            bool, Union[V1ValidatedFunction, V2ValidatedFunction]
+        ] = {}
+        self._simple_types, self._required = self._get_simple_types(fn)
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Validated functions are not picklable in some environments, so the
+        # validation is dropped when its function is pickled and rebuilt on first use
+        return (type(None), ())
+
+    @staticmethod
+    def _get_simple_types(
+        fn: Callable[..., Any],
+    ) -> tuple[Optional[dict[str, type[Any]]], frozenset[str]]:
+        """
+        Returns the types of the function's parameters if they are all annotated with
+        simple types and have no pydantic defaults, along with the names of the
+        required parameters.
+        """
+        try:
+            signature = inspect.signature(fn, eval_str=True)
+        except Exception:
+            return None, frozenset()
+
+        simple_types: dict[str, type[Any]] = {}
+        for name, parameter in signature.parameters.items():
+            if (
+                parameter.kind
+                not in (parameter.POSITIONAL_OR_KEYWORD, parameter.KEYWORD_ONLY)
+                or parameter.annotation not in SIMPLE_PARAMETER_TYPES
+                or isinstance(parameter.default, (FieldInfo, V1FieldInfo))
+            ):
+                return None, frozenset()
+            simple_types[name] = parameter.annotation
+
+        required = frozenset(
+            name
+            for name, parameter in signature.parameters.items()
+            if parameter.default is parameter.empty
+        )
+        return simple_types, required
+
+    def validate_simple_parameters(
+        self, parameters: dict[str, Any]
+    ) -> Optional[dict[str, Any]]:
+        """
+        Returns the validated parameters without running validation if every value is
+        exactly of its annotated simple type, or `None` if they must be validated.
+        """
+        simple_types = self._simple_types
+        if (
+            simple_types is None
+            or not self._required <= parameters.keys()
+            or not parameters.keys() <= simple_types.keys()
+        ):
+            return None
+
+        for name, value in parameters.items():
+            if type(value) is not simple_types[name]:
+                return None
+
+        return {name: parameters[name] for name in simple_types if name in parameters}
+
+    def validated_function(
+        self, fn: Callable[..., Any], v1: bool = False
+    ) -> Union[V1ValidatedFunction, V2ValidatedFunction]:
+        """
+        Returns the validated function that casts arguments with pydantic v1 or v2
+        models, creating it on first use.
+        """
+        try:
+            return self._validated_functions[v1]
+        except KeyError:
+            pass
+
+        config = dict(arbitrary_types_allowed=True)
+        validated_fn = (
+            V1ValidatedFunction(fn, config=config)
+            if v1
+            else V2ValidatedFunction(fn, config=config)
+        )
+        self._validated_functions[v1] = validated_fn
+        return validated_fn
+
+
+def get_parameter_validation(fn: Callable[..., Any]) -> _ParameterValidation:
+    """
+    Returns the parameter validation for a flow function.
+
+    Validation is cached on the function itself, along with the annotations it was
+    built from, so that it is rebuilt if they change and released with the function.
+    It cannot be stored on the flow because validated functions are not picklable in
+    some environments.
+    """
+    annotations = tuple(getattr(fn, "__annotations__", {}).items())
+    if not inspect.isfunction(fn):
+        return _ParameterValidation(fn, annotations)
+
+    validation = fn.__dict__.get("__prefect_parameter_validation__")
+    if validation is None or validation.annotations != annotations:
+        validation = _ParameterValidation(fn, annotations)
+        fn.__dict__["__prefect_parameter_validation__"] = validation
+    return validation
+
 
 class FlowStateHook(Protocol, Generic[P, R]):
     """
@@ -193,6 +316,8 @@ class Flow(Generic[P, R]):
         on_cancellation: An optional list of callables to run when the flow enters a cancelling state.
         on_crashed: An optional list of callables to run when the flow enters a crashed state.
         on_running: An optional list of callables to run when the flow enters a running state.
+        lightweight_tasks: If set, tasks called in the flow skip orchestration, as if
+            each task were defined with `lightweight=True`. Defaults to `False`.
     """
 
     # NOTE: These parameters (types, defaults, and docstrings) should be duplicated
@@ -221,6 +346,7 @@ class Flow(Generic[P, R]):
         on_cancellation: Optional[list[FlowStateHook[P, R]]] = None,
         on_crashed: Optional[list[FlowStateHook[P, R]]] = None,
         on_running: Optional[list[FlowStateHook[P, R]]] = None,
+        lightweight_tasks: bool = False,
     ):
         if name is not None and not isinstance(name, str):  # pyright: ignore[reportUnnecessaryIsInstance]
             raise TypeError(
@@ -361,10 +487,8 @@ class Flow(Generic[P, R]):
         if self.should_validate_parameters:
             # Try to create the validated function now so that incompatibility can be
             # raised at declaration time rather than at runtime
-            # We cannot, however, store the validated function on the flow because it
-            # is not picklable in some environments
             try:
-                ValidatedFunction(self.fn, config={"arbitrary_types_allowed": True})
+                get_parameter_validation(self.fn).validated_function(self.fn)
             except ConfigError as exc:
                 raise ValueError(
                     "Flow function is not compatible with `validate_parameters`. "
@@ -391,6 +515,7 @@ class Flow(Generic[P, R]):
         self.on_cancellation_hooks: list[FlowStateHook[P, R]] = on_cancellation or []
         self.on_crashed_hooks: list[FlowStateHook[P, R]] = on_crashed or []
         self.on_running_hooks: list[FlowStateHook[P, R]] = on_running or []
+        self.lightweight_tasks = lightweight_tasks
 
         # Used for flows loaded from remote storage
         self._storage: Optional["RunnerStorage"] = None
@@ -460,6 +585,7 @@ class Flow(Generic[P, R]):
         on_cancellation: Optional[list[FlowStateHook[P, R]]] = None,
         on_crashed: Optional[list[FlowStateHook[P, R]]] = None,
         on_running: Optional[list[FlowStateHook[P, R]]] = None,
+        lightweight_tasks: Optional[bool] = None,
     ) -> "Flow[P, R]":
         """
         Create a new flow from the current object, updating provided options.
@@ -489,6 +615,8 @@ class Flow(Generic[P, R]):
             on_cancellation: A new list of callables to run when the flow enters a cancelling state.
             on_crashed: A new list of callables to run when the flow enters a crashed state.
             on_running: A new list of callables to run when the flow enters a running state.
+            lightweight_tasks: A new value indicating if tasks called in the flow
+                should skip orchestration.
 
         Returns:
             A new `Flow` instance.
@@ -569,6 +697,11 @@ class Flow(Generic[P, R]):
             on_cancellation=on_cancellation or self.on_cancellation_hooks,
             on_crashed=on_crashed or self.on_crashed_hooks,
             on_running=on_running or self.on_running_hooks,
+            lightweight_tasks=(
+                lightweight_tasks
+                if lightweight_tasks is not None
+                else self.lightweight_tasks
+            ),
         )
         new_flow._storage = self._storage
         new_flow._entrypoint = self._entrypoint
@@ -586,6 +719,13 @@ class Flow(Generic[P, R]):
             ParameterTypeError: if the provided parameters are not valid
         """
 
+        parameter_validation = get_parameter_validation(self.fn)
+
+        # Values of simple types cannot be block references or be cast to other values
+        validated = parameter_validation.validate_simple_parameters(parameters)
+        if validated is not None:
+            return validated
+
         def resolve_block_reference(data: Any | dict[str, Any]) -> Any:
             if isinstance(data, dict) and "$ref" in data:
                 return Block.load_from_ref(data["$ref"], _sync=True)
@@ -619,12 +759,9 @@ class Flow(Generic[P, R]):
                 "Cannot mix Pydantic v1 and v2 types as arguments to a flow."
             )
 
-        validated_fn_kwargs = dict(arbitrary_types_allowed=True)
-
-        if has_v1_models:
-            validated_fn = V1ValidatedFunction(self.fn, config=validated_fn_kwargs)
-        else:
-            validated_fn = V2ValidatedFunction(self.fn, config=validated_fn_kwargs)
+        validated_fn = parameter_validation.validated_function(
+            self.fn, v1=has_v1_models
+        )
 
         try:
             with warnings.catch_warnings():
@@ -669,6 +806,9 @@ class Flow(Generic[P, R]):
                 self.fn, "__prefect_cls__", None
             ):
                 continue
+            if type(value) in JSON_PARAMETER_TYPES:
+                serialized_parameters[key] = value
+                continue
             if isinstance(value, (PrefectFuture, State)):
                 # Don't call jsonable_encoder() on a PrefectFuture or State to
                 # avoid triggering a __getitem__ call
@@ -1791,6 +1931,7 @@ class FlowDecorator:
         on_cancellation: Optional[list[FlowStateHook[..., Any]]] = None,
         on_crashed: Optional[list[FlowStateHook[..., Any]]] = None,
         on_running: Optional[list[FlowStateHook[..., Any]]] = None,
+        lightweight_tasks: bool = False,
     ) -> Callable[[Callable[P, R]], Flow[P, R]]: ...
 
     @overload
@@ -1817,6 +1958,7 @@ class FlowDecorator:
         on_cancellation: Optional[list[FlowStateHook[..., Any]]] = None,
         on_crashed: Optional[list[FlowStateHook[..., Any]]] = None,
         on_running: Optional[list[FlowStateHook[..., Any]]] = None,
+        lightweight_tasks: bool = False,
     ) -> Callable[[Callable[P, R]], Flow[P, R]]: ...
 
     def __call__(
@@ -1842,6 +1984,7 @@ class FlowDecorator:
         on_cancellation: Optional[list[FlowStateHook[..., Any]]] = None,
         on_crashed: Optional[list[FlowStateHook[..., Any]]] = None,
         on_running: Optional[list[FlowStateHook[..., Any]]] = None,
+        lightweight_tasks: bool = False,
     ) -> Union[Flow[P, R], Callable[[Callable[P, R]], Flow[P, R]]]:
         """
         Decorator to designate a function as a Prefect workflow.
@@ -1907,6 +2050,8 @@ class FlowDecorator:
                 final state of the flow run.
             on_running: An optional list of functions to call when the flow run is started. Each
                 function should accept three arguments: the flow, the flow run, and the current state
+            lightweight_tasks: If set, tasks called in the flow skip orchestration, as if
+                each task were defined with `lightweight=True`. Defaults to `False`.
 
         Returns:
             A callable `Flow` object which, when called, will run the flow and return its
@@ -1979,6 +2124,7 @@ class FlowDecorator:
                 on_cancellation=on_cancellation,
                 on_crashed=on_crashed,
                 on_running=on_running,
+                lightweight_tasks=lightweight_tasks,
             )
         else:
             return cast(
@@ -2004,6 +2150,7 @@ class FlowDecorator:
                     on_cancellation=on_cancellation,
                     on_crashed=on_crashed,
                     on_running=on_running,
+                    lightweight_tasks=lightweight_tasks,
                 ),
             )
 
@@ -2206,6 +2353,7 @@ class InfrastructureBoundFlow(Flow[P, R]):
         on_cancellation: Optional[list[FlowStateHook[P, R]]] = None,
         on_crashed: Optional[list[FlowStateHook[P, R]]] = None,
         on_running: Optional[list[FlowStateHook[P, R]]] = None,
+        lightweight_tasks: Optional[bool] = None,
         job_variables: Optional[dict[str, Any]] = None,
     ) -> "InfrastructureBoundFlow[P, R]":
         new_flow = super().with_options(
@@ -2228,6 +2376,7 @@ class InfrastructureBoundFlow(Flow[P, R]):
             on_cancellation=on_cancellation,
             on_crashed=on_crashed,
             on_running=on_running,
+            lightweight_tasks=lightweight_tasks,
         )
         new_infrastructure_bound_flow = bind_flow_to_infrastructure(
             new_flow,
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import datetime
 import inspect
 import json
 import logging
@@ -9,7 +10,7 @@ import traceback
 import uuid
 import warnings
 from contextlib import asynccontextmanager
-from typing import TYPE_CHECKING, Any, Dict, TextIO, Type
+from typing import TYPE_CHECKING, Any, Dict, NamedTuple, TextIO, Type, Union
 
 from rich.console import Console
 from rich.highlighter import Highlighter, NullHighlighter
@@ -32,6 +33,7 @@ from prefect.settings import (
     PREFECT_LOGGING_MARKUP,
     PREFECT_LOGGING_TO_API_BATCH_INTERVAL,
     PREFECT_LOGGING_TO_API_BATCH_SIZE,
+    PREFECT_LOGGING_TO_API_COMPRESS,
     PREFECT_LOGGING_TO_API_MAX_LOG_SIZE,
     PREFECT_LOGGING_TO_API_WHEN_MISSING_FLOW,
 )
@@ -49,7 +51,39 @@ if TYPE_CHECKING:
     from prefect.client.schemas.objects import FlowRun, TaskRun
 
 
-class APILogWorker(BatchedQueueService[Dict[str, Any]]):
+def _uuid_or_none(value: Any) -> str | None:
+    """
+    Convert a run identifier to its JSON representation.
+
+    Raises a `ValueError` or `TypeError` if the identifier is not a UUID.
+    """
+    if value is None:
+        return None
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    return str(uuid.UUID(value))
+
+
+def _format_timestamp(timestamp: float) -> str:
+    """
+    Format a POSIX timestamp as it would be serialized by the `LogCreate` schema.
+    """
+    formatted = datetime.datetime.fromtimestamp(
+        timestamp, datetime.timezone.utc
+    ).isoformat()
+    return formatted.replace("+00:00", "Z")
+
+
+class EncodedLog(NamedTuple):
+    """
+    A log encoded as a `LogCreate` JSON payload, with its size in bytes.
+    """
+
+    payload: str
+    size: int
+
+
+class APILogWorker(BatchedQueueService[Union[Dict[str, Any], EncodedLog]]):
     @property
     def max_batch_size(self) -> int:
         return max(
@@ -62,9 +96,16 @@ class APILogWorker(BatchedQueueService[Dict[str, Any]]):
     def min_interval(self) -> float | None:
         return PREFECT_LOGGING_TO_API_BATCH_INTERVAL.value()
 
-    async def _handle_batch(self, items: list[dict[str, Any]]):
+    async def _handle_batch(self, items: list[Union[Dict[str, Any], EncodedLog]]):
+        # Send logs that were encoded by the handler as-is rather than serializing
+        # them again
+        logs = [
+            item.payload if isinstance(item, EncodedLog) else item for item in items
+        ]
         try:
-            await self._client.create_logs(items)
+            await self._client.create_logs(
+                logs, compress=PREFECT_LOGGING_TO_API_COMPRESS.value()
+            )
         except Exception as e:
             # Roughly replicate the behavior of the stdlib logger error handling
             if logging.raiseExceptions and sys.stderr:
@@ -91,7 +132,9 @@ class APILogWorker(BatchedQueueService[Dict[str, Any]]):
         # Ensure a unique worker is retrieved per relevant logging settings
         return super().instance(*settings, *args)
 
-    def _get_size(self, item: Dict[str, Any]) -> int:
+    def _get_size(self, item: Union[Dict[str, Any], EncodedLog]) -> int:
+        if isinstance(item, EncodedLog):
+            return item.size
         return item.pop("__payload_size__", None) or len(json.dumps(item).encode())
 
 
@@ -152,7 +195,8 @@ class APILogHandler(logging.Handler):
             if not getattr(record, "send_to_api", True):
                 return  # Do not send records that have opted out
 
-            log = self.prepare(record)
+            # only the encoded log is queued
+            log = self._encode_log(self._prepare_log(record))
             APILogWorker.instance().send(log)
 
         except Exception:
@@ -192,6 +236,15 @@ class APILogHandler(logging.Handler):
 
         Logs exceeding the maximum size will be dropped.
         """
+        log = self._prepare_log(record)
+        log["__payload_size__"] = self._encode_log(log).size
+        return log
+
+    def _prepare_log(self, record: logging.LogRecord) -> Dict[str, Any]:
+        """
+        Convert a `logging.LogRecord` to the API `LogCreate` schema, inferring the
+        linked flow or task run from the log record or the current run context.
+        """
         flow_run_id = getattr(record, "flow_run_id", None)
         task_run_id = getattr(record, "task_run_id", None)
         worker_id = getattr(record, "worker_id", None)
@@ -221,36 +274,79 @@ class APILogHandler(logging.Handler):
                     "run information."
                 )
 
-        # Parsing to a `LogCreate` object here gives us nice parsing error messages
-        # from the standard lib `handleError` method if something goes wrong and
-        # prevents malformed logs from entering the queue
         if isinstance(flow_run_id, str):
             try:
                 flow_run_id = uuid.UUID(flow_run_id)
             except ValueError:
                 flow_run_id = None
 
-        log = LogCreate(
+        return self._build_log(
+            record,
             flow_run_id=flow_run_id,
             task_run_id=task_run_id,
             worker_id=worker_id,
-            name=record.name,
-            level=record.levelno,
-            timestamp=from_timestamp(getattr(record, "created", None) or time.time()),  # pyright: ignore[reportArgumentType] DateTime is split into two types depending on Python version
-            message=self.format(record),
-        ).model_dump(mode="json")
+        )
 
-        log_size = log["__payload_size__"] = self._get_payload_size(log)
+    def _build_log(
+        self,
+        record: logging.LogRecord,
+        flow_run_id: Any = None,
+        task_run_id: Any = None,
+        worker_id: Any = None,
+    ) -> Dict[str, Any]:
+        """
+        Build the JSON-compatible `LogCreate` payload for a record.
+
+        Records with well-formed run identifiers are converted directly, without
+        validating them with the `LogCreate` schema.
+        """
+        timestamp = getattr(record, "created", None) or time.time()
+        message = self.format(record)
+
+        try:
+            ids = [_uuid_or_none(id_) for id_ in (flow_run_id, task_run_id, worker_id)]
+        except (TypeError, ValueError):
+            # Parsing to a `LogCreate` object here gives us nice parsing error
+            # messages from the standard lib `handleError` method and prevents
+            # malformed logs from entering the queue
+            log = LogCreate(
+                flow_run_id=flow_run_id,
+                task_run_id=task_run_id,
+                worker_id=worker_id,
+                name=record.name,
+                level=record.levelno,
+                timestamp=from_timestamp(timestamp),  # pyright: ignore[reportArgumentType] DateTime is split into two types depending on Python version
+                message=message,
+            ).model_dump(mode="json")
+        else:
+            log = {
+                "name": record.name,
+                "level": record.levelno,
+                "message": message,
+                "timestamp": _format_timestamp(timestamp),
+                "flow_run_id": ids[0],
+                "task_run_id": ids[1],
+            }
+            if ids[2] is not None:
+                log["worker_id"] = ids[2]
+
+        return log
+
+    def _encode_log(self, log: Dict[str, Any]) -> EncodedLog:
+        """
+        Encode a log once, to check its size and to send it to the API as-is.
+
+        Raises a `ValueError` if the log is larger than the maximum log size.
+        """
+        payload = json.dumps(log)
+        # The payload is ASCII-encoded, so its length is its size in bytes
+        log_size = len(payload)
         if log_size > PREFECT_LOGGING_TO_API_MAX_LOG_SIZE.value():
             raise ValueError(
                 f"Log of size {log_size} is greater than the max size of "
                 f"{PREFECT_LOGGING_TO_API_MAX_LOG_SIZE.value()}"
             )
-
-        return log
-
-    def _get_payload_size(self, log: Dict[str, Any]) -> int:
-        return len(json.dumps(log).encode())
+        return EncodedLog(payload, log_size)
 
 
 class WorkerAPILogHandler(APILogHandler):
@@ -262,33 +358,14 @@ class WorkerAPILogHandler(APILogHandler):
             return
         super().emit(record)
 
-    def prepare(self, record: logging.LogRecord) -> Dict[str, Any]:
+    def _prepare_log(self, record: logging.LogRecord) -> Dict[str, Any]:
         """
-        Convert a `logging.LogRecord` to the API `LogCreate` schema and serialize.
+        Convert a `logging.LogRecord` to the API `LogCreate` schema.
 
         This will add in the worker id to the log.
-
-        Logs exceeding the maximum size will be dropped.
         """
 
-        worker_id = getattr(record, "worker_id", None)
-
-        log = LogCreate(
-            worker_id=worker_id,
-            name=record.name,
-            level=record.levelno,
-            timestamp=from_timestamp(getattr(record, "created", None) or time.time()),  # pyright: ignore[reportArgumentType] DateTime is split into two types depending on Python version
-            message=self.format(record),
-        ).model_dump(mode="json")
-
-        log_size = log["__payload_size__"] = self._get_payload_size(log)
-        if log_size > PREFECT_LOGGING_TO_API_MAX_LOG_SIZE.value():
-            raise ValueError(
-                f"Log of size {log_size} is greater than the max size of "
-                f"{PREFECT_LOGGING_TO_API_MAX_LOG_SIZE.value()}"
-            )
-
-        return log
+        return self._build_log(record, worker_id=getattr(record, "worker_id", None))
 
 
 class PrefectConsoleHandler(StreamHandler):
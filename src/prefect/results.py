@@ -3,6 +3,7 @@ from __future__ import annotations
 import asyncio
 import os
 import socket
+import sys
 import threading
 import uuid
 from datetime import datetime
@@ -37,7 +38,13 @@ from prefect._internal.compatibility.async_dispatch import async_dispatch
 from prefect._internal.compatibility.blocks import call_explicitly_async_block_method
 from prefect._internal.compatibility.deprecated import deprecated_callable
 from prefect._internal.concurrency.event_loop import get_running_loop
+from prefect._result_cache import (
+    LocalResultCache,
+    get_local_result_cache,
+    result_checksum,
+)
 from prefect._result_records import R, ResultRecord, ResultRecordMetadata
+from prefect._result_writes import get_pending_result_write
 from prefect.blocks.core import Block
 from prefect.exceptions import (
     ConfigurationError,
@@ -50,7 +57,7 @@ from prefect.filesystems import (
 )
 from prefect.locking.protocol import LockManager
 from prefect.logging import get_logger
-from prefect.serializers import Serializer
+from prefect.serializers import ArrowSerializer, Serializer, is_arrow_payload
 from prefect.settings.context import get_current_settings
 from prefect.types import DateTime
 from prefect.utilities.annotations import NotSet
@@ -290,8 +297,34 @@ def _format_user_supplied_storage_key(key: str) -> str:
 T = TypeVar("T")
 
 
+METADATA_SIDECAR_SUFFIX = ".metadata"
+
+
+def _metadata_sidecar_key(key: str) -> str:
+    """
+    Return the key of the metadata stored next to the result at the given key when
+    no separate metadata storage is configured.
+    """
+    return f"{key}{METADATA_SIDECAR_SUFFIX}"
+
+
+def _result_record_size(result_record: "ResultRecord[Any]") -> int:
+    """
+    Estimate the memory used by a result record from the size of its serialized
+    result.
+    """
+    if result_record.metadata.size is not None:
+        return result_record.metadata.size
+    if not result_record.is_loaded:
+        return 1
+    return max(sys.getsizeof(result_record.result), 1)
+
+
 def default_cache() -> LRUCache[str, "ResultRecord[Any]"]:
-    return LRUCache(maxsize=1000)
+    return LRUCache(
+        maxsize=get_current_settings().results.memory_cache_max_size,
+        getsizeof=_result_record_size,
+    )
 
 
 def result_storage_discriminator(x: Any) -> str:
@@ -315,7 +348,8 @@ class ResultStore(BaseModel):
         result_storage: The storage for result records. If not provided, the default
             result storage will be used.
         metadata_storage: The storage for result record metadata. If not provided,
-            the metadata will be stored alongside the results.
+            the metadata will be stored in a `.metadata` sidecar next to each result
+            in the result storage.
         lock_manager: The lock manager to use for locking result records. If not provided,
             the store cannot be used in transactions with the SERIALIZABLE isolation level.
         cache_result_in_memory: Whether to cache results in memory.
@@ -480,6 +514,8 @@ class ResultStore(BaseModel):
         Returns:
             bool: True if the result record exists, False otherwise.
         """
+        await self._await_pending_write(key)
+
         if self.metadata_storage is not None:
             # TODO: Add an `exists` method to commonly used storage blocks
             # so the entire payload doesn't need to be read
@@ -495,13 +531,16 @@ class ResultStore(BaseModel):
                 return False
         else:
             try:
-                content = await call_explicitly_async_block_method(
-                    self.result_storage, "read_path", (key,), {}
-                )
-                if content is None:
-                    return False
-                record: ResultRecord[Any] = ResultRecord.deserialize(content)
-                metadata = record.metadata
+                metadata = await self._read_metadata_sidecar(key)
+                if metadata is None:
+                    # fall back to the combined layout written by older versions
+                    content = await call_explicitly_async_block_method(
+                        self.result_storage, "read_path", (key,), {}
+                    )
+                    if content is None:
+                        return False
+                    record: ResultRecord[Any] = ResultRecord.deserialize(content)
+                    metadata = record.metadata
             except Exception:
                 return False
 
@@ -537,6 +576,15 @@ class ResultStore(BaseModel):
         """
         return await self._exists(key=key, _sync=False)
 
+    async def _await_pending_write(self, key: str) -> None:
+        """
+        Wait for a write-behind write to the given key to finish so that readers
+        see the result that was committed.
+        """
+        write = get_pending_result_write(self._resolved_key_path(key))
+        if write is not None:
+            await asyncio.wait([asyncio.wrap_future(write.future)])
+
     def _resolved_key_path(self, key: str) -> str:
         if self.result_storage_block_id is None and (
             _resolve_path := getattr(self.result_storage, "_resolve_path", None)
@@ -548,6 +596,80 @@ class ResultStore(BaseModel):
                 return key
         return key
 
+    async def _read_metadata_sidecar(self, key: str) -> ResultRecordMetadata | None:
+        """
+        Read the metadata stored next to the result at the given key.
+
+        Returns `None` if there is no metadata sidecar, e.g. for results written by
+        older versions that store metadata and result together. Any other error
+        reading the sidecar is raised.
+        """
+        try:
+            content = await call_explicitly_async_block_method(
+                self.result_storage, "read_path", (_metadata_sidecar_key(key),), {}
+            )
+        except (FileNotFoundError, ValueError):
+            # `LocalFileSystem` raises a `ValueError` for missing paths
+            return None
+        if content is None:
+            return None
+        return ResultRecordMetadata.load_bytes(content)
+
+    def _lazy_result_record(
+        self, metadata: ResultRecordMetadata
+    ) -> "ResultRecord[Any]":
+        """
+        Create a result record that reads its result from the result storage the
+        first time the result is accessed.
+        """
+        assert metadata.storage_key is not None
+        storage_key = metadata.storage_key
+        result_storage = self.result_storage
+        local_cache = self._local_result_cache() if metadata.checksum else None
+
+        async def load_result() -> Any:
+            if isinstance(metadata.serializer, ArrowSerializer) and (
+                path := self._local_arrow_path(storage_key)
+            ):
+                return metadata.serializer.load_path(path)
+            if local_cache is not None and metadata.checksum is not None:
+                if (content := local_cache.get(metadata.checksum)) is not None:
+                    return metadata.serializer.loads(content)
+            content = await call_explicitly_async_block_method(
+                result_storage, "read_path", (storage_key,), {}
+            )
+            if local_cache is not None:
+                local_cache.put(content)
+            return metadata.serializer.loads(content)
+
+        return ResultRecord.lazy(metadata, load_result)
+
+    def _local_result_cache(self) -> LocalResultCache | None:
+        """
+        Return the local disk cache for results in this store's result storage, if
+        enabled.
+        """
+        # results in a local file system are already on disk
+        if isinstance(self.result_storage, LocalFileSystem):
+            return None
+        return get_local_result_cache()
+
+    def _local_arrow_path(self, key: str) -> Path | None:
+        """
+        Return the local path of the given key if the result storage is a local file
+        system and the file holds an Arrow or Parquet payload that can be
+        memory-mapped.
+        """
+        if not isinstance(self.result_storage, LocalFileSystem):
+            return None
+        path = self.result_storage._resolve_path(key)  # pyright: ignore[reportPrivateUsage]
+        try:
+            with open(path, "rb") as f:
+                head = f.read(6)
+        except OSError:
+            return None
+        return path if is_arrow_payload(head) else None
+
     @sync_compatible
     async def _read(self, key: str, holder: str) -> "ResultRecord[Any]":
         """
@@ -569,6 +691,8 @@ class ResultStore(BaseModel):
         if self.lock_manager is not None and not self.is_lock_holder(key, holder):
             await self.await_for_lock(key)
 
+        await self._await_pending_write(key)
+
         resolved_key_path = self._resolved_key_path(key)
 
         if resolved_key_path in self.cache:
@@ -587,22 +711,23 @@ class ResultStore(BaseModel):
                 {},
             )
             metadata = ResultRecordMetadata.load_bytes(metadata_content)
+        else:
+            metadata = await self._read_metadata_sidecar(key)
+
+        if metadata is not None:
             assert metadata.storage_key is not None, (
                 "Did not find storage key in metadata"
             )
-            result_content = await call_explicitly_async_block_method(
-                self.result_storage,
-                "read_path",
-                (metadata.storage_key,),
-                {},
-            )
-            result_record: ResultRecord[Any] = (
-                ResultRecord.deserialize_from_result_and_metadata(
-                    result=result_content, metadata=metadata_content
-                )
+            result_record: ResultRecord[Any] = self._lazy_result_record(metadata)
+            await emit_result_read_event(self, resolved_key_path)
+        elif path := self._local_arrow_path(key):
+            result_record: ResultRecord[Any] = ResultRecord.deserialize_from_arrow_file(
+                path
             )
+            result_record.metadata.size = path.stat().st_size
             await emit_result_read_event(self, resolved_key_path)
         else:
+            # fall back to the combined layout written by older versions
             content = await call_explicitly_async_block_method(
                 self.result_storage,
                 "read_path",
@@ -612,10 +737,11 @@ class ResultStore(BaseModel):
             result_record: ResultRecord[Any] = ResultRecord.deserialize(
                 content, backup_serializer=self.serializer
             )
+            result_record.metadata.size = len(content)
             await emit_result_read_event(self, resolved_key_path)
 
         if self.cache_result_in_memory:
-            self.cache[resolved_key_path] = result_record
+            self._cache_result_record(resolved_key_path, result_record)
         return result_record
 
     def read(
@@ -789,7 +915,7 @@ class ResultStore(BaseModel):
                 self.result_storage,
                 "write_path",
                 (result_record.metadata.storage_key,),
-                {"content": result_record.serialize_result()},
+                {"content": self._serialize_result(result_record)},
             )
             await call_explicitly_async_block_method(
                 self.metadata_storage,
@@ -798,17 +924,47 @@ class ResultStore(BaseModel):
                 {"content": result_record.serialize_metadata()},
             )
             await emit_result_write_event(self, result_record.metadata.storage_key)
-        # Otherwise, write the result metadata and result together
+        # Otherwise, write the metadata to a sidecar next to the result so it can
+        # be read without reading the result. The result is written first so the
+        # metadata is only visible once the result is available.
         else:
             await call_explicitly_async_block_method(
                 self.result_storage,
                 "write_path",
                 (result_record.metadata.storage_key,),
-                {"content": result_record.serialize()},
+                {"content": self._serialize_result(result_record)},
+            )
+            await call_explicitly_async_block_method(
+                self.result_storage,
+                "write_path",
+                (_metadata_sidecar_key(result_record.metadata.storage_key),),
+                {"content": result_record.serialize_metadata()},
             )
             await emit_result_write_event(self, result_record.metadata.storage_key)
         if self.cache_result_in_memory:
+            self._cache_result_record(key, result_record)
+
+    def _cache_result_record(
+        self, key: str, result_record: "ResultRecord[Any]"
+    ) -> None:
+        try:
             self.cache[key] = result_record
+        except ValueError:
+            # the record is larger than the whole cache
+            self.cache.pop(key, None)
+
+    def _serialize_result(self, result_record: "ResultRecord[Any]") -> bytes:
+        """
+        Serialize the result of a record that is stored separately from its
+        metadata, recording its checksum in the metadata and adding it to the local
+        result cache.
+        """
+        content = result_record.serialize_result()
+        result_record.metadata.checksum = result_checksum(content)
+        result_record.metadata.size = len(content)
+        if local_cache := self._local_result_cache():
+            local_cache.put(content)
+        return content
 
     def persist_result_record(
         self, result_record: "ResultRecord[Any]", holder: str | None = None
@@ -13,7 +13,19 @@ bytes to an object respectively.
 
 import base64
 import io
-from typing import Any, ClassVar, Generic, Optional, Union, overload
+import json
+import sys
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    ClassVar,
+    Generic,
+    Literal,
+    Optional,
+    Union,
+    overload,
+)
 
 from pydantic import (
     BaseModel,
@@ -36,10 +48,21 @@ from prefect.utilities.dispatch import get_dispatch_key, lookup_type, register_b
 from prefect.utilities.importtools import from_qualified_name, to_qualified_name
 from prefect.utilities.pydantic import custom_pydantic_encoder
 
+if TYPE_CHECKING:
+    import pyarrow
+
 D = TypeVar("D", default=Any)
 
 _TYPE_ADAPTER_CACHE: dict[str, TypeAdapter[Any]] = {}
 
+# Keys used in the Arrow schema metadata written by the `ArrowSerializer`
+ARROW_KIND_KEY = b"prefect.kind"
+ARROW_SHAPE_KEY = b"prefect.shape"
+ARROW_RESULT_RECORD_METADATA_KEY = b"prefect.result_record_metadata"
+
+_ARROW_IPC_MAGIC = b"ARROW1"
+_PARQUET_MAGIC = b"PAR1"
+
 
 def prefect_json_object_encoder(obj: Any) -> Any:
     """
@@ -280,3 +303,180 @@ class CompressedJSONSerializer(CompressedSerializer[D]):
     type: str = Field(default="compressed/json", frozen=True)
 
     serializer: Serializer[D] = Field(default_factory=JSONSerializer)
+
+
+def _import_pyarrow() -> Any:
+    try:
+        import pyarrow
+    except ImportError as exc:
+        raise ImportError(
+            "`pyarrow` must be installed to use the `ArrowSerializer`. "
+            "You can install it with `pip install pyarrow`"
+        ) from exc
+    return pyarrow
+
+
+def is_arrow_payload(blob: bytes) -> bool:
+    """
+    Check if the given bytes start with the magic bytes of an Arrow IPC file or a
+    Parquet file.
+    """
+    return blob[:6] == _ARROW_IPC_MAGIC or blob[:4] == _PARQUET_MAGIC
+
+
+class ArrowSerializer(Serializer[D]):
+    """
+    Serializes tabular data using Apache Arrow.
+
+    Supports `pyarrow` tables and record batches, pandas and polars data frames, and
+    numpy arrays. Data is written in the Arrow IPC (Feather V2) file format by default
+    or as Parquet. Arrow IPC data is read without copying its buffers, and data stored
+    on a local file system can be memory-mapped with `load_path`.
+
+    Requires `pyarrow` to be installed.
+
+    Attributes:
+        format: The file format to write, either "ipc" or "parquet".
+        compression: An optional compression codec. Arrow IPC supports "lz4" and
+            "zstd"; Parquet supports codecs such as "snappy", "gzip" and "zstd".
+            Compressed IPC data must be decompressed when read.
+    """
+
+    type: str = Field(default="arrow", frozen=True)
+
+    format: Literal["ipc", "parquet"] = "ipc"
+    compression: Optional[str] = None
+
+    def dumps(self, obj: D) -> bytes:
+        return self.dumps_with_metadata(obj)
+
+    def dumps_with_metadata(self, obj: D, metadata: Optional[bytes] = None) -> bytes:
+        """
+        Encode the object into a blob of bytes, storing the given metadata in the
+        schema metadata of the written file.
+        """
+        pa = _import_pyarrow()
+        table = self._to_table(obj)
+        if metadata is not None:
+            table = table.replace_schema_metadata(
+                {
+                    **(table.schema.metadata or {}),
+                    ARROW_RESULT_RECORD_METADATA_KEY: metadata,
+                }
+            )
+
+        sink = pa.BufferOutputStream()
+        if self.format == "parquet":
+            import pyarrow.parquet as pq
+
+            pq.write_table(table, sink, compression=self.compression or "none")
+        else:
+            options = pa.ipc.IpcWriteOptions(compression=self.compression)
+            with pa.ipc.new_file(sink, table.schema, options=options) as writer:
+                writer.write_table(table)
+        return sink.getvalue().to_pybytes()
+
+    def loads(self, blob: bytes) -> D:
+        pa = _import_pyarrow()
+        return self._from_table(self._read_table(pa.BufferReader(blob)))
+
+    def load_path(self, path: Union[str, Path]) -> D:
+        """
+        Decode the object stored in the file at the given local path.
+
+        The file is memory-mapped so the buffers of the returned data are backed by
+        the file rather than copied into memory.
+        """
+        pa = _import_pyarrow()
+        return self._from_table(self._read_table(pa.memory_map(str(path), "r")))
+
+    @staticmethod
+    def read_result_record_metadata(source: Union[bytes, Path]) -> Optional[bytes]:
+        """
+        Read the metadata stored alongside the data by `dumps_with_metadata` without
+        reading the data itself.
+        """
+        pa = _import_pyarrow()
+        reader = (
+            pa.BufferReader(source)
+            if isinstance(source, bytes)
+            else pa.memory_map(str(source), "r")
+        )
+        if ArrowSerializer._is_parquet(reader):
+            import pyarrow.parquet as pq
+
+            schema = pq.read_schema(reader)
+        else:
+            schema = pa.ipc.open_file(reader).schema
+        return (schema.metadata or {}).get(ARROW_RESULT_RECORD_METADATA_KEY)
+
+    @staticmethod
+    def _is_parquet(reader: "pyarrow.NativeFile") -> bool:
+        head = reader.read(4)
+        reader.seek(0)
+        return head == _PARQUET_MAGIC
+
+    @staticmethod
+    def _read_table(reader: "pyarrow.NativeFile") -> "pyarrow.Table":
+        pa = _import_pyarrow()
+        if ArrowSerializer._is_parquet(reader):
+            import pyarrow.parquet as pq
+
+            return pq.read_table(reader)
+        return pa.ipc.open_file(reader).read_all()
+
+    @staticmethod
+    def _to_table(obj: Any) -> "pyarrow.Table":
+        pa = _import_pyarrow()
+        metadata: dict[bytes, bytes] = {}
+        module = type(obj).__module__.split(".")[0]
+
+        if isinstance(obj, pa.Table):
+            table, kind = obj, "arrow"
+        elif isinstance(obj, pa.RecordBatch):
+            table, kind = pa.Table.from_batches([obj]), "arrow"
+        elif module == "pandas" and type(obj).__name__ == "DataFrame":
+            table, kind = pa.Table.from_pandas(obj), "pandas"
+        elif module == "polars" and type(obj).__name__ == "DataFrame":
+            table, kind = obj.to_arrow(), "polars"
+        elif (np := sys.modules.get("numpy")) is not None and isinstance(
+            obj, np.ndarray
+        ):
+            # arrays are stored as a single flat column, reshaped when read
+            table = pa.table({"values": pa.array(obj.reshape(-1))})
+            kind = "numpy"
+            metadata[ARROW_SHAPE_KEY] = json.dumps(list(obj.shape)).encode()
+        else:
+            raise TypeError(
+                "The Arrow serializer supports pyarrow tables, pandas and polars "
+                f"data frames, and numpy arrays. Got {type(obj).__name__!r}."
+            )
+
+        metadata[ARROW_KIND_KEY] = kind.encode()
+        return table.replace_schema_metadata(
+            {**(table.schema.metadata or {}), **metadata}
+        )
+
+    @staticmethod
+    def _from_table(table: "pyarrow.Table") -> Any:
+        metadata = dict(table.schema.metadata or {})
+        kind = metadata.pop(ARROW_KIND_KEY, b"arrow").decode()
+        shape = metadata.pop(ARROW_SHAPE_KEY, None)
+        metadata.pop(ARROW_RESULT_RECORD_METADATA_KEY, None)
+        table = table.replace_schema_metadata(metadata or None)
+
+        if kind == "pandas":
+            return table.to_pandas()
+        elif kind == "polars":
+            import polars
+
+            return polars.from_arrow(table)
+        elif kind == "numpy":
+            column = table.column("values")
+            values = (
+                column.chunk(0).to_numpy(zero_copy_only=False)
+                if column.num_chunks == 1
+                else column.to_numpy()
+            )
+            return values.reshape(json.loads(shape)) if shape else values
+        return table
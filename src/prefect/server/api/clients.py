@@ -1,21 +1,43 @@
 from __future__ import annotations
 
 import base64
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+import inspect
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, List, Optional
 from urllib.parse import quote
 from uuid import UUID
 
 import httpx
 import pydantic
+import sqlalchemy as sa
+from fastapi import HTTPException
+from fastapi.encoders import jsonable_encoder
+from fastapi.exception_handlers import http_exception_handler
 from httpx import Response
 from starlette import status
+from starlette.responses import Response as StarletteResponse
 from typing_extensions import Self
 
 from prefect.client.base import PrefectHttpxAsyncClient
 from prefect.exceptions import ObjectNotFound
 from prefect.logging import get_logger
-from prefect.server.schemas.actions import DeploymentFlowRunCreate, StateCreate
-from prefect.server.schemas.core import WorkPool
+from prefect.server.api import (
+    dependencies,
+    deployments,
+    flow_runs,
+    work_queues,
+    workers,
+)
+from prefect.server.api.workers import WorkerLookups
+from prefect.server.database import provide_database_interface
+from prefect.server.exceptions import ObjectNotFoundError
+from prefect.server.orchestration import dependencies as orchestration_dependencies
+from prefect.server.schemas.actions import (
+    DeploymentFlowRunCreate,
+    StateCreate,
+    WorkPoolUpdate,
+    WorkQueueUpdate,
+)
+from prefect.server.schemas.core import CreatedBy, WorkPool
 from prefect.server.schemas.filters import VariableFilter, VariableFilterName
 from prefect.server.schemas.responses import DeploymentResponse, OrchestrationResult
 from prefect.settings import get_current_settings
@@ -223,6 +245,148 @@ class OrchestrationClient(BaseClient):
         )
 
 
+class InProcessOrchestrationClient(OrchestrationClient):
+    """
+    An `OrchestrationClient` that performs its writes by calling the API's route
+    functions directly instead of sending requests through the ASGI application.
+
+    This skips request serialization, the middleware stack, and routing for each call, while
+    the route functions still apply the same validation and orchestration rules.
+    Provenance is derived from the same automation headers that the HTTP client sends,
+    and errors are converted to responses by the server's own exception handlers, so
+    callers receive the same `Response` they would have received over HTTP.  Reads
+    continue to go through the ASGI application.
+    """
+
+    def __init__(self, additional_headers: dict[str, str] | None = None):
+        super().__init__(additional_headers=additional_headers)
+        headers = self._http_client.headers
+        self._created_by: Optional[CreatedBy] = dependencies.get_created_by(
+            prefect_automation_id=headers.get("Prefect-Automation-ID"),
+            prefect_automation_name=headers.get("Prefect-Automation-Name"),
+        )
+
+    async def _call(
+        self,
+        method: str,
+        path: str,
+        endpoint: Callable[..., Awaitable[Any]],
+        status_code: int = status.HTTP_200_OK,
+        **kwargs: Any,
+    ) -> Response:
+        from prefect.server.api.server import (
+            custom_internal_exception_handler,
+            integrity_exception_handler,
+            prefect_object_not_found_exception_handler,
+        )
+
+        request = self._http_client.build_request(method, path)
+        outgoing = StarletteResponse(status_code=status_code)
+
+        if "response" in inspect.signature(endpoint).parameters:
+            kwargs["response"] = outgoing
+
+        try:
+            result = await endpoint(db=provide_database_interface(), **kwargs)
+        except HTTPException as exc:
+            error = await http_exception_handler(None, exc)  # type: ignore[arg-type]
+        except ObjectNotFoundError as exc:
+            error = await prefect_object_not_found_exception_handler(None, exc)  # type: ignore[arg-type]
+        except sa.exc.IntegrityError as exc:
+            error = await integrity_exception_handler(None, exc)  # type: ignore[arg-type]
+        except Exception as exc:
+            error = await custom_internal_exception_handler(None, exc)  # type: ignore[arg-type]
+        else:
+            if result is None:
+                return Response(outgoing.status_code, request=request)
+            return Response(
+                outgoing.status_code, json=jsonable_encoder(result), request=request
+            )
+
+        return Response(error.status_code, content=error.body, request=request)
+
+    async def create_flow_run(
+        self, deployment_id: UUID, flow_run_create: DeploymentFlowRunCreate
+    ) -> Response:
+        return await self._call(
+            "POST",
+            f"/deployments/{deployment_id}/create_flow_run",
+            deployments.create_flow_run_from_deployment,
+            flow_run=flow_run_create,
+            deployment_id=deployment_id,
+            created_by=self._created_by,
+            worker_lookups=WorkerLookups(),
+        )
+
+    async def pause_deployment(self, deployment_id: UUID) -> Response:
+        return await self._call(
+            "POST",
+            f"/deployments/{deployment_id}/pause_deployment",
+            deployments.pause_deployment,
+            deployment_id=deployment_id,
+        )
+
+    async def resume_deployment(self, deployment_id: UUID) -> Response:
+        return await self._call(
+            "POST",
+            f"/deployments/{deployment_id}/resume_deployment",
+            deployments.resume_deployment,
+            deployment_id=deployment_id,
+        )
+
+    async def set_flow_run_state(
+        self, flow_run_id: UUID, state: StateCreate
+    ) -> Response:
+        return await self._call(
+            "POST",
+            f"/flow_runs/{flow_run_id}/set_state",
+            flow_runs.set_flow_run_state,
+            flow_run_id=flow_run_id,
+            state=state,
+            force=False,
+            flow_policy=await orchestration_dependencies.provide_flow_policy(),
+            orchestration_parameters=(
+                await orchestration_dependencies.provide_flow_orchestration_parameters()
+            ),
+            api_version=None,
+        )
+
+    async def pause_work_pool(self, work_pool_name: str) -> Response:
+        return await self._update_work_pool(work_pool_name, is_paused=True)
+
+    async def resume_work_pool(self, work_pool_name: str) -> Response:
+        return await self._update_work_pool(work_pool_name, is_paused=False)
+
+    async def _update_work_pool(self, work_pool_name: str, is_paused: bool) -> Response:
+        return await self._call(
+            "PATCH",
+            f"/work_pools/{quote(work_pool_name)}",
+            workers.update_work_pool,
+            status_code=status.HTTP_204_NO_CONTENT,
+            work_pool=WorkPoolUpdate(is_paused=is_paused),
+            work_pool_name=work_pool_name,
+            worker_lookups=WorkerLookups(),
+        )
+
+    async def pause_work_queue(self, work_queue_id: UUID) -> Response:
+        return await self._update_work_queue(work_queue_id, is_paused=True)
+
+    async def resume_work_queue(self, work_queue_id: UUID) -> Response:
+        return await self._update_work_queue(work_queue_id, is_paused=False)
+
+    async def _update_work_queue(
+        self, work_queue_id: UUID, is_paused: bool
+    ) -> Response:
+        return await self._call(
+            "PATCH",
+            f"/work_queues/{work_queue_id}",
+            work_queues.update_work_queue,
+            status_code=status.HTTP_204_NO_CONTENT,
+            work_queue=WorkQueueUpdate(is_paused=is_paused),
+            work_queue_id=work_queue_id,
+        )
+
+
 class WorkPoolsOrchestrationClient(BaseClient):
     async def __aenter__(self) -> Self:
         return self
@@ -14,6 +14,7 @@ from starlette.background import BackgroundTasks
 import prefect.server.api.dependencies as dependencies
 import prefect.server.models as models
 import prefect.server.schemas as schemas
+from prefect.server.api import read_cache
 from prefect.server.api.validation import (
     validate_job_variables_for_deployment,
     validate_job_variables_for_deployment_flow_run,
@@ -397,17 +398,34 @@ async def read_deployment(
     """
     Get a deployment by id.
     """
-    async with db.session_context() as session:
-        deployment = await models.deployments.read_deployment(
-            session=session, deployment_id=deployment_id
-        )
-        if not deployment:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND, detail="Deployment not found"
+
+    async def read_deployment() -> Optional[schemas.responses.DeploymentResponse]:
+        async with db.session_context() as session:
+            deployment = await models.deployments.read_deployment(
+                session=session, deployment_id=deployment_id
             )
-        return schemas.responses.DeploymentResponse.model_validate(
-            deployment, from_attributes=True
+            if not deployment:
+                return None
+            return schemas.responses.DeploymentResponse.model_validate(
+                deployment, from_attributes=True
+            )
+
+    deployment = await read_cache.read_through(
+        ("read_deployment", deployment_id),
+        [
+            "deployment",
+            "deployment_schedule",
+            "concurrency_limit_v2",
+            "work_queue",
+            "work_pool",
+        ],
+        read_deployment,
+    )
+    if not deployment:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Deployment not found"
         )
+    return deployment
 
 
 @router.post("/filter")
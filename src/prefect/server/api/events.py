@@ -202,7 +202,7 @@ async def read_events(
     results).
     """
     filter = filter or EventFilter()
-    async with db.session_context() as session:
+    async with db.read_only_session_context() as session:
         events, total, next_token = await database.query_events(
             session=session,
             filter=filter,
@@ -228,7 +228,7 @@ async def read_account_events_page(
     Returns the next page of Events for a previous query against the given Account, and
     the URL to request the next page (if there are more results).
     """
-    async with db.session_context() as session:
+    async with db.read_only_session_context() as session:
         try:
             events, total, next_token = await database.query_next_page(
                 session=session, page_token=page_token
@@ -272,7 +272,7 @@ async def count_account_events(
     that can be counted include the day the event occurred, the type of event, or
     the IDs of the resources associated with the event.
     """
-    async with db.session_context() as session:
+    async with db.read_only_session_context() as session:
         return await handle_event_count_request(
             session=session,
             filter=filter,
@@ -192,7 +192,7 @@ async def count_flow_runs(
     """
     Query for flow runs.
     """
-    async with db.session_context() as session:
+    async with db.read_only_session_context() as session:
         return await models.flow_runs.count_flow_runs(
             session=session,
             flow_filter=flows,
@@ -300,7 +300,7 @@ async def flow_run_history(
             detail="History interval must not be less than 1 second.",
         )
 
-    async with db.session_context() as session:
+    async with db.read_only_session_context() as session:
         return await run_history(
             session=session,
             run_type="flow_run",
@@ -541,7 +541,7 @@ async def read_flow_runs(
     """
     Query for flow runs.
     """
-    async with db.session_context() as session:
+    async with db.read_only_session_context() as session:
         db_flow_runs = await models.flow_runs.read_flow_runs(
             session=session,
             flow_filter=flows,
@@ -761,7 +761,7 @@ async def paginate_flow_runs(
     """
     offset = (page - 1) * limit
 
-    async with db.session_context() as session:
+    async with db.read_only_session_context() as session:
         runs = await models.flow_runs.read_flow_runs(
             session=session,
             flow_filter=flows,
@@ -1,4 +1,5 @@
-from typing import Awaitable, Callable
+import zlib
+from typing import Any, Awaitable, Callable
 
 from fastapi import status
 from starlette.middleware.base import BaseHTTPMiddleware
@@ -8,6 +9,7 @@ from starlette.responses import JSONResponse, Response
 from prefect import settings
 from prefect.server import models
 from prefect.server.database import provide_database_interface
+from prefect.utilities.asyncutils import run_sync_in_worker_thread
 
 NextMiddlewareFunction = Callable[[Request], Awaitable[Response]]
 
@@ -71,3 +73,120 @@ class CsrfMiddleware(BaseHTTPMiddleware):
                     )
 
         return await call_next(request)
+
+
+class RequestBodyTooLarge(Exception):
+    """
+    Raised when a decompressed request body is larger than allowed.
+    """
+
+
+class GZipRequestMiddleware:
+    """
+    Middleware that decompresses the bodies of requests sent with a
+    `Content-Encoding: gzip` header, such as batches of logs sent by clients with
+    `PREFECT_LOGGING_TO_API_COMPRESS` enabled.
+
+    Only requests to the given paths are decompressed, and bodies that are larger
+    than `max_body_size` once decompressed are rejected with a 413 status code.
+    """
+
+    # compressed bodies larger than this are decompressed on a worker thread, so
+    # that they don't block the event loop
+    WORKER_THREAD_THRESHOLD = 256 * 1024
+
+    def __init__(
+        self,
+        app: Any,
+        paths: tuple[str, ...] = ("/logs/",),
+        max_body_size: int = 64 * 1024 * 1024,
+    ):
+        self.app = app
+        self.paths = paths
+        self.max_body_size = max_body_size
+
+    async def __call__(self, scope: Any, receive: Any, send: Any) -> None:
+        if (
+            scope["type"] != "http"
+            or not scope["path"].endswith(self.paths)
+            or not any(
+                name == b"content-encoding" and value.strip().lower() == b"gzip"
+                for name, value in scope["headers"]
+            )
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        try:
+            compressed = await self._read_body(receive)
+            if len(compressed) > self.WORKER_THREAD_THRESHOLD:
+                body = await run_sync_in_worker_thread(self._decompress, compressed)
+            else:
+                body = self._decompress(compressed)
+        except RequestBodyTooLarge:
+            response = JSONResponse(
+                {"detail": "Request body is too large."},
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            )
+            await response(scope, receive, send)
+            return
+        except (OSError, EOFError, zlib.error):
+            response = JSONResponse(
+                {"detail": "Invalid gzip-encoded request body."},
+                status_code=status.HTTP_400_BAD_REQUEST,
+            )
+            await response(scope, receive, send)
+            return
+
+        headers = [
+            (name, value)
+            for name, value in scope["headers"]
+            if name not in (b"content-encoding", b"content-length")
+        ]
+        headers.append((b"content-length", str(len(body)).encode()))
+
+        body_sent = False
+
+        async def receive_decompressed() -> Any:
+            nonlocal body_sent
+            if body_sent:
+                return await receive()
+            body_sent = True
+            return {"type": "http.request", "body": body, "more_body": False}
+
+        await self.app({**scope, "headers": headers}, receive_decompressed, send)
+
+    async def _read_body(self, receive: Any) -> bytes:
+        chunks: list[bytes] = []
+        size = 0
+        more_body = True
+        while more_body:
+            message = await receive()
+            chunk = message.get("body", b"")
+            size += len(chunk)
+            if size > self.max_body_size:
+                raise RequestBodyTooLarge()
+            chunks.append(chunk)
+            more_body = message.get("more_body", False)
+        return b"".join(chunks)
+
+    def _decompress(self, compressed: bytes) -> bytes:
+        """
+        Decompresses a gzip-encoded body, which may have several members, without
+        ever holding more than `max_body_size` bytes of output.
+        """
+        body = bytearray()
+        remaining = compressed
+        while remaining:
+            decompressor = zlib.decompressobj(wbits=16 + zlib.MAX_WBITS)
+            body += decompressor.decompress(
+                remaining, self.max_body_size + 1 - len(body)
+            )
+            if len(body) > self.max_body_size or decompressor.unconsumed_tail:
+                raise RequestBodyTooLarge()
+            if not decompressor.eof:
+                raise EOFError(
+                    "Compressed request body ended before the end-of-stream marker"
+                )
+            remaining = decompressor.unused_data
+        return bytes(body)
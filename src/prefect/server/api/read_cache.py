@@ -0,0 +1,143 @@
+"""
+A short-lived, in-process cache for the results of hot read endpoints.
+
+Results are cached under the endpoint's normalized arguments together with the write
+generation of each table they are read from.  Committing a session that wrote to one
+of those tables advances the table's generation, so that later reads miss the cache
+and query the database again.  Writes made by another process can't be seen this
+way, so caching is disabled unless `PREFECT_SERVER_API_READ_CACHE_TTL` is set, and
+cached results expire after that many seconds.
+
+Identical reads that arrive while one is already querying the database wait for its
+result instead of running the same query again, even when caching is disabled.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from functools import partial
+from typing import Any, Awaitable, Callable, Hashable, Iterable, TypeVar
+
+import sqlalchemy as sa
+from cachetools import LRUCache
+from sqlalchemy.orm import ORMExecuteState, Session, UOWTransaction
+
+from prefect.settings import get_current_settings
+
+T = TypeVar("T")
+
+# the most results that are cached at once
+MAX_CACHED_RESULTS = 2000
+
+# the generation of writes to tables that could not be identified, which every
+# cached result depends on
+ANY_TABLE = "*"
+
+# the key in `Session.info` for the tables a session's transaction has written to
+_WRITTEN_TABLES = "prefect_read_cache_written_tables"
+
+_generations: dict[str, int] = {}
+_results: LRUCache[Hashable, tuple[float, Any]] = LRUCache(maxsize=MAX_CACHED_RESULTS)
+_in_flight: dict[Hashable, asyncio.Future[Any]] = {}
+
+
+async def read_through(
+    key: Hashable, tables: Iterable[str], read: Callable[[], Awaitable[T]]
+) -> T:
+    """
+    Returns the cached result of a read, or performs it.
+
+    Args:
+        key: identifies the read, such as the endpoint's name and its normalized
+            arguments
+        tables: the names of the tables the result is read from
+        read: performs the read; its result must not be modified by callers, since it
+            may be shared with other requests
+
+    Returns:
+        the result of the read
+    """
+    cache_key = (key, *_current_generations(tables))
+
+    ttl = get_current_settings().server.api.read_cache_ttl
+    if ttl > 0 and (cached := _results.get(cache_key)) is not None:
+        expires, result = cached
+        if time.monotonic() < expires:
+            return result
+        _results.pop(cache_key, None)
+
+    future = _in_flight.get(cache_key)
+    if future is None or future.get_loop() is not asyncio.get_running_loop():
+        future = asyncio.ensure_future(read())
+        _in_flight[cache_key] = future
+        future.add_done_callback(partial(_finish_read, cache_key, ttl))
+
+    # a request that is cancelled must not cancel the read for the others
+    return await asyncio.shield(future)
+
+
+def invalidate(*tables: str) -> None:
+    """
+    Advances the write generation of the given tables, so that cached results read
+    from them are no longer used.  Pass `ANY_TABLE` to invalidate every result.
+    """
+    for table in tables:
+        _generations[table] = _generations.get(table, 0) + 1
+
+
+def _current_generations(tables: Iterable[str]) -> tuple[tuple[str, int], ...]:
+    return tuple(
+        (table, _generations.get(table, 0))
+        for table in (*sorted(set(tables)), ANY_TABLE)
+    )
+
+
+def _finish_read(cache_key: Hashable, ttl: float, future: asyncio.Future[Any]) -> None:
+    if _in_flight.get(cache_key) is future:
+        del _in_flight[cache_key]
+
+    if future.cancelled() or future.exception() is not None:
+        return
+
+    # a result read before a write was committed is cached under the old generation,
+    # where later reads will not find it
+    if ttl > 0:
+        _results[cache_key] = (time.monotonic() + ttl, future.result())
+
+
+def _record_written_tables(session: Session, tables: Iterable[str]) -> None:
+    session.info.setdefault(_WRITTEN_TABLES, set()).update(tables)
+
+
+@sa.event.listens_for(Session, "do_orm_execute")
+def _record_statement_writes(orm_execute_state: ORMExecuteState) -> None:
+    if not (
+        orm_execute_state.is_insert
+        or orm_execute_state.is_update
+        or orm_execute_state.is_delete
+    ):
+        return
+
+    name = getattr(getattr(orm_execute_state.statement, "table", None), "name", None)
+    _record_written_tables(
+        orm_execute_state.session, [name if isinstance(name, str) else ANY_TABLE]
+    )
+
+
+@sa.event.listens_for(Session, "after_flush")
+def _record_flushed_writes(session: Session, flush_context: UOWTransaction) -> None:
+    _record_written_tables(
+        session,
+        {
+            sa.inspect(instance).mapper.local_table.name
+            for instance in (*session.new, *session.dirty, *session.deleted)
+        },
+    )
+
+
+@sa.event.listens_for(Session, "after_commit")
+@sa.event.listens_for(Session, "after_rollback")
+def _invalidate_written_tables(session: Session) -> None:
+    if tables := session.info.pop(_WRITTEN_TABLES, None):
+        invalidate(*tables)
@@ -4,6 +4,7 @@ Utilities for querying flow and task run history.
 
 import datetime
 import json
+import math
 from typing import TYPE_CHECKING, List, Optional
 
 import pydantic
@@ -58,6 +59,48 @@ async def run_history(
             f"Unknown run type {run_type!r}. Expected 'flow_run' or 'task_run'."
         )
 
+    # Runs in terminal states are counted from the run history buckets when the
+    # filters allow, leaving only other runs and those in buckets that are split
+    # between intervals to be scanned
+    bucketed: Optional[list[list[schemas.responses.HistoryResponseState]]] = None
+    if history_end > history_start and models.run_history_buckets.answers_filters(
+        history_interval,
+        flows,
+        flow_runs,
+        task_runs,
+        deployments,
+        work_pools,
+        work_queues,
+    ):
+        interval_count = min(
+            math.ceil(
+                (history_end - history_start).total_seconds()
+                / history_interval.total_seconds()
+            ),
+            500,
+        )
+        unbucketed = models.run_history_buckets.unbucketed_ranges(
+            history_start, history_interval, interval_count
+        )
+        bucketed = await models.run_history_buckets.read_interval_counts(
+            session,
+            run_type,
+            "expected_start_time",
+            history_start,
+            history_interval,
+            interval_count,
+            unbucketed,
+        )
+        runs_criteria = sa.or_(
+            run_model.state_type.is_(None),
+            run_model.state_type.not_in(schemas.states.TERMINAL_STATES),
+            models.run_history_buckets.in_ranges(
+                run_model.expected_start_time, unbucketed
+            ),
+        )
+    else:
+        runs_criteria = sa.true()
+
     # create a CTE for timestamp intervals
     intervals = db.queries.make_timestamp_intervals(
         history_start,
@@ -76,7 +119,9 @@ async def run_history(
                 run_model.estimated_start_time_delta,
                 run_model.state_type,
                 run_model.state_name,
-            ).select_from(run_model),
+            )
+            .select_from(run_model)
+            .where(runs_criteria),
             flow_filter=flows,
             flow_run_filter=flow_runs,
             task_run_filter=task_runs,
@@ -165,6 +210,14 @@ async def run_history(
         for r in records:
             r["states"] = json.loads(r["states"])
 
-    return pydantic.TypeAdapter(
+    history = pydantic.TypeAdapter(
         List[schemas.responses.HistoryResponse]
     ).validate_python(records)
+
+    if bucketed is not None:
+        for interval, bucketed_states in zip(history, bucketed):
+            interval.states = models.run_history_buckets.merge_states(
+                interval.states, bucketed_states
+            )
+
+    return history
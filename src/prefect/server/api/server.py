@@ -12,6 +12,7 @@ import gc
 import mimetypes
 import os
 import random
+import select
 import shutil
 import socket
 import sqlite3
@@ -60,6 +61,7 @@ from prefect.settings import (
     PREFECT_UI_SERVE_BASE,
     get_current_settings,
 )
+from prefect.utilities.asyncutils import run_sync_in_worker_thread
 from prefect.utilities.hashing import hash_objects
 
 if os.environ.get("PREFECT_LOGFIRE_ENABLED"):
@@ -78,6 +80,8 @@ else:
 if TYPE_CHECKING:
     import logging
 
+    from prefect.server.database.templates import SQLiteTemplate
+
 TITLE = "Prefect Server"
 API_TITLE = "Prefect Prefect REST API"
 UI_TITLE = "Prefect Prefect REST API UI"
@@ -347,6 +351,7 @@ def create_api_app(
         logfire.instrument_fastapi(api_app)  # pyright: ignore
 
     api_app.add_middleware(GZipMiddleware)
+    api_app.add_middleware(api.middleware.GZipRequestMiddleware)
 
     @api_app.get(health_check_path, tags=["Root"])
     async def health_check() -> bool:  # type: ignore[reportUnusedFunction]
@@ -503,6 +508,25 @@ def create_ui_app(ephemeral: bool) -> FastAPI:
 
 APP_CACHE: dict[tuple[prefect.settings.Settings, bool], FastAPI] = {}
 
+# The file descriptor of a pipe used to tell a parent process that a subprocess
+# server is ready to serve requests
+READY_FD_ENV_VAR = "PREFECT__SERVER_READY_FD"
+
+
+def _notify_ready() -> None:
+    """
+    Signal readiness to the process that started this server, if it asked for it.
+    """
+    ready_fd = os.environ.pop(READY_FD_ENV_VAR, None)
+    if ready_fd is None:
+        return
+
+    try:
+        os.write(int(ready_fd), b"1")
+        os.close(int(ready_fd))
+    except (OSError, ValueError) as exc:
+        logger.debug("Unable to signal readiness: %r", exc)
+
 
 def _memoize_block_auto_registration(
     fn: Callable[[], Awaitable[None]],
@@ -514,9 +538,7 @@ def _memoize_block_auto_registration(
     import toml
 
     import prefect.plugins
-    from prefect.blocks.core import Block
-    from prefect.server.models.block_registration import _load_collection_blocks_data
-    from prefect.utilities.dispatch import get_registry_for_type
+    from prefect.server.models.block_registration import block_registry_fingerprint
 
     @wraps(fn)
     async def wrapper(*args: Any, **kwargs: Any) -> None:
@@ -528,11 +550,8 @@ def _memoize_block_auto_registration(
         # before loading the registry
         prefect.plugins.load_prefect_collections()
 
-        blocks_registry = get_registry_for_type(Block)
-        collection_blocks_data = await _load_collection_blocks_data()
         current_blocks_loading_hash = hash_objects(
-            blocks_registry,
-            collection_blocks_data,
+            block_registry_fingerprint(),
             PREFECT_API_DATABASE_CONNECTION_URL.value(),
             hash_algo=sha256,
         )
@@ -642,11 +661,50 @@ def create_app(
         async with session:
             await run_block_auto_registration(session=session)
 
+    def get_database_template() -> Optional["SQLiteTemplate"]:
+        """Return the template for a new ephemeral database, if fast start is enabled"""
+        if not (
+            ephemeral
+            and get_current_settings().server.ephemeral.fast_start
+            and prefect.settings.PREFECT_API_DATABASE_MIGRATE_ON_START
+            and prefect.settings.PREFECT_API_BLOCKS_REGISTER_ON_START
+        ):
+            return None
+
+        from prefect.plugins import load_prefect_collections
+        from prefect.server.database.templates import get_sqlite_template
+        from prefect.server.models.block_registration import block_registry_fingerprint
+
+        # Ensure collections are imported and have the opportunity to register types
+        # before loading the registry
+        load_prefect_collections()
+        return get_sqlite_template(
+            PREFECT_API_DATABASE_CONNECTION_URL.value(),
+            block_registry_fingerprint(),
+        )
+
+    async def prepare_database():
+        """Create and migrate the database and register block types"""
+        template = get_database_template()
+        new_database = template is not None and not template.database_path.exists()
+
+        if template is not None and new_database and template.restore():
+            logger.debug("Created database from template %s", template.path)
+            return
+
+        await run_migrations()
+        if template is not None and new_database:
+            # the memo store may refer to a previous database at the same location,
+            # so always register block types before saving a template
+            await add_block_types.__wrapped__()
+            await run_sync_in_worker_thread(template.save)
+        else:
+            await add_block_types()
+
     @asynccontextmanager
     async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         if app not in LIFESPAN_RAN_FOR_APP:
-            await run_migrations()
-            await add_block_types()
+            await prepare_database()
 
             Services: type[Service] = Service
             if ephemeral or webserver_only:
@@ -654,6 +712,7 @@ def create_app(
 
             async with Services.running():
                 LIFESPAN_RAN_FOR_APP.add(app)
+                _notify_ready()
                 yield
         else:
             yield
@@ -788,6 +847,7 @@ class SubprocessASGIServer:
             self.port: Optional[int] = port
             self.server_process: subprocess.Popen[Any] | None = None
             self.running: bool = False
+            self._ready_fd: int | None = None
             self._initialized = True
 
     def find_available_port(self) -> int:
@@ -840,13 +900,15 @@ class SubprocessASGIServer:
                 self.running = True
                 self.server_process = self._run_uvicorn_command()
                 atexit.register(self.stop)
+                max_wait_time = (
+                    timeout or PREFECT_SERVER_EPHEMERAL_STARTUP_TIMEOUT_SECONDS.value()
+                )
+                wait_started = time.monotonic()
+                if self._wait_for_ready_signal(max_wait_time):
+                    return
                 with httpx.Client() as client:
                     response = None
-                    elapsed_time = 0
-                    max_wait_time = (
-                        timeout
-                        or PREFECT_SERVER_EPHEMERAL_STARTUP_TIMEOUT_SECONDS.value()
-                    )
+                    elapsed_time = time.monotonic() - wait_started
                     while elapsed_time < max_wait_time:
                         if self.server_process.poll() == 3:
                             self.port = self.find_available_port()
@@ -880,6 +942,34 @@ class SubprocessASGIServer:
                 self.running = False
                 raise
 
+    def _wait_for_ready_signal(self, timeout: float) -> bool:
+        """
+        Wait for the server process to signal that it is ready over its ready pipe.
+
+        Returns `False` if the server process has no ready pipe or closed it without
+        signaling, in which case the caller should fall back to polling the server.
+        """
+        if self._ready_fd is None:
+            return False
+
+        try:
+            readable, _, _ = select.select([self._ready_fd], [], [], timeout)
+            return bool(readable) and os.read(self._ready_fd, 1) == b"1"
+        finally:
+            self._close_ready_fd()
+
+    def _bind_socket(self) -> socket.socket:
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        try:
+            sock.bind(("127.0.0.1", self.port or 0))
+        except OSError:
+            sock.close()
+            self.port = self.find_available_port()
+            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            sock.bind(("127.0.0.1", self.port))
+        sock.listen(2048)
+        return sock
+
     def _run_uvicorn_command(self) -> subprocess.Popen[Any]:
         # used to turn off serving the UI
         server_env = {
@@ -887,32 +977,62 @@ class SubprocessASGIServer:
             "PREFECT__SERVER_EPHEMERAL": "1",
             "PREFECT__SERVER_FINAL": "1",
         }
-        return subprocess.Popen(
-            args=[
-                sys.executable,
-                "-m",
-                "uvicorn",
-                "--app-dir",
-                str(prefect.__module_path__.parent),
-                "--factory",
-                "prefect.server.api.server:create_app",
-                "--host",
-                "127.0.0.1",
-                "--port",
-                str(self.port),
-                "--log-level",
-                "error",
-                "--lifespan",
-                "on",
-            ],
-            env={
-                **os.environ,
-                **server_env,
-                **get_current_settings().to_environment_variables(exclude_unset=True),
-            },
-        )
+        args = [
+            sys.executable,
+            "-m",
+            "uvicorn",
+            "--app-dir",
+            str(prefect.__module_path__.parent),
+            "--factory",
+            "prefect.server.api.server:create_app",
+            "--log-level",
+            "error",
+            "--lifespan",
+            "on",
+        ]
+        env = {
+            **os.environ,
+            **server_env,
+            **get_current_settings().to_environment_variables(exclude_unset=True),
+        }
+
+        if sys.platform == "win32":
+            # file descriptors can't be passed to the server process on Windows, so
+            # it binds its own port and the caller polls it until it is ready
+            return subprocess.Popen(
+                args=[*args, "--host", "127.0.0.1", "--port", str(self.port)],
+                env=env,
+            )
+
+        # Bind the socket before starting the server process so that connections
+        # are queued until the server accepts them, and have the server signal when
+        # it is ready over a pipe instead of polling it
+        sock = self._bind_socket()
+        ready_read_fd, ready_write_fd = os.pipe()
+        try:
+            process = subprocess.Popen(
+                args=[*args, "--fd", str(sock.fileno())],
+                env={**env, READY_FD_ENV_VAR: str(ready_write_fd)},
+                pass_fds=(sock.fileno(), ready_write_fd),
+            )
+        except BaseException:
+            os.close(ready_read_fd)
+            raise
+        finally:
+            os.close(ready_write_fd)
+            sock.close()
+
+        self._close_ready_fd()
+        self._ready_fd = ready_read_fd
+        return process
+
+    def _close_ready_fd(self) -> None:
+        if self._ready_fd is not None:
+            os.close(self._ready_fd)
+            self._ready_fd = None
 
     def stop(self) -> None:
+        self._close_ready_fd()
         if self.server_process:
             subprocess_server_logger.info(
                 f"Stopping temporary server on {self.address}"
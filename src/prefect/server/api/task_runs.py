@@ -118,7 +118,7 @@ async def count_task_runs(
     """
     Count task runs.
     """
-    async with db.session_context() as session:
+    async with db.read_only_session_context() as session:
         return await models.task_runs.count_task_runs(
             session=session,
             flow_filter=flows,
@@ -160,7 +160,7 @@ async def task_run_history(
             detail="History interval must not be less than 1 second.",
         )
 
-    async with db.session_context() as session:
+    async with db.read_only_session_context() as session:
         return await run_history(
             session=session,
             run_type="task_run",
@@ -205,7 +205,7 @@ async def read_task_runs(
     """
     Query for task runs.
     """
-    async with db.session_context() as session:
+    async with db.read_only_session_context() as session:
         return await models.task_runs.read_task_runs(
             session=session,
             flow_filter=flows,
@@ -234,7 +234,7 @@ async def paginate_task_runs(
     """
     offset = (page - 1) * limit
 
-    async with db.session_context() as session:
+    async with db.read_only_session_context() as session:
         runs = await models.task_runs.read_task_runs(
             session=session,
             flow_filter=flows,
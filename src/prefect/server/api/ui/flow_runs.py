@@ -11,6 +11,7 @@ from pydantic import Field
 import prefect.server.schemas as schemas
 from prefect.logging import get_logger
 from prefect.server import models
+from prefect.server.api import read_cache
 from prefect.server.database import PrefectDBInterface, provide_database_interface
 from prefect.server.utilities.schemas.bases import PrefectBaseModel
 from prefect.server.utilities.server import PrefectRouter
@@ -68,7 +69,7 @@ async def read_flow_run_history(
         # this field in order to compute `estimated_run_time`
         db.FlowRun.state_timestamp,
     ]
-    async with db.session_context() as session:
+    async with db.read_only_session_context() as session:
         result = await models.flow_runs.read_flow_runs(
             columns=columns,
             flow_filter=flows,
@@ -101,28 +102,37 @@ async def count_task_runs_by_flow_run(
     """
     Get task run counts by flow run id.
     """
-    async with db.session_context() as session:
-        query = (
-            sa.select(
-                db.TaskRun.flow_run_id,
-                sa.func.count(db.TaskRun.id).label("task_run_count"),
-            )
-            .where(
-                sa.and_(
-                    db.TaskRun.flow_run_id.in_(flow_run_ids),
-                    sa.not_(db.TaskRun.subflow_run.has()),
+    unique_flow_run_ids = tuple(sorted(set(flow_run_ids)))
+
+    async def read_counts() -> dict[UUID, int]:
+        async with db.read_only_session_context() as session:
+            query = (
+                sa.select(
+                    db.TaskRun.flow_run_id,
+                    sa.func.count(db.TaskRun.id).label("task_run_count"),
+                )
+                .where(
+                    sa.and_(
+                        db.TaskRun.flow_run_id.in_(unique_flow_run_ids),
+                        sa.not_(db.TaskRun.subflow_run.has()),
+                    )
                 )
+                .group_by(db.TaskRun.flow_run_id)
             )
-            .group_by(db.TaskRun.flow_run_id)
-        )
 
-        results = await session.execute(query)
+            results = await session.execute(query)
+
+            return {
+                flow_run_id: task_run_count for flow_run_id, task_run_count in results.t
+            }
 
-        task_run_counts_by_flow_run = {
-            flow_run_id: task_run_count for flow_run_id, task_run_count in results.t
-        }
+    task_run_counts_by_flow_run = await read_cache.read_through(
+        ("count_task_runs_by_flow_run", unique_flow_run_ids),
+        ["task_run", "flow_run"],
+        read_counts,
+    )
 
-        return {
-            flow_run_id: task_run_counts_by_flow_run.get(flow_run_id, 0)
-            for flow_run_id in flow_run_ids
-        }
+    return {
+        flow_run_id: task_run_counts_by_flow_run.get(flow_run_id, 0)
+        for flow_run_id in flow_run_ids
+    }
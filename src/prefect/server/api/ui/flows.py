@@ -10,6 +10,7 @@ from fastapi import Body, Depends
 from pydantic import Field, field_validator
 
 from prefect.logging import get_logger
+from prefect.server.api import read_cache
 from prefect.server.database import PrefectDBInterface, provide_database_interface
 from prefect.server.schemas.states import StateType
 from prefect.server.utilities.database import UUID as UUIDTypeDecorator
@@ -52,25 +53,30 @@ async def count_deployments_by_flow(
     """
     Get deployment counts by flow id.
     """
-    async with db.session_context() as session:
-        query = (
-            sa.select(
-                db.Deployment.flow_id,
-                sa.func.count(db.Deployment.id).label("deployment_count"),
+    unique_flow_ids = tuple(sorted(set(flow_ids)))
+
+    async def read_counts() -> Dict[UUID, int]:
+        async with db.read_only_session_context() as session:
+            query = (
+                sa.select(
+                    db.Deployment.flow_id,
+                    sa.func.count(db.Deployment.id).label("deployment_count"),
+                )
+                .where(db.Deployment.flow_id.in_(unique_flow_ids))
+                .group_by(db.Deployment.flow_id)
             )
-            .where(db.Deployment.flow_id.in_(flow_ids))
-            .group_by(db.Deployment.flow_id)
-        )
 
-        results = await session.execute(query)
+            results = await session.execute(query)
+
+            return {
+                flow_id: deployment_count for flow_id, deployment_count in results.all()
+            }
 
-        deployment_counts_by_flow = {
-            flow_id: deployment_count for flow_id, deployment_count in results.all()
-        }
+    deployment_counts_by_flow = await read_cache.read_through(
+        ("count_deployments_by_flow", unique_flow_ids), ["deployment"], read_counts
+    )
 
-        return {
-            flow_id: deployment_counts_by_flow.get(flow_id, 0) for flow_id in flow_ids
-        }
+    return {flow_id: deployment_counts_by_flow.get(flow_id, 0) for flow_id in flow_ids}
 
 
 def _get_postgres_next_runs_query(flow_ids: List[UUID]):
@@ -147,32 +153,36 @@ async def next_runs_by_flow(
     """
     Get the next flow run by flow id.
     """
+    unique_flow_ids = sorted(set(flow_ids))
+
+    async def read_next_runs() -> Dict[UUID, SimpleNextFlowRun]:
+        async with db.read_only_session_context() as session:
+            if db.dialect.name == "postgresql":
+                query = _get_postgres_next_runs_query(flow_ids=unique_flow_ids)
+            else:
+                query = _get_sqlite_next_runs_query(flow_ids=unique_flow_ids)
+
+            results = await session.execute(query)
+
+            return {
+                UUID(str(result.flow_id)): SimpleNextFlowRun(
+                    id=result.id,
+                    flow_id=result.flow_id,
+                    name=result.name,
+                    state_name=result.state_name,
+                    state_type=result.state_type,
+                    next_scheduled_start_time=parse_datetime(
+                        result.next_scheduled_start_time
+                    ).replace(tzinfo=ZoneInfo("UTC"))
+                    if isinstance(result.next_scheduled_start_time, str)
+                    else result.next_scheduled_start_time,
+                )
+                for result in results.all()
+            }
+
+    results_by_flow_id = await read_cache.read_through(
+        ("next_runs_by_flow", tuple(unique_flow_ids)), ["flow_run"], read_next_runs
+    )
 
-    async with db.session_context() as session:
-        if db.dialect.name == "postgresql":
-            query = _get_postgres_next_runs_query(flow_ids=flow_ids)
-        else:
-            query = _get_sqlite_next_runs_query(flow_ids=flow_ids)
-
-        results = await session.execute(query)
-
-        results_by_flow_id = {
-            UUID(str(result.flow_id)): SimpleNextFlowRun(
-                id=result.id,
-                flow_id=result.flow_id,
-                name=result.name,
-                state_name=result.state_name,
-                state_type=result.state_type,
-                next_scheduled_start_time=parse_datetime(
-                    result.next_scheduled_start_time
-                ).replace(tzinfo=ZoneInfo("UTC"))
-                if isinstance(result.next_scheduled_start_time, str)
-                else result.next_scheduled_start_time,
-            )
-            for result in results.all()
-        }
-
-        response = {
-            flow_id: results_by_flow_id.get(flow_id, None) for flow_id in flow_ids
-        }
-        return response
+    response = {flow_id: results_by_flow_id.get(flow_id, None) for flow_id in flow_ids}
+    return response
@@ -72,7 +72,7 @@ async def read_dashboard_task_run_counts(
     window = end_time - start_time
     delta = window / bucket_count
 
-    async with db.session_context(begin_transaction=False) as session:
+    async with db.read_only_session_context() as session:
         # Gather the raw counts. The counts are divided into buckets of time
         # and each bucket contains the number of successful and failed task
         # runs.
@@ -93,6 +93,42 @@ async def read_dashboard_task_run_counts(
             / delta.total_seconds()
         ).label("bucket")
 
+        # Count from the run history buckets when the filters allow, leaving only
+        # the task runs in buckets that are split between counts, or by the start
+        # time filter, to be scanned
+        bucketed: Optional[list[list[schemas.responses.HistoryResponseState]]] = None
+        raw_criteria: sa.ColumnElement[bool] = sa.true()
+        if models.run_history_buckets.answers_filters(
+            delta,
+            flows,
+            flow_runs,
+            task_runs.model_copy(update={"start_time": None, "state": None}),
+            deployments,
+            work_pools,
+            work_queues,
+        ):
+            unbucketed = models.run_history_buckets.unbucketed_ranges(
+                start_datetime,
+                delta,
+                bucket_count,
+                bounds=[
+                    task_runs.start_time.after_,
+                    task_runs.start_time.before_ or end_time,
+                ],
+            )
+            bucketed = await models.run_history_buckets.read_interval_counts(
+                session,
+                "task_run",
+                "start_time",
+                start_datetime,
+                delta,
+                bucket_count,
+                unbucketed,
+            )
+            raw_criteria = models.run_history_buckets.in_ranges(
+                db.TaskRun.start_time, unbucketed
+            )
+
         raw_counts = (
             (
                 await models.task_runs._apply_task_run_filters(
@@ -118,7 +154,7 @@ async def read_dashboard_task_run_counts(
                                 else_=0,
                             )
                         ).label("successful_count"),
-                    ),
+                    ).where(raw_criteria),
                     flow_filter=flows,
                     flow_run_filter=flow_runs,
                     task_run_filter=task_runs,
@@ -152,8 +188,15 @@ async def read_dashboard_task_run_counts(
 
     for row in result:
         index = int(row.bucket)
-        buckets[index].completed = row.successful_count
-        buckets[index].failed = row.failed_count
+        buckets[index].completed += row.successful_count
+        buckets[index].failed += row.failed_count
+
+    for index, states in enumerate(bucketed or []):
+        for state in states:
+            if state.state_type in FAILED_STATES:
+                buckets[index].failed += state.count_runs
+            else:
+                buckets[index].completed += state.count_runs
 
     return buckets
 
@@ -166,7 +209,7 @@ async def read_task_run_counts_by_state(
     deployments: Optional[schemas.filters.DeploymentFilter] = None,
     db: PrefectDBInterface = Depends(provide_database_interface),
 ) -> schemas.states.CountByState:
-    async with db.session_context(begin_transaction=False) as session:
+    async with db.read_only_session_context() as session:
         return await models.task_runs.count_task_runs_by_state(
             session=session,
             flow_filter=flows,
@@ -2,7 +2,8 @@
 Routes for interacting with work queue objects.
 """
 
-from typing import TYPE_CHECKING, List, Optional
+import datetime
+from typing import TYPE_CHECKING, Dict, List, Optional
 from uuid import UUID
 
 import sqlalchemy as sa
@@ -21,6 +22,7 @@ import prefect.server.api.dependencies as dependencies
 import prefect.server.models as models
 import prefect.server.schemas as schemas
 from prefect._internal.uuid7 import uuid7
+from prefect.server.api import read_cache
 from prefect.server.api.validation import validate_job_variable_defaults_for_work_pool
 from prefect.server.database import PrefectDBInterface, provide_database_interface
 from prefect.server.models.deployments import mark_deployments_ready
@@ -220,25 +222,29 @@ async def read_work_pool(
     Read a work pool by name
     """
 
-    async with db.session_context() as session:
-        work_pool_id = await worker_lookups._get_work_pool_id_from_name(
-            session=session, work_pool_name=work_pool_name
-        )
-        orm_work_pool = await models.workers.read_work_pool(
-            session=session, work_pool_id=work_pool_id
-        )
-        work_pool = schemas.core.WorkPool.model_validate(
-            orm_work_pool, from_attributes=True
-        )
+    async def read_work_pool() -> schemas.core.WorkPool:
+        async with db.session_context() as session:
+            work_pool_id = await worker_lookups._get_work_pool_id_from_name(
+                session=session, work_pool_name=work_pool_name
+            )
+            orm_work_pool = await models.workers.read_work_pool(
+                session=session, work_pool_id=work_pool_id
+            )
+            return schemas.core.WorkPool.model_validate(
+                orm_work_pool, from_attributes=True
+            )
 
-        if prefect_client_version and Version(prefect_client_version) <= Version(
-            "3.3.7"
-        ):
-            # Client versions 3.3.7 and below do not support the default_result_storage_block_id field and will error
-            # when receiving it.
-            del work_pool.storage_configuration.default_result_storage_block_id
+    work_pool = await read_cache.read_through(
+        ("read_work_pool", work_pool_name), ["work_pool"], read_work_pool
+    )
 
-        return work_pool
+    if prefect_client_version and Version(prefect_client_version) <= Version("3.3.7"):
+        # Client versions 3.3.7 and below do not support the default_result_storage_block_id field and will error
+        # when receiving it.
+        work_pool = work_pool.model_copy(deep=True)
+        del work_pool.storage_configuration.default_result_storage_block_id
+
+    return work_pool
 
 
 @router.post("/filter")
@@ -399,15 +405,20 @@ async def get_scheduled_flow_runs(
             ]
             work_queue_ids = [wq.id for wq in work_queues]
 
-    async with db.session_context(begin_transaction=True) as session:
-        queue_response = await models.workers.get_scheduled_flow_runs(
-            session=session,
-            work_pool_ids=[work_pool_id],
-            work_queue_ids=work_queue_ids,
-            scheduled_before=scheduled_before,
-            scheduled_after=scheduled_after,
-            limit=limit,
-        )
+    if scheduled_before is not None and not await _has_runs_due(
+        db=db, work_queues=work_queues, scheduled_before=scheduled_before
+    ):
+        queue_response = []
+    else:
+        async with db.session_context(begin_transaction=True) as session:
+            queue_response = await models.workers.get_scheduled_flow_runs(
+                session=session,
+                work_pool_ids=[work_pool_id],
+                work_queue_ids=work_queue_ids,
+                scheduled_before=scheduled_before,
+                scheduled_after=scheduled_after,
+                limit=limit,
+            )
 
     background_tasks.add_task(
         mark_work_queues_ready,
@@ -429,6 +440,37 @@ async def get_scheduled_flow_runs(
     return queue_response
 
 
+async def _has_runs_due(
+    db: PrefectDBInterface,
+    work_queues: List["ORMWorkQueue"],
+    scheduled_before: DateTime,
+) -> bool:
+    """
+    Whether any of the given work queues has a scheduled run that is due to start by
+    `scheduled_before`, so that polls of idle queues can skip getting and locking
+    their runs.  Most polls find nothing due, and many workers poll the same queues,
+    so the next start times are shared through the read cache until a flow run is
+    written.
+    """
+    work_queue_ids = tuple(sorted(work_queue.id for work_queue in work_queues))
+
+    async def read_next_scheduled_start_times() -> Dict[UUID, datetime.datetime]:
+        async with db.session_context() as session:
+            return await models.workers.read_next_scheduled_start_times(
+                session=session, work_queue_ids=list(work_queue_ids)
+            )
+
+    next_scheduled_start_times = await read_cache.read_through(
+        ("next_scheduled_start_times", work_queue_ids),
+        ["flow_run"],
+        read_next_scheduled_start_times,
+    )
+    return any(
+        start_time <= scheduled_before
+        for start_time in next_scheduled_start_times.values()
+    )
+
+
 # -----------------------------------------------------
 # --
 # --
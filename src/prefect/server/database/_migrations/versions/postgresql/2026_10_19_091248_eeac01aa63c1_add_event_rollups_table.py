@@ -0,0 +1,106 @@
+"""Add `event_rollups` table
+
+Revision ID: eeac01aa63c1
+Revises: 3b86c5ea017a
+Create Date: 2026-10-19 09:12:48.630215
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+import prefect
+
+# revision identifiers, used by Alembic.
+revision = "eeac01aa63c1"
+down_revision = "3b86c5ea017a"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "event_rollups",
+        sa.Column("time_unit", sa.Text(), nullable=False),
+        sa.Column(
+            "bucket",
+            prefect.server.utilities.database.Timestamp(timezone=True),
+            nullable=False,
+        ),
+        sa.Column("event", sa.Text(), nullable=False),
+        sa.Column("resource_id", sa.Text(), nullable=False),
+        sa.Column("count", sa.BigInteger(), nullable=False),
+        sa.Column(
+            "oldest",
+            prefect.server.utilities.database.Timestamp(timezone=True),
+            nullable=False,
+        ),
+        sa.Column(
+            "latest",
+            prefect.server.utilities.database.Timestamp(timezone=True),
+            nullable=False,
+        ),
+        sa.Column(
+            "id",
+            prefect.server.utilities.database.UUID(),
+            server_default=sa.text("(GEN_RANDOM_UUID())"),
+            nullable=False,
+        ),
+        sa.Column(
+            "created",
+            prefect.server.utilities.database.Timestamp(timezone=True),
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated",
+            prefect.server.utilities.database.Timestamp(timezone=True),
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk_event_rollups")),
+    )
+    op.create_index(
+        "uq_event_rollups__time_unit_bucket_event_resource_id",
+        "event_rollups",
+        ["time_unit", "bucket", "event", "resource_id"],
+        unique=True,
+    )
+    op.create_index(
+        op.f("ix_event_rollups__updated"),
+        "event_rollups",
+        ["updated"],
+        unique=False,
+    )
+
+    # Backfill the rollups from the events that are already stored, truncating each
+    # event's `occurred` timestamp to the start of its minute and hour in UTC
+    for time_unit in ["minute", "hour"]:
+        op.execute(
+            sa.text(
+                """
+                INSERT INTO event_rollups
+                    (time_unit, bucket, event, resource_id, count, oldest, latest)
+                SELECT
+                    :time_unit,
+                    date_trunc(:time_unit, occurred AT TIME ZONE 'UTC')
+                        AT TIME ZONE 'UTC',
+                    event,
+                    resource_id,
+                    count(*),
+                    min(occurred),
+                    max(occurred)
+                FROM events
+                GROUP BY 2, event, resource_id
+                """
+            ).bindparams(time_unit=time_unit)
+        )
+
+
+def downgrade():
+    op.drop_index(op.f("ix_event_rollups__updated"), table_name="event_rollups")
+    op.drop_index(
+        "uq_event_rollups__time_unit_bucket_event_resource_id",
+        table_name="event_rollups",
+    )
+    op.drop_table("event_rollups")
@@ -0,0 +1,131 @@
+"""Add `run_history_bucket` table
+
+Revision ID: 682b8bb01651
+Revises: eeac01aa63c1
+Create Date: 2026-10-19 10:02:34.176392
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+import prefect
+
+# revision identifiers, used by Alembic.
+revision = "682b8bb01651"
+down_revision = "eeac01aa63c1"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "run_history_bucket",
+        sa.Column("run_type", sa.Text(), nullable=False),
+        sa.Column("time_field", sa.Text(), nullable=False),
+        sa.Column(
+            "bucket",
+            prefect.server.utilities.database.Timestamp(timezone=True),
+            nullable=False,
+        ),
+        sa.Column(
+            "state_type",
+            postgresql.ENUM(
+                "SCHEDULED",
+                "PENDING",
+                "RUNNING",
+                "COMPLETED",
+                "FAILED",
+                "CANCELLED",
+                "CRASHED",
+                "PAUSED",
+                "CANCELLING",
+                name="state_type",
+                create_type=False,
+            ),
+            nullable=False,
+        ),
+        sa.Column("state_name", sa.Text(), nullable=False),
+        sa.Column("count", sa.BigInteger(), nullable=False),
+        sa.Column("sum_estimated_run_time", sa.Float(), nullable=False),
+        sa.Column("sum_estimated_lateness", sa.Float(), nullable=False),
+        sa.Column(
+            "id",
+            prefect.server.utilities.database.UUID(),
+            server_default=sa.text("(GEN_RANDOM_UUID())"),
+            nullable=False,
+        ),
+        sa.Column(
+            "created",
+            prefect.server.utilities.database.Timestamp(timezone=True),
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated",
+            prefect.server.utilities.database.Timestamp(timezone=True),
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk_run_history_bucket")),
+    )
+    op.create_index(
+        "uq_run_history_bucket__run_type_time_field_bucket_state",
+        "run_history_bucket",
+        ["run_type", "time_field", "bucket", "state_type", "state_name"],
+        unique=True,
+    )
+    op.create_index(
+        op.f("ix_run_history_bucket__updated"),
+        "run_history_bucket",
+        ["updated"],
+        unique=False,
+    )
+
+    # Backfill the buckets from the runs that are already in terminal states,
+    # truncating each run's timestamp to the start of its minute in UTC
+    for run_type, time_fields in [
+        ("flow_run", ["expected_start_time"]),
+        ("task_run", ["expected_start_time", "start_time"]),
+    ]:
+        for time_field in time_fields:
+            op.execute(
+                sa.text(
+                    f"""
+                    INSERT INTO run_history_bucket
+                        (run_type, time_field, bucket, state_type, state_name, count,
+                         sum_estimated_run_time, sum_estimated_lateness)
+                    SELECT
+                        :run_type,
+                        :time_field,
+                        date_trunc('minute', {time_field} AT TIME ZONE 'UTC')
+                            AT TIME ZONE 'UTC',
+                        state_type,
+                        state_name,
+                        count(*),
+                        sum(greatest(0, extract(epoch FROM total_run_time))),
+                        sum(
+                            CASE WHEN start_time > expected_start_time
+                            THEN extract(epoch FROM start_time - expected_start_time)
+                            ELSE 0 END
+                        )
+                    FROM {run_type}
+                    WHERE state_type IN ('COMPLETED', 'FAILED', 'CANCELLED', 'CRASHED')
+                        AND state_name IS NOT NULL
+                        AND {time_field} IS NOT NULL
+                    GROUP BY 3, state_type, state_name
+                    """
+                ).bindparams(run_type=run_type, time_field=time_field)
+            )
+
+
+def downgrade():
+    op.drop_index(
+        op.f("ix_run_history_bucket__updated"), table_name="run_history_bucket"
+    )
+    op.drop_index(
+        "uq_run_history_bucket__run_type_time_field_bucket_state",
+        table_name="run_history_bucket",
+    )
+    op.drop_table("run_history_bucket")
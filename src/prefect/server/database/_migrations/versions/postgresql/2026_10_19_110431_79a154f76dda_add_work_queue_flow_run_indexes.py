@@ -0,0 +1,43 @@
+"""Add indexes for reading scheduled and active flow runs by work queue
+
+Revision ID: 79a154f76dda
+Revises: 682b8bb01651
+Create Date: 2026-10-19 11:04:31.615920
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "79a154f76dda"
+down_revision = "682b8bb01651"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.get_context().autocommit_block():
+        op.execute(
+            """
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_flow_run__scheduled_work_queue_id_next_scheduled_start_time
+            ON flow_run (work_queue_id, next_scheduled_start_time)
+            WHERE state_type = 'SCHEDULED';
+            """
+        )
+        op.execute(
+            """
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_flow_run__active_work_queue_id
+            ON flow_run (work_queue_id)
+            WHERE state_type IN ('RUNNING', 'PENDING');
+            """
+        )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.execute(
+            "DROP INDEX CONCURRENTLY IF EXISTS ix_flow_run__active_work_queue_id;"
+        )
+        op.execute(
+            "DROP INDEX CONCURRENTLY IF EXISTS ix_flow_run__scheduled_work_queue_id_next_scheduled_start_time;"
+        )
@@ -0,0 +1,32 @@
+"""Add index for trimming `event_rollups`
+
+Revision ID: 450e49014d2d
+Revises: 79a154f76dda
+Create Date: 2026-10-19 14:02:31.204875
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "450e49014d2d"
+down_revision = "79a154f76dda"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.get_context().autocommit_block():
+        op.execute(
+            """
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_event_rollups__time_unit_latest
+            ON event_rollups (time_unit, latest);
+            """
+        )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.execute(
+            "DROP INDEX CONCURRENTLY IF EXISTS ix_event_rollups__time_unit_latest;"
+        )
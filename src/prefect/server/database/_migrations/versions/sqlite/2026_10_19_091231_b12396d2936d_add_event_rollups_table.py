@@ -0,0 +1,106 @@
+"""Add `event_rollups` table
+
+Revision ID: b12396d2936d
+Revises: 8bb517bae6f9
+Create Date: 2026-10-19 09:12:31.418226
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+import prefect
+
+# revision identifiers, used by Alembic.
+revision = "b12396d2936d"
+down_revision = "8bb517bae6f9"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "event_rollups",
+        sa.Column("time_unit", sa.Text(), nullable=False),
+        sa.Column(
+            "bucket",
+            prefect.server.utilities.database.Timestamp(timezone=True),
+            nullable=False,
+        ),
+        sa.Column("event", sa.Text(), nullable=False),
+        sa.Column("resource_id", sa.Text(), nullable=False),
+        sa.Column("count", sa.BigInteger(), nullable=False),
+        sa.Column(
+            "oldest",
+            prefect.server.utilities.database.Timestamp(timezone=True),
+            nullable=False,
+        ),
+        sa.Column(
+            "latest",
+            prefect.server.utilities.database.Timestamp(timezone=True),
+            nullable=False,
+        ),
+        sa.Column(
+            "id",
+            prefect.server.utilities.database.UUID(),
+            server_default=sa.text(
+                "(\n    (\n        lower(hex(randomblob(4)))\n        || '-'\n        || lower(hex(randomblob(2)))\n        || '-4'\n        || substr(lower(hex(randomblob(2))),2)\n        || '-'\n        || substr('89ab',abs(random()) % 4 + 1, 1)\n        || substr(lower(hex(randomblob(2))),2)\n        || '-'\n        || lower(hex(randomblob(6)))\n    )\n    )"
+            ),
+            nullable=False,
+        ),
+        sa.Column(
+            "created",
+            prefect.server.utilities.database.Timestamp(timezone=True),
+            server_default=sa.text("(strftime('%Y-%m-%d %H:%M:%f000', 'now'))"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated",
+            prefect.server.utilities.database.Timestamp(timezone=True),
+            server_default=sa.text("(strftime('%Y-%m-%d %H:%M:%f000', 'now'))"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk_event_rollups")),
+    )
+    with op.batch_alter_table("event_rollups", schema=None) as batch_op:
+        batch_op.create_index(
+            "uq_event_rollups__time_unit_bucket_event_resource_id",
+            ["time_unit", "bucket", "event", "resource_id"],
+            unique=True,
+        )
+        batch_op.create_index(
+            batch_op.f("ix_event_rollups__updated"), ["updated"], unique=False
+        )
+
+    # Backfill the rollups from the events that are already stored, truncating each
+    # event's `occurred` timestamp to the start of its minute and hour
+    for time_unit, bucket_format in [
+        ("minute", "%Y-%m-%d %H:%M:00.000000"),
+        ("hour", "%Y-%m-%d %H:00:00.000000"),
+    ]:
+        op.execute(
+            sa.text(
+                """
+                INSERT INTO event_rollups
+                    (time_unit, bucket, event, resource_id, count, oldest, latest)
+                SELECT
+                    :time_unit,
+                    strftime(:bucket_format, occurred),
+                    event,
+                    resource_id,
+                    count(*),
+                    min(occurred),
+                    max(occurred)
+                FROM events
+                GROUP BY strftime(:bucket_format, occurred), event, resource_id
+                """
+            ).bindparams(time_unit=time_unit, bucket_format=bucket_format)
+        )
+
+
+def downgrade():
+    with op.batch_alter_table("event_rollups", schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f("ix_event_rollups__updated"))
+        batch_op.drop_index("uq_event_rollups__time_unit_bucket_event_resource_id")
+
+    op.drop_table("event_rollups")
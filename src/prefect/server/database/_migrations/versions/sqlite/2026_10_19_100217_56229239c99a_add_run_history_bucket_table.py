@@ -0,0 +1,135 @@
+"""Add `run_history_bucket` table
+
+Revision ID: 56229239c99a
+Revises: b12396d2936d
+Create Date: 2026-10-19 10:02:17.512804
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+import prefect
+
+# revision identifiers, used by Alembic.
+revision = "56229239c99a"
+down_revision = "b12396d2936d"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "run_history_bucket",
+        sa.Column("run_type", sa.Text(), nullable=False),
+        sa.Column("time_field", sa.Text(), nullable=False),
+        sa.Column(
+            "bucket",
+            prefect.server.utilities.database.Timestamp(timezone=True),
+            nullable=False,
+        ),
+        sa.Column(
+            "state_type",
+            sa.Enum(
+                "SCHEDULED",
+                "PENDING",
+                "RUNNING",
+                "COMPLETED",
+                "FAILED",
+                "CANCELLED",
+                "CRASHED",
+                "PAUSED",
+                "CANCELLING",
+                name="state_type",
+            ),
+            nullable=False,
+        ),
+        sa.Column("state_name", sa.Text(), nullable=False),
+        sa.Column("count", sa.BigInteger(), nullable=False),
+        sa.Column("sum_estimated_run_time", sa.Float(), nullable=False),
+        sa.Column("sum_estimated_lateness", sa.Float(), nullable=False),
+        sa.Column(
+            "id",
+            prefect.server.utilities.database.UUID(),
+            server_default=sa.text(
+                "(\n    (\n        lower(hex(randomblob(4)))\n        || '-'\n        || lower(hex(randomblob(2)))\n        || '-4'\n        || substr(lower(hex(randomblob(2))),2)\n        || '-'\n        || substr('89ab',abs(random()) % 4 + 1, 1)\n        || substr(lower(hex(randomblob(2))),2)\n        || '-'\n        || lower(hex(randomblob(6)))\n    )\n    )"
+            ),
+            nullable=False,
+        ),
+        sa.Column(
+            "created",
+            prefect.server.utilities.database.Timestamp(timezone=True),
+            server_default=sa.text("(strftime('%Y-%m-%d %H:%M:%f000', 'now'))"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated",
+            prefect.server.utilities.database.Timestamp(timezone=True),
+            server_default=sa.text("(strftime('%Y-%m-%d %H:%M:%f000', 'now'))"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk_run_history_bucket")),
+    )
+    with op.batch_alter_table("run_history_bucket", schema=None) as batch_op:
+        batch_op.create_index(
+            "uq_run_history_bucket__run_type_time_field_bucket_state",
+            ["run_type", "time_field", "bucket", "state_type", "state_name"],
+            unique=True,
+        )
+        batch_op.create_index(
+            batch_op.f("ix_run_history_bucket__updated"), ["updated"], unique=False
+        )
+
+    # Backfill the buckets from the runs that are already in terminal states,
+    # truncating each run's timestamp to the start of its minute.  Intervals are
+    # stored as timestamps offset from the UNIX epoch.
+    for run_type, time_fields in [
+        ("flow_run", ["expected_start_time"]),
+        ("task_run", ["expected_start_time", "start_time"]),
+    ]:
+        for time_field in time_fields:
+            op.execute(
+                sa.text(
+                    f"""
+                    INSERT INTO run_history_bucket
+                        (run_type, time_field, bucket, state_type, state_name, count,
+                         sum_estimated_run_time, sum_estimated_lateness)
+                    SELECT
+                        :run_type,
+                        :time_field,
+                        strftime('%Y-%m-%d %H:%M:00.000000', {time_field}),
+                        state_type,
+                        state_name,
+                        count(*),
+                        sum(
+                            max(
+                                0,
+                                (julianday(total_run_time) - julianday('1970-01-01'))
+                                * 86400
+                            )
+                        ),
+                        sum(
+                            CASE WHEN start_time > expected_start_time
+                            THEN (julianday(start_time) - julianday(expected_start_time))
+                                * 86400
+                            ELSE 0 END
+                        )
+                    FROM {run_type}
+                    WHERE state_type IN ('COMPLETED', 'FAILED', 'CANCELLED', 'CRASHED')
+                        AND state_name IS NOT NULL
+                        AND {time_field} IS NOT NULL
+                    GROUP BY
+                        strftime('%Y-%m-%d %H:%M:00.000000', {time_field}),
+                        state_type,
+                        state_name
+                    """
+                ).bindparams(run_type=run_type, time_field=time_field)
+            )
+
+
+def downgrade():
+    with op.batch_alter_table("run_history_bucket", schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f("ix_run_history_bucket__updated"))
+        batch_op.drop_index("uq_run_history_bucket__run_type_time_field_bucket_state")
+
+    op.drop_table("run_history_bucket")
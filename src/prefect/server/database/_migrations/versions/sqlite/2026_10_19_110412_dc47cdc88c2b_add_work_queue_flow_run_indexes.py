@@ -0,0 +1,39 @@
+"""Add indexes for reading scheduled and active flow runs by work queue
+
+Revision ID: dc47cdc88c2b
+Revises: 56229239c99a
+Create Date: 2026-10-19 11:04:12.208395
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "dc47cdc88c2b"
+down_revision = "56229239c99a"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute(
+        """
+        CREATE INDEX IF NOT EXISTS ix_flow_run__scheduled_work_queue_id_next_scheduled_start_time
+        ON flow_run (work_queue_id, next_scheduled_start_time)
+        WHERE state_type = 'SCHEDULED';
+        """
+    )
+    op.execute(
+        """
+        CREATE INDEX IF NOT EXISTS ix_flow_run__active_work_queue_id
+        ON flow_run (work_queue_id)
+        WHERE state_type IN ('RUNNING', 'PENDING');
+        """
+    )
+
+
+def downgrade():
+    op.execute("DROP INDEX IF EXISTS ix_flow_run__active_work_queue_id;")
+    op.execute(
+        "DROP INDEX IF EXISTS ix_flow_run__scheduled_work_queue_id_next_scheduled_start_time;"
+    )
@@ -0,0 +1,28 @@
+"""Add index for trimming `event_rollups`
+
+Revision ID: f2dacdf89607
+Revises: dc47cdc88c2b
+Create Date: 2026-10-19 14:02:12.537104
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "f2dacdf89607"
+down_revision = "dc47cdc88c2b"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute(
+        """
+        CREATE INDEX IF NOT EXISTS ix_event_rollups__time_unit_latest
+        ON event_rollups (time_unit, latest);
+        """
+    )
+
+
+def downgrade():
+    op.execute("DROP INDEX IF EXISTS ix_event_rollups__time_unit_latest;")
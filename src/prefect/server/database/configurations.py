@@ -1,14 +1,17 @@
 from __future__ import annotations
 
+import asyncio
 import os
 import sqlite3
 import ssl
+import time
 import traceback
 from abc import ABC, abstractmethod
 from asyncio import AbstractEventLoop, get_running_loop
 from collections.abc import AsyncGenerator, Hashable
 from contextlib import AbstractAsyncContextManager, asynccontextmanager
 from contextvars import ContextVar
+from dataclasses import dataclass, field
 from functools import partial
 from typing import Any, Optional
 
@@ -26,6 +29,7 @@ from sqlalchemy.ext.asyncio import (
 from sqlalchemy.pool import ConnectionPoolEntry
 from typing_extensions import TypeAlias
 
+from prefect.logging import get_logger
 from prefect.settings import (
     PREFECT_API_DATABASE_CONNECTION_TIMEOUT,
     PREFECT_API_DATABASE_ECHO,
@@ -48,12 +52,23 @@ if os.getenv("PREFECT_LOGFIRE_ENABLED"):
 else:
     logfire = None
 
+logger = get_logger("server.database")
+
 SQLITE_BEGIN_MODE: ContextVar[Optional[str]] = ContextVar(  # novm
     "SQLITE_BEGIN_MODE", default=None
 )
 
+# The connection of the SQLite writer the current context is running a transaction on
+SQLITE_WRITER_CONNECTION: ContextVar[Optional[AsyncConnection]] = ContextVar(  # novm
+    "SQLITE_WRITER_CONNECTION", default=None
+)
+
 _EngineCacheKey: TypeAlias = tuple[AbstractEventLoop, str, bool, Optional[float]]
 ENGINES: dict[_EngineCacheKey, AsyncEngine] = {}
+WRITERS: dict[_EngineCacheKey, "SqliteWriter"] = {}
+# the lag of each read replica in seconds, or None if it is unreachable, and when it
+# was last checked
+REPLICA_LAG: dict[_EngineCacheKey, tuple[Optional[float], float]] = {}
 
 
 class ConnectionTracker:
@@ -121,6 +136,155 @@ class ConnectionTracker:
 TRACKER: ConnectionTracker = ConnectionTracker()
 
 
+@dataclass
+class _WriteRequest:
+    granted: asyncio.Future[AsyncConnection] = field(
+        default_factory=lambda: get_running_loop().create_future()
+    )
+    # set to whether the transaction should be committed once it is done with the
+    # connection
+    finished: asyncio.Future[bool] = field(
+        default_factory=lambda: get_running_loop().create_future()
+    )
+    committed: asyncio.Future[None] = field(
+        default_factory=lambda: get_running_loop().create_future()
+    )
+
+
+class SqliteWriter:
+    """
+    Funnels write transactions against a SQLite database through one connection.
+
+    SQLite allows one writer at a time, and writers that collide wait on the busy
+    timeout and may fail with `database is locked`. A writer task instead hands its
+    connection to one transaction at a time, in the order they were requested.
+
+    Transactions waiting for the connection are coalesced: each one runs in a
+    savepoint of a single `BEGIN IMMEDIATE` transaction, which is committed once
+    no more transactions are waiting or `max_batch_size` have run. A transaction
+    is not complete until its batch is committed, and a failed commit fails every
+    transaction in the batch. If the writer's connection fails, every transaction
+    waiting on it fails and the next transaction opens a new connection.
+    """
+
+    def __init__(self, engine: AsyncEngine, max_batch_size: int = 100) -> None:
+        self.engine = engine
+        self.max_batch_size = max_batch_size
+        self._requests: asyncio.Queue[_WriteRequest] = asyncio.Queue()
+        self._task: Optional[asyncio.Task[None]] = None
+
+    @asynccontextmanager
+    async def transaction(self) -> AsyncGenerator[AsyncConnection, None]:
+        """
+        Wait for the writer connection and yield it. The connection is already in a
+        transaction, so callers must work within a savepoint that is released or
+        rolled back before exiting.
+        """
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+        request = _WriteRequest()
+        self._requests.put_nowait(request)
+        try:
+            connection = await request.granted
+        except asyncio.CancelledError:
+            # the connection may have been granted just before the cancellation
+            if request.granted.done() and not request.granted.cancelled():
+                request.finished.set_result(False)
+            raise
+
+        token = SQLITE_WRITER_CONNECTION.set(connection)
+        try:
+            yield connection
+        except BaseException:
+            request.finished.set_result(False)
+            raise
+        else:
+            request.finished.set_result(True)
+        finally:
+            SQLITE_WRITER_CONNECTION.reset(token)
+
+        await request.committed
+
+    async def close(self) -> None:
+        """Stop the writer task and dispose of its engine"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.engine.dispose()
+
+    async def _run(self) -> None:
+        while True:
+            batch = [await self._requests.get()]
+            try:
+                async with self.engine.connect() as connection:
+                    while True:
+                        await self._run_batch(connection, batch)
+                        batch = [await self._requests.get()]
+            except Exception as exc:
+                # fail every transaction waiting on the connection, and connect again
+                # for the next one
+                logger.error("SQLite writer connection failed", exc_info=exc)
+                while not self._requests.empty():
+                    batch.append(self._requests.get_nowait())
+                for request in batch:
+                    if not request.granted.done():
+                        request.granted.set_exception(exc)
+                    elif (
+                        request.finished.done()
+                        and request.finished.result()
+                        and not request.committed.done()
+                    ):
+                        request.committed.set_exception(exc)
+
+    async def _run_batch(
+        self, connection: AsyncConnection, batch: list[_WriteRequest]
+    ) -> None:
+        """
+        Runs the request in `batch` and those waiting behind it in one transaction,
+        adding each of them to `batch`.
+        """
+        request = batch[0]
+        token = SQLITE_BEGIN_MODE.set("IMMEDIATE")
+        try:
+            await connection.begin()
+        except Exception as exc:
+            if not request.granted.done():
+                request.granted.set_exception(exc)
+            return
+        finally:
+            SQLITE_BEGIN_MODE.reset(token)
+
+        committed: list[asyncio.Future[None]] = []
+        while True:
+            if not request.granted.done():
+                request.granted.set_result(connection)
+                if await request.finished:
+                    committed.append(request.committed)
+
+            if len(committed) >= self.max_batch_size or self._requests.empty():
+                break
+            request = self._requests.get_nowait()
+            batch.append(request)
+
+        try:
+            await connection.commit()
+        except Exception as exc:
+            logger.warning("Failed to commit SQLite write batch", exc_info=exc)
+            for future in committed:
+                if not future.done():
+                    future.set_exception(exc)
+            await connection.rollback()
+        else:
+            for future in committed:
+                if not future.done():
+                    future.set_result(None)
+
+
 class BaseDatabaseConfiguration(ABC):
     """
     Abstract base class used to inject database connection configuration into Prefect.
@@ -140,6 +304,8 @@ class BaseDatabaseConfiguration(ABC):
         connection_app_name: Optional[str] = None,
         statement_cache_size: Optional[int] = None,
         prepared_statement_cache_size: Optional[int] = None,
+        read_replica_connection_url: Optional[str] = None,
+        read_replica_max_lag: Optional[float] = None,
     ) -> None:
         self.connection_url = connection_url
         self.echo: bool = echo or PREFECT_API_DATABASE_ECHO.value()
@@ -167,6 +333,16 @@ class BaseDatabaseConfiguration(ABC):
             prepared_statement_cache_size
             or get_current_settings().server.database.sqlalchemy.connect_args.prepared_statement_cache_size
         )
+        replica_url = get_current_settings().server.database.read_replica_connection_url
+        self.read_replica_connection_url: Optional[str] = (
+            read_replica_connection_url
+            or (replica_url.get_secret_value() if replica_url else None)
+        )
+        self.read_replica_max_lag: float = (
+            read_replica_max_lag
+            if read_replica_max_lag is not None
+            else get_current_settings().server.database.read_replica_max_lag
+        )
 
     def unique_key(self) -> tuple[Hashable, ...]:
         """
@@ -178,6 +354,13 @@ class BaseDatabaseConfiguration(ABC):
     async def engine(self) -> AsyncEngine:
         """Returns a SqlAlchemy engine"""
 
+    async def read_only_engine(self) -> AsyncEngine:
+        """
+        Returns a SqlAlchemy engine for queries that do not write, which is the
+        primary engine unless a read replica is supported and configured
+        """
+        return await self.engine()
+
     @abstractmethod
     async def session(self, engine: AsyncEngine) -> AsyncSession:
         """
@@ -209,6 +392,9 @@ class BaseDatabaseConfiguration(ABC):
 
 
 class AsyncPostgresConfiguration(BaseDatabaseConfiguration):
+    # how often to check the replication lag of the read replica, in seconds
+    REPLICA_LAG_CHECK_INTERVAL = 5.0
+
     async def engine(self) -> AsyncEngine:
         """Retrieves an async SQLAlchemy engine.
 
@@ -223,12 +409,92 @@ class AsyncPostgresConfiguration(BaseDatabaseConfiguration):
         Returns:
             AsyncEngine: a SQLAlchemy engine
         """
+        return await self._engine(self.connection_url)
+
+    async def read_only_engine(self) -> AsyncEngine:
+        """
+        Retrieves an async SQLAlchemy engine for the read replica, if one is
+        configured. Falls back to the primary engine while the replica is
+        unreachable or lagging by more than `read_replica_max_lag` seconds.
+        """
+        if not self.read_replica_connection_url:
+            return await self.engine()
+
+        replica = await self._engine(self.read_replica_connection_url)
+        lag = await self.replica_lag(replica)
+        if lag is None or lag > self.read_replica_max_lag:
+            return await self.engine()
+        return replica
 
+    async def replica_lag(self, replica: AsyncEngine) -> Optional[float]:
+        """
+        Returns the replication lag of the read replica in seconds, or `None` if it
+        cannot be reached or is not streaming changes from the primary. The lag is
+        checked at most every `REPLICA_LAG_CHECK_INTERVAL` seconds.
+        """
+        cache_key = (
+            get_running_loop(),
+            str(self.read_replica_connection_url),
+            self.echo,
+            self.timeout,
+        )
+        lag, checked = REPLICA_LAG.get(cache_key, (None, 0.0))
+        if time.monotonic() - checked < self.REPLICA_LAG_CHECK_INTERVAL:
+            return lag
+
+        try:
+            async with replica.connect() as connection:
+                # a replica that has replayed everything it received is caught up,
+                # even if the primary has not written anything recently, but only
+                # while it is still receiving from the primary; a stopped receiver
+                # has also replayed everything it received.  The receiver's status
+                # is hidden from roles without pg_read_all_stats, in which case a
+                # running receiver is all that can be checked.
+                result = await connection.execute(
+                    sa.text(
+                        """
+                        SELECT CASE
+                            WHEN NOT pg_is_in_recovery() THEN 0
+                            WHEN NOT EXISTS (
+                                SELECT 1 FROM pg_stat_wal_receiver
+                                WHERE COALESCE(status, 'streaming') = 'streaming'
+                            ) THEN NULL
+                            WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn()
+                                THEN 0
+                            ELSE COALESCE(
+                                EXTRACT(
+                                    EPOCH FROM now() - pg_last_xact_replay_timestamp()
+                                ),
+                                0
+                            )
+                        END
+                        """
+                    )
+                )
+                lag = result.scalar_one()
+            if lag is None:
+                logger.warning(
+                    "The read replica is not streaming from the primary database, "
+                    "reading from the primary database"
+                )
+            else:
+                lag = float(lag)
+        except Exception as exc:
+            logger.warning(
+                "Unable to reach the read replica, reading from the primary database",
+                exc_info=exc,
+            )
+            lag = None
+
+        REPLICA_LAG[cache_key] = (lag, time.monotonic())
+        return lag
+
+    async def _engine(self, connection_url: str) -> AsyncEngine:
         loop = get_running_loop()
 
         cache_key = (
             loop,
-            self.connection_url,
+            connection_url,
             self.echo,
             self.timeout,
         )
@@ -292,7 +558,7 @@ class AsyncPostgresConfiguration(BaseDatabaseConfiguration):
                 kwargs["max_overflow"] = self.sqlalchemy_max_overflow
 
             engine = create_async_engine(
-                self.connection_url,
+                connection_url,
                 echo=self.echo,
                 # "pre-ping" connections upon checkout to ensure they have not been
                 # closed on the server side
@@ -428,19 +694,60 @@ class AioSqliteConfiguration(BaseDatabaseConfiguration):
                     pool_recycle=-1,
                 )
 
-            engine = create_async_engine(self.connection_url, echo=self.echo, **kwargs)
-            event.listen(engine.sync_engine, "connect", self.setup_sqlite)
-            event.listen(engine.sync_engine, "begin", self.begin_sqlite_stmt)
+            ENGINES[cache_key] = self._create_engine(**kwargs)
+            await self.schedule_engine_disposal(cache_key)
+        return ENGINES[cache_key]
 
-            if logfire:
-                logfire.instrument_sqlalchemy(engine)  # pyright: ignore
+    async def writer(self) -> SqliteWriter:
+        """
+        Retrieves the writer that transactions are funneled through when
+        `PREFECT_SERVER_DATABASE_SQLITE_SINGLE_WRITER` is enabled.
+        """
+        loop = get_running_loop()
 
-            if TRACKER.active:
-                TRACKER.track_pool(engine.pool)
+        cache_key = (loop, self.connection_url, self.echo, self.timeout)
+        if cache_key not in WRITERS:
+            kwargs: dict[str, Any] = dict(paramstyle="named")
+            if self.timeout is not None:
+                kwargs["connect_args"] = dict(timeout=self.timeout)
 
-            ENGINES[cache_key] = engine
-            await self.schedule_engine_disposal(cache_key)
-        return ENGINES[cache_key]
+            # the writer holds its only connection for its whole lifetime
+            engine = self._create_engine(
+                poolclass=sa.pool.AsyncAdaptedQueuePool,
+                pool_size=1,
+                max_overflow=0,
+                pool_recycle=-1,
+                **kwargs,
+            )
+            WRITERS[cache_key] = SqliteWriter(engine)
+
+            async def close_writer(cache_key: _EngineCacheKey) -> None:
+                writer = WRITERS.pop(cache_key, None)
+                if writer:
+                    await writer.close()
+
+            await add_event_loop_shutdown_callback(partial(close_writer, cache_key))
+        return WRITERS[cache_key]
+
+    def uses_single_writer(self) -> bool:
+        """Returns true if transactions are funneled through a single writer"""
+        return (
+            get_current_settings().server.database.sqlite_single_writer
+            and not self.is_inmemory()
+        )
+
+    def _create_engine(self, **kwargs: Any) -> AsyncEngine:
+        engine = create_async_engine(self.connection_url, echo=self.echo, **kwargs)
+        event.listen(engine.sync_engine, "connect", self.setup_sqlite)
+        event.listen(engine.sync_engine, "begin", self.begin_sqlite_stmt)
+
+        if logfire:
+            logfire.instrument_sqlalchemy(engine)  # pyright: ignore
+
+        if TRACKER.active:
+            TRACKER.track_pool(engine.pool)
+
+        return engine
 
     async def schedule_engine_disposal(self, cache_key: _EngineCacheKey) -> None:
         """
@@ -542,6 +849,22 @@ class AioSqliteConfiguration(BaseDatabaseConfiguration):
     async def begin_transaction(
         self, session: AsyncSession, with_for_update: bool = False
     ) -> AsyncGenerator[AsyncSessionTransaction, None]:
+        if self.uses_single_writer():
+            connection = SQLITE_WRITER_CONNECTION.get()
+            if connection is not None:
+                # a transaction nested in a writer transaction cannot wait for the
+                # writer, which is not free until the outer transaction is done, so it
+                # runs in a savepoint of the outer transaction's connection
+                async with self._begin_savepoint(session, connection) as transaction:
+                    yield transaction
+                return
+
+            writer = await self.writer()
+            async with writer.transaction() as connection:
+                async with self._begin_savepoint(session, connection) as transaction:
+                    yield transaction
+            return
+
         token = SQLITE_BEGIN_MODE.set("IMMEDIATE" if with_for_update else "DEFERRED")
 
         try:
@@ -550,6 +873,24 @@ class AioSqliteConfiguration(BaseDatabaseConfiguration):
         finally:
             SQLITE_BEGIN_MODE.reset(token)
 
+    @asynccontextmanager
+    async def _begin_savepoint(
+        self, session: AsyncSession, connection: AsyncConnection
+    ) -> AsyncGenerator[AsyncSessionTransaction, None]:
+        """
+        Runs the session's transaction in a savepoint of the writer connection's
+        transaction.
+        """
+        session.sync_session.bind = connection.sync_connection
+        session.sync_session.join_transaction_mode = "create_savepoint"
+        try:
+            async with session.begin() as transaction:
+                yield transaction
+        finally:
+            # release anything the session began after its transaction before the
+            # connection is used by another transaction
+            await session.close()
+
     async def session(self, engine: AsyncEngine) -> AsyncSession:
         """
         Retrieves a SQLAlchemy session for an engine.
@@ -137,6 +137,18 @@ class PrefectDBInterface(metaclass=DBSingleton):
             else:
                 yield session
 
+    @asynccontextmanager
+    async def read_only_session_context(self):
+        """
+        Provides a SQLAlchemy session for queries that do not write. The session
+        reads from the read replica when one is configured and caught up, so it may
+        not see the most recent writes.
+        """
+        engine = await self.database_config.read_only_engine()
+        session = await self.database_config.session(engine)
+        async with session:
+            yield session
+
     @property
     def dialect(self) -> type[sa.engine.Dialect]:
         return get_dialect(self.database_config.connection_url)
@@ -166,6 +178,11 @@ class PrefectDBInterface(metaclass=DBSingleton):
         """A task run orm model"""
         return orm_models.TaskRun
 
+    @property
+    def RunHistoryBucket(self) -> type[orm_models.RunHistoryBucket]:
+        """A model counting terminal runs per minute and state"""
+        return orm_models.RunHistoryBucket
+
     @property
     def TaskRunState(self) -> type[orm_models.TaskRunState]:
         """A task run state orm model"""
@@ -317,3 +334,8 @@ class PrefectDBInterface(metaclass=DBSingleton):
     def EventResource(self) -> type[orm_models.EventResource]:
         """An event resource model"""
         return orm_models.EventResource
+
+    @property
+    def EventRollup(self) -> type[orm_models.EventRollup]:
+        """A model counting events per minute or hour"""
+        return orm_models.EventRollup
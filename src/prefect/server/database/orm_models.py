@@ -639,6 +639,31 @@ class FlowRun(Run):
                 postgresql_where=cls.state_type == schemas.states.StateType.SCHEDULED,
                 sqlite_where=cls.state_type == schemas.states.StateType.SCHEDULED,
             ),
+            sa.Index(
+                # the next scheduled runs of each work queue, for workers
+                "ix_flow_run__scheduled_work_queue_id_next_scheduled_start_time",
+                cls.work_queue_id,
+                cls.next_scheduled_start_time,
+                postgresql_where=cls.state_type == schemas.states.StateType.SCHEDULED,
+                sqlite_where=cls.state_type == schemas.states.StateType.SCHEDULED,
+            ),
+            sa.Index(
+                # the runs counted against work queue and pool concurrency limits
+                "ix_flow_run__active_work_queue_id",
+                cls.work_queue_id,
+                postgresql_where=cls.state_type.in_(
+                    [
+                        schemas.states.StateType.RUNNING,
+                        schemas.states.StateType.PENDING,
+                    ]
+                ),
+                sqlite_where=cls.state_type.in_(
+                    [
+                        schemas.states.StateType.RUNNING,
+                        schemas.states.StateType.PENDING,
+                    ]
+                ),
+            ),
         )
 
 
@@ -774,6 +799,37 @@ class TaskRun(Run):
         )
 
 
+class RunHistoryBucket(Base):
+    """
+    The number of flow or task runs in each terminal state whose expected start time
+    (or, for task runs, start time) falls in a given minute, maintained as runs change
+    state so that run history doesn't need to scan every run.
+    """
+
+    __table_args__: Any = (
+        sa.Index(
+            "uq_run_history_bucket__run_type_time_field_bucket_state",
+            "run_type",
+            "time_field",
+            "bucket",
+            "state_type",
+            "state_name",
+            unique=True,
+        ),
+    )
+
+    run_type: Mapped[str] = mapped_column(sa.Text())
+    time_field: Mapped[str] = mapped_column(sa.Text())
+    bucket: Mapped[DateTime]
+    state_type: Mapped[schemas.states.StateType] = mapped_column(
+        sa.Enum(schemas.states.StateType, name="state_type")
+    )
+    state_name: Mapped[str] = mapped_column(sa.Text())
+    count: Mapped[int] = mapped_column(sa.BigInteger())
+    sum_estimated_run_time: Mapped[float] = mapped_column(sa.Float())
+    sum_estimated_lateness: Mapped[float] = mapped_column(sa.Float())
+
+
 class DeploymentSchedule(Base):
     deployment_id: Mapped[uuid.UUID] = mapped_column(
         sa.ForeignKey("deployment.id", ondelete="CASCADE"), index=True
@@ -1462,6 +1518,38 @@ class EventResource(Base):
     event_id: Mapped[uuid.UUID]
 
 
+class EventRollup(Base):
+    """
+    The number of events with a given name and resource that occurred in each minute
+    or hour, maintained as events are written so that counts over long time ranges
+    don't need to scan the `events` table.
+    """
+
+    @declared_attr.directive
+    def __tablename__(cls) -> str:
+        return "event_rollups"
+
+    __table_args__: Any = (
+        sa.Index(
+            "uq_event_rollups__time_unit_bucket_event_resource_id",
+            "time_unit",
+            "bucket",
+            "event",
+            "resource_id",
+            unique=True,
+        ),
+        sa.Index("ix_event_rollups__time_unit_latest", "time_unit", "latest"),
+    )
+
+    time_unit: Mapped[str] = mapped_column(sa.Text())
+    bucket: Mapped[DateTime]
+    event: Mapped[str] = mapped_column(sa.Text())
+    resource_id: Mapped[str] = mapped_column(sa.Text())
+    count: Mapped[int] = mapped_column(sa.BigInteger())
+    oldest: Mapped[DateTime]
+    latest: Mapped[DateTime]
+
+
 # These are temporary until we've migrated all the references to the new,
 # non-ORM names
 
@@ -1474,6 +1562,7 @@ ORMTaskRunStateCache = TaskRunStateCache
 ORMRun = Run
 ORMFlowRun = FlowRun
 ORMTaskRun = TaskRun
+ORMRunHistoryBucket = RunHistoryBucket
 ORMDeploymentSchedule = DeploymentSchedule
 ORMDeployment = Deployment
 ORMLog = Log
@@ -1500,6 +1589,7 @@ ORMCompositeTriggerChildFiring = CompositeTriggerChildFiring
 ORMAutomationEventFollower = AutomationEventFollower
 ORMEvent = Event
 ORMEventResource = EventResource
+ORMEventRollup = EventRollup
 
 
 _UpsertColumns = Iterable[Union[str, "sa.Column[Any]", roles.DDLConstraintColumnRole]]
@@ -1579,6 +1669,27 @@ class BaseORMConfiguration(ABC):
         """Unique columns for upserting a BlockDocument"""
         return [BlockDocument.block_type_id, BlockDocument.name]
 
+    @property
+    def run_history_bucket_unique_upsert_columns(self) -> _UpsertColumns:
+        """Unique columns for upserting a RunHistoryBucket"""
+        return [
+            RunHistoryBucket.run_type,
+            RunHistoryBucket.time_field,
+            RunHistoryBucket.bucket,
+            RunHistoryBucket.state_type,
+            RunHistoryBucket.state_name,
+        ]
+
+    @property
+    def event_rollup_unique_upsert_columns(self) -> _UpsertColumns:
+        """Unique columns for upserting an EventRollup"""
+        return [
+            EventRollup.time_unit,
+            EventRollup.bucket,
+            EventRollup.event,
+            EventRollup.resource_id,
+        ]
+
 
 class AsyncPostgresORMConfiguration(BaseORMConfiguration):
     """Postgres specific orm configuration"""
@@ -0,0 +1,145 @@
+"""
+Pre-migrated SQLite template databases.
+
+Creating a new SQLite database requires running every migration and registering all
+block types, which takes several seconds. When fast start is enabled for ephemeral
+servers, the first database created for a given set of migrations and block types is
+saved as a template, and later databases are created by copying the template.
+"""
+
+from __future__ import annotations
+
+import os
+import shutil
+import sqlite3
+import uuid
+from hashlib import sha256
+from pathlib import Path
+from typing import Optional
+
+import sqlalchemy as sa
+
+import prefect.server.database
+from prefect.logging import get_logger
+from prefect.settings.context import get_current_settings
+from prefect.utilities.hashing import hash_objects
+
+logger = get_logger("server.database")
+
+SQLITE_MIGRATIONS_PATH = (
+    Path(prefect.server.database.__file__).parent
+    / "_migrations"
+    / "versions"
+    / "sqlite"
+)
+
+
+def sqlite_database_path(connection_url: str) -> Optional[Path]:
+    """
+    Returns the path of the file of a SQLite database, or `None` if the connection URL
+    is not for a SQLite database stored in a file.
+    """
+    url = sa.engine.make_url(connection_url)
+    if url.get_backend_name() != "sqlite":
+        return None
+    database = url.database
+    if not database or database == ":memory:" or database.startswith("file:"):
+        return None
+    return Path(database).expanduser()
+
+
+class SQLiteTemplate:
+    """
+    A template for new SQLite databases at `database_path`, identified by `key`.
+    """
+
+    def __init__(self, database_path: Path, key: str, directory: Path):
+        self.database_path = database_path
+        self.key = key
+        self.directory = directory
+
+    @property
+    def path(self) -> Path:
+        return self.directory / f"{self.key}.db"
+
+    def restore(self) -> bool:
+        """
+        Create the database from the template.
+
+        Returns `False` if there is no template or the database already exists.
+        """
+        if not self.path.exists() or self.database_path.exists():
+            return False
+
+        self.database_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.database_path.with_name(
+            f".{self.database_path.name}.{uuid.uuid4().hex}.tmp"
+        )
+        try:
+            shutil.copyfile(self.path, tmp_path)
+            # linking only succeeds if no other process has created the database in
+            # the meantime
+            os.link(tmp_path, self.database_path)
+        except FileExistsError:
+            return False
+        except OSError as exc:
+            logger.debug("Unable to restore template database: %r", exc)
+            return False
+        finally:
+            tmp_path.unlink(missing_ok=True)
+
+        return True
+
+    def save(self) -> None:
+        """
+        Save a copy of the database as the template.
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.directory / f".{self.key}.{uuid.uuid4().hex}.tmp"
+        try:
+            source = sqlite3.connect(self.database_path)
+            try:
+                destination = sqlite3.connect(tmp_path)
+                try:
+                    # the backup API copies a consistent snapshot even while the
+                    # database is in use
+                    source.backup(destination)
+                finally:
+                    destination.close()
+            finally:
+                source.close()
+            os.replace(tmp_path, self.path)
+        except (OSError, sqlite3.Error) as exc:
+            logger.debug("Unable to save template database: %r", exc)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+
+
+def get_sqlite_template(
+    connection_url: str, block_registry_fingerprint: object
+) -> Optional[SQLiteTemplate]:
+    """
+    Returns the template for new databases at the given connection URL, or `None` if
+    the database is not a SQLite database stored in a file.
+
+    Templates are identified by the available migrations and the given fingerprint
+    of the registered block types, so a template is never used for a database that
+    would be created differently.
+    """
+    database_path = sqlite_database_path(connection_url)
+    if database_path is None:
+        return None
+
+    key = hash_objects(
+        sorted(path.name for path in SQLITE_MIGRATIONS_PATH.glob("*.py")),
+        block_registry_fingerprint,
+        hash_algo=sha256,
+    )
+    if key is None:
+        return None
+
+    return SQLiteTemplate(
+        database_path=database_path,
+        key=key,
+        directory=get_current_settings().home / "database-templates",
+    )
@@ -296,9 +296,9 @@ class ExternalDataAction(Action):
     async def orchestration_client(
         self, triggered_action: "TriggeredAction"
     ) -> "OrchestrationClient":
-        from prefect.server.api.clients import OrchestrationClient
+        from prefect.server.api.clients import InProcessOrchestrationClient
 
-        return OrchestrationClient(
+        return InProcessOrchestrationClient(
             additional_headers={
                 "Prefect-Automation-ID": str(triggered_action.automation.id),
                 "Prefect-Automation-Name": (
@@ -41,6 +41,11 @@ class EventPublisher(Publisher):
     async def publish_data(self, data: bytes, attributes: Mapping[str, str]) -> None:
         await self._publisher.publish_data(data, attributes)
 
+    async def publish_decoded_data(
+        self, data: bytes, attributes: Mapping[str, str], decoded: Any
+    ) -> None:
+        await self._publisher.publish_decoded_data(data, attributes, decoded)
+
     async def publish_event(self, event: ReceivedEvent) -> None:
         """
         Publishes the given events
@@ -66,12 +71,13 @@ class EventPublisher(Publisher):
             event.id,
             event.resource.get("prefect.resource.id"),
         )
-        await self.publish_data(
+        await self.publish_decoded_data(
             encoded,
             {
                 "id": str(event.id),
                 "event": event.event,
             },
+            event,
         )
 
 
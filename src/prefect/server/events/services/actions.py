@@ -31,7 +31,9 @@ class Actions(RunInAllServers, Service):
     async def start(self) -> NoReturn:
         assert self.consumer_task is None, "Actions already started"
         self.consumer: Consumer = create_consumer(
-            "actions", name=generate_unique_consumer_name("actions")
+            "actions",
+            name=generate_unique_consumer_name("actions"),
+            concurrency=get_current_settings().server.services.triggers.actions_concurrency,
         )
 
         async with actions.consumer() as handler:
@@ -8,7 +8,12 @@ import rich
 from prefect.logging import get_logger
 from prefect.server.events.schemas.events import ReceivedEvent
 from prefect.server.services.base import RunInAllServers, Service
-from prefect.server.utilities.messaging import Consumer, Message, create_consumer
+from prefect.server.utilities.messaging import (
+    Consumer,
+    Message,
+    create_consumer,
+    decode_message,
+)
 from prefect.server.utilities.messaging._consumer_names import (
     generate_unique_consumer_name,
 )
@@ -43,7 +48,7 @@ class EventLogger(RunInAllServers, Service):
 
         async def handler(message: Message):
             right_now = now("UTC")
-            event: ReceivedEvent = ReceivedEvent.model_validate_json(message.data)
+            event = decode_message(message, ReceivedEvent)
 
             console.print(
                 "Event:",
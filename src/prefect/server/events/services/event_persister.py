@@ -17,17 +17,28 @@ from prefect.logging import get_logger
 from prefect.server.database import provide_database_interface
 from prefect.server.events.schemas.events import ReceivedEvent
 from prefect.server.events.storage.database import write_events
+from prefect.server.events.storage.rollups import (
+    ROLLUP_TIME_UNITS,
+    rollup_retention_period,
+)
 from prefect.server.services.base import RunInAllServers, Service
+from prefect.server.services.partition_manager import (
+    PARTITIONED_TABLES,
+    is_partitioned,
+)
+from prefect.server.utilities.database import get_dialect
 from prefect.server.utilities.messaging import (
     Consumer,
     Message,
     MessageHandler,
     create_consumer,
+    decode_message,
 )
 from prefect.server.utilities.messaging._consumer_names import (
     generate_unique_consumer_name,
 )
 from prefect.settings import (
+    PREFECT_API_DATABASE_CONNECTION_URL,
     PREFECT_API_SERVICES_EVENT_PERSISTER_BATCH_SIZE,
     PREFECT_API_SERVICES_EVENT_PERSISTER_FLUSH_INTERVAL,
     PREFECT_EVENTS_RETENTION_PERIOD,
@@ -80,6 +91,23 @@ async def batch_delete(
     return total_deleted
 
 
+async def _partitioned_tables(session: AsyncSession) -> set[str]:
+    """
+    The names of the tables whose expired rows are removed by the partition manager
+    service by dropping partitions, rather than by deleting rows.
+    """
+    if not get_current_settings().server.services.partition_manager.enabled:
+        return set()
+    if get_dialect(PREFECT_API_DATABASE_CONNECTION_URL.value()).name != "postgresql":
+        return set()
+
+    return {
+        table.name
+        for table in PARTITIONED_TABLES
+        if await is_partitioned(session, table.name)
+    }
+
+
 class EventPersister(RunInAllServers, Service):
     """A service that persists events to the database as they arrive."""
 
@@ -164,10 +192,9 @@ async def create_handler(
             batch.append(await queue.get())
 
         try:
-            async with db.session_context() as session:
+            async with db.session_context(begin_transaction=True) as session:
                 await write_events(session=session, events=batch)
-                await session.commit()
-                logger.debug("Finished persisting events.")
+            logger.debug("Finished persisting events.")
         except Exception:
             logger.debug("Error flushing events, restoring to queue", exc_info=True)
             for event in batch:
@@ -180,25 +207,47 @@ async def create_handler(
         )
         try:
             async with db.session_context() as session:
-                resource_count = await batch_delete(
-                    session,
-                    db.EventResource,
-                    db.EventResource.updated < older_than,
-                    batch_size=delete_batch_size,
-                )
-
-                event_count = await batch_delete(
-                    session,
-                    db.Event,
-                    db.Event.occurred < older_than,
-                    batch_size=delete_batch_size,
-                )
-
-                if resource_count or event_count:
+                partitioned = await _partitioned_tables(session)
+
+                resource_count = 0
+                if db.EventResource.__tablename__ not in partitioned:
+                    resource_count = await batch_delete(
+                        session,
+                        db.EventResource,
+                        db.EventResource.updated < older_than,
+                        batch_size=delete_batch_size,
+                    )
+
+                event_count = 0
+                if db.Event.__tablename__ not in partitioned:
+                    event_count = await batch_delete(
+                        session,
+                        db.Event,
+                        db.Event.occurred < older_than,
+                        batch_size=delete_batch_size,
+                    )
+
+                # rollups are only removed once every event they count has expired
+                rollup_count = 0
+                for time_unit in ROLLUP_TIME_UNITS:
+                    rollup_count += await batch_delete(
+                        session,
+                        db.EventRollup,
+                        sa.and_(
+                            db.EventRollup.time_unit == time_unit.value,
+                            db.EventRollup.latest
+                            < now("UTC") - rollup_retention_period(time_unit),
+                        ),
+                        batch_size=delete_batch_size,
+                    )
+
+                if resource_count or event_count or rollup_count:
                     logger.debug(
-                        "Trimmed %s events and %s event resources older than %s.",
+                        "Trimmed %s events, %s event resources, and %s event rollups "
+                        "older than %s.",
                         event_count,
                         resource_count,
+                        rollup_count,
                         older_than,
                     )
         except Exception:
@@ -225,7 +274,7 @@ async def create_handler(
         if not message.data:
             return
 
-        event = ReceivedEvent.model_validate_json(message.data)
+        event = decode_message(message, ReceivedEvent)
 
         logger.debug(
             "Received event: %s with id: %s for resource: %s",
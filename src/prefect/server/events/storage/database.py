@@ -1,4 +1,5 @@
 from typing import TYPE_CHECKING, Any, Generator, Optional, Sequence
+from uuid import UUID
 
 import pydantic
 import sqlalchemy as sa
@@ -18,6 +19,7 @@ from prefect.server.events.storage import (
     INTERACTIVE_PAGE_SIZE,
     from_page_token,
     process_time_based_counts,
+    rollups,
     to_page_token,
 )
 from prefect.server.utilities.database import get_dialect
@@ -79,13 +81,20 @@ async def count_events(
     time_unit.validate_buckets(
         filter.occurred.since, filter.occurred.until, time_interval
     )
-    results = await session.execute(
-        countable.get_database_query(filter, time_unit, time_interval)
-    )
 
-    counts = pydantic.TypeAdapter(list[EventCount]).validate_python(
-        results.mappings().all()
-    )
+    if rollup_unit := rollups.rollup_time_unit(
+        filter, countable, time_unit, time_interval
+    ):
+        counts = await rollups.count_events(
+            session, filter, countable, time_unit, time_interval, rollup_unit
+        )
+    else:
+        results = await session.execute(
+            countable.get_database_query(filter, time_unit, time_interval)
+        )
+        counts = pydantic.TypeAdapter(list[EventCount]).validate_python(
+            results.mappings().all()
+        )
 
     if countable in (Countable.day, Countable.time):
         counts = process_time_based_counts(filter, time_unit, time_interval, counts)
@@ -199,7 +208,8 @@ async def read_events(
 
 async def write_events(session: AsyncSession, events: list[ReceivedEvent]) -> None:
     """
-    Write events to the database.
+    Write events to the database, adding any that weren't already stored to the
+    event count rollups.
 
     Args:
         session: a database session
@@ -208,58 +218,86 @@ async def write_events(session: AsyncSession, events: list[ReceivedEvent]) -> No
     if events:
         dialect = get_dialect(PREFECT_API_DATABASE_CONNECTION_URL.value())
         if dialect.name == "postgresql":
-            await _write_postgres_events(session, events)
+            inserted = await _write_postgres_events(session, events)
         else:
-            await _write_sqlite_events(session, events)
+            inserted = await _write_sqlite_events(session, events)
+
+        await rollups.write_rollups(session, inserted)
 
 
 @db_injector
 async def _write_sqlite_events(
     db: PrefectDBInterface, session: AsyncSession, events: list[ReceivedEvent]
-) -> None:
+) -> list[ReceivedEvent]:
     """
     Write events to the SQLite database.
 
-    SQLite does not support the `RETURNING` clause with SQLAlchemy < 2, so we need to
-    check for existing events before inserting them.
+    Like the Postgres path, duplicate events are skipped with `ON CONFLICT DO NOTHING`
+    and only the newly inserted events have their resources written.  The rows are
+    sent as a single executemany-style statement, which SQLAlchemy splits into
+    batches that fit within SQLite's parameter limits.  SQLite versions before 3.35
+    do not support `RETURNING`, so on those the existing events are read first.
 
     Args:
         session: a SQLite events session
         events: the events to insert
+
+    Returns:
+        The events that were inserted
     """
-    for batch in _in_safe_batches(events):
-        event_ids = {event.id for event in batch}
+    event_rows = [event.as_database_row() for event in events]
+    if session.get_bind().dialect.insert_returning:
         result = await session.scalars(
-            sa.select(db.Event.id).where(db.Event.id.in_(event_ids))
+            db.queries.insert(db.Event).on_conflict_do_nothing().returning(db.Event.id),
+            event_rows,
         )
-        existing_event_ids = list(result.all())
-        events_to_insert = [
-            event for event in batch if event.id not in existing_event_ids
-        ]
-        event_rows = [event.as_database_row() for event in events_to_insert]
-        await session.execute(db.queries.insert(db.Event).values(event_rows))
-
-        resource_rows: list[dict[str, Any]] = []
-        for event in events_to_insert:
-            resource_rows.extend(event.as_database_resource_rows())
+        inserted_event_ids = set(result.all())
+    else:
+        existing_event_ids: set[UUID] = set()
+        for batch in _in_safe_batches(events):
+            result = await session.scalars(
+                sa.select(db.Event.id).where(
+                    db.Event.id.in_([event.id for event in batch])
+                )
+            )
+            existing_event_ids.update(result.all())
+        await session.execute(
+            db.queries.insert(db.Event).on_conflict_do_nothing(), event_rows
+        )
+        inserted_event_ids = {event.id for event in events} - existing_event_ids
 
-        if not resource_rows:
+    inserted: list[ReceivedEvent] = []
+    resource_rows: list[dict[str, Any]] = []
+    for event in events:
+        if event.id not in inserted_event_ids:
+            # the event was a duplicate, so its related resources were already written
             continue
+        # discard the id so that a duplicate later in the batch is skipped as well
+        inserted_event_ids.discard(event.id)
+        inserted.append(event)
+        resource_rows.extend(event.as_database_resource_rows())
 
-        await session.execute(db.queries.insert(db.EventResource).values(resource_rows))
+    if resource_rows:
+        await session.execute(db.queries.insert(db.EventResource), resource_rows)
+
+    return inserted
 
 
 @db_injector
 async def _write_postgres_events(
     db: PrefectDBInterface, session: AsyncSession, events: list[ReceivedEvent]
-) -> None:
+) -> list[ReceivedEvent]:
     """
     Write events to the Postgres database.
 
     Args:
         session: a Postgres events session
         events: the events to insert
+
+    Returns:
+        The events that were inserted
     """
+    inserted: list[ReceivedEvent] = []
     for batch in _in_safe_batches(events):
         event_rows = [event.as_database_row() for event in batch]
         result = await session.scalars(
@@ -277,6 +315,8 @@ async def _write_postgres_events(
                 # we will skip adding its related resources, as they would have been
                 # inserted already
                 continue
+            inserted_event_ids.discard(event.id)
+            inserted.append(event)
             resource_rows.extend(event.as_database_resource_rows())
 
         if not resource_rows:
@@ -284,6 +324,8 @@ async def _write_postgres_events(
 
         await session.execute(db.queries.insert(db.EventResource).values(resource_rows))
 
+    return inserted
+
 
 def get_max_query_parameters() -> int:
     dialect = get_dialect(PREFECT_API_DATABASE_CONNECTION_URL.value())
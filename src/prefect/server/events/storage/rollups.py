@@ -0,0 +1,356 @@
+"""
+Pre-aggregated event counts.
+
+As events are written, the number of events with each name and resource is counted
+per minute and per hour in the `event_rollups` table.  Count queries whose buckets are
+whole multiples of one of those time units, and whose filter only constrains the
+event name and resource ID, are answered by summing rollups for the part of the range
+they cover completely.  The partial minutes or hours at either edge of the range are
+counted from the `events` table.
+
+Per-minute rollups outnumber per-hour rollups by up to sixty to one, so they are only
+retained for `PREFECT_SERVER_EVENTS_MINUTE_ROLLUP_RETENTION_PERIOD`, after which
+counts with buckets that are not whole hours fall back to the `events` table.
+"""
+
+from __future__ import annotations
+
+import datetime
+import math
+from datetime import timedelta
+from typing import TYPE_CHECKING, Any, Optional
+from zoneinfo import ZoneInfo
+
+import pydantic
+import sqlalchemy as sa
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.visitors import replacement_traverse
+
+from prefect.server.database import PrefectDBInterface, db_injector
+from prefect.server.events.counting import PIVOT_DATETIME, Countable, TimeUnit
+from prefect.server.events.filters import EventFilter, EventOccurredFilter
+from prefect.server.events.schemas.events import EventCount, ReceivedEvent
+from prefect.settings import get_current_settings
+from prefect.types._datetime import now
+
+if TYPE_CHECKING:
+    from sqlalchemy.sql.expression import ColumnExpressionArgument
+
+
+UTC = ZoneInfo("UTC")
+
+# The time units that events are rolled up into, coarsest first
+ROLLUP_TIME_UNITS: tuple[TimeUnit, ...] = (TimeUnit.hour, TimeUnit.minute)
+
+
+def truncate(occurred: datetime.datetime, time_unit: TimeUnit) -> datetime.datetime:
+    """Returns the start of the rollup bucket that contains the given time"""
+    occurred = occurred.astimezone(UTC)
+    if time_unit == TimeUnit.hour:
+        return occurred.replace(minute=0, second=0, microsecond=0)
+    elif time_unit == TimeUnit.minute:
+        return occurred.replace(second=0, microsecond=0)
+    else:
+        raise NotImplementedError(f"Events are not rolled up by {time_unit.value}.")
+
+
+@db_injector
+async def write_rollups(
+    db: PrefectDBInterface, session: AsyncSession, events: list[ReceivedEvent]
+) -> None:
+    """
+    Add the given events to the rollups.
+
+    Only pass events that were newly written; counting an event twice would inflate
+    the rollups.
+
+    Args:
+        session: a database session
+        events: the events that were written
+    """
+    rows: dict[tuple[str, datetime.datetime, str, str], dict[str, Any]] = {}
+    for event in events:
+        occurred = event.occurred.astimezone(UTC)
+        for time_unit in ROLLUP_TIME_UNITS:
+            key = (
+                time_unit.value,
+                truncate(occurred, time_unit),
+                event.event,
+                event.resource.id,
+            )
+            if row := rows.get(key):
+                row["count"] += 1
+                row["oldest"] = min(row["oldest"], occurred)
+                row["latest"] = max(row["latest"], occurred)
+            else:
+                rows[key] = {
+                    "time_unit": key[0],
+                    "bucket": key[1],
+                    "event": key[2],
+                    "resource_id": key[3],
+                    "count": 1,
+                    "oldest": occurred,
+                    "latest": occurred,
+                }
+
+    if not rows:
+        return
+
+    insert = db.queries.insert(db.EventRollup)
+    rollup = db.EventRollup
+    await session.execute(
+        insert.on_conflict_do_update(
+            index_elements=db.orm.event_rollup_unique_upsert_columns,
+            set_={
+                "count": rollup.count + insert.excluded.count,
+                "oldest": sa.case(
+                    (insert.excluded.oldest < rollup.oldest, insert.excluded.oldest),
+                    else_=rollup.oldest,
+                ),
+                "latest": sa.case(
+                    (insert.excluded.latest > rollup.latest, insert.excluded.latest),
+                    else_=rollup.latest,
+                ),
+            },
+        ),
+        # upsert in a consistent order so that concurrent writers don't deadlock
+        [rows[key] for key in sorted(rows)],
+    )
+
+
+def rollup_retention_period(time_unit: TimeUnit) -> timedelta:
+    """Returns how long rollups of the given time unit are retained"""
+    settings = get_current_settings().server.events
+    if time_unit == TimeUnit.minute:
+        return min(settings.retention_period, settings.minute_rollup_retention_period)
+    return settings.retention_period
+
+
+def rollup_time_unit(
+    filter: EventFilter,
+    countable: Countable,
+    time_unit: TimeUnit,
+    time_interval: float,
+) -> Optional[TimeUnit]:
+    """
+    Returns the coarsest rollup that can answer the given count query, or `None` if
+    it must be answered from the `events` table.
+    """
+    if countable == Countable.resource:
+        # resources are labelled by the name in their most recent event
+        return None
+
+    if filter.related or filter.any_resource or filter.id.id:
+        return None
+
+    if filter.resource and filter.resource.labels:
+        return None
+
+    if countable == Countable.event:
+        return ROLLUP_TIME_UNITS[0]
+
+    if countable == Countable.day:
+        bucket_size = TimeUnit.day.as_timedelta(1)
+    else:
+        bucket_size = time_unit.as_timedelta(time_interval)
+
+    for rollup_unit in ROLLUP_TIME_UNITS:
+        if bucket_size % rollup_unit.as_timedelta(1) == timedelta(0):
+            return rollup_unit
+
+    return None
+
+
+def _ceil(value: datetime.datetime, time_unit: TimeUnit) -> datetime.datetime:
+    truncated = truncate(value, time_unit)
+    if truncated < value:
+        truncated += time_unit.as_timedelta(1)
+    return truncated
+
+
+@db_injector
+def _rollup_where_clauses(
+    db: PrefectDBInterface, filter: EventFilter
+) -> list["ColumnExpressionArgument[bool]"]:
+    """Applies the filter's event name and resource ID criteria to the rollups"""
+    events = db.Event.__table__
+    rollups = db.EventRollup.__table__
+
+    def replace(element: Any) -> Any:
+        if getattr(element, "table", None) is events and element.name in rollups.c:
+            return rollups.c[element.name]
+        return None
+
+    clauses: list["ColumnExpressionArgument[bool]"] = []
+    for criteria in (filter.event, filter.resource):
+        if criteria:
+            clauses.extend(
+                replacement_traverse(clause, {}, replace)
+                for clause in criteria.build_where_clauses()
+            )
+    return clauses
+
+
+async def count_events(
+    session: AsyncSession,
+    filter: EventFilter,
+    countable: Countable,
+    time_unit: TimeUnit,
+    time_interval: float,
+    rollup_unit: TimeUnit,
+) -> list[EventCount]:
+    """
+    Count events using the rollups of the given time unit for the part of the
+    filter's time range that they cover completely, and the `events` table for the
+    rest.
+    """
+    since = filter.occurred.since.astimezone(UTC)
+    until = filter.occurred.until.astimezone(UTC)
+
+    # Rollups from before the retention period may be missing events that were
+    # already trimmed, so they are never used
+    retained_since = now("UTC") - rollup_retention_period(rollup_unit)
+
+    covered_since = _ceil(max(since, retained_since), rollup_unit)
+    covered_until = truncate(until + timedelta(microseconds=1), rollup_unit)
+
+    if covered_since >= covered_until:
+        return await _count_raw_events(
+            session, filter, countable, time_unit, time_interval
+        )
+
+    counts = await _count_rollups(
+        session,
+        filter,
+        countable,
+        time_unit,
+        time_interval,
+        rollup_unit,
+        covered_since,
+        covered_until,
+    )
+
+    edges = [
+        (since, covered_since - timedelta(microseconds=1)),
+        (covered_until, until),
+    ]
+    for edge_since, edge_until in edges:
+        if edge_since > edge_until:
+            continue
+        edge_filter = filter.model_copy(
+            update={"occurred": EventOccurredFilter(since=edge_since, until=edge_until)}
+        )
+        counts.extend(
+            await _count_raw_events(
+                session, edge_filter, countable, time_unit, time_interval
+            )
+        )
+
+    return _merge_counts(countable, counts)
+
+
+async def _count_raw_events(
+    session: AsyncSession,
+    filter: EventFilter,
+    countable: Countable,
+    time_unit: TimeUnit,
+    time_interval: float,
+) -> list[EventCount]:
+    results = await session.execute(
+        countable.get_database_query(filter, time_unit, time_interval)
+    )
+    return pydantic.TypeAdapter(list[EventCount]).validate_python(
+        results.mappings().all()
+    )
+
+
+@db_injector
+async def _count_rollups(
+    db: PrefectDBInterface,
+    session: AsyncSession,
+    filter: EventFilter,
+    countable: Countable,
+    time_unit: TimeUnit,
+    time_interval: float,
+    rollup_unit: TimeUnit,
+    since: datetime.datetime,
+    until: datetime.datetime,
+) -> list[EventCount]:
+    rollup = db.EventRollup
+    where = [
+        rollup.time_unit == rollup_unit.value,
+        rollup.bucket >= since,
+        rollup.bucket < until,
+        *_rollup_where_clauses(filter),
+    ]
+
+    if countable == Countable.event:
+        result = await session.execute(
+            sa.select(
+                rollup.event,
+                sa.func.sum(rollup.count).label("count"),
+                sa.func.min(rollup.oldest).label("start_time"),
+                sa.func.max(rollup.latest).label("end_time"),
+            )
+            .where(*where)
+            .group_by(rollup.event)
+        )
+        return [
+            EventCount(
+                value=row.event,
+                label=row.event,
+                count=row.count,
+                start_time=row.start_time,
+                end_time=row.end_time,
+            )
+            for row in result
+        ]
+
+    if countable == Countable.day:
+        bucket_size = TimeUnit.day.as_timedelta(1)
+    else:
+        bucket_size = time_unit.as_timedelta(time_interval)
+
+    result = await session.execute(
+        sa.select(rollup.bucket, sa.func.sum(rollup.count).label("count"))
+        .where(*where)
+        .group_by(rollup.bucket)
+    )
+
+    # the labels and times of time-based counts are replaced with those of their
+    # spans by `process_time_based_counts`, so only the value and count matter here
+    counts: list[EventCount] = []
+    for row in result:
+        bucket = row.bucket.astimezone(UTC)
+        index = math.floor((bucket - PIVOT_DATETIME) / bucket_size)
+        counts.append(
+            EventCount(
+                value=str(index),
+                label=bucket.isoformat(),
+                count=row.count,
+                start_time=bucket,
+                end_time=bucket,
+            )
+        )
+    return counts
+
+
+def _merge_counts(countable: Countable, counts: list[EventCount]) -> list[EventCount]:
+    """Combines counts of the same value from rollups and the range's edges"""
+    merged: dict[str, EventCount] = {}
+    for count in counts:
+        value = count.value
+        if countable in (Countable.day, Countable.time):
+            value = str(int(float(value)))
+
+        if existing := merged.get(value):
+            existing.count += count.count
+            existing.start_time = min(existing.start_time, count.start_time)
+            existing.end_time = max(existing.end_time, count.end_time)
+        else:
+            merged[value] = count.model_copy(update={"value": value})
+
+    if countable in (Countable.day, Countable.time):
+        return sorted(merged.values(), key=lambda count: count.start_time)
+
+    return sorted(merged.values(), key=lambda count: (-count.count, count.label))
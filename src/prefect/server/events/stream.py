@@ -88,7 +88,7 @@ async def distributor() -> AsyncGenerator[messaging.MessageHandler, None]:
             return
 
         if subscribers:
-            event = ReceivedEvent.model_validate_json(message.data)
+            event = messaging.decode_message(message, ReceivedEvent)
             for queue in subscribers:
                 filter = filters[queue]
                 if filter.excludes(event):
@@ -56,7 +56,11 @@ from prefect.server.events.schemas.automations import (
     TriggerState,
 )
 from prefect.server.events.schemas.events import ReceivedEvent
-from prefect.server.utilities.messaging import Message, MessageHandler
+from prefect.server.utilities.messaging import (
+    Message,
+    MessageHandler,
+    decode_message,
+)
 from prefect.server.utilities.postgres_listener import (
     get_pg_notify_connection,
     pg_listen,
@@ -1114,7 +1118,7 @@ async def consumer(
         if await ordering.event_has_been_seen(event_id):
             return
 
-        event = ReceivedEvent.model_validate_json(message.data)
+        event = decode_message(message, ReceivedEvent)
 
         try:
             await reactive_evaluation(event)
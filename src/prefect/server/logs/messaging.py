@@ -7,6 +7,8 @@ from __future__ import annotations
 from contextlib import asynccontextmanager
 from typing import TYPE_CHECKING, AsyncGenerator
 
+from pydantic import TypeAdapter
+
 from prefect.logging import get_logger
 from prefect.server.schemas.core import Log
 from prefect.server.utilities import messaging
@@ -17,6 +19,8 @@ if TYPE_CHECKING:
 
 logger: "logging.Logger" = get_logger(__name__)
 
+logs_adapter: TypeAdapter[list[Log]] = TypeAdapter(list[Log])
+
 
 @asynccontextmanager
 async def create_log_publisher() -> AsyncGenerator[messaging.Publisher, None]:
@@ -34,6 +38,8 @@ async def publish_logs(logs: list[Log]) -> None:
     """
     Publishes logs to the messaging system.
 
+    The logs are published as a single message containing a JSON array of logs.
+
     Args:
         logs: The logs to publish
     """
@@ -44,8 +50,7 @@ async def publish_logs(logs: list[Log]) -> None:
         return
 
     async with create_log_publisher() as publisher:
-        for log in logs:
-            await publisher.publish_data(
-                data=log.model_dump_json().encode(),
-                attributes={"log_id": str(log.id)} if log.id else {},
-            )
+        await publisher.publish_data(
+            data=logs_adapter.dump_json(logs),
+            attributes={"log_count": str(len(logs))},
+        )
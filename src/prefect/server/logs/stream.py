@@ -15,6 +15,7 @@ from typing import (
 )
 
 from prefect.logging import get_logger
+from prefect.server.logs.messaging import logs_adapter
 from prefect.server.schemas.core import Log
 from prefect.server.schemas.filters import LogFilter
 from prefect.server.services.base import RunInAllServers, Service
@@ -165,20 +166,25 @@ async def distributor() -> AsyncGenerator[messaging.MessageHandler, None]:
 
         if subscribers:
             try:
-                log = Log.model_validate_json(message.data)
+                if "log_count" in message.attributes:
+                    # A batch of logs published by a single request
+                    logs = logs_adapter.validate_json(message.data)
+                else:
+                    logs = [Log.model_validate_json(message.data)]
             except Exception as e:
                 logger.warning(f"Failed to parse log message: {e}")
                 return
 
-            for queue in subscribers:
-                filter = filters[queue]
-                if not log_matches_filter(log, filter):
-                    continue
+            for log in logs:
+                for queue in subscribers:
+                    filter = filters[queue]
+                    if not log_matches_filter(log, filter):
+                        continue
 
-                try:
-                    queue.put_nowait(log)
-                except asyncio.QueueFull:
-                    continue
+                    try:
+                        queue.put_nowait(log)
+                    except asyncio.QueueFull:
+                        continue
 
     yield message_handler
 
@@ -14,6 +14,7 @@ from . import (
     flow_runs,
     flows,
     logs,
+    run_history_buckets,
     saved_searches,
     task_run_states,
     task_runs,
@@ -1,4 +1,6 @@
 import json
+import os
+import sys
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Dict, List, Union, cast
 from uuid import UUID
@@ -25,6 +27,59 @@ COLLECTIONS_BLOCKS_DATA_PATH = (
 )
 
 
+def _block_module_fingerprint(module_name: str) -> list[Any]:
+    """
+    Returns the version of the package a block class is defined in along with the
+    size and modification time of its module's file, so that upgrading or editing
+    the package changes the fingerprint.
+    """
+    module = sys.modules.get(module_name)
+    package = sys.modules.get(module_name.partition(".")[0])
+    fingerprint: list[Any] = [getattr(package, "__version__", None)]
+
+    module_file = getattr(module, "__file__", None)
+    if module_file:
+        try:
+            module_stat = os.stat(module_file)
+        except OSError:
+            pass
+        else:
+            fingerprint += [module_stat.st_size, module_stat.st_mtime_ns]
+    return fingerprint
+
+
+def block_registry_fingerprint() -> dict[str, Any]:
+    """
+    Returns a cheap fingerprint of the blocks that would be registered by
+    `run_block_auto_registration`.
+
+    Registered block classes are identified by their import path, the version of
+    their package and the size and modification time of their module, and the
+    collection blocks data by the size and modification time of its file, so that
+    computing the fingerprint does not require serializing any block schemas.
+    """
+    import prefect
+    from prefect.utilities.dispatch import get_registry_for_type
+
+    block_registry = get_registry_for_type(Block) or {}
+    collection_blocks_data = COLLECTIONS_BLOCKS_DATA_PATH.stat()
+
+    return {
+        "prefect_version": prefect.__version__,
+        "blocks": sorted(
+            [
+                f"{key}={block_class.__module__}.{block_class.__qualname__}",
+                *_block_module_fingerprint(block_class.__module__),
+            ]
+            for key, block_class in block_registry.items()
+        ),
+        "collection_blocks_data": [
+            collection_blocks_data.st_size,
+            collection_blocks_data.st_mtime_ns,
+        ],
+    }
+
+
 async def _install_protected_system_blocks(session: AsyncSession) -> None:
     """Install block types that the system expects to be present"""
     protected_system_blocks = cast(
@@ -132,6 +132,14 @@ async def create_flow_run(
         result = await session.execute(query)
         model = result.scalar_one()
 
+    # a new run may have been created with its state type already set, rather
+    # than with a state to orchestrate
+    if model.created == right_now:
+        await models.run_history_buckets.update_buckets(
+            session,
+            added=models.run_history_buckets.run_contributions("flow_run", model),
+        )
+
     # if the flow run was created in this function call then we need to set the
     # state. If it was created idempotently, the created time won't match.
     if model.created == right_now and flow_run.state:
@@ -496,6 +504,15 @@ async def delete_flow_run(
     if deployment_id:
         await cleanup_flow_run_concurrency_slots(session=session, flow_run=flow_run)
 
+    # Remove the flow run and the task runs deleted along with it from the run
+    # history
+    await models.run_history_buckets.remove_runs(
+        session, "flow_run", db.FlowRun.id == flow_run_id
+    )
+    await models.run_history_buckets.remove_runs(
+        session, "task_run", db.TaskRun.flow_run_id == flow_run_id
+    )
+
     # Delete the flow run
     result = await session.execute(
         delete(db.FlowRun).where(db.FlowRun.id == flow_run_id)
@@ -11,6 +11,7 @@ from sqlalchemy import delete, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.sql import Select
 
+import prefect.server.models as models
 import prefect.server.schemas as schemas
 from prefect.server.database import PrefectDBInterface, db_injector, orm_models
 
@@ -286,6 +287,18 @@ async def delete_flow(
         bool: whether or not the flow was deleted
     """
 
+    # Remove the flow's runs, which are deleted along with it, from the run history
+    await models.run_history_buckets.remove_runs(
+        session, "flow_run", db.FlowRun.flow_id == flow_id
+    )
+    await models.run_history_buckets.remove_runs(
+        session,
+        "task_run",
+        db.TaskRun.flow_run_id.in_(
+            select(db.FlowRun.id).where(db.FlowRun.flow_id == flow_id)
+        ),
+    )
+
     result = await session.execute(delete(db.Flow).where(db.Flow.id == flow_id))
     return result.rowcount > 0
 
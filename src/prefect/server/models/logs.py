@@ -3,16 +3,19 @@ Functions for interacting with log ORM objects.
 Intended for internal use by the Prefect REST API.
 """
 
-from typing import TYPE_CHECKING, Generator, Optional, Sequence, Tuple
+from typing import TYPE_CHECKING, Any, Generator, Optional, Sequence, Tuple
 
+import sqlalchemy as sa
 from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
 
 import prefect.server.schemas as schemas
+from prefect._internal.uuid7 import uuid7
 from prefect.logging import get_logger
 from prefect.server.database import PrefectDBInterface, db_injector, orm_models
 from prefect.server.logs import messaging
 from prefect.server.schemas.actions import LogCreate
+from prefect.types._datetime import now
 from prefect.utilities.collections import batched_iterable
 
 # We have a limit of 32,767 parameters at a time for a single query...
@@ -24,6 +27,19 @@ NUMBER_OF_LOG_FIELDS = len(schemas.core.Log.model_fields)
 # ...so we can only INSERT batches of a certain size at a time
 LOG_BATCH_SIZE = MAXIMUM_QUERY_PARAMETERS // NUMBER_OF_LOG_FIELDS
 
+# The columns written when logs are created
+LOG_COLUMNS = [
+    "id",
+    "created",
+    "updated",
+    "name",
+    "level",
+    "message",
+    "timestamp",
+    "flow_run_id",
+    "task_run_id",
+]
+
 if TYPE_CHECKING:
     import logging
 
@@ -44,6 +60,9 @@ async def create_logs(
     """
     Creates new logs
 
+    Logs are inserted in bulk: with `COPY` on PostgreSQL and a single `executemany`
+    on SQLite.
+
     Args:
         session: a database session
         logs: a list of log schemas
@@ -52,12 +71,32 @@ async def create_logs(
         None
     """
     try:
-        full_logs = [schemas.core.Log(**log.model_dump()) for log in logs]
-        await session.execute(
-            db.queries.insert(db.Log).values(
-                [log.model_dump(exclude={"created", "updated"}) for log in full_logs]
+        created = now("UTC")
+        # The logs have already been validated, so build the full logs without
+        # validating them again
+        full_logs = [
+            schemas.core.Log.model_construct(
+                id=uuid7(),
+                created=created,
+                updated=created,
+                name=log.name,
+                level=log.level,
+                message=log.message,
+                timestamp=log.timestamp,
+                flow_run_id=log.flow_run_id,
+                task_run_id=log.task_run_id,
             )
-        )
+            for log in logs
+        ]
+        if full_logs:
+            connection = await session.connection()
+            if connection.dialect.name == "postgresql":
+                await _copy_logs(connection, db.Log.__table__, full_logs)
+            else:
+                await connection.execute(
+                    sa.insert(db.Log.__table__),
+                    [_log_row(log) for log in full_logs],
+                )
         await messaging.publish_logs(full_logs)
 
     except RuntimeError as exc:
@@ -70,6 +109,27 @@ async def create_logs(
             raise
 
 
+def _log_row(log: schemas.core.Log) -> dict[str, Any]:
+    return {column: getattr(log, column) for column in LOG_COLUMNS}
+
+
+async def _copy_logs(
+    connection: AsyncConnection, table: sa.Table, logs: Sequence[schemas.core.Log]
+) -> None:
+    """
+    Insert logs with the PostgreSQL `COPY` protocol.
+    """
+    raw_connection = await connection.get_raw_connection()
+    # The driver connection is the underlying `asyncpg` connection
+    driver_connection: Any = raw_connection.driver_connection
+    await driver_connection.copy_records_to_table(
+        table.name,
+        schema_name=table.schema,
+        columns=LOG_COLUMNS,
+        records=[tuple(getattr(log, column) for column in LOG_COLUMNS) for log in logs],
+    )
+
+
 @db_injector
 async def read_logs(
     db: PrefectDBInterface,
@@ -0,0 +1,361 @@
+"""
+Functions for maintaining and reading run history buckets.
+
+Flow and task runs in terminal states are counted per minute of their expected start
+time, and task runs also per minute of their start time, in the `run_history_bucket`
+table. The buckets are updated whenever a run changes state or is deleted, so that
+history queries read a few rows per minute instead of every run in their range. Runs
+in other states are never bucketed, because their estimated run time and lateness
+keep changing as time passes.
+
+Intended for internal use by the Prefect REST API.
+"""
+
+import datetime
+from typing import Any, Iterable, Literal, Optional, Sequence
+from zoneinfo import ZoneInfo
+
+import sqlalchemy as sa
+from sqlalchemy.ext.asyncio import AsyncSession
+
+import prefect.server.schemas as schemas
+from prefect.server.database import PrefectDBInterface, db_injector
+from prefect.server.utilities.schemas import PrefectBaseModel
+
+UTC = ZoneInfo("UTC")
+
+RunType = Literal["flow_run", "task_run"]
+TimeField = Literal["expected_start_time", "start_time"]
+
+BUCKET_SIZE = datetime.timedelta(minutes=1)
+
+# the run timestamps that each type of run is bucketed by
+BUCKETED_TIME_FIELDS: dict[RunType, tuple[TimeField, ...]] = {
+    "flow_run": ("expected_start_time",),
+    "task_run": ("expected_start_time", "start_time"),
+}
+
+
+def truncate(value: datetime.datetime) -> datetime.datetime:
+    """Returns the start of the bucket that contains the given time"""
+    return value.astimezone(UTC).replace(second=0, microsecond=0)
+
+
+def answers_filters(
+    interval: datetime.timedelta, *filters: Optional[PrefectBaseModel]
+) -> bool:
+    """
+    Returns whether a query for intervals of the given size, with the given filters,
+    can be answered from the buckets. Buckets are only kept per state and time, so
+    any other filter criteria require a scan of the runs themselves.
+    """
+    if interval < BUCKET_SIZE:
+        return False
+
+    for filter in filters:
+        if filter is None:
+            continue
+        for field in type(filter).model_fields:
+            if field != "operator" and getattr(filter, field) is not None:
+                return False
+
+    return True
+
+
+def run_contributions(run_type: RunType, run: Any) -> list[dict[str, Any]]:
+    """
+    Returns the bucket counts contributed by a run, given an object with its
+    `state_type`, `state_name`, `expected_start_time`, `start_time`, and
+    `total_run_time`.
+    """
+    if run.state_type not in schemas.states.TERMINAL_STATES:
+        return []
+
+    # mirror the terminal-state case of `Run.estimated_run_time` and
+    # `Run.estimated_start_time_delta`, clamped at zero as in `run_history`
+    estimated_run_time = max(run.total_run_time.total_seconds(), 0.0)
+    estimated_lateness = 0.0
+    if (
+        run.start_time is not None
+        and run.expected_start_time is not None
+        and run.start_time > run.expected_start_time
+    ):
+        estimated_lateness = (run.start_time - run.expected_start_time).total_seconds()
+
+    contributions: list[dict[str, Any]] = []
+    for time_field in BUCKETED_TIME_FIELDS[run_type]:
+        value: Optional[datetime.datetime] = getattr(run, time_field)
+        if value is None:
+            continue
+        contributions.append(
+            {
+                "run_type": run_type,
+                "time_field": time_field,
+                "bucket": truncate(value),
+                "state_type": run.state_type,
+                "state_name": run.state_name,
+                "count": 1,
+                "sum_estimated_run_time": estimated_run_time,
+                "sum_estimated_lateness": estimated_lateness,
+            }
+        )
+    return contributions
+
+
+@db_injector
+async def update_buckets(
+    db: PrefectDBInterface,
+    session: AsyncSession,
+    removed: Iterable[dict[str, Any]] = (),
+    added: Iterable[dict[str, Any]] = (),
+) -> None:
+    """
+    Replaces the `removed` contributions to the buckets with the `added` ones.
+
+    Args:
+        session: a database session
+        removed: contributions of runs as they were before a change
+        added: contributions of runs as they are after a change
+    """
+    rows: dict[tuple[Any, ...], dict[str, Any]] = {}
+    for sign, contributions in ((-1, removed), (1, added)):
+        for contribution in contributions:
+            key = (
+                contribution["run_type"],
+                contribution["time_field"],
+                contribution["bucket"],
+                contribution["state_type"].value,
+                contribution["state_name"],
+            )
+            row = rows.setdefault(
+                key,
+                {
+                    **contribution,
+                    "count": 0,
+                    "sum_estimated_run_time": 0.0,
+                    "sum_estimated_lateness": 0.0,
+                },
+            )
+            row["count"] += sign * contribution["count"]
+            row["sum_estimated_run_time"] += (
+                sign * contribution["sum_estimated_run_time"]
+            )
+            row["sum_estimated_lateness"] += (
+                sign * contribution["sum_estimated_lateness"]
+            )
+
+    # most transitions between non-terminal states leave the buckets unchanged
+    changes = [
+        rows[key]
+        for key in sorted(rows)
+        if rows[key]["count"]
+        or rows[key]["sum_estimated_run_time"]
+        or rows[key]["sum_estimated_lateness"]
+    ]
+    if not changes:
+        return
+
+    insert = db.queries.insert(db.RunHistoryBucket)
+    bucket = db.RunHistoryBucket
+    await session.execute(
+        insert.on_conflict_do_update(
+            index_elements=db.orm.run_history_bucket_unique_upsert_columns,
+            set_={
+                "count": bucket.count + insert.excluded.count,
+                "sum_estimated_run_time": (
+                    bucket.sum_estimated_run_time
+                    + insert.excluded.sum_estimated_run_time
+                ),
+                "sum_estimated_lateness": (
+                    bucket.sum_estimated_lateness
+                    + insert.excluded.sum_estimated_lateness
+                ),
+            },
+        ),
+        # changes are upserted in a consistent order so that concurrent
+        # transitions don't deadlock
+        changes,
+    )
+
+
+@db_injector
+def bucketed_columns(
+    db: PrefectDBInterface, run_type: RunType
+) -> tuple[sa.ColumnElement[Any], ...]:
+    """The columns of a run that `run_contributions` needs"""
+    model = db.FlowRun if run_type == "flow_run" else db.TaskRun
+    return (
+        model.state_type,
+        model.state_name,
+        model.expected_start_time,
+        model.start_time,
+        model.total_run_time,
+    )
+
+
+@db_injector
+async def remove_runs(
+    db: PrefectDBInterface,
+    session: AsyncSession,
+    run_type: RunType,
+    *where: sa.ColumnElement[bool],
+) -> None:
+    """
+    Removes the runs matching the given criteria from the buckets. This must be
+    called before the runs are deleted.
+
+    Args:
+        session: a database session
+        run_type: whether the criteria select flow runs or task runs
+        where: criteria selecting the runs that will be deleted
+    """
+    model = db.FlowRun if run_type == "flow_run" else db.TaskRun
+    result = await session.execute(
+        sa.select(*bucketed_columns(run_type)).where(
+            model.state_type.in_(schemas.states.TERMINAL_STATES), *where
+        )
+    )
+    await update_buckets(
+        session,
+        removed=[
+            contribution
+            for run in result
+            for contribution in run_contributions(run_type, run)
+        ],
+    )
+
+
+def unbucketed_ranges(
+    start: datetime.datetime,
+    interval: datetime.timedelta,
+    intervals: int,
+    bounds: Iterable[datetime.datetime] = (),
+) -> list[tuple[datetime.datetime, datetime.datetime]]:
+    """
+    Returns the buckets that are split between intervals, which must be counted from
+    the runs themselves.
+
+    Args:
+        start: the start of the first interval
+        interval: the size of each interval
+        intervals: the number of intervals
+        bounds: other times, such as filter bounds, whose buckets are always split
+    """
+    split = {
+        truncate(boundary)
+        for boundary in (start + i * interval for i in range(intervals + 1))
+        if truncate(boundary) != boundary
+    }
+    split.update(truncate(bound) for bound in bounds)
+    return [(bucket, bucket + BUCKET_SIZE) for bucket in sorted(split)]
+
+
+def in_ranges(
+    column: sa.ColumnElement[datetime.datetime],
+    ranges: Sequence[tuple[datetime.datetime, datetime.datetime]],
+) -> sa.ColumnElement[bool]:
+    """Returns criteria selecting values of the column within any of the ranges"""
+    return sa.or_(
+        sa.false(),
+        *(sa.and_(column >= since, column < until) for since, until in ranges),
+    )
+
+
+@db_injector
+async def read_interval_counts(
+    db: PrefectDBInterface,
+    session: AsyncSession,
+    run_type: RunType,
+    time_field: TimeField,
+    start: datetime.datetime,
+    interval: datetime.timedelta,
+    intervals: int,
+    unbucketed: Sequence[tuple[datetime.datetime, datetime.datetime]],
+) -> list[list[schemas.responses.HistoryResponseState]]:
+    """
+    Sums the buckets that fall wholly within each interval, by state.
+
+    Args:
+        session: a database session
+        run_type: the type of run to count
+        time_field: the run timestamp to count by
+        start: the start of the first interval
+        interval: the size of each interval
+        intervals: the number of intervals
+        unbucketed: the split buckets from `unbucketed_ranges`, which are left out
+
+    Returns:
+        a list of the state counts for each interval
+    """
+    bucket = db.RunHistoryBucket
+
+    # every bucket read lies wholly within one interval, so its midpoint assigns it
+    # to that interval without any rounding error at the boundaries
+    index = sa.func.floor(
+        (
+            sa.func.date_diff_seconds(bucket.bucket, start)
+            + BUCKET_SIZE.total_seconds() / 2
+        )
+        / interval.total_seconds()
+    ).label("interval")
+
+    query = (
+        sa.select(
+            index,
+            bucket.state_type,
+            bucket.state_name,
+            sa.func.sum(bucket.count).label("count"),
+            sa.func.sum(bucket.sum_estimated_run_time).label("sum_estimated_run_time"),
+            sa.func.sum(bucket.sum_estimated_lateness).label("sum_estimated_lateness"),
+        )
+        .where(
+            bucket.run_type == run_type,
+            bucket.time_field == time_field,
+            bucket.bucket >= truncate(start),
+            bucket.bucket < start + intervals * interval,
+        )
+        .group_by(index, bucket.state_type, bucket.state_name)
+        .having(sa.func.sum(bucket.count) > 0)
+    )
+    if unbucketed:
+        query = query.where(bucket.bucket.not_in([since for since, _ in unbucketed]))
+
+    counts: list[list[schemas.responses.HistoryResponseState]] = [
+        [] for _ in range(intervals)
+    ]
+    for row in await session.execute(query):
+        i = int(row.interval)
+        if not 0 <= i < intervals:
+            continue
+        counts[i].append(
+            schemas.responses.HistoryResponseState(
+                state_type=row.state_type,
+                state_name=row.state_name,
+                count_runs=row.count,
+                sum_estimated_run_time=datetime.timedelta(
+                    seconds=row.sum_estimated_run_time
+                ),
+                sum_estimated_lateness=datetime.timedelta(
+                    seconds=row.sum_estimated_lateness
+                ),
+            )
+        )
+    return counts
+
+
+def merge_states(
+    *states: Iterable[schemas.responses.HistoryResponseState],
+) -> list[schemas.responses.HistoryResponseState]:
+    """Combines the state counts of an interval from buckets and from runs"""
+    merged: dict[
+        tuple[schemas.states.StateType, str], schemas.responses.HistoryResponseState
+    ] = {}
+    for state in (state for group in states for state in group):
+        key = (state.state_type, state.state_name)
+        if existing := merged.get(key):
+            existing.count_runs += state.count_runs
+            existing.sum_estimated_run_time += state.sum_estimated_run_time
+            existing.sum_estimated_lateness += state.sum_estimated_lateness
+        else:
+            merged[key] = state.model_copy()
+    return list(merged.values())
@@ -135,6 +135,14 @@ async def create_task_run(
             session.add(model)
             await session.flush()
 
+    # a new run may have been created with its state type already set, rather
+    # than with a state to orchestrate
+    if model.created == right_now:
+        await models.run_history_buckets.update_buckets(
+            session,
+            added=models.run_history_buckets.run_contributions("task_run", model),
+        )
+
     if model.created == right_now and task_run.state:
         await models.task_runs.set_task_run_state(
             session=session,
@@ -456,6 +464,10 @@ async def delete_task_run(
         bool: whether or not the task run was deleted
     """
 
+    await models.run_history_buckets.remove_runs(
+        session, "task_run", db.TaskRun.id == task_run_id
+    )
+
     result = await session.execute(
         delete(db.TaskRun).where(db.TaskRun.id == task_run_id)
     )
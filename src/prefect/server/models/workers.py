@@ -25,6 +25,7 @@ from prefect.server.database import PrefectDBInterface, db_injector, orm_models
 from prefect.server.events.clients import PrefectServerEventsClient
 from prefect.server.exceptions import ObjectNotFoundError
 from prefect.server.models.events import work_pool_status_event
+from prefect.server.schemas.states import StateType
 from prefect.server.schemas.statuses import WorkQueueStatus
 from prefect.server.utilities.database import UUID as PrefectUUID
 from prefect.types._datetime import DateTime, now
@@ -332,6 +333,47 @@ async def get_scheduled_flow_runs(
     )
 
 
+@db_injector
+async def read_next_scheduled_start_times(
+    db: PrefectDBInterface,
+    session: AsyncSession,
+    work_queue_ids: List[UUID],
+) -> Dict[UUID, datetime.datetime]:
+    """
+    Reads when the next scheduled run of each work queue is due to start.  This is
+    much cheaper than getting the scheduled runs themselves, since it reads a single
+    entry of an index for each queue.
+
+    Args:
+        session (AsyncSession): a database session
+        work_queue_ids (List[UUID]): a list of work pool queue ids
+
+    Returns:
+        Dict[UUID, datetime.datetime]: the next scheduled start time of each queue
+            that has scheduled runs
+    """
+    next_scheduled_start_time = (
+        sa.select(db.FlowRun.next_scheduled_start_time)
+        .where(
+            db.FlowRun.work_queue_id == db.WorkQueue.id,
+            db.FlowRun.state_type == StateType.SCHEDULED,
+        )
+        .order_by(db.FlowRun.next_scheduled_start_time.asc())
+        .limit(1)
+        .scalar_subquery()
+    )
+    result = await session.execute(
+        sa.select(db.WorkQueue.id, next_scheduled_start_time).where(
+            db.WorkQueue.id.in_(work_queue_ids)
+        )
+    )
+    return {
+        work_queue_id: start_time
+        for work_queue_id, start_time in result.all()
+        if start_time is not None
+    }
+
+
 # -----------------------------------------------------
 # --
 # --
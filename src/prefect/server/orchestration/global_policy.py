@@ -10,7 +10,7 @@ state database, they should be the most deeply nested contexts in orchestration
 
 from __future__ import annotations
 
-from typing import Any, Union, cast
+from typing import Any, Optional, Union, cast
 
 from packaging.version import Version
 
@@ -27,7 +27,7 @@ from prefect.server.orchestration.rules import (
     TaskOrchestrationContext,
     TaskRunUniversalTransform,
 )
-from prefect.server.schemas import core
+from prefect.server.schemas import core, states
 from prefect.server.schemas.core import FlowRunPolicy
 
 
@@ -39,6 +39,7 @@ def COMMON_GLOBAL_TRANSFORMS() -> list[
     ]
 ]:
     return [
+        UpdateRunHistoryBuckets,
         SetRunStateType,
         SetRunStateName,
         SetRunStateTimestamp,
@@ -112,6 +113,60 @@ class GlobalTaskPolicy(BaseOrchestrationPolicy[orm_models.TaskRun, core.TaskRunP
         ) + [IncrementTaskRunCount]
 
 
+class UpdateRunHistoryBuckets(
+    BaseUniversalTransform[
+        orm_models.Run, Union[core.FlowRunPolicy, core.TaskRunPolicy]
+    ]
+):
+    """
+    Moves a run between run history buckets as it enters or leaves a terminal state.
+
+    This transform compares the run before and after all other transforms have
+    updated it, so it should be the first global transform.
+    """
+
+    def __init__(
+        self,
+        context: OrchestrationContext[orm_models.Run, Any],
+        from_state_type: Optional[states.StateType],
+        to_state_type: Optional[states.StateType],
+    ):
+        super().__init__(context, from_state_type, to_state_type)
+        self._initial_contributions: Optional[list[dict[str, Any]]] = None
+
+    @staticmethod
+    def _run_type(
+        context: GenericOrchestrationContext[orm_models.Run, Any],
+    ) -> models.run_history_buckets.RunType:
+        if isinstance(context, FlowOrchestrationContext):
+            return "flow_run"
+        return "task_run"
+
+    async def before_transition(
+        self, context: GenericOrchestrationContext[orm_models.Run, Any]
+    ) -> None:
+        if self.nullified_transition():
+            return
+
+        self._initial_contributions = models.run_history_buckets.run_contributions(
+            self._run_type(context), context.run
+        )
+
+    async def after_transition(
+        self, context: GenericOrchestrationContext[orm_models.Run, Any]
+    ) -> None:
+        if self._initial_contributions is None:
+            return
+
+        await models.run_history_buckets.update_buckets(
+            session=context.session,
+            removed=self._initial_contributions,
+            added=models.run_history_buckets.run_contributions(
+                self._run_type(context), context.run
+            ),
+        )
+
+
 class SetRunStateType(
     BaseUniversalTransform[
         orm_models.Run, Union[core.FlowRunPolicy, core.TaskRunPolicy]
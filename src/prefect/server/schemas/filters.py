@@ -223,6 +223,13 @@ class FlowRunFilterId(PrefectFilterBaseModel):
     not_any_: Optional[list[UUID]] = Field(
         default=None, description="A list of flow run ids to exclude"
     )
+    lt_: Optional[UUID] = Field(
+        default=None,
+        description=(
+            "Only include flow runs with an id less than this id. Combined with the"
+            " `ID_DESC` sort, this allows keyset pagination over flow runs."
+        ),
+    )
 
     def _get_filter_list(
         self, db: "PrefectDBInterface"
@@ -232,6 +239,8 @@ class FlowRunFilterId(PrefectFilterBaseModel):
             filters.append(db.FlowRun.id.in_(self.any_))
         if self.not_any_ is not None:
             filters.append(db.FlowRun.id.not_in(self.not_any_))
+        if self.lt_ is not None:
+            filters.append(db.FlowRun.id < self.lt_)
         return filters
 
 
@@ -772,6 +781,13 @@ class TaskRunFilterId(PrefectFilterBaseModel):
     any_: Optional[list[UUID]] = Field(
         default=None, description="A list of task run ids to include"
     )
+    lt_: Optional[UUID] = Field(
+        default=None,
+        description=(
+            "Only include task runs with an id less than this id. Combined with the"
+            " `ID_DESC` sort, this allows keyset pagination over task runs."
+        ),
+    )
 
     def _get_filter_list(
         self, db: "PrefectDBInterface"
@@ -779,6 +795,8 @@ class TaskRunFilterId(PrefectFilterBaseModel):
         filters: list[sa.ColumnExpressionArgument[bool]] = []
         if self.any_ is not None:
             filters.append(db.TaskRun.id.in_(self.any_))
+        if self.lt_ is not None:
+            filters.append(db.TaskRun.id < self.lt_)
         return filters
 
 
@@ -1393,6 +1411,29 @@ class LogFilterTaskRunId(PrefectFilterBaseModel):
         return filters
 
 
+class LogFilterCursor(PrefectFilterBaseModel):
+    """
+    Filter for logs positioned strictly after a `(Log.timestamp, Log.id)` pair.
+
+    Combined with the `TIMESTAMP_ASC` sort, this allows keyset pagination over logs.
+    """
+
+    timestamp: DateTime = Field(
+        default=..., description="The timestamp of the last log that was read"
+    )
+    id: UUID = Field(default=..., description="The id of the last log that was read")
+
+    def _get_filter_list(
+        self, db: "PrefectDBInterface"
+    ) -> Iterable[sa.ColumnExpressionArgument[bool]]:
+        return [
+            sa.or_(
+                db.Log.timestamp > self.timestamp,
+                sa.and_(db.Log.timestamp == self.timestamp, db.Log.id > self.id),
+            )
+        ]
+
+
 class LogFilter(PrefectOperatorFilterBaseModel):
     """Filter logs. Only logs matching all criteria will be returned"""
 
@@ -1408,6 +1449,10 @@ class LogFilter(PrefectOperatorFilterBaseModel):
     task_run_id: Optional[LogFilterTaskRunId] = Field(
         default=None, description="Filter criteria for `Log.task_run_id`"
     )
+    cursor: Optional[LogFilterCursor] = Field(
+        default=None,
+        description="Only include logs after the given `(timestamp, id)` position",
+    )
 
     def _get_filter_list(
         self, db: "PrefectDBInterface"
@@ -1422,6 +1467,8 @@ class LogFilter(PrefectOperatorFilterBaseModel):
             filters.append(self.flow_run_id.as_sql_filter())
         if self.task_run_id is not None:
             filters.append(self.task_run_id.as_sql_filter())
+        if self.cursor is not None:
+            filters.append(self.cursor.as_sql_filter())
 
         return filters
 
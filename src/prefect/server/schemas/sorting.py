@@ -96,8 +96,8 @@ class LogSort(AutoEnum):
     def as_sql_sort(self, db: "PrefectDBInterface") -> Iterable[sa.ColumnElement[Any]]:
         """Return an expression used to sort task runs"""
         sort_mapping: dict[str, Iterable[sa.ColumnElement[Any]]] = {
-            "TIMESTAMP_ASC": [db.Log.timestamp.asc()],
-            "TIMESTAMP_DESC": [db.Log.timestamp.desc()],
+            "TIMESTAMP_ASC": [db.Log.timestamp.asc(), db.Log.id.asc()],
+            "TIMESTAMP_DESC": [db.Log.timestamp.desc(), db.Log.id.desc()],
         }
         return sort_mapping[self.value]
 
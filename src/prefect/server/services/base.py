@@ -41,6 +41,7 @@ def _known_service_modules() -> list[ModuleType]:
         cancellation_cleanup,
         foreman,
         late_runs,
+        partition_manager,
         pause_expirations,
         scheduler,
         task_run_recorder,
@@ -52,6 +53,7 @@ def _known_service_modules() -> list[ModuleType]:
         cancellation_cleanup,
         foreman,
         late_runs,
+        partition_manager,
         pause_expirations,
         scheduler,
         task_run_recorder,
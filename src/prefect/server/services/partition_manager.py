@@ -0,0 +1,404 @@
+"""
+The PartitionManager service. Responsible for partitioning the events, event resources,
+and logs tables by time on PostgreSQL, creating partitions ahead of time, and dropping
+partitions that are past their retention period.
+
+Partitioning is opt-in and is enabled by turning on this service with
+`PREFECT_SERVER_SERVICES_PARTITION_MANAGER_ENABLED`. The first time the service runs,
+it converts each existing table into a partitioned table in a single transaction; the
+existing rows are kept in a "legacy" partition that is dropped once all of its rows
+are past their retention period.
+"""
+
+from __future__ import annotations
+
+import datetime
+import re
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Optional
+
+import sqlalchemy as sa
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from prefect.server.database import PrefectDBInterface
+from prefect.server.database.dependencies import db_injector
+from prefect.server.services.base import LoopService
+from prefect.server.utilities.database import get_dialect
+from prefect.settings import PREFECT_API_DATABASE_CONNECTION_URL
+from prefect.settings.context import get_current_settings
+from prefect.settings.models.server.services import ServicesBaseSetting
+from prefect.types._datetime import now
+
+if TYPE_CHECKING:
+    from prefect.settings.models.root import Settings
+
+EPOCH = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
+
+# Postgres truncates identifiers longer than this
+MAX_IDENTIFIER_LENGTH = 63
+
+
+@dataclass(frozen=True)
+class PartitionedTable:
+    """
+    A table that is partitioned by ranges of a timestamp column.
+    """
+
+    name: str
+    column: str
+
+    def retention_period(self, settings: "Settings") -> Optional[datetime.timedelta]:
+        if self.name == "log":
+            return settings.server.logs.retention_period
+        return settings.server.events.retention_period
+
+
+PARTITIONED_TABLES = [
+    PartitionedTable("events", "occurred"),
+    PartitionedTable("event_resources", "occurred"),
+    PartitionedTable("log", "timestamp"),
+]
+
+
+@dataclass(frozen=True)
+class Partition:
+    """
+    A range partition of a partitioned table. A `None` bound is unbounded.
+    """
+
+    name: str
+    start: Optional[datetime.datetime]
+    end: Optional[datetime.datetime]
+
+
+def partition_start(
+    timestamp: datetime.datetime, interval: datetime.timedelta
+) -> datetime.datetime:
+    """
+    The start of the partition interval that contains the given timestamp.
+
+    Partition boundaries are aligned to multiples of the interval since the epoch, so
+    partitions line up across runs of the service.
+    """
+    return EPOCH + ((timestamp - EPOCH) // interval) * interval
+
+
+def partition_name(table: PartitionedTable, start: datetime.datetime) -> str:
+    return f"{table.name}_p{start:%Y%m%d%H%M}"
+
+
+def _parse_bound(value: str) -> Optional[datetime.datetime]:
+    """
+    Parse one side of a range partition bound as rendered by `pg_get_expr` in a
+    session using the UTC time zone, e.g. `'2025-01-01 00:00:00+00'`.
+    """
+    value = value.strip()
+    if value in ("MINVALUE", "MAXVALUE"):
+        return None
+    value = value.strip("'")
+    if value.endswith("+00"):
+        value = f"{value}:00"
+    return datetime.datetime.fromisoformat(value)
+
+
+def parse_partition_bounds(
+    bounds: str,
+) -> tuple[Optional[datetime.datetime], Optional[datetime.datetime]]:
+    """
+    Parse the bounds of a range partition, e.g.
+    `FOR VALUES FROM ('2025-01-01 00:00:00+00') TO ('2025-01-02 00:00:00+00')`.
+    """
+    match = re.match(r"FOR VALUES FROM \((.+)\) TO \((.+)\)$", bounds)
+    if not match:
+        raise ValueError(f"Unsupported partition bounds: {bounds!r}")
+    return _parse_bound(match.group(1)), _parse_bound(match.group(2))
+
+
+async def is_partitioned(session: AsyncSession, table_name: str) -> bool:
+    """
+    Whether the given table in the current schema is a partitioned table.
+    """
+    result = await session.execute(
+        sa.text(
+            "SELECT 1 FROM pg_partitioned_table pt"
+            " JOIN pg_class c ON c.oid = pt.partrelid"
+            " WHERE c.relname = :name"
+            " AND c.relnamespace = to_regnamespace(current_schema())"
+        ),
+        {"name": table_name},
+    )
+    return result.scalar() is not None
+
+
+async def read_partitions(
+    session: AsyncSession, table: PartitionedTable
+) -> list[Partition]:
+    """
+    Read the range partitions of a partitioned table, ordered by their bounds. The
+    default partition is not included.
+    """
+    # Render bounds in UTC so that they can be parsed consistently
+    await session.execute(sa.text("SET LOCAL TimeZone = 'UTC'"))
+    result = await session.execute(
+        sa.text(
+            "SELECT c.relname, pg_get_expr(c.relpartbound, c.oid)"
+            " FROM pg_inherits i"
+            " JOIN pg_class c ON c.oid = i.inhrelid"
+            " WHERE i.inhparent = to_regclass(quote_ident(:name))"
+        ),
+        {"name": table.name},
+    )
+    partitions: list[Partition] = []
+    for name, bounds in result.all():
+        if bounds == "DEFAULT":
+            continue
+        start, end = parse_partition_bounds(bounds)
+        partitions.append(Partition(name=name, start=start, end=end))
+
+    return sorted(partitions, key=lambda p: (p.start is not None, p.start))
+
+
+def _timestamp_literal(timestamp: datetime.datetime) -> str:
+    # Partition bounds cannot be given as query parameters
+    return f"'{timestamp.astimezone(datetime.timezone.utc).isoformat()}'"
+
+
+def _renamed_identifier(name: str, suffix: str) -> str:
+    return f"{name[: MAX_IDENTIFIER_LENGTH - len(suffix)]}{suffix}"
+
+
+async def partition_table(
+    session: AsyncSession,
+    table: PartitionedTable,
+    interval: datetime.timedelta,
+) -> None:
+    """
+    Convert an existing table into a table partitioned by ranges of its timestamp
+    column.
+
+    The existing table becomes the table's first partition and holds all rows up
+    to the end of the current partition interval (or of the interval of its latest
+    row). A default partition holds rows that fall outside of all other partitions.
+    Indexes and foreign keys of the table are recreated on the partitioned table.
+
+    This must run in a transaction so that a failure leaves the table unchanged.
+    The table is locked while its rows are indexed for the new primary key. A table
+    that is already partitioned, for example by another server, is left as is.
+    """
+    quoted = f'"{table.name}"'
+    legacy_name = _renamed_identifier(table.name, "_legacy")
+
+    await session.execute(sa.text(f"LOCK TABLE {quoted} IN ACCESS EXCLUSIVE MODE"))
+    if await is_partitioned(session, table.name):
+        return
+
+    result = await session.execute(
+        sa.text(
+            "SELECT conname FROM pg_constraint"
+            " WHERE conrelid = to_regclass(quote_ident(:name)) AND contype = 'p'"
+        ),
+        {"name": table.name},
+    )
+    primary_key = result.scalar_one()
+
+    result = await session.execute(
+        sa.text(
+            "SELECT indexname, indexdef FROM pg_indexes"
+            " WHERE schemaname = current_schema() AND tablename = :name"
+        ),
+        {"name": table.name},
+    )
+    # These definitions refer to the original table name, which will be the name
+    # of the partitioned table
+    indexes = [
+        (name, definition) for name, definition in result.all() if name != primary_key
+    ]
+
+    result = await session.execute(
+        sa.text(
+            "SELECT conname, pg_get_constraintdef(oid) FROM pg_constraint"
+            " WHERE conrelid = to_regclass(quote_ident(:name)) AND contype = 'f'"
+        ),
+        {"name": table.name},
+    )
+    foreign_keys = result.all()
+
+    result = await session.execute(
+        sa.text(f'SELECT max("{table.column}") FROM {quoted}')
+    )
+    latest: Optional[datetime.datetime] = result.scalar()
+    boundary = partition_start(max(latest or now("UTC"), now("UTC")), interval)
+    boundary += interval
+
+    await session.execute(sa.text(f'ALTER TABLE {quoted} RENAME TO "{legacy_name}"'))
+    await session.execute(
+        sa.text(f'ALTER TABLE "{legacy_name}" DROP CONSTRAINT "{primary_key}"')
+    )
+    for name, _ in indexes:
+        await session.execute(
+            sa.text(
+                f'ALTER INDEX "{name}" RENAME TO "{_renamed_identifier(name, "_legacy")}"'
+            )
+        )
+
+    await session.execute(
+        sa.text(
+            f"CREATE TABLE {quoted}"
+            f' (LIKE "{legacy_name}" INCLUDING DEFAULTS INCLUDING STORAGE)'
+            f' PARTITION BY RANGE ("{table.column}")'
+        )
+    )
+    # Unique constraints on a partitioned table must include the partition key
+    await session.execute(
+        sa.text(
+            f'ALTER TABLE {quoted} ADD CONSTRAINT "{primary_key}"'
+            f' PRIMARY KEY (id, "{table.column}")'
+        )
+    )
+    for _, definition in indexes:
+        await session.execute(sa.text(definition))
+    # Attaching the existing table reuses its matching foreign keys as well
+    for name, definition in foreign_keys:
+        await session.execute(
+            sa.text(f'ALTER TABLE {quoted} ADD CONSTRAINT "{name}" {definition}')
+        )
+
+    # Attaching the existing table reuses its matching indexes
+    await session.execute(
+        sa.text(
+            f'ALTER TABLE {quoted} ATTACH PARTITION "{legacy_name}"'
+            f" FOR VALUES FROM (MINVALUE) TO ({_timestamp_literal(boundary)})"
+        )
+    )
+    await session.execute(
+        sa.text(
+            f'CREATE TABLE "{_renamed_identifier(table.name, "_default")}"'
+            f" PARTITION OF {quoted} DEFAULT"
+        )
+    )
+
+
+async def create_partition(
+    session: AsyncSession,
+    table: PartitionedTable,
+    start: datetime.datetime,
+    end: datetime.datetime,
+) -> None:
+    """
+    Create a partition for the given range, if it does not already exist.
+
+    Rows in the range that were written to the default partition are moved to the
+    new partition.
+    """
+    quoted = f'"{table.name}"'
+    default_name = _renamed_identifier(table.name, "_default")
+
+    await session.execute(
+        sa.text(
+            "CREATE TEMPORARY TABLE prefect_moved_rows"
+            f' (LIKE "{default_name}") ON COMMIT DROP'
+        )
+    )
+    await session.execute(
+        sa.text(
+            f'WITH moved AS (DELETE FROM "{default_name}"'
+            f' WHERE "{table.column}" >= :start AND "{table.column}" < :end'
+            " RETURNING *) INSERT INTO prefect_moved_rows SELECT * FROM moved"
+        ),
+        {"start": start, "end": end},
+    )
+    await session.execute(
+        sa.text(
+            f'CREATE TABLE IF NOT EXISTS "{partition_name(table, start)}"'
+            f" PARTITION OF {quoted}"
+            f" FOR VALUES FROM ({_timestamp_literal(start)})"
+            f" TO ({_timestamp_literal(end)})"
+        )
+    )
+    await session.execute(
+        sa.text(f"INSERT INTO {quoted} SELECT * FROM prefect_moved_rows")
+    )
+
+
+async def drop_partition(session: AsyncSession, partition: Partition) -> None:
+    """
+    Drop a partition along with its rows, if it has not already been dropped.
+    """
+    await session.execute(sa.text(f'DROP TABLE IF EXISTS "{partition.name}"'))
+
+
+class PartitionManager(LoopService):
+    """
+    Partitions the events, event resources, and logs tables by time on PostgreSQL.
+
+    Each loop creates the partitions for the coming intervals and drops partitions
+    whose rows are all older than the retention period of their table.
+    """
+
+    @classmethod
+    def service_settings(cls) -> ServicesBaseSetting:
+        return get_current_settings().server.services.partition_manager
+
+    def __init__(self, loop_seconds: float | None = None, **kwargs: Any):
+        settings = get_current_settings().server.services.partition_manager
+        super().__init__(loop_seconds=loop_seconds or settings.loop_seconds, **kwargs)
+        self.interval: datetime.timedelta = settings.partition_interval
+        self.premake: int = settings.premake_partitions
+
+    @db_injector
+    async def run_once(self, db: PrefectDBInterface) -> None:
+        dialect = get_dialect(PREFECT_API_DATABASE_CONNECTION_URL.value())
+        if dialect.name != "postgresql":
+            self.logger.debug("Partitioning is only supported on PostgreSQL.")
+            return
+
+        for table in PARTITIONED_TABLES:
+            try:
+                await self.manage_table(db, table)
+            except Exception:
+                self.logger.exception("Error managing partitions of %r", table.name)
+
+    async def manage_table(
+        self, db: PrefectDBInterface, table: PartitionedTable
+    ) -> None:
+        async with db.session_context(begin_transaction=True) as session:
+            if not await is_partitioned(session, table.name):
+                self.logger.info("Partitioning table %r...", table.name)
+                await partition_table(session, table, self.interval)
+
+        current_time = now("UTC")
+        create_until = (
+            partition_start(current_time, self.interval)
+            + (self.premake + 1) * self.interval
+        )
+
+        async with db.session_context(begin_transaction=True) as session:
+            partitions = await read_partitions(session, table)
+        covered_until = max(
+            (p.end for p in partitions if p.end is not None),
+            default=partition_start(current_time, self.interval),
+        )
+        while covered_until < create_until:
+            end = partition_start(covered_until, self.interval) + self.interval
+            async with db.session_context(begin_transaction=True) as session:
+                await create_partition(session, table, covered_until, end)
+            self.logger.debug(
+                "Created partition of %r from %s to %s", table.name, covered_until, end
+            )
+            covered_until = end
+
+        retention_period = table.retention_period(get_current_settings())
+        if retention_period is None:
+            return
+
+        older_than = current_time - retention_period
+        for partition in partitions:
+            if partition.end is None or partition.end > older_than:
+                continue
+            async with db.session_context(begin_transaction=True) as session:
+                await drop_partition(session, partition)
+            self.logger.info(
+                "Dropped partition %r of rows older than %s",
+                partition.name,
+                partition.end,
+            )
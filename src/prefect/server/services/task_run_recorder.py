@@ -5,8 +5,10 @@ from contextlib import asynccontextmanager
 from typing import TYPE_CHECKING, AsyncGenerator, NoReturn, Optional
 from uuid import UUID
 
+import sqlalchemy as sa
 from sqlalchemy.ext.asyncio import AsyncSession
 
+import prefect.server.models as models
 from prefect.logging import get_logger
 from prefect.server.database import (
     PrefectDBInterface,
@@ -23,6 +25,7 @@ from prefect.server.utilities.messaging import (
     Message,
     MessageHandler,
     create_consumer,
+    decode_message,
 )
 from prefect.server.utilities.messaging._consumer_names import (
     generate_unique_consumer_name,
@@ -45,17 +48,22 @@ def causal_ordering() -> CausalOrdering:
 
 
 @db_injector
-async def _insert_task_run_state(
-    db: PrefectDBInterface, session: AsyncSession, task_run: TaskRun
+async def _insert_task_run_states(
+    db: PrefectDBInterface,
+    session: AsyncSession,
+    task_run: TaskRun,
+    previous_states: list[State],
 ):
     if TYPE_CHECKING:
         assert task_run.state is not None
+    created = now("UTC")
     await session.execute(
         db.queries.insert(db.TaskRunState)
         .values(
-            created=now("UTC"),
-            task_run_id=task_run.id,
-            **task_run.state.model_dump(),
+            [
+                {"created": created, "task_run_id": task_run.id, **state.model_dump()}
+                for state in [*previous_states, task_run.state]
+            ]
         )
         .on_conflict_do_nothing(
             index_elements=[
@@ -93,6 +101,26 @@ def task_run_from_event(event: ReceivedEvent) -> TaskRun:
     )
 
 
+def previous_states_from_event(event: ReceivedEvent) -> list[State]:
+    """
+    Returns the states that a task run entered before the state of the event, if
+    the client coalesced their events into this one.
+    """
+    task_run_id = event.resource.prefect_object_id("prefect.task-run")
+
+    flow_run_id: Optional[UUID] = None
+    if flow_run_resource := event.resource_in_role.get("flow-run"):
+        flow_run_id = flow_run_resource.prefect_object_id("prefect.flow-run")
+
+    states: list[State] = []
+    for previous_state in event.payload.get("previous_states") or []:
+        state = State.model_validate(previous_state)
+        state.state_details.task_run_id = task_run_id
+        state.state_details.flow_run_id = flow_run_id
+        states.append(state)
+    return states
+
+
 async def record_task_run_event(event: ReceivedEvent) -> None:
     task_run = task_run_from_event(event)
 
@@ -117,7 +145,18 @@ async def record_task_run_event(event: ReceivedEvent) -> None:
     }
 
     db = provide_database_interface()
-    async with db.session_context() as session:
+    bucketed_columns = models.run_history_buckets.bucketed_columns("task_run")
+    async with db.session_context(begin_transaction=True) as session:
+        # Lock the task run as it was before this event, so that it is moved
+        # between run history buckets consistently
+        previous = (
+            await session.execute(
+                sa.select(*bucketed_columns)
+                .where(db.TaskRun.id == task_run.id)
+                .with_for_update()
+            )
+        ).one_or_none()
+
         # Combine all attributes for a single atomic operation
         all_attributes = {
             **task_run_attributes,
@@ -126,7 +165,7 @@ async def record_task_run_event(event: ReceivedEvent) -> None:
         }
 
         # Single atomic INSERT ... ON CONFLICT DO UPDATE
-        await session.execute(
+        upsert = (
             db.queries.insert(db.TaskRun)
             .values(**all_attributes)
             .on_conflict_do_update(
@@ -139,11 +178,40 @@ async def record_task_run_event(event: ReceivedEvent) -> None:
                 where=db.TaskRun.state_timestamp < task_run.state.timestamp,
             )
         )
+        if session.get_bind().dialect.insert_returning:
+            result = await session.execute(upsert.returning(*bucketed_columns))
+            recorded = result.one_or_none()
+        else:
+            # SQLite versions before 3.35 do not support RETURNING, so the recorded
+            # task run is read back if the upsert changed it
+            result = await session.execute(upsert)
+            recorded = None
+            if result.rowcount:
+                recorded = (
+                    await session.execute(
+                        sa.select(*bucketed_columns).where(db.TaskRun.id == task_run.id)
+                    )
+                ).one()
+
+        # Nothing is recorded when the event is older than the task run's state
+        if recorded is not None:
+            await models.run_history_buckets.update_buckets(
+                session,
+                removed=(
+                    models.run_history_buckets.run_contributions("task_run", previous)
+                    if previous is not None
+                    else []
+                ),
+                added=models.run_history_buckets.run_contributions(
+                    "task_run", recorded
+                ),
+            )
 
-        # Still need to insert the task_run_state separately
-        await _insert_task_run_state(session, task_run)
-
-        await session.commit()
+        # Still need to insert the task_run_state separately, along with any states
+        # that were coalesced into this event
+        await _insert_task_run_states(
+            session, task_run, previous_states_from_event(event)
+        )
 
     logger.debug(
         "Recorded task run state change",
@@ -163,7 +231,7 @@ async def record_task_run_event(event: ReceivedEvent) -> None:
 @asynccontextmanager
 async def consumer() -> AsyncGenerator[MessageHandler, None]:
     async def message_handler(message: Message):
-        event: ReceivedEvent = ReceivedEvent.model_validate_json(message.data)
+        event = decode_message(message, ReceivedEvent)
 
         if not event.event.startswith("prefect.task-run"):
             return
@@ -15,6 +15,7 @@ from typing import (
     runtime_checkable,
 )
 from collections.abc import AsyncGenerator, Awaitable, Iterable, Mapping
+from pydantic import BaseModel
 from typing_extensions import Self
 
 from prefect.settings import PREFECT_MESSAGING_CACHE, PREFECT_MESSAGING_BROKER
@@ -27,6 +28,7 @@ logger: "logging.Logger" = get_logger(__name__)
 
 
 M = TypeVar("M", bound="Message", covariant=True)
+D = TypeVar("D", bound=BaseModel)
 
 
 class Message(Protocol):
@@ -69,6 +71,18 @@ class Publisher(AbstractAsyncContextManager["Publisher"], abc.ABC):
         self, data: bytes, attributes: Mapping[str, str]
     ) -> None: ...
 
+    async def publish_decoded_data(
+        self, data: bytes, attributes: Mapping[str, str], decoded: Any
+    ) -> None:
+        """
+        Publishes data along with the object that it was encoded from.
+
+        Brokers that deliver messages within the process may hand the object to
+        consumers (see `decode_message`), so that each consumer does not decode the
+        data again. By default, only the data is published.
+        """
+        await self.publish_data(data, attributes)
+
     @abc.abstractmethod
     async def __aenter__(self) -> Self: ...
 
@@ -126,6 +140,26 @@ class CapturingPublisher(Publisher):
 MessageHandler = Callable[[Message], Awaitable[None]]
 
 
+def decode_message(message: Message, model: type[D]) -> D:
+    """
+    Returns the object that a message was encoded from.
+
+    The message data is only validated if the broker did not deliver the decoded
+    object with the message. A delivered object is shared by every consumer of the
+    message, so it must not be modified.
+
+    Args:
+        message: the message to decode
+        model: the type of object the message data encodes
+    Returns:
+        the decoded object
+    """
+    decoded = getattr(message, "decoded", None)
+    if isinstance(decoded, model):
+        return decoded
+    return model.model_validate_json(message.data)
+
+
 class StopConsumer(Exception):
     """
     Exception to raise to stop a consumer.
@@ -3,20 +3,23 @@ from __future__ import annotations
 import asyncio
 import copy
 import threading
+import time
 from collections import defaultdict
 from collections.abc import AsyncGenerator, Iterable, Mapping, MutableMapping
 from contextlib import asynccontextmanager
-from dataclasses import asdict, dataclass
+from contextvars import ContextVar
+from dataclasses import dataclass, field, replace
 from datetime import timedelta
 from pathlib import Path
 from types import TracebackType
-from typing import TYPE_CHECKING, Any, Optional, TypeVar, Union
+from typing import IO, TYPE_CHECKING, Any, Literal, Optional, TypeVar, Union
 from uuid import uuid4
 
 import anyio
 from cachetools import TTLCache
 from exceptiongroup import BaseExceptionGroup  # novermin
-from pydantic_core import to_json
+from prometheus_client import Counter, Gauge
+from pydantic_core import from_json, to_json
 from typing_extensions import Self
 
 from prefect.logging import get_logger
@@ -31,13 +34,44 @@ if TYPE_CHECKING:
 
 logger: "logging.Logger" = get_logger(__name__)
 
+OverflowPolicy = Literal["block", "drop_oldest", "spill"]
+
+# Set while a consumer's handler is running, since a handler that waited for room in
+# a full subscription could be waiting on its own consumer, directly or through
+# other topics, and never be woken.
+HANDLING_MESSAGE: ContextVar[bool] = ContextVar("HANDLING_MESSAGE", default=False)
+
+MESSAGING_QUEUE_DEPTH = Gauge(
+    "prefect_messaging_queue_depth",
+    "The number of messages waiting in in-memory subscriptions, by topic",
+    labelnames=["topic"],
+)
+MESSAGING_LAG = Gauge(
+    "prefect_messaging_lag_seconds",
+    "How long the most recently consumed message waited in its subscription, by topic",
+    labelnames=["topic"],
+)
+MESSAGES_DROPPED = Counter(
+    "prefect_messaging_messages_dropped",
+    "The number of messages dropped because a subscription was full, by topic",
+    labelnames=["topic"],
+)
+MESSAGES_SPILLED = Counter(
+    "prefect_messaging_messages_spilled",
+    "The number of messages spilled to disk because a subscription was full, by topic",
+    labelnames=["topic"],
+)
+
 # Simple global counters by topic with thread-safe access
 _metrics_lock: threading.Lock | None = None
-METRICS: dict[str, dict[str, int]] = defaultdict(
+METRICS: dict[str, dict[str, float]] = defaultdict(
     lambda: {
         "published": 0,
         "retried": 0,
         "consumed": 0,
+        "dropped": 0,
+        "spilled": 0,
+        "lag": 0.0,
     }
 )
 
@@ -51,14 +85,26 @@ async def log_metrics_periodically(interval: float = 2.0) -> None:
             for topic, data in METRICS.items():
                 if data["published"] == 0:
                     continue
-                depth = data["published"] - data["consumed"]
+                topic_object = Topic._topics.get(topic)
+                depth = (
+                    sum(
+                        subscription.depth
+                        for subscription in topic_object._subscriptions
+                    )
+                    if topic_object
+                    else 0
+                )
                 logger.debug(
-                    "Topic=%r | published=%d consumed=%d retried=%d depth=%d",
+                    "Topic=%r | published=%d consumed=%d retried=%d dropped=%d "
+                    "spilled=%d depth=%d lag=%.3fs",
                     topic,
                     data["published"],
                     data["consumed"],
                     data["retried"],
+                    data["dropped"],
+                    data["spilled"],
                     depth,
+                    data["lag"],
                 )
 
 
@@ -70,11 +116,120 @@ async def update_metric(topic: str, key: str, amount: int = 1) -> None:
         METRICS[topic][key] += amount
 
 
+async def set_metric(topic: str, key: str, value: float) -> None:
+    global _metrics_lock
+    if _metrics_lock is None:
+        _metrics_lock = threading.Lock()
+    with _metrics_lock:
+        METRICS[topic][key] = value
+
+
 @dataclass
 class MemoryMessage:
     data: Union[bytes, str]
     attributes: Mapping[str, Any]
     retry_count: int = 0
+    # The object the data was encoded from, if it was published with the data. It is
+    # shared by every subscription and must not be modified.
+    decoded: Any = field(default=None, repr=False, compare=False)
+    # When the message was delivered to its subscription, used to measure lag
+    delivered_at: float = field(default=0.0, repr=False, compare=False)
+
+
+class SpillSegment:
+    """
+    An append-only file of messages that did not fit in a subscription's queue.
+
+    Messages are read back in the order they were written, and the file is
+    truncated once every message in it has been read. Decoded objects are not
+    written, so consumers decode spilled messages from their data. The file is
+    written and read in a worker thread, one operation at a time, and each operation
+    runs to completion even if the caller is cancelled.
+
+    Attributes:
+        path: The path to the segment file.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._file: IO[bytes] | None = None
+        self._read_offset = 0
+        self._unread = 0
+        self._appending = 0
+        self._lock = asyncio.Lock()
+
+    @property
+    def pending(self) -> int:
+        """The number of messages appended but not yet read, including those still
+        being written"""
+        return self._unread + self._appending
+
+    async def append(self, message: MemoryMessage) -> None:
+        line = (
+            to_json(
+                {
+                    "data": message.data,
+                    "attributes": message.attributes,
+                    "retry_count": message.retry_count,
+                    "delivered_at": message.delivered_at,
+                }
+            )
+            + b"\n"
+        )
+        # counted before it is written, so that messages delivered in the meantime
+        # queue up behind it and reads wait for it
+        self._appending += 1
+        try:
+            async with self._lock:
+                await anyio.to_thread.run_sync(self._write, line)
+        finally:
+            self._appending -= 1
+
+    async def pop(self) -> MemoryMessage | None:
+        """
+        Read the oldest message in the segment, or return `None` if another reader
+        took it or it could not be written.
+        """
+        async with self._lock:
+            line = await anyio.to_thread.run_sync(self._read)
+        if line is None:
+            return None
+        return MemoryMessage(**from_json(line))
+
+    def _write(self, line: bytes) -> None:
+        if self._file is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = open(self.path, "w+b")
+        end = self._file.seek(0, 2)
+        try:
+            self._file.write(line)
+            self._file.flush()
+        except BaseException:
+            # don't leave a partial line for the next read
+            self._file.truncate(end)
+            raise
+        self._unread += 1
+
+    def _read(self) -> bytes | None:
+        if self._file is None or not self._unread:
+            return None
+        self._file.seek(self._read_offset)
+        line = self._file.readline()
+        self._read_offset = self._file.tell()
+        self._unread -= 1
+        if not self._unread:
+            self._file.seek(0)
+            self._file.truncate()
+            self._read_offset = 0
+        return line
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        self.path.unlink(missing_ok=True)
+        self._read_offset = 0
+        self._unread = 0
 
 
 class Subscription:
@@ -90,11 +245,21 @@ class Subscription:
 
     Messages remain in the dead letter queue until they are removed manually.
 
+    The queue holds at most `capacity` messages. When it is full, the overflow
+    policy decides what happens to new messages: `block` makes the publisher wait
+    for the consumers to catch up, `drop_oldest` discards the oldest waiting
+    message, and `spill` appends messages to a segment file on disk until the
+    consumers have caught up. Publishers running in a consumer's message handler
+    are never blocked, and spill instead.
+
     Attributes:
         topic: The topic that the subscription receives messages from.
         max_retries: The maximum number of times a message will be retried for
             this subscription.
         dead_letter_queue_path: The path to the dead letter queue folder.
+        capacity: The maximum number of messages in the queue, or 0 for no limit.
+        overflow_policy: What to do with messages delivered to a full queue.
+        spill_path: The path to the folder for spilled messages.
     """
 
     def __init__(
@@ -102,25 +267,66 @@ class Subscription:
         topic: "Topic",
         max_retries: int = 3,
         dead_letter_queue_path: Path | str | None = None,
+        capacity: int | None = None,
+        overflow_policy: OverflowPolicy | None = None,
+        spill_path: Path | str | None = None,
     ) -> None:
+        settings = get_current_settings()
         self.topic = topic
         self.max_retries = max_retries
         self.dead_letter_queue_path: Path = (
             Path(dead_letter_queue_path)
             if dead_letter_queue_path
-            else get_current_settings().home / "dlq"
+            else settings.home / "dlq"
+        )
+        self.capacity: int = (
+            capacity
+            if capacity is not None
+            else settings.server.events.messaging_queue_capacity
         )
-        self._queue: asyncio.Queue[MemoryMessage] = asyncio.Queue()
+        self.overflow_policy: OverflowPolicy = (
+            overflow_policy or settings.server.events.messaging_overflow_policy
+        )
+        self.spill_path: Path = (
+            Path(spill_path) if spill_path else settings.home / "spill"
+        )
+        self._queue: asyncio.Queue[MemoryMessage] = asyncio.Queue(maxsize=self.capacity)
         self._retry: asyncio.Queue[MemoryMessage] = asyncio.Queue()
+        self._spill: SpillSegment | None = None
+
+    @property
+    def depth(self) -> int:
+        """The number of messages waiting to be consumed"""
+        spilled = self._spill.pending if self._spill else 0
+        return self._queue.qsize() + self._retry.qsize() + spilled
 
     async def deliver(self, message: MemoryMessage) -> None:
         """
-        Deliver a message to the subscription's queue.
+        Deliver a message to the subscription's queue, applying the overflow
+        policy if the queue is full.
 
         Args:
             message: The message to deliver.
         """
-        await self._queue.put(message)
+        message.delivered_at = time.monotonic()
+        if self._spill and self._spill.pending:
+            # Once messages have spilled, later ones must follow them to keep order
+            if not await self._spill_message(message):
+                return
+        elif self._queue.full() and (
+            self.overflow_policy == "spill"
+            or (self.overflow_policy == "block" and HANDLING_MESSAGE.get())
+        ):
+            if not await self._spill_message(message):
+                return
+        elif self.overflow_policy == "drop_oldest" and self._queue.full():
+            self._queue.get_nowait()
+            self._queue.put_nowait(message)
+            MESSAGES_DROPPED.labels(self.topic.name).inc()
+            await update_metric(self.topic.name, "dropped")
+        else:
+            await self._queue.put(message)
+            MESSAGING_QUEUE_DEPTH.labels(self.topic.name).inc()
         await update_metric(self.topic.name, "published")
         logger.debug(
             "Delivered message to topic=%r queue_size=%d retry_queue_size=%d",
@@ -149,6 +355,7 @@ class Subscription:
             await self.send_to_dead_letter_queue(message)
         else:
             await self._retry.put(message)
+            MESSAGING_QUEUE_DEPTH.labels(self.topic.name).inc()
             await update_metric(self.topic.name, "retried")
             logger.debug(
                 "Retried message on topic=%r retry_count=%d queue_size=%d retry_queue_size=%d",
@@ -162,9 +369,47 @@ class Subscription:
         """
         Get a message from the subscription's queue.
         """
-        if not self._retry.empty():
-            return await self._retry.get()
-        return await self._queue.get()
+        message: MemoryMessage | None = None
+        while message is None:
+            if not self._retry.empty():
+                message = await self._retry.get()
+            elif self._queue.empty() and self._spill and self._spill.pending:
+                message = await self._spill.pop()
+            else:
+                message = await self._queue.get()
+
+        MESSAGING_QUEUE_DEPTH.labels(self.topic.name).dec()
+        lag = time.monotonic() - message.delivered_at
+        MESSAGING_LAG.labels(self.topic.name).set(lag)
+        await set_metric(self.topic.name, "lag", lag)
+        return message
+
+    async def _spill_message(self, message: MemoryMessage) -> bool:
+        if self._spill is None:
+            self._spill = SpillSegment(
+                self.spill_path / f"{self.topic.name}-{uuid4().hex}.segment"
+            )
+        try:
+            await self._spill.append(message)
+        except Exception as e:
+            logger.warning("Failed to spill message to disk", exc_info=e)
+            MESSAGES_DROPPED.labels(self.topic.name).inc()
+            await update_metric(self.topic.name, "dropped")
+            return False
+        MESSAGING_QUEUE_DEPTH.labels(self.topic.name).inc()
+        MESSAGES_SPILLED.labels(self.topic.name).inc()
+        await update_metric(self.topic.name, "spilled")
+        return True
+
+    def close(self) -> None:
+        """
+        Discard any messages waiting in the subscription and remove its spilled
+        messages from disk.
+        """
+        MESSAGING_QUEUE_DEPTH.labels(self.topic.name).dec(self.depth)
+        if self._spill:
+            self._spill.close()
+            self._spill = None
 
     async def send_to_dead_letter_queue(self, message: MemoryMessage) -> None:
         """
@@ -179,7 +424,13 @@ class Subscription:
         self.dead_letter_queue_path.mkdir(parents=True, exist_ok=True)
         try:
             await anyio.Path(self.dead_letter_queue_path / uuid4().hex).write_bytes(
-                to_json(asdict(message))
+                to_json(
+                    {
+                        "data": message.data,
+                        "attributes": message.attributes,
+                        "retry_count": message.retry_count,
+                    }
+                )
             )
         except Exception as e:
             logger.warning("Failed to write message to dead letter queue", exc_info=e)
@@ -217,16 +468,20 @@ class Topic:
 
     def unsubscribe(self, subscription: Subscription) -> None:
         self._subscriptions.remove(subscription)
+        subscription.close()
 
     def clear(self) -> None:
-        for subscription in self._subscriptions:
+        for subscription in list(self._subscriptions):
             self.unsubscribe(subscription)
         self._subscriptions = []
 
     async def publish(self, message: MemoryMessage) -> None:
-        for subscription in self._subscriptions:
-            # Ensure that each subscription gets its own copy of the message
-            await subscription.deliver(copy.deepcopy(message))
+        for subscription in list(self._subscriptions):
+            # Ensure that each subscription gets its own copy of the message. The data
+            # is immutable and the decoded object is read-only, so they are shared.
+            await subscription.deliver(
+                replace(message, attributes=copy.deepcopy(message.attributes))
+            )
 
 
 @asynccontextmanager
@@ -308,7 +563,15 @@ class Publisher(_Publisher):
         return None
 
     async def publish_data(self, data: bytes, attributes: Mapping[str, str]) -> None:
-        to_publish = [MemoryMessage(data, attributes)]
+        await self._publish(MemoryMessage(data, attributes))
+
+    async def publish_decoded_data(
+        self, data: bytes, attributes: Mapping[str, str], decoded: Any
+    ) -> None:
+        await self._publish(MemoryMessage(data, attributes, decoded=decoded))
+
+    async def _publish(self, message: MemoryMessage) -> None:
+        to_publish = [message]
         if self.deduplicate_by:
             to_publish = await self._cache.without_duplicates(
                 self.deduplicate_by, to_publish
@@ -351,6 +614,8 @@ class Consumer(_Consumer):
             raise group
 
     async def _consume_loop(self, handler: MessageHandler) -> None:
+        # each loop runs in a task of its own, so this only applies to its handler
+        HANDLING_MESSAGE.set(True)
         while True:
             message = await self.subscription.get()
             try:
@@ -57,6 +57,14 @@ def default_local_storage_path(values: dict[str, Any]) -> Path:
     return home / "storage"
 
 
+def default_result_cache_path(values: dict[str, Any]) -> Path:
+    """Default local result cache path based on home directory."""
+    home = values.get("home")
+    if not isinstance(home, Path):
+        home = Path("~/.prefect").expanduser()
+    return home / "result-cache"
+
+
 def default_memo_store_path(values: dict[str, Any]) -> Path:
     """Default memo_store_path based on home directory."""
     home = values.get("home")
@@ -59,6 +59,11 @@ class LoggingToAPISettings(PrefectBaseSettings):
         description="The maximum size in bytes for a single log.",
     )
 
+    compress: bool = Field(
+        default=False,
+        description="If `True`, batches of logs are gzip-compressed before they are sent to the API. The API server must accept gzip-encoded requests.",
+    )
+
     when_missing_flow: Literal["warn", "error", "ignore"] = Field(
         default="warn",
         description="""
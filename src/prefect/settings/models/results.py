@@ -8,7 +8,7 @@ from pydantic_settings import SettingsConfigDict
 
 from prefect.settings.base import PrefectBaseSettings, build_settings_config
 
-from ._defaults import default_local_storage_path
+from ._defaults import default_local_storage_path, default_result_cache_path
 
 
 class ResultsSettings(PrefectBaseSettings):
@@ -47,3 +47,42 @@ class ResultsSettings(PrefectBaseSettings):
             "prefect_local_storage_path",
         ),
     )
+
+    write_behind: bool = Field(
+        default=False,
+        description="If `True`, task results are persisted on a background pipeline and task runs report completion once the write is queued. Flow runs wait for pending writes before finishing.",
+    )
+
+    write_behind_max_pending: int = Field(
+        default=100,
+        ge=1,
+        description="The maximum number of result writes that may be queued or in progress when `write_behind` is enabled. Tasks block until a slot is available.",
+    )
+
+    write_behind_max_concurrency: int = Field(
+        default=4,
+        ge=1,
+        description="The maximum number of result writes that run concurrently when `write_behind` is enabled.",
+    )
+
+    memory_cache_max_size: int = Field(
+        default=256 * 1024**2,
+        ge=1,
+        description="The maximum total size, in bytes, of the result records each result store keeps in memory, measured by the size of their serialized results. Least recently used records are evicted first.",
+    )
+
+    local_cache_enabled: bool = Field(
+        default=False,
+        description="If `True`, results read from or written to remote result storage are also cached on the local disk, where they are shared by all processes on the host.",
+    )
+
+    local_cache_path: Path = Field(
+        default_factory=default_result_cache_path,
+        description="The directory of the local result cache. Defaults to $PREFECT_HOME/result-cache.",
+    )
+
+    local_cache_max_size: int = Field(
+        default=1024**3,
+        ge=0,
+        description="The maximum total size, in bytes, of the local result cache. Least recently used results are evicted first.",
+    )
@@ -47,6 +47,27 @@ class ServerAPISettings(PrefectBaseSettings):
         ),
     )
 
+    read_cache_ttl: float = Field(
+        default=0,
+        ge=0,
+        description="""
+        How long, in seconds, the results of frequently repeated reads, such as reading
+        a deployment or work pool and the UI's deployment and task run counts, are
+        cached by the API server (defaults to `0`, which disables caching). Cached
+        results are discarded as soon as this server process commits a write to the
+        tables they were read from, but writes made by other processes are not seen
+        until the entry expires, so only enable caching when a single API server
+        process writes to the database or when reads may be this stale.
+
+        Identical reads that are in progress at the same time share a single query
+        whether or not caching is enabled.
+        """,
+        validation_alias=AliasChoices(
+            AliasPath("read_cache_ttl"),
+            "prefect_server_api_read_cache_ttl",
+        ),
+    )
+
     keepalive_timeout: int = Field(
         default=5,
         description="""
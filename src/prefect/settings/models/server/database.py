@@ -270,6 +270,38 @@ class ServerDatabaseSettings(PrefectBaseSettings):
         ),
     )
 
+    read_replica_connection_url: Optional[SecretStr] = Field(
+        default=None,
+        description="""
+        A connection string for a read replica of a PostgreSQL database. When set,
+        read-only API endpoints such as filters, counts, and run history query the
+        replica instead of the primary database.
+        """,
+        validation_alias=AliasChoices(
+            AliasPath("read_replica_connection_url"),
+            "prefect_server_database_read_replica_connection_url",
+        ),
+    )
+
+    read_replica_max_lag: float = Field(
+        default=5.0,
+        ge=0,
+        description="The maximum replication lag, in seconds, of the read replica before reads fall back to the primary database. Defaults to 5 seconds.",
+        validation_alias=AliasChoices(
+            AliasPath("read_replica_max_lag"),
+            "prefect_server_database_read_replica_max_lag",
+        ),
+    )
+
+    sqlite_single_writer: bool = Field(
+        default=False,
+        description="If `True`, transactions against a SQLite database are funneled through a single writer connection, and transactions that are waiting for it are committed together. This avoids `database is locked` errors when many writers are active. Has no effect on in-memory and PostgreSQL databases.",
+        validation_alias=AliasChoices(
+            AliasPath("sqlite_single_writer"),
+            "prefect_server_database_sqlite_single_writer",
+        ),
+    )
+
     # handle deprecated fields
 
     def __getattribute__(self, name: str) -> Any:
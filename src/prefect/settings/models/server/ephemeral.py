@@ -34,3 +34,12 @@ class ServerEphemeralSettings(PrefectBaseSettings):
         Defaults to `20`.
         """,
     )
+
+    fast_start: bool = Field(
+        default=False,
+        description="""
+        When enabled, ephemeral servers create new SQLite databases by copying a
+        pre-migrated template database instead of running migrations and registering
+        block types. Templates are saved in `PREFECT_HOME/database-templates`.
+        """,
+    )
@@ -1,5 +1,5 @@
 from datetime import timedelta
-from typing import ClassVar
+from typing import ClassVar, Literal
 
 from pydantic import AliasChoices, AliasPath, Field
 from pydantic_settings import SettingsConfigDict
@@ -99,6 +99,15 @@ class ServerEventsSettings(PrefectBaseSettings):
         ),
     )
 
+    minute_rollup_retention_period: timedelta = Field(
+        default=timedelta(days=1),
+        description="The amount of time to retain per-minute event count rollups in the database. Per-hour rollups are retained as long as events. Older counts whose buckets are not whole hours are counted from the events table.",
+        validation_alias=AliasChoices(
+            AliasPath("minute_rollup_retention_period"),
+            "prefect_server_events_minute_rollup_retention_period",
+        ),
+    )
+
     maximum_websocket_backfill: timedelta = Field(
         default=timedelta(minutes=15),
         description="The maximum range to look back for backfilling events for a websocket subscriber.",
@@ -149,3 +158,22 @@ class ServerEventsSettings(PrefectBaseSettings):
             "prefect_server_events_maximum_event_name_length",
         ),
     )
+
+    messaging_queue_capacity: int = Field(
+        default=0,
+        ge=0,
+        description="The maximum number of messages waiting in each subscription of the in-memory message broker. When a subscription is full, `messaging_overflow_policy` applies. 0 means subscriptions are unbounded.",
+        validation_alias=AliasChoices(
+            AliasPath("messaging_queue_capacity"),
+            "prefect_server_events_messaging_queue_capacity",
+        ),
+    )
+
+    messaging_overflow_policy: Literal["block", "drop_oldest", "spill"] = Field(
+        default="spill",
+        description="What the in-memory message broker does with messages delivered to a full subscription. `spill` writes messages to a segment file on disk until consumers catch up, `drop_oldest` discards the oldest waiting message, and `block` makes the publisher wait for consumers to catch up. Publishers in a consumer's message handler spill rather than block, since they may be waiting on their own consumer.",
+        validation_alias=AliasChoices(
+            AliasPath("messaging_overflow_policy"),
+            "prefect_server_events_messaging_overflow_policy",
+        ),
+    )
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import ClassVar
+from datetime import timedelta
+from typing import ClassVar, Optional
 
 from pydantic import Field
 from pydantic_settings import SettingsConfigDict
@@ -26,3 +27,8 @@ class ServerLogsSettings(PrefectBaseSettings):
         default=False,
         description="Whether or not to publish logs to the streaming system.",
     )
+
+    retention_period: Optional[timedelta] = Field(
+        default=None,
+        description="The amount of time to retain logs in the database. Logs are only removed by the partition manager service on PostgreSQL. If not set, logs are retained indefinitely.",
+    )
@@ -373,6 +373,54 @@ class ServerServicesSchedulerSettings(ServicesBaseSetting):
     )
 
 
+class ServerServicesPartitionManagerSettings(ServicesBaseSetting):
+    """
+    Settings for controlling the partition manager service
+    """
+
+    model_config: ClassVar[SettingsConfigDict] = build_settings_config(
+        ("server", "services", "partition_manager")
+    )
+
+    enabled: bool = Field(
+        default=False,
+        description="Whether or not to start the partition manager service in the server application. When enabled on PostgreSQL, the events, event resources, and logs tables are partitioned by time and expired rows are removed by dropping whole partitions. The first run converts the existing tables, locking them while they are reindexed.",
+        validation_alias=AliasChoices(
+            AliasPath("enabled"),
+            "prefect_server_services_partition_manager_enabled",
+        ),
+    )
+
+    loop_seconds: float = Field(
+        default=3600,
+        description="The partition manager service will create and drop partitions this often. Defaults to `3600`.",
+        validation_alias=AliasChoices(
+            AliasPath("loop_seconds"),
+            "prefect_server_services_partition_manager_loop_seconds",
+        ),
+    )
+
+    partition_interval: timedelta = Field(
+        default=timedelta(days=1),
+        ge=timedelta(hours=1),
+        description="The span of time covered by each partition. Defaults to one day.",
+        validation_alias=AliasChoices(
+            AliasPath("partition_interval"),
+            "prefect_server_services_partition_manager_partition_interval",
+        ),
+    )
+
+    premake_partitions: int = Field(
+        default=3,
+        ge=1,
+        description="The number of future partitions to create ahead of time. Defaults to `3`.",
+        validation_alias=AliasChoices(
+            AliasPath("premake_partitions"),
+            "prefect_server_services_partition_manager_premake_partitions",
+        ),
+    )
+
+
 class ServerServicesPauseExpirationsSettings(ServicesBaseSetting):
     """
     Settings for controlling the pause expiration service
@@ -474,6 +522,20 @@ class ServerServicesTriggersSettings(ServicesBaseSetting):
         ),
     )
 
+    actions_concurrency: int = Field(
+        default=10,
+        gt=0,
+        description="""
+        The number of automation actions that may run concurrently in each server.
+        Only applies to messaging brokers that consume messages concurrently, such as
+        the in-memory broker.
+        """,
+        validation_alias=AliasChoices(
+            AliasPath("actions_concurrency"),
+            "prefect_server_services_triggers_actions_concurrency",
+        ),
+    )
+
 
 class ServerServicesSettings(PrefectBaseSettings):
     """
@@ -512,6 +574,10 @@ class ServerServicesSettings(PrefectBaseSettings):
         default_factory=ServerServicesPauseExpirationsSettings,
         description="Settings for controlling the pause expiration service",
     )
+    partition_manager: ServerServicesPartitionManagerSettings = Field(
+        default_factory=ServerServicesPartitionManagerSettings,
+        description="Settings for controlling the partition manager service",
+    )
     task_run_recorder: ServerServicesTaskRunRecorderSettings = Field(
         default_factory=ServerServicesTaskRunRecorderSettings,
         description="Settings for controlling the task run recorder service",
@@ -95,6 +95,11 @@ class TasksSettings(PrefectBaseSettings):
         "Note that setting to `False` will override the behavior set by a parent flow or task.",
     )
 
+    coalesce_state_events: bool = Field(
+        default=False,
+        description="If `True`, the Pending and Running states of a task run are emitted together with its next state in a single event, rather than as an event for each state. Intermediate states are still recorded, but automations and other consumers of events will not observe them as they happen.",
+    )
+
     runner: TasksRunnerSettings = Field(
         default_factory=TasksRunnerSettings,
         description="Settings for controlling task runner behavior",
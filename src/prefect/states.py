@@ -115,7 +115,7 @@ async def _get_state_result_data_with_retries(
         try:
             if isinstance(state.data, ResultRecordMetadata):
                 record = await ResultStore._from_metadata(state.data)
-                return record.result
+                return await record.aload_result()
             else:
                 return await state.data.get()
         except Exception as e:
@@ -161,7 +161,7 @@ async def _get_state_result(
             state, retry_result_failure=retry_result_failure
         )
     elif isinstance(state.data, ResultRecord):
-        result = state.data.result
+        result = await state.data.aload_result()
 
     elif state.data is None:
         if state.is_failed() or state.is_crashed() or state.is_cancelled():
@@ -484,10 +484,10 @@ async def get_state_exception(state: State) -> BaseException:
         raise ValueError(f"Expected failed or crashed state got {state!r}.")
 
     if isinstance(state.data, ResultRecord):
-        result = state.data.result
+        result = await state.data.aload_result()
     elif isinstance(state.data, ResultRecordMetadata):
         record = await ResultStore._from_metadata(state.data)
-        result = record.result
+        result = await record.aload_result()
     elif state.data is None:
         result = None
     else:
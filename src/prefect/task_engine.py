@@ -34,10 +34,16 @@ from opentelemetry import trace
 from typing_extensions import ParamSpec, Self
 
 import prefect.types._datetime
+from prefect._internal.uuid7 import uuid7
 from prefect.cache_policies import CachePolicy
 from prefect.client.orchestration import PrefectClient, SyncPrefectClient, get_client
 from prefect.client.schemas import TaskRun
-from prefect.client.schemas.objects import RunInput, State
+from prefect.client.schemas.objects import (
+    RunInput,
+    State,
+    StateDetails,
+    TaskRunPolicy,
+)
 from prefect.concurrency.context import ConcurrencyContext
 from prefect.concurrency.v1.asyncio import concurrency as aconcurrency
 from prefect.concurrency.v1.context import ConcurrencyContext as ConcurrencyContextV1
@@ -47,6 +53,7 @@ from prefect.context import (
     AsyncClientContext,
     FlowRunContext,
     SyncClientContext,
+    TagsContext,
     TaskRunContext,
     hydrated_context,
 )
@@ -79,6 +86,7 @@ from prefect.states import (
     Running,
     exception_to_crashed_state,
     exception_to_failed_state,
+    format_exception,
     return_value_to_state,
 )
 from prefect.telemetry.run_telemetry import RunTelemetry
@@ -89,14 +97,17 @@ from prefect.transactions import (
     atransaction,
     transaction,
 )
-from prefect.utilities._engine import get_hook_name
+from prefect.utilities._engine import dynamic_key_for_task_run, get_hook_name
 from prefect.utilities.annotations import NotSet
 from prefect.utilities.asyncutils import run_coro_as_sync
 from prefect.utilities.callables import call_with_parameters, parameters_to_args_kwargs
 from prefect.utilities.collections import visit_collection
 from prefect.utilities.engine import (
+    collect_task_run_inputs_sync,
     emit_task_run_state_change_event,
     link_state_to_task_run_result,
+    resolve_inputs,
+    resolve_inputs_sync,
     resolve_to_final_result,
 )
 from prefect.utilities.math import clamped_poisson_interval
@@ -132,6 +143,11 @@ class BaseTaskRunEngine(Generic[P, R]):
     _is_started: bool = False
     _task_name_set: bool = False
     _last_event: Optional[PrefectEvent] = None
+    # states whose events are held back to be emitted with the next state's event
+    _deferred_states: list[State[Any]] = field(default_factory=list)
+    _coalesce_state_events: bool = field(
+        default_factory=lambda: get_current_settings().tasks.coalesce_state_events
+    )
     _telemetry: RunTelemetry = field(default_factory=RunTelemetry)
 
     def __post_init__(self) -> None:
@@ -296,12 +312,52 @@ class BaseTaskRunEngine(Generic[P, R]):
             message="Task rolled back as part of transaction",
         )
 
+        self.emit_state_change_event(self.state, rolled_back_state)
+
+    def emit_state_change_event(
+        self, initial_state: Optional[State[Any]], validated_state: State[Any]
+    ) -> None:
+        """
+        Emits an event for the task run entering a new state.
+
+        If state events are coalesced, the events of Pending and Running states are
+        deferred and the states are included in the event of the next state instead.
+        """
+        if TYPE_CHECKING:
+            assert self.task_run is not None
+
+        if self._coalesce_state_events and (
+            validated_state.is_pending() or validated_state.is_running()
+        ):
+            self._deferred_states.append(validated_state)
+            return
+
+        self._last_event = emit_task_run_state_change_event(
+            task_run=self.task_run,
+            initial_state=initial_state,
+            validated_state=validated_state,
+            follows=self._last_event,
+            previous_states=self._deferred_states,
+        )
+        self._deferred_states = []
+
+    def emit_deferred_state_change_events(self) -> None:
+        """
+        Emits an event for the last deferred state, e.g. if the task run ends without
+        leaving a Pending state.
+        """
+        if not self.task_run or not self._deferred_states:
+            return
+
+        *previous_states, last_state = self._deferred_states
         self._last_event = emit_task_run_state_change_event(
             task_run=self.task_run,
-            initial_state=self.state,
-            validated_state=rolled_back_state,
+            initial_state=previous_states[-1] if previous_states else None,
+            validated_state=last_state,
             follows=self._last_event,
+            previous_states=previous_states,
         )
+        self._deferred_states = []
 
 
 @dataclass
@@ -456,12 +512,7 @@ class SyncTaskRunEngine(BaseTaskRunEngine[P, R]):
             link_state_to_task_run_result(new_state, result)
 
         # emit a state change event
-        self._last_event = emit_task_run_state_change_event(
-            task_run=self.task_run,
-            initial_state=last_state,
-            validated_state=self.task_run.state,
-            follows=self._last_event,
-        )
+        self.emit_state_change_event(last_state, self.task_run.state)
         self._telemetry.update_state(new_state)
         return new_state
 
@@ -709,11 +760,7 @@ class SyncTaskRunEngine(BaseTaskRunEngine[P, R]):
                             )
                         )
                         # Emit an event to capture that the task run was in the `PENDING` state.
-                        self._last_event = emit_task_run_state_change_event(
-                            task_run=self.task_run,
-                            initial_state=None,
-                            validated_state=self.task_run.state,
-                        )
+                        self.emit_state_change_event(None, self.task_run.state)
 
                     with self.setup_run_context():
                         # setup_run_context might update the task run name, so log creation here
@@ -750,6 +797,7 @@ class SyncTaskRunEngine(BaseTaskRunEngine[P, R]):
                     self.handle_crash(exc)
                     raise
                 finally:
+                    self.emit_deferred_state_change_events()
                     self.log_finished_message()
                     self._is_started = False
                     self._client = None
@@ -1034,19 +1082,14 @@ class AsyncTaskRunEngine(BaseTaskRunEngine[P, R]):
 
         if new_state.is_final():
             if isinstance(new_state.data, ResultRecord):
-                result = new_state.data.result
+                result = await new_state.data.aload_result()
             else:
                 result = new_state.data
 
             link_state_to_task_run_result(new_state, result)
 
         # emit a state change event
-        self._last_event = emit_task_run_state_change_event(
-            task_run=self.task_run,
-            initial_state=last_state,
-            validated_state=self.task_run.state,
-            follows=self._last_event,
-        )
+        self.emit_state_change_event(last_state, self.task_run.state)
 
         self._telemetry.update_state(new_state)
         return new_state
@@ -1054,7 +1097,7 @@ class AsyncTaskRunEngine(BaseTaskRunEngine[P, R]):
     async def result(self, raise_on_failure: bool = True) -> "Union[R, State, None]":
         if self._return_value is not NotSet:
             if isinstance(self._return_value, ResultRecord):
-                return self._return_value.result
+                return await self._return_value.aload_result()
             # otherwise, return the value as is
             return self._return_value
 
@@ -1291,11 +1334,7 @@ class AsyncTaskRunEngine(BaseTaskRunEngine[P, R]):
                             extra_task_inputs=dependencies,
                         )
                         # Emit an event to capture that the task run was in the `PENDING` state.
-                        self._last_event = emit_task_run_state_change_event(
-                            task_run=self.task_run,
-                            initial_state=None,
-                            validated_state=self.task_run.state,
-                        )
+                        self.emit_state_change_event(None, self.task_run.state)
 
                     async with self.setup_run_context():
                         # setup_run_context might update the task run name, so log creation here
@@ -1332,6 +1371,7 @@ class AsyncTaskRunEngine(BaseTaskRunEngine[P, R]):
                     await self.handle_crash(exc)
                     raise
                 finally:
+                    self.emit_deferred_state_change_events()
                     self.log_finished_message()
                     self._is_started = False
                     self._client = None
@@ -1639,6 +1679,157 @@ async def run_generator_task_async(
         await engine.result()
 
 
+def _start_lightweight_task_run(
+    task: "Task[P, R]",
+    parameters: dict[str, Any],
+    flow_run_context: FlowRunContext,
+) -> tuple[TaskRun, list[State[Any]]]:
+    """
+    Creates a task run for a lightweight task call and moves it to a running state.
+
+    The task run is not created through the API; it is reported with the other
+    lightweight task runs of the flow run once the flow run ends.
+    """
+    dynamic_key = dynamic_key_for_task_run(
+        context=flow_run_context, task=task, stable=False
+    )
+    task_run_id = uuid7()
+    flow_run_id = getattr(flow_run_context.flow_run, "id", None)
+    pending = Pending(
+        state_details=StateDetails(task_run_id=task_run_id, flow_run_id=flow_run_id)
+    )
+    task_run = TaskRun(
+        id=task_run_id,
+        name=f"{task.name}-{str(dynamic_key)[:3]}",
+        flow_run_id=flow_run_id,
+        task_key=task.task_key,
+        dynamic_key=str(dynamic_key),
+        task_version=task.version,
+        empirical_policy=TaskRunPolicy(),
+        tags=list(set(task.tags).union(TagsContext.get().current_tags or [])),
+        task_inputs={
+            name: collect_task_run_inputs_sync(value)
+            for name, value in parameters.items()
+        },
+        expected_start_time=pending.timestamp,
+        created=pending.timestamp,
+        updated=pending.timestamp,
+    )
+    running = Running(state_details=pending.state_details.model_copy())
+    _set_lightweight_task_run_state(task_run, running)
+    task_run.start_time = running.timestamp
+    task_run.run_count = 1
+    task_run.flow_run_run_count = getattr(flow_run_context.flow_run, "run_count", 0)
+    return task_run, [pending]
+
+
+def _set_lightweight_task_run_state(task_run: TaskRun, state: State[Any]) -> None:
+    task_run.state = state
+    task_run.state_id = state.id
+    task_run.state_type = state.type
+    task_run.state_name = state.name
+
+
+def _finish_lightweight_task_run(
+    task_run: TaskRun,
+    previous_states: list[State[Any]],
+    state: State[Any],
+    flow_run_context: FlowRunContext,
+) -> State[Any]:
+    """
+    Moves a lightweight task run to its final state and queues the task run to be
+    reported when the flow run ends.
+    """
+    if task_run.state is not None:
+        previous_states.append(task_run.state)
+    state.state_details = previous_states[-1].state_details.model_copy()
+    _set_lightweight_task_run_state(task_run, state)
+    task_run.end_time = state.timestamp
+    if task_run.start_time is not None:
+        task_run.total_run_time = state.timestamp - task_run.start_time
+    flow_run_context.lightweight_task_runs.append((task_run, previous_states))
+    return state
+
+
+def _lightweight_task_run_failed(exc: Exception) -> State[Any]:
+    return Failed(
+        data=exc,
+        message=f"Task run encountered an exception {format_exception(exc)}",
+    )
+
+
+def _lightweight_task_run_result(
+    state: State[Any], return_type: Literal["state", "result"]
+) -> Any:
+    if return_type == "state":
+        return state
+    if state.is_failed():
+        raise state.data
+    return state.data
+
+
+def run_lightweight_task_sync(
+    task: "Task[P, R]",
+    flow_run_context: FlowRunContext,
+    parameters: Optional[dict[str, Any]] = None,
+    return_type: Literal["state", "result"] = "result",
+) -> Union[R, State, None]:
+    """
+    Runs a task by calling its function directly instead of orchestrating the task
+    run. Used for calls of lightweight tasks within a flow run.
+    """
+    parameters = parameters or {}
+    task_run, previous_states = _start_lightweight_task_run(
+        task, parameters, flow_run_context
+    )
+    try:
+        result = call_with_parameters(task.fn, resolve_inputs_sync(parameters))
+    except Exception as exc:
+        state = _finish_lightweight_task_run(
+            task_run,
+            previous_states,
+            _lightweight_task_run_failed(exc),
+            flow_run_context,
+        )
+    else:
+        state = _finish_lightweight_task_run(
+            task_run, previous_states, Completed(data=result), flow_run_context
+        )
+        link_state_to_task_run_result(state, result)
+    return _lightweight_task_run_result(state, return_type)
+
+
+async def run_lightweight_task_async(
+    task: "Task[P, R]",
+    flow_run_context: FlowRunContext,
+    parameters: Optional[dict[str, Any]] = None,
+    return_type: Literal["state", "result"] = "result",
+) -> Union[R, State, None]:
+    """
+    Runs an async task by awaiting its function directly instead of orchestrating
+    the task run. Used for calls of lightweight tasks within a flow run.
+    """
+    parameters = parameters or {}
+    task_run, previous_states = _start_lightweight_task_run(
+        task, parameters, flow_run_context
+    )
+    try:
+        result = await call_with_parameters(task.fn, await resolve_inputs(parameters))
+    except Exception as exc:
+        state = _finish_lightweight_task_run(
+            task_run,
+            previous_states,
+            _lightweight_task_run_failed(exc),
+            flow_run_context,
+        )
+    else:
+        state = _finish_lightweight_task_run(
+            task_run, previous_states, Completed(data=result), flow_run_context
+        )
+        link_state_to_task_run_result(state, result)
+    return _lightweight_task_run_result(state, return_type)
+
+
 @overload
 def run_task(
     task: "Task[P, R]",
@@ -157,6 +157,7 @@ class TaskOptions(TypedDict, total=False):
     retry_condition_fn: Optional[RetryConditionCallable]
     viz_return_value: Any
     asset_deps: Optional[list[Union[Asset, str]]]
+    lightweight: bool
 
 
 def task_input_hash(
@@ -366,6 +367,12 @@ class Task(Generic[P, R]):
             to its retry policy.
         viz_return_value: An optional value to return when the task dependency tree is visualized.
         asset_deps: An optional list of upstream assets that this task depends on.
+        lightweight: If set, calls of the task within a flow run skip orchestration.
+            The task function is called directly, without caching, result
+            persistence, or an event for each state change, and the task runs are
+            reported in bulk when the flow run ends. Calls of tasks with retries,
+            timeouts, hooks, or `wait_for` are orchestrated as usual. Defaults to
+            `False`.
     """
 
     # NOTE: These parameters (types, defaults, and docstrings) should be duplicated
@@ -408,6 +415,7 @@ class Task(Generic[P, R]):
         retry_condition_fn: Optional[RetryConditionCallable] = None,
         viz_return_value: Optional[Any] = None,
         asset_deps: Optional[list[Union[str, Asset]]] = None,
+        lightweight: bool = False,
     ):
         # Validate if hook passed is list and contains callables
         hook_categories = [on_completion, on_failure]
@@ -609,6 +617,8 @@ class Task(Generic[P, R]):
             else []
         )
 
+        self.lightweight = lightweight
+
     @property
     def ismethod(self) -> bool:
         return hasattr(self.fn, "__prefect_self__")
@@ -678,6 +688,7 @@ class Task(Generic[P, R]):
         retry_condition_fn: Optional[RetryConditionCallable] = None,
         viz_return_value: Optional[Any] = None,
         asset_deps: Optional[list[Union[str, Asset]]] = None,
+        lightweight: Union[bool, type[NotSet]] = NotSet,
     ) -> "Task[P, R]":
         """
         Create a new task from the current object, updating provided options.
@@ -717,6 +728,7 @@ class Task(Generic[P, R]):
                 if the task should end as failed. Defaults to `None`, indicating the task should
                 always continue to its retry policy.
             viz_return_value: An optional value to return when the task dependency tree is visualized.
+            lightweight: A new option for enabling or disabling lightweight task runs.
 
         Returns:
             A new `Task` instance.
@@ -819,6 +831,9 @@ class Task(Generic[P, R]):
             retry_condition_fn=retry_condition_fn or self.retry_condition_fn,
             viz_return_value=viz_return_value or self.viz_return_value,
             asset_deps=asset_deps or self.asset_deps,
+            lightweight=(
+                lightweight if lightweight is not NotSet else self.lightweight
+            ),
         )
 
     def on_completion(self, fn: StateHookCallable) -> StateHookCallable:
@@ -1134,6 +1149,25 @@ class Task(Generic[P, R]):
                 self.isasync, self.name, parameters, self.viz_return_value
             )
 
+        flow_run_context = FlowRunContext.get()
+        if flow_run_context and self._runs_lightweight(flow_run_context, wait_for):
+            from prefect.task_engine import (
+                run_lightweight_task_async,
+                run_lightweight_task_sync,
+            )
+
+            run_lightweight_task = (
+                run_lightweight_task_async
+                if self.isasync
+                else run_lightweight_task_sync
+            )
+            return run_lightweight_task(
+                task=self,
+                flow_run_context=flow_run_context,
+                parameters=parameters,
+                return_type=return_type,
+            )
+
         from prefect.task_engine import run_task
 
         return run_task(
@@ -1143,6 +1177,47 @@ class Task(Generic[P, R]):
             return_type=return_type,
         )
 
+    def _runs_lightweight(
+        self,
+        flow_run_context: FlowRunContext,
+        wait_for: Optional[OneOrManyFutureOrResult[Any]] = None,
+    ) -> bool:
+        """
+        Whether a call of this task in the given flow run skips orchestration.
+
+        Calls that need the task engine, e.g. for retries, timeouts, hooks, tag
+        concurrency limits, logging prints, or persisting and caching results, are
+        orchestrated even if the task or flow enables lightweight task runs.
+        """
+        flow = flow_run_context.flow
+        if not (self.lightweight or (flow is not None and flow.lightweight_tasks)):
+            return False
+        return not (
+            wait_for
+            or self.isgenerator
+            or isinstance(self, MaterializingTask)
+            or self.retries
+            or self.timeout_seconds
+            or self.on_completion_hooks
+            or self.on_failure_hooks
+            or self.on_commit_hooks
+            or self.on_rollback_hooks
+            or self.tags
+            or TagsContext.get().current_tags
+            or self.task_run_name is not None
+            or (
+                self.log_prints
+                if self.log_prints is not None
+                else flow_run_context.log_prints
+            )
+            or (
+                self.persist_result
+                if self.persist_result is not None
+                else flow_run_context.persist_result
+            )
+            or TaskRunContext.get()
+        )
+
     @overload
     def submit(
         self: "Task[P, R]",
@@ -1790,6 +1865,7 @@ def task(
     retry_condition_fn: Optional[RetryConditionCallable] = None,
     viz_return_value: Any = None,
     asset_deps: Optional[list[Union[str, Asset]]] = None,
+    lightweight: bool = False,
 ) -> Callable[[Callable[P, R]], Task[P, R]]: ...
 
 
@@ -1826,6 +1902,7 @@ def task(
     retry_condition_fn: Optional[RetryConditionCallable] = None,
     viz_return_value: Any = None,
     asset_deps: Optional[list[Union[str, Asset]]] = None,
+    lightweight: bool = False,
 ) -> Callable[[Callable[P, R]], Task[P, R]]: ...
 
 
@@ -1863,6 +1940,7 @@ def task(
     retry_condition_fn: Optional[RetryConditionCallable] = None,
     viz_return_value: Any = None,
     asset_deps: Optional[list[Union[str, Asset]]] = None,
+    lightweight: bool = False,
 ) -> Callable[[Callable[P, R]], Task[P, R]]: ...
 
 
@@ -1897,6 +1975,7 @@ def task(
     retry_condition_fn: Optional[RetryConditionCallable] = None,
     viz_return_value: Any = None,
     asset_deps: Optional[list[Union[str, Asset]]] = None,
+    lightweight: bool = False,
 ):
     """
     Decorator to designate a function as a task in a Prefect workflow.
@@ -1958,6 +2037,12 @@ def task(
             to its retry policy.
         viz_return_value: An optional value to return when the task dependency tree is visualized.
         asset_deps: An optional list of upstream assets that this task depends on.
+        lightweight: If set, calls of the task within a flow run skip orchestration.
+            The task function is called directly, without caching, result
+            persistence, or an event for each state change, and the task runs are
+            reported in bulk when the flow run ends. Calls of tasks with retries,
+            timeouts, hooks, or `wait_for` are orchestrated as usual. Defaults to
+            `False`.
 
     Returns:
         A callable `Task` object which, when called, will submit the task for execution.
@@ -2047,6 +2132,7 @@ def task(
             retry_condition_fn=retry_condition_fn,
             viz_return_value=viz_return_value,
             asset_deps=asset_deps,
+            lightweight=lightweight,
         )
     else:
         return cast(
@@ -2077,6 +2163,7 @@ def task(
                 retry_condition_fn=retry_condition_fn,
                 viz_return_value=viz_return_value,
                 asset_deps=asset_deps,
+                lightweight=lightweight,
             ),
         )
 
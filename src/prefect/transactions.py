@@ -24,6 +24,7 @@ import anyio.to_thread
 from pydantic import Field, PrivateAttr
 from typing_extensions import Self
 
+from prefect._result_writes import get_result_write_pipeline
 from prefect.context import ContextModel
 from prefect.exceptions import (
     ConfigurationError,
@@ -37,6 +38,7 @@ from prefect.results import (
     ResultStore,
     get_result_store,
 )
+from prefect.settings.context import get_current_settings
 from prefect.utilities._engine import get_hook_name
 from prefect.utilities.annotations import NotSet
 from prefect.utilities.asyncutils import run_coro_as_sync
@@ -182,6 +184,14 @@ class BaseTransaction(ContextModel, abc.ABC):
     def is_active(self) -> bool:
         return self.state == TransactionState.ACTIVE
 
+    def _should_write_behind(self) -> bool:
+        # serializable transactions release their lock on commit, so their
+        # result must be durable before the commit returns
+        return (
+            get_current_settings().results.write_behind
+            and self.isolation_level != IsolationLevel.SERIALIZABLE
+        )
+
     def prepare_transaction(self) -> None:
         """Helper method to prepare transaction state and validate configuration."""
         if self._token is not None:
@@ -350,7 +360,14 @@ class Transaction(BaseTransaction):
 
             if self.store and self.key and self.write_on_commit:
                 if isinstance(self._staged_value, ResultRecord):
-                    self.store.persist_result_record(result_record=self._staged_value)
+                    if self._should_write_behind():
+                        get_result_write_pipeline().submit(
+                            self.store, self._staged_value
+                        )
+                    else:
+                        self.store.persist_result_record(
+                            result_record=self._staged_value
+                        )
                 else:
                     self.store.write(key=self.key, obj=self._staged_value)
 
@@ -504,9 +521,14 @@ class AsyncTransaction(BaseTransaction):
 
             if self.store and self.key and self.write_on_commit:
                 if isinstance(self._staged_value, ResultRecord):
-                    await self.store.apersist_result_record(
-                        result_record=self._staged_value
-                    )
+                    if self._should_write_behind():
+                        await get_result_write_pipeline().asubmit(
+                            self.store, self._staged_value
+                        )
+                    else:
+                        await self.store.apersist_result_record(
+                            result_record=self._staged_value
+                        )
                 else:
                     await self.store.awrite(key=self.key, obj=self._staged_value)
 
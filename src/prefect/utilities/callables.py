@@ -15,7 +15,6 @@ from typing import Any, Callable, Optional, Union, cast
 
 import cloudpickle  # type: ignore  # no stubs available
 import pydantic
-from griffe import Docstring, DocstringSectionKind, Parser, parse
 from typing_extensions import Literal, TypeVar
 
 from prefect._internal.pydantic.v1_schema import has_v1_type_as_param
@@ -267,6 +266,8 @@ def parameter_docstrings(docstring: Optional[str]) -> dict[str, str]:
     if not docstring:
         return param_docstrings
 
+    from griffe import Docstring, DocstringSectionKind, Parser, parse
+
     with disable_logger("griffe"):
         parsed = parse(Docstring(docstring), Parser.google)
         for section in parsed:
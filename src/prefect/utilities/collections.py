@@ -5,6 +5,7 @@ Utilities for extensions of and operations on Python collections.
 import io
 import itertools
 import types
+import weakref
 from collections import OrderedDict
 from collections.abc import (
     Callable,
@@ -233,6 +234,76 @@ def batched_iterable(
         yield batch
 
 
+class _CollectionKind(Enum):
+    """
+    How `visit_collection` visits the children of an object of a given type.
+    """
+
+    LEAF = auto()
+    OPAQUE = auto()
+    ANNOTATION = auto()
+    SEQUENCE = auto()
+    MAPPING = auto()
+    DATACLASS = auto()
+    PYDANTIC = auto()
+
+
+# The kinds of common types, which are looked up before any other types
+_COLLECTION_KINDS: dict[type[Any], tuple[_CollectionKind, tuple[str, ...]]] = {
+    **{
+        type_: (_CollectionKind.LEAF, ())
+        for type_ in (str, bytes, int, float, bool, complex, type(None))
+    },
+    **{type_: (_CollectionKind.SEQUENCE, ()) for type_ in (list, tuple, set)},
+    **{type_: (_CollectionKind.MAPPING, ()) for type_ in (dict, OrderedDict)},
+}
+
+# The kinds of all other types seen so far, which are held weakly since types may be
+# created dynamically, e.g. by mocks
+_collection_kinds_cache: "weakref.WeakKeyDictionary[type[Any], tuple[_CollectionKind, tuple[str, ...]]]" = weakref.WeakKeyDictionary()
+
+
+def _get_collection_kind(
+    type_: type[Any],
+) -> tuple[_CollectionKind, tuple[str, ...]]:
+    """
+    Returns the kind of a type for `visit_collection` and, for dataclasses, the names
+    of their fields.
+    """
+    try:
+        return _COLLECTION_KINDS[type_]
+    except KeyError:
+        pass
+
+    try:
+        return _collection_kinds_cache[type_]
+    except (KeyError, TypeError):
+        pass
+
+    field_names: tuple[str, ...] = ()
+    if issubclass(type_, (types.GeneratorType, types.AsyncGeneratorType, Mock)):
+        kind = _CollectionKind.OPAQUE
+    elif issubclass(type_, BaseAnnotation):
+        kind = _CollectionKind.ANNOTATION
+    elif issubclass(type_, (list, tuple, set)):
+        kind = _CollectionKind.SEQUENCE
+    elif issubclass(type_, (dict, OrderedDict)):
+        kind = _CollectionKind.MAPPING
+    elif is_dataclass(type_):
+        kind = _CollectionKind.DATACLASS
+        field_names = tuple(field.name for field in fields(type_))
+    elif issubclass(type_, pydantic.BaseModel):
+        kind = _CollectionKind.PYDANTIC
+    else:
+        kind = _CollectionKind.LEAF
+
+    try:
+        _collection_kinds_cache[type_] = (kind, field_names)
+    except TypeError:
+        pass
+    return kind, field_names
+
+
 class StopVisiting(BaseException):
     """
     A special exception used to stop recursive visits in `visit_collection`.
@@ -375,170 +446,162 @@ def visit_collection(
 
     if _seen is None:
         _seen = {}
+    seen = _seen
 
     if context is not None:
-        _callback = cast(Callable[[Any, dict[str, VT]], Any], visit_fn)
-
-        def visit_nested(expr: Any) -> Optional[Any]:
-            return visit_collection(
-                expr,
-                _callback,
-                return_data=return_data,
-                remove_annotations=remove_annotations,
-                max_depth=max_depth - 1,
-                # Copy the context on nested calls so it does not "propagate up"
-                context=context.copy(),
-                _seen=_seen,
-            )
-
-        def visit_expression(expr: Any) -> Any:
-            return _callback(expr, context)
+        callback_with_context = cast(Callable[[Any, dict[str, VT]], Any], visit_fn)
+        callback = None
     else:
-        _callback = cast(Callable[[Any], Any], visit_fn)
-
-        def visit_nested(expr: Any) -> Optional[Any]:
-            # Utility for a recursive call, preserving options and updating the depth.
-            return visit_collection(
-                expr,
-                _callback,
-                return_data=return_data,
-                remove_annotations=remove_annotations,
-                max_depth=max_depth - 1,
-                _seen=_seen,
-            )
-
-        def visit_expression(expr: Any) -> Any:
-            return _callback(expr)
-
-    # --- 1. Visit every expression
-    try:
-        result = visit_expression(expr)
-    except StopVisiting:
-        max_depth = 0
-        result = expr
-
-    if return_data:
-        # Only mutate the root expression if the user indicated we're returning data,
-        # otherwise the function could return null and we have no collection to check
-        expr = result
-
-    # --- 2. Visit every child of the expression recursively
-
-    # If we have reached the maximum depth or we have already visited this object,
-    # return the result if we are returning data, otherwise return None
-    obj_id = id(expr)
-    if max_depth == 0:
-        return result if return_data else None
-    elif obj_id in _seen:
-        # Return the cached transformed result
-        return _seen[obj_id] if return_data else None
-
-    # Mark this object as being processed to handle circular references
-    # We'll update with the actual result later
-    _seen[obj_id] = expr
+        callback_with_context = None
+        callback = cast(Callable[[Any], Any], visit_fn)
+
+    def visit(expr: Any, max_depth: int, context: Optional[dict[str, VT]]) -> Any:
+        # --- 1. Visit every expression
+        try:
+            if callback is not None:
+                result = callback(expr)
+            else:
+                assert callback_with_context is not None and context is not None
+                result = callback_with_context(expr, context)
+        except StopVisiting:
+            max_depth = 0
+            result = expr
 
-    # Then visit every item in the expression if it is a collection
+        if return_data:
+            # Only mutate the root expression if the user indicated we're returning
+            # data, otherwise the function could return null and we have no
+            # collection to check
+            expr = result
 
-    # presume that the result is the original expression.
-    # in each of the following cases, we will update the result if we need to.
-    result = expr
+        # --- 2. Visit every child of the expression recursively
 
-    # --- Generators
+        # If we have reached the maximum depth, return the result if we are
+        # returning data, otherwise return None
+        if max_depth == 0:
+            return result if return_data else None
 
-    if isinstance(expr, (types.GeneratorType, types.AsyncGeneratorType)):
-        # Do not attempt to iterate over generators, as it will exhaust them
-        pass
+        kind, field_names = _get_collection_kind(type(expr))
 
-    # --- Mocks
+        # Leaves cannot contain themselves, so they do not need to be tracked
+        if kind is _CollectionKind.LEAF:
+            return result if return_data else None
 
-    elif isinstance(expr, Mock):
-        # Do not attempt to recurse into mock objects
-        pass
+        # If we have already visited this object, return the cached transformed result
+        obj_id = id(expr)
+        if obj_id in seen:
+            return seen[obj_id] if return_data else None
 
-    # --- Annotations (unmapped, quote, etc.)
+        # Mark this object as being processed to handle circular references
+        # We'll update with the actual result later
+        seen[obj_id] = expr
 
-    elif isinstance(expr, BaseAnnotation):
-        annotated = cast(BaseAnnotation[Any], expr)
-        if context is not None:
-            context["annotation"] = cast(VT, annotated)
-        unwrapped = annotated.unwrap()
-        value = visit_nested(unwrapped)
-
-        if return_data:
-            # if we are removing annotations, return the value
-            if remove_annotations:
-                result = value
-            # if the value was modified, rewrap it
-            elif value is not unwrapped:
-                result = annotated.rewrap(value)
-            # otherwise return the expr
-
-    # --- Sequences
-
-    elif isinstance(expr, (list, tuple, set)):
-        seq = cast(Union[list[Any], tuple[Any], set[Any]], expr)
-        items = [visit_nested(o) for o in seq]
-        if return_data:
-            modified = any(item is not orig for item, orig in zip(items, seq))
-            if modified:
-                result = type(seq)(items)
+        # presume that the result is the original expression.
+        # in each of the following cases, we will update the result if we need to.
+        result = expr
+        depth = max_depth - 1
 
-    # --- Dictionaries
+        # Contexts are copied on nested calls so they do not "propagate up"
+        if context is None:
 
-    elif isinstance(expr, (dict, OrderedDict)):
-        mapping = cast(dict[Any, Any], expr)
-        items = [(visit_nested(k), visit_nested(v)) for k, v in mapping.items()]
-        if return_data:
-            modified = any(
-                k1 is not k2 or v1 is not v2
-                for (k1, v1), (k2, v2) in zip(items, mapping.items())
-            )
-            if modified:
-                result = type(mapping)(items)
-
-    # --- Dataclasses
+            def visit_nested(expr: Any) -> Any:
+                return visit(expr, depth, None)
+        else:
 
-    elif is_dataclass(expr) and not isinstance(expr, type):
-        expr_fields = fields(expr)
-        values = [visit_nested(getattr(expr, f.name)) for f in expr_fields]
-        if return_data:
-            modified = any(
-                getattr(expr, f.name) is not v for f, v in zip(expr_fields, values)
-            )
-            if modified:
-                result = replace(
-                    expr, **{f.name: v for f, v in zip(expr_fields, values)}
+            def visit_nested(expr: Any) -> Any:
+                return visit(expr, depth, context.copy())
+
+        # --- Generators and mocks are not visited, since iterating over a generator
+        # would exhaust it and mocks create attributes on access
+
+        if kind is _CollectionKind.OPAQUE:
+            pass
+
+        # --- Annotations (unmapped, quote, etc.)
+
+        elif kind is _CollectionKind.ANNOTATION:
+            annotated = cast(BaseAnnotation[Any], expr)
+            if context is not None:
+                context["annotation"] = cast(VT, annotated)
+            unwrapped = annotated.unwrap()
+            value = visit_nested(unwrapped)
+
+            if return_data:
+                # if we are removing annotations, return the value
+                if remove_annotations:
+                    result = value
+                # if the value was modified, rewrap it
+                elif value is not unwrapped:
+                    result = annotated.rewrap(value)
+                # otherwise return the expr
+
+        # --- Sequences
+
+        elif kind is _CollectionKind.SEQUENCE:
+            seq = cast(Union[list[Any], tuple[Any], set[Any]], expr)
+            items = [visit_nested(o) for o in seq]
+            if return_data:
+                modified = any(item is not orig for item, orig in zip(items, seq))
+                if modified:
+                    result = type(seq)(items)
+
+        # --- Dictionaries
+
+        elif kind is _CollectionKind.MAPPING:
+            mapping = cast(dict[Any, Any], expr)
+            items = [(visit_nested(k), visit_nested(v)) for k, v in mapping.items()]
+            if return_data:
+                modified = any(
+                    k1 is not k2 or v1 is not v2
+                    for (k1, v1), (k2, v2) in zip(items, mapping.items())
                 )
-
-    # --- Pydantic models
-
-    elif isinstance(expr, pydantic.BaseModel):
-        # when extra=allow, fields not in model_fields may be in model_fields_set
-        original_data = dict(expr)
-        updated_data = {
-            field: visit_nested(value) for field, value in original_data.items()
-        }
-
-        if return_data:
-            modified = any(
-                original_data[field] is not updated_data[field]
-                for field in updated_data
-            )
-            if modified:
-                # Use construct to avoid validation and handle immutability
-                model_instance = expr.model_construct(
-                    _fields_set=expr.model_fields_set, **updated_data
+                if modified:
+                    result = type(mapping)(items)
+
+        # --- Dataclasses
+
+        elif kind is _CollectionKind.DATACLASS:
+            original_values = [getattr(expr, name) for name in field_names]
+            values = [visit_nested(value) for value in original_values]
+            if return_data:
+                modified = any(
+                    original is not value
+                    for original, value in zip(original_values, values)
                 )
-                for private_attr in expr.__private_attributes__:
-                    setattr(model_instance, private_attr, getattr(expr, private_attr))
-                result = model_instance
-
-    # Update the cache with the final transformed result
-    if return_data:
-        _seen[obj_id] = result
+                if modified:
+                    result = replace(expr, **dict(zip(field_names, values)))
+
+        # --- Pydantic models
+
+        elif kind is _CollectionKind.PYDANTIC:
+            model = cast(pydantic.BaseModel, expr)
+            # when extra=allow, fields not in model_fields may be in model_fields_set
+            original_data = dict(model)
+            updated_data = {
+                field: visit_nested(value) for field, value in original_data.items()
+            }
+
+            if return_data:
+                modified = any(
+                    original_data[field] is not updated_data[field]
+                    for field in updated_data
+                )
+                if modified:
+                    # Use construct to avoid validation and handle immutability
+                    model_instance = model.model_construct(
+                        _fields_set=model.model_fields_set, **updated_data
+                    )
+                    for private_attr in model.__private_attributes__:
+                        setattr(
+                            model_instance, private_attr, getattr(model, private_attr)
+                        )
+                    result = model_instance
+
+        # Update the cache with the final transformed result
+        if return_data:
+            seen[obj_id] = result
+            return result
 
-    if return_data:
-        return result
+    return visit(expr, max_depth, context)
 
 
 @overload
@@ -1,9 +1,10 @@
 import asyncio
 import contextlib
+import datetime
 import os
 import signal
 import time
-from collections.abc import Awaitable, Callable, Generator
+from collections.abc import Awaitable, Callable, Collection, Generator, Sequence
 from functools import partial
 from logging import Logger
 from typing import (
@@ -50,7 +51,8 @@ from prefect.results import ResultRecord, should_persist_result
 from prefect.settings import PREFECT_LOGGING_LOG_PRINTS
 from prefect.states import State
 from prefect.tasks import Task
-from prefect.utilities.annotations import allow_failure, quote
+from prefect.utilities.annotations import BaseAnnotation, allow_failure, quote
+from prefect.utilities.asyncutils import run_sync_in_worker_thread
 from prefect.utilities.collections import StopVisiting, visit_collection
 from prefect.utilities.text import truncated_to
 
@@ -59,10 +61,35 @@ if TYPE_CHECKING:
 
 API_HEALTHCHECKS: dict[str, float] = {}
 UNTRACKABLE_TYPES: set[type[Any]] = {bool, type(None), type(...), type(NotImplemented)}
+# Values of these types can never contain futures or states
+ATOMIC_TYPES: frozenset[type[Any]] = frozenset(
+    {str, bytes, int, float, bool, complex, type(None)}
+)
 engine_logger: Logger = get_logger("engine")
 T = TypeVar("T")
 
 
+def _atomic_collection_values(expr: Any) -> Optional[Collection[Any]]:
+    """
+    Returns the values of a builtin collection that only contains atomic values, e.g.
+    a list of numbers or a dictionary of strings, or `None` for any other expression.
+
+    Visitors that only look for futures and states can skip the values of these
+    collections instead of being called with each of them.
+    """
+    expr_type = type(expr)
+    if expr_type is list or expr_type is tuple or expr_type is set:
+        values = cast(Collection[Any], expr)
+    elif expr_type is dict:
+        values = [*expr, *expr.values()]
+    else:
+        return None
+
+    if all(type(value) in ATOMIC_TYPES for value in values):
+        return values
+    return None
+
+
 async def collect_task_run_inputs(
     expr: Any, max_depth: int = -1
 ) -> set[Union[TaskRunResult, FlowRunResult]]:
@@ -83,6 +110,14 @@ async def collect_task_run_inputs(
 
     inputs: set[Union[TaskRunResult, FlowRunResult]] = set()
 
+    def add_result_to_inputs(obj: Any) -> None:
+        res = get_state_for_result(obj)
+        if res:
+            state, run_type = res
+            run_result = state.state_details.to_run_result(run_type)
+            if run_result:
+                inputs.add(run_result)
+
     def add_futures_and_states_to_inputs(obj: Any) -> None:
         if isinstance(obj, PrefectFuture):
             inputs.add(TaskRunResult(id=obj.task_run_id))
@@ -97,12 +132,12 @@ async def collect_task_run_inputs(
         elif isinstance(obj, quote):
             raise StopVisiting
         else:
-            res = get_state_for_result(obj)
-            if res:
-                state, run_type = res
-                run_result = state.state_details.to_run_result(run_type)
-                if run_result:
-                    inputs.add(run_result)
+            add_result_to_inputs(obj)
+            # atomic values can only be inputs as the results of other runs
+            if (values := _atomic_collection_values(obj)) is not None:
+                for value in values:
+                    add_result_to_inputs(value)
+                raise StopVisiting
 
     visit_collection(
         expr,
@@ -133,6 +168,14 @@ def collect_task_run_inputs_sync(
 
     inputs: set[Union[TaskRunResult, FlowRunResult]] = set()
 
+    def add_result_to_inputs(obj: Any) -> None:
+        res = get_state_for_result(obj)
+        if res:
+            state, run_type = res
+            run_result = state.state_details.to_run_result(run_type)
+            if run_result:
+                inputs.add(run_result)
+
     def add_futures_and_states_to_inputs(obj: Any) -> None:
         if isinstance(obj, future_cls) and hasattr(obj, "task_run_id"):
             inputs.add(
@@ -151,12 +194,12 @@ def collect_task_run_inputs_sync(
         elif isinstance(obj, quote):
             raise StopVisiting
         else:
-            res = get_state_for_result(obj)
-            if res:
-                state, run_type = res
-                run_result = state.state_details.to_run_result(run_type)
-                if run_result:
-                    inputs.add(run_result)
+            add_result_to_inputs(obj)
+            # atomic values can only be inputs as the results of other runs
+            if (values := _atomic_collection_values(obj)) is not None:
+                for value in values:
+                    add_result_to_inputs(value)
+                raise StopVisiting
 
     visit_collection(
         expr,
@@ -214,6 +257,7 @@ async def resolve_inputs(
 
     futures: set[PrefectFuture[Any]] = set()
     states: set[State[Any]] = set()
+    annotations: list[BaseAnnotation[Any]] = []
     result_by_state: dict[State[Any], Any] = {}
 
     if not parameters:
@@ -227,9 +271,13 @@ async def resolve_inputs(
         if isinstance(expr, PrefectFuture):
             fut: PrefectFuture[Any] = expr
             futures.add(fut)
-        if isinstance(expr, State):
+        elif isinstance(expr, State):
             state: State[Any] = expr
             states.add(state)
+        elif isinstance(expr, BaseAnnotation):
+            annotations.append(cast(BaseAnnotation[Any], expr))
+        elif _atomic_collection_values(expr) is not None:
+            raise StopVisiting()
 
         return cast(Any, expr)
 
@@ -241,6 +289,20 @@ async def resolve_inputs(
         context={},
     )
 
+    # Parameters without futures, states, or annotations resolve to themselves, so
+    # they do not need to be visited again
+    if not futures and not states and not annotations:
+        return dict(parameters) if return_data else dict.fromkeys(parameters)
+
+    # Wait for futures on worker threads, so that the event loop is not blocked
+    state_by_future: dict[PrefectFuture[Any], State[Any]] = {}
+    if futures:
+        await asyncio.gather(
+            *(run_sync_in_worker_thread(future.wait) for future in futures)
+        )
+        state_by_future = {future: future.state for future in futures}
+        states.update(state_by_future.values())
+
     # Only retrieve the result if requested as it may be expensive
     if return_data:
         finished_states = [state for state in states if state.is_final()]
@@ -261,9 +323,11 @@ async def resolve_inputs(
             raise StopVisiting()
 
         if isinstance(expr, PrefectFuture):
-            state = expr.state
+            state = state_by_future[expr]
         elif isinstance(expr, State):
             state = expr
+        elif _atomic_collection_values(expr) is not None:
+            raise StopVisiting()
         else:
             return expr
 
@@ -352,7 +416,7 @@ async def propose_state(
     if state.is_final():
         result: Any
         if _is_result_record(state.data):
-            result = state.data.result
+            result = await state.data.aload_result()
         else:
             result = state.data
 
@@ -616,12 +680,34 @@ async def check_api_reachable(client: "PrefectClient", fail_message: str) -> Non
     API_HEALTHCHECKS[api_url] = get_deadline(60 * 10)
 
 
+def _state_payload(state: State[Any], message_length: int) -> dict[str, Any]:
+    return {
+        "type": str(state.type.value),
+        "name": state.name,
+        "message": truncated_to(message_length, state.message),
+        "state_details": state.state_details.model_dump(
+            mode="json",
+            exclude_none=True,
+            exclude_unset=True,
+            exclude={"flow_run_id", "task_run_id"},
+        ),
+    }
+
+
 def emit_task_run_state_change_event(
     task_run: TaskRun,
     initial_state: Optional[State[Any]],
     validated_state: State[Any],
     follows: Optional[Event] = None,
+    previous_states: Optional[Sequence[State[Any]]] = None,
 ) -> Optional[Event]:
+    """
+    Emits an event for a task run entering a new state.
+
+    If `previous_states` are given, they are states the task run entered before the
+    validated state that did not have events of their own. They are included in the
+    event so that they can still be recorded.
+    """
     state_message_truncation_length = 100_000
 
     if _is_result_record(validated_state.data) and should_persist_result():
@@ -629,64 +715,53 @@ def emit_task_run_state_change_event(
     else:
         data = None
 
+    payload: dict[str, Any] = {
+        "intended": {
+            "from": str(initial_state.type.value) if initial_state else None,
+            "to": str(validated_state.type.value) if validated_state else None,
+        },
+        "initial_state": (
+            _state_payload(initial_state, state_message_truncation_length)
+            if initial_state
+            else None
+        ),
+        "validated_state": {
+            **_state_payload(validated_state, state_message_truncation_length),
+            "data": data,
+        },
+        "task_run": task_run.model_dump(
+            mode="json",
+            exclude_none=True,
+            exclude={
+                "id",
+                "created",
+                "updated",
+                "flow_run_id",
+                "state_id",
+                "state_type",
+                "state_name",
+                "state",
+                # server materialized fields
+                "estimated_start_time_delta",
+                "estimated_run_time",
+            },
+        ),
+    }
+    if previous_states:
+        payload["previous_states"] = [
+            {
+                "id": str(state.id),
+                "timestamp": state.timestamp.isoformat(),
+                **_state_payload(state, state_message_truncation_length),
+            }
+            for state in previous_states
+        ]
+
     return emit_event(
         id=validated_state.id,
         occurred=validated_state.timestamp,
         event=f"prefect.task-run.{validated_state.name}",
-        payload={
-            "intended": {
-                "from": str(initial_state.type.value) if initial_state else None,
-                "to": str(validated_state.type.value) if validated_state else None,
-            },
-            "initial_state": (
-                {
-                    "type": str(initial_state.type.value),
-                    "name": initial_state.name,
-                    "message": truncated_to(
-                        state_message_truncation_length, initial_state.message
-                    ),
-                    "state_details": initial_state.state_details.model_dump(
-                        mode="json",
-                        exclude_none=True,
-                        exclude_unset=True,
-                        exclude={"flow_run_id", "task_run_id"},
-                    ),
-                }
-                if initial_state
-                else None
-            ),
-            "validated_state": {
-                "type": str(validated_state.type.value),
-                "name": validated_state.name,
-                "message": truncated_to(
-                    state_message_truncation_length, validated_state.message
-                ),
-                "state_details": validated_state.state_details.model_dump(
-                    mode="json",
-                    exclude_none=True,
-                    exclude_unset=True,
-                    exclude={"flow_run_id", "task_run_id"},
-                ),
-                "data": data,
-            },
-            "task_run": task_run.model_dump(
-                mode="json",
-                exclude_none=True,
-                exclude={
-                    "id",
-                    "created",
-                    "updated",
-                    "flow_run_id",
-                    "state_id",
-                    "state_type",
-                    "state_name",
-                    "state",
-                    # server materialized fields
-                    "estimated_start_time_delta",
-                    "estimated_run_time",
-                },
-            ),
-        },
+        payload=payload,
         resource={
             "prefect.resource.id": f"prefect.task-run.{task_run.id}",
             "prefect.resource.name": task_run.name,
@@ -707,6 +782,37 @@ def emit_task_run_state_change_event(
     )
 
 
+def emit_lightweight_task_run_events(flow_run_context: FlowRunContext) -> None:
+    """
+    Reports the lightweight task runs of a flow run that have not been reported yet.
+
+    Each task run is reported with a single event for its final state that includes
+    the states it entered before, so that the task runs are recorded in bulk instead
+    of with an event for each state change.
+    """
+    task_runs = flow_run_context.lightweight_task_runs
+    if not task_runs:
+        return
+
+    total_run_time = datetime.timedelta()
+    for task_run, previous_states in task_runs:
+        if task_run.state is None:
+            continue
+        emit_task_run_state_change_event(
+            task_run=task_run,
+            initial_state=previous_states[-1] if previous_states else None,
+            validated_state=task_run.state,
+            previous_states=previous_states,
+        )
+        total_run_time += task_run.total_run_time
+
+    engine_logger.debug(
+        f"Reported {len(task_runs)} lightweight task run(s) with a total run time of"
+        f" {total_run_time.total_seconds():.3f}s"
+    )
+    task_runs.clear()
+
+
 def resolve_to_final_result(expr: Any, context: dict[str, Any]) -> Any:
     """
     Resolve any `PrefectFuture`, or `State` types nested in parameters into
@@ -734,6 +840,8 @@ def resolve_to_final_result(expr: Any, context: dict[str, Any]) -> Any:
         state = expr.state
     elif isinstance(expr, State):
         state = expr
+    elif _atomic_collection_values(expr) is not None:
+        raise StopVisiting()
     else:
         return expr
 
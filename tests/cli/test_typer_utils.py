@@ -1,7 +1,42 @@
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from prefect.cli import app
 from prefect.cli._types import PrefectTyper
-from prefect.cli.root import app
 from prefect.testing.cli import invoke_and_assert
 
+RUN_CLI = """
+import json
+import sys
+
+from prefect.cli import app
+
+try:
+    app({args!r}, prog_name="prefect")
+except SystemExit:
+    pass
+
+print(json.dumps(sorted(module for module in sys.modules if module.startswith("prefect."))))
+"""
+
+
+def run_cli(args: list[str], prefect_home: Path) -> tuple[str, list[str]]:
+    """
+    Runs the CLI in a fresh interpreter and returns its output and imported modules
+    """
+    output = subprocess.check_output(
+        [sys.executable, "-c", RUN_CLI.format(args=args)],
+        env={**os.environ, "PREFECT_HOME": str(prefect_home)},
+        text=True,
+    )
+    output, _, modules = output.rstrip().rpartition("\n")
+    return output, json.loads(modules)
+
 
 class TestPrefectTyper:
     singular_subcommand = PrefectTyper(name="singular-subcommand")
@@ -55,3 +90,48 @@ class TestPrefectTyper:
             expected_output_contains="Test Command Executed",
             expected_code=0,
         )
+
+
+class TestLazyCommands:
+    @pytest.mark.parametrize("name", list(app.lazy_commands))
+    def test_lazy_commands_are_registered_by_their_modules(self, name: str):
+        invoke_and_assert([name, "--help"], expected_code=0)
+
+    @pytest.mark.parametrize("command", ["profile", "profiles"])
+    def test_invoking_a_command_only_imports_its_module(
+        self, tmp_path: Path, command: str
+    ):
+        output, modules = run_cli([command, "ls"], tmp_path)
+
+        assert "Available Profiles" in output
+        assert "prefect.cli.profile" in modules
+        assert "prefect.cli.deploy" not in modules
+        assert "prefect.cli.server" not in modules
+
+    def test_help_is_rendered_from_cached_manifest(self, tmp_path: Path):
+        output, modules = run_cli(["--help"], tmp_path)
+
+        assert "prefect.cli.deploy" in modules
+        assert (tmp_path / "cli-manifest.json").exists()
+
+        cached_output, cached_modules = run_cli(["--help"], tmp_path)
+
+        assert cached_output == output
+        assert not any(
+            module in cached_modules
+            for modules in app.lazy_commands.values()
+            for module in modules
+        )
+
+    def test_loaded_modules_are_not_imported_again(
+        self, monkeypatch: pytest.MonkeyPatch
+    ):
+        invoke_and_assert(["profile", "--help"], expected_code=0)
+        registered_groups = list(app.registered_groups)
+
+        # e.g. a test harness that resets `sys.modules` between tests
+        monkeypatch.delitem(sys.modules, "prefect.cli.profile", raising=False)
+
+        invoke_and_assert(["profile", "--help"], expected_code=0)
+        assert "prefect.cli.profile" not in sys.modules
+        assert app.registered_groups == registered_groups
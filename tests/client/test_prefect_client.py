@@ -1132,6 +1132,53 @@ async def test_read_flow_runs_with_tags(
         assert len(flow_runs) == 0
 
 
+async def test_iter_flow_runs_pages_through_all_flow_runs(prefect_client):
+    @flow
+    def foo():
+        pass
+
+    flow_run_ids = {(await prefect_client.create_flow_run(foo)).id for _ in range(7)}
+
+    flow_runs = [
+        flow_run async for flow_run in prefect_client.iter_flow_runs(page_size=3)
+    ]
+    assert len(flow_runs) == 7
+    assert {flow_run.id for flow_run in flow_runs} == flow_run_ids
+    assert [flow_run.id for flow_run in flow_runs] == sorted(flow_run_ids, reverse=True)
+
+
+async def test_iter_flow_runs_respects_filters(prefect_client):
+    @flow
+    def foo():
+        pass
+
+    for _ in range(3):
+        await prefect_client.create_flow_run(foo, state=Pending())
+    scheduled_ids = {
+        (await prefect_client.create_flow_run(foo, state=Scheduled())).id
+        for _ in range(5)
+    }
+
+    flow_runs = [
+        flow_run
+        async for flow_run in prefect_client.iter_flow_runs(
+            flow_run_filter=FlowRunFilter(
+                state=dict(type=dict(any_=[StateType.SCHEDULED]))
+            ),
+            page_size=2,
+        )
+    ]
+    assert {flow_run.id for flow_run in flow_runs} == scheduled_ids
+
+
+async def test_iter_flow_runs_rejects_or_filters(prefect_client):
+    with pytest.raises(ValueError, match="or_"):
+        async for _ in prefect_client.iter_flow_runs(
+            flow_run_filter=FlowRunFilter(operator="or_")
+        ):
+            pass
+
+
 async def test_read_flows_without_filter(prefect_client):
     @flow
     def foo():
@@ -1465,6 +1512,91 @@ async def test_read_filtered_logs(session, prefect_client, deployment):
         assert log.flow_run_id not in flow_runs[3:]
 
 
+async def test_iter_logs_pages_through_logs_in_timestamp_order(prefect_client):
+    flow_run_id = uuid4()
+    timestamp = now()
+    logs = [
+        LogCreate(
+            name="prefect.flow_runs",
+            level=20,
+            message=f"Log {i}",
+            # include logs that share a timestamp to exercise the keyset tiebreaker
+            timestamp=timestamp + timedelta(seconds=i // 2),
+            flow_run_id=flow_run_id,
+        )
+        for i in range(9)
+    ]
+    await prefect_client.create_logs(logs)
+
+    read = [
+        log
+        async for log in prefect_client.iter_logs(
+            log_filter=LogFilter(flow_run_id=LogFilterFlowRunId(any_=[flow_run_id])),
+            page_size=2,
+        )
+    ]
+    assert len(read) == 9
+    assert len({log.id for log in read}) == 9
+    assert [log.timestamp for log in read] == sorted(log.timestamp for log in read)
+
+
+async def test_iter_task_runs_pages_through_all_task_runs(prefect_client):
+    @flow
+    def foo():
+        pass
+
+    @task
+    def bar():
+        pass
+
+    flow_run = await prefect_client.create_flow_run(foo)
+    task_run_ids = set()
+    for i in range(5):
+        task_run = await prefect_client.create_task_run(
+            bar, flow_run_id=flow_run.id, dynamic_key=str(i)
+        )
+        task_run_ids.add(task_run.id)
+
+    task_runs = [
+        task_run
+        async for task_run in prefect_client.iter_task_runs(
+            flow_run_filter=FlowRunFilter(id=dict(any_=[flow_run.id])),
+            page_size=2,
+        )
+    ]
+    assert {task_run.id for task_run in task_runs} == task_run_ids
+    assert len(task_runs) == 5
+
+
+async def test_iter_events_follows_page_tokens(session, prefect_client):
+    from prefect.events.filters import EventFilter, EventNameFilter
+    from prefect.server.events.schemas.events import ReceivedEvent
+    from prefect.server.events.storage.database import write_events
+
+    events = [
+        ReceivedEvent(
+            occurred=now("UTC") - timedelta(seconds=i),
+            event="iter.events.test",
+            resource={"prefect.resource.id": f"my.resource.{i}"},
+            received=now("UTC"),
+            id=uuid4(),
+        )
+        for i in range(7)
+    ]
+    await write_events(session, events)
+    await session.commit()
+
+    read = [
+        event
+        async for event in prefect_client.iter_events(
+            filter=EventFilter(event=EventNameFilter(name=["iter.events.test"])),
+            page_size=3,
+        )
+    ]
+    assert {event.id for event in read} == {event.id for event in events}
+    assert len(read) == 7
+
+
 async def test_prefect_api_tls_insecure_skip_verify_setting_set_to_true(monkeypatch):
     with temporary_settings(updates={PREFECT_API_TLS_INSECURE_SKIP_VERIFY: True}):
         mock = Mock()
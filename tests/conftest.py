@@ -549,6 +549,9 @@ def start_of_test() -> datetime.datetime:
     return now("UTC")
 
 
+NON_RELOADABLE_MODULES = ("numpy", "pandas", "pyarrow")
+
+
 @pytest.fixture(autouse=True)
 def reset_sys_modules():
     import importlib
@@ -563,9 +566,12 @@ def reset_sys_modules():
     yield
 
     # Delete all of the module objects that were introduced so they are not
-    # cached.
+    # cached. Extension modules that cannot be imported a second time are kept.
     for module in set(sys.modules.keys()):
-        if module not in original_modules:
+        if module not in original_modules and not any(
+            module == name or module.startswith(f"{name}.")
+            for name in NON_RELOADABLE_MODULES
+        ):
             del sys.modules[module]
 
     importlib.invalidate_caches()
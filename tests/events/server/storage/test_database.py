@@ -125,6 +125,61 @@ class TestWriteEvents:
             )
             assert len(list(results)) == len(event.related) + 1
 
+    async def test_write_events_ignores_batches_of_only_duplicates(
+        self,
+        session: AsyncSession,
+        db: PrefectDBInterface,
+        event: ReceivedEvent,
+    ):
+        for _ in range(2):
+            async with session as session:
+                await write_events(session=session, events=[event, event])
+                await session.commit()
+
+        async with session as session:
+            results = await session.execute(
+                sa.select(db.Event).where(db.Event.id == event.id)
+            )
+            assert len(list(results)) == 1
+
+            results = await session.execute(
+                sa.select(db.EventResource).where(db.EventResource.event_id == event.id)
+            )
+            assert len(list(results)) == len(event.related) + 1
+
+    async def test_write_events_ignores_duplicates_without_insert_returning(
+        self,
+        session: AsyncSession,
+        db: PrefectDBInterface,
+        event: ReceivedEvent,
+        other_events: List[ReceivedEvent],
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        # SQLite versions before 3.35 do not support RETURNING
+        monkeypatch.setattr(session.get_bind().dialect, "insert_returning", False)
+
+        async with session as session:
+            await write_events(session=session, events=[event])
+            await session.commit()
+
+        async with session as session:
+            await write_events(session=session, events=[event, other_events[0], event])
+            await session.commit()
+
+        async with session as session:
+            for written in (event, other_events[0]):
+                results = await session.execute(
+                    sa.select(db.Event).where(db.Event.id == written.id)
+                )
+                assert len(list(results)) == 1
+
+                results = await session.execute(
+                    sa.select(db.EventResource).where(
+                        db.EventResource.event_id == written.id
+                    )
+                )
+                assert len(list(results)) == len(written.related) + 1
+
     async def test_write_events_writes_in_chunks(
         self,
         session: AsyncSession,
@@ -22,7 +22,11 @@ from prefect.server.events.services import event_persister
 from prefect.server.events.services.event_persister import batch_delete
 from prefect.server.events.storage.database import query_events, write_events
 from prefect.server.utilities.messaging import CapturedMessage, Message, MessageHandler
-from prefect.settings import PREFECT_EVENTS_RETENTION_PERIOD, temporary_settings
+from prefect.settings import (
+    PREFECT_EVENTS_RETENTION_PERIOD,
+    PREFECT_SERVER_EVENTS_MINUTE_ROLLUP_RETENTION_PERIOD,
+    temporary_settings,
+)
 from prefect.types import DateTime
 from prefect.types._datetime import now
 
@@ -402,6 +406,28 @@ async def test_trims_messages_periodically(
     assert all(resource.occurred >= cutoff_date for resource in remaining_resources)
 
 
+async def test_trims_minute_rollups_after_their_retention_period(
+    event: ReceivedEvent, session: AsyncSession, db: PrefectDBInterface
+):
+    await write_events(
+        session,
+        [event.model_copy(update={"occurred": now("UTC") - timedelta(hours=2)})],
+    )
+    await session.commit()
+
+    with temporary_settings(
+        {PREFECT_SERVER_EVENTS_MINUTE_ROLLUP_RETENTION_PERIOD: timedelta(hours=1)}
+    ):
+        async with event_persister.create_handler(
+            flush_every=timedelta(seconds=0.001),
+            trim_every=timedelta(seconds=0.001),
+        ):
+            await asyncio.sleep(0.1)
+
+    result = await session.execute(sa.select(db.EventRollup.time_unit))
+    assert list(result.scalars()) == ["hour"]
+
+
 async def test_batch_delete(
     event: ReceivedEvent, session: AsyncSession, db: PrefectDBInterface
 ):
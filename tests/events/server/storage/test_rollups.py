@@ -0,0 +1,240 @@
+import datetime
+from datetime import timedelta
+from typing import Optional
+from unittest import mock
+from uuid import uuid4
+
+import pytest
+import sqlalchemy as sa
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from prefect.server.database import PrefectDBInterface
+from prefect.server.events.counting import Countable, TimeUnit
+from prefect.server.events.filters import (
+    EventFilter,
+    EventNameFilter,
+    EventOccurredFilter,
+    EventRelatedFilter,
+    EventResourceFilter,
+)
+from prefect.server.events.schemas.events import ReceivedEvent
+from prefect.server.events.storage import rollups
+from prefect.server.events.storage.database import count_events, write_events
+from prefect.settings import (
+    PREFECT_SERVER_EVENTS_MINUTE_ROLLUP_RETENTION_PERIOD,
+    temporary_settings,
+)
+from prefect.types._datetime import now
+
+
+@pytest.fixture
+def start() -> datetime.datetime:
+    return (now("UTC") - timedelta(days=2)).replace(
+        hour=0, minute=0, second=0, microsecond=0
+    )
+
+
+@pytest.fixture
+def events(start: datetime.datetime) -> list[ReceivedEvent]:
+    # one event every 7 minutes for a day, across a few names and resources
+    return [
+        ReceivedEvent(
+            occurred=start + timedelta(minutes=7 * i, seconds=i % 60),
+            event=["things.happened", "things.didn't", "other.stuff"][i % 3],
+            resource={"prefect.resource.id": f"foo.{i % 4}"},
+            payload={},
+            id=uuid4(),
+        )
+        for i in range(24 * 60 // 7)
+    ]
+
+
+@pytest.fixture
+async def stored_events(
+    session: AsyncSession, events: list[ReceivedEvent]
+) -> list[ReceivedEvent]:
+    await write_events(session, events)
+    await session.commit()
+    return events
+
+
+async def rollup_totals(
+    session: AsyncSession, db: PrefectDBInterface
+) -> dict[str, int]:
+    result = await session.execute(
+        sa.select(db.EventRollup.time_unit, sa.func.sum(db.EventRollup.count)).group_by(
+            db.EventRollup.time_unit
+        )
+    )
+    return {time_unit: total for time_unit, total in result}
+
+
+async def test_writing_events_rolls_them_up_by_minute_and_hour(
+    session: AsyncSession,
+    db: PrefectDBInterface,
+    stored_events: list[ReceivedEvent],
+):
+    assert await rollup_totals(session, db) == {
+        "minute": len(stored_events),
+        "hour": len(stored_events),
+    }
+
+    first = stored_events[0]
+    result = await session.execute(
+        sa.select(db.EventRollup).where(
+            db.EventRollup.time_unit == "hour",
+            db.EventRollup.bucket == first.occurred.replace(minute=0, second=0),
+            db.EventRollup.event == first.event,
+            db.EventRollup.resource_id == first.resource.id,
+        )
+    )
+    rollup = result.scalar_one()
+    assert rollup.count == 1
+    assert rollup.oldest == first.occurred
+    assert rollup.latest == first.occurred
+
+
+async def test_rollups_accumulate_across_writes(
+    session: AsyncSession,
+    db: PrefectDBInterface,
+    start: datetime.datetime,
+):
+    def event_at(minutes: int) -> ReceivedEvent:
+        return ReceivedEvent(
+            occurred=start + timedelta(minutes=minutes),
+            event="things.happened",
+            resource={"prefect.resource.id": "foo.1"},
+            payload={},
+            id=uuid4(),
+        )
+
+    later, earlier = event_at(30), event_at(10)
+    await write_events(session, [later])
+    await write_events(session, [earlier])
+    await session.commit()
+
+    result = await session.execute(
+        sa.select(db.EventRollup).where(db.EventRollup.time_unit == "hour")
+    )
+    rollup = result.scalar_one()
+    assert rollup.count == 2
+    assert rollup.oldest == earlier.occurred
+    assert rollup.latest == later.occurred
+
+
+async def test_duplicate_events_are_not_rolled_up_twice(
+    session: AsyncSession,
+    db: PrefectDBInterface,
+    stored_events: list[ReceivedEvent],
+):
+    await write_events(session, stored_events[:10])
+    await session.commit()
+
+    assert await rollup_totals(session, db) == {
+        "minute": len(stored_events),
+        "hour": len(stored_events),
+    }
+
+
+@pytest.mark.parametrize(
+    "countable, time_unit, time_interval, expected",
+    [
+        (Countable.time, TimeUnit.day, 1, TimeUnit.hour),
+        (Countable.time, TimeUnit.hour, 2, TimeUnit.hour),
+        (Countable.time, TimeUnit.minute, 30, TimeUnit.minute),
+        (Countable.time, TimeUnit.minute, 1.5, None),
+        (Countable.time, TimeUnit.second, 30, None),
+        (Countable.day, TimeUnit.minute, 1.5, TimeUnit.hour),
+        (Countable.event, TimeUnit.second, 1, TimeUnit.hour),
+        (Countable.resource, TimeUnit.day, 1, None),
+    ],
+)
+def test_choosing_a_rollup(
+    countable: Countable,
+    time_unit: TimeUnit,
+    time_interval: float,
+    expected: Optional[TimeUnit],
+):
+    assert (
+        rollups.rollup_time_unit(EventFilter(), countable, time_unit, time_interval)
+        == expected
+    )
+
+
+@pytest.mark.parametrize(
+    "filter",
+    [
+        EventFilter(related=EventRelatedFilter(id=["foo.1"])),
+        EventFilter(resource=EventResourceFilter(labels={"hello": "world"})),
+    ],
+)
+def test_filters_on_other_criteria_are_not_answered_by_rollups(filter: EventFilter):
+    assert rollups.rollup_time_unit(filter, Countable.time, TimeUnit.day, 1) is None
+
+
+@pytest.mark.parametrize(
+    "countable, time_unit, time_interval",
+    [
+        (Countable.day, TimeUnit.day, 1),
+        (Countable.time, TimeUnit.hour, 1),
+        (Countable.time, TimeUnit.hour, 3),
+        (Countable.time, TimeUnit.minute, 20),
+        (Countable.event, TimeUnit.day, 1),
+    ],
+)
+@pytest.mark.parametrize(
+    "criteria",
+    [
+        {},
+        {"event": EventNameFilter(prefix=["things."])},
+        {"resource": EventResourceFilter(id=["foo.1", "foo.2"])},
+        {"resource": EventResourceFilter(id_prefix=["foo.3"])},
+    ],
+)
+# the events are from two days ago, so with a one day retention they are counted
+# without minute rollups
+@pytest.mark.parametrize(
+    "minute_rollup_retention", [timedelta(days=1), timedelta(days=7)]
+)
+async def test_counts_from_rollups_match_counts_from_events(
+    session: AsyncSession,
+    stored_events: list[ReceivedEvent],
+    start: datetime.datetime,
+    countable: Countable,
+    time_unit: TimeUnit,
+    time_interval: float,
+    criteria: dict[str, object],
+    minute_rollup_retention: timedelta,
+):
+    # a range that starts and ends part way through an hour, so that the edges are
+    # counted from the events table
+    filter = EventFilter(
+        occurred=EventOccurredFilter(
+            since=start + timedelta(hours=1, minutes=23, seconds=7),
+            until=start + timedelta(hours=20, minutes=51, seconds=13),
+        ),
+        **criteria,
+    )
+
+    with (
+        temporary_settings(
+            {
+                PREFECT_SERVER_EVENTS_MINUTE_ROLLUP_RETENTION_PERIOD: minute_rollup_retention
+            }
+        ),
+        mock.patch.object(
+            rollups, "count_events", wraps=rollups.count_events
+        ) as from_rollups,
+    ):
+        counts = await count_events(
+            session, filter, countable, time_unit, time_interval
+        )
+    from_rollups.assert_called_once()
+
+    with mock.patch.object(rollups, "rollup_time_unit", return_value=None):
+        expected = await count_events(
+            session, filter, countable, time_unit, time_interval
+        )
+
+    assert counts == expected
+    assert sum(count.count for count in counts) > 0
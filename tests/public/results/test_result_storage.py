@@ -54,6 +54,8 @@ async def test_async_method_used_in_async_context(
         stored_result_record = await store.aread("testing")
 
         assert stored_result_record.result == result == "this is a test"
-        # Verify awrite_path was called
-        mock_awrite.assert_awaited_once()
-        assert mock_awrite.await_args[0][0] == "testing"  # Check path argument
+        # Verify awrite_path was called for the result and its metadata sidecar
+        assert [call.args[0] for call in mock_awrite.await_args_list] == [
+            "testing",
+            "testing.metadata",
+        ]
@@ -385,7 +385,9 @@ async def test_root_flow_default_remote_storage_saves_correct_result(tmp_path):
     assert result == {"foo": "bar"}
     local_storage = await LocalFileSystem.load("my-result-storage")
     result_bytes = await local_storage.read_path(f"{tmp_path / 'my-result.pkl'}")
-    saved_python_result = ResultRecord.deserialize(result_bytes).result
+    saved_python_result = ResultRecord.deserialize(
+        result_bytes, backup_serializer=PickleSerializer()
+    ).result
 
     assert saved_python_result == {"foo": "bar"}
 
@@ -444,6 +446,7 @@ def test_flow_version_result_storage_key():
 
     assert isinstance(storage_block, LocalFileSystem)
     result = ResultRecord.deserialize(
-        storage_block.read_path("somespecialflowversion")
+        storage_block.read_path("somespecialflowversion"),
+        backup_serializer=PickleSerializer(),
     ).result
     assert result == "hello"
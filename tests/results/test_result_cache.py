@@ -0,0 +1,191 @@
+import os
+import time
+
+import pytest
+
+from prefect._result_cache import (
+    LocalResultCache,
+    get_local_result_cache,
+    result_checksum,
+)
+from prefect.filesystems import LocalFileSystem, RemoteFileSystem
+from prefect.results import ResultStore
+from prefect.serializers import JSONSerializer
+from prefect.settings import (
+    PREFECT_RESULTS_LOCAL_CACHE_ENABLED,
+    PREFECT_RESULTS_LOCAL_CACHE_PATH,
+    PREFECT_RESULTS_MEMORY_CACHE_MAX_SIZE,
+    temporary_settings,
+)
+
+
+class TestLocalResultCache:
+    def test_put_and_get(self, tmp_path):
+        cache = LocalResultCache(tmp_path, max_size=1024)
+
+        checksum = cache.put(b"hello")
+
+        assert checksum == result_checksum(b"hello")
+        assert cache.get(checksum) == b"hello"
+
+    def test_get_missing_entry(self, tmp_path):
+        cache = LocalResultCache(tmp_path, max_size=1024)
+
+        assert cache.get(result_checksum(b"hello")) is None
+
+    def test_corrupted_entries_are_dropped(self, tmp_path):
+        cache = LocalResultCache(tmp_path, max_size=1024)
+        checksum = cache.put(b"hello")
+        (tmp_path / checksum).write_bytes(b"goodbye")
+
+        assert cache.get(checksum) is None
+        assert not (tmp_path / checksum).exists()
+
+    def test_content_larger_than_the_cache_is_not_stored(self, tmp_path):
+        cache = LocalResultCache(tmp_path, max_size=4)
+
+        assert cache.put(b"hello") is None
+        assert cache.get(result_checksum(b"hello")) is None
+
+    def test_least_recently_used_entries_are_evicted(self, tmp_path):
+        cache = LocalResultCache(tmp_path, max_size=10)
+        first = cache.put(b"aaaa")
+        second = cache.put(b"bbbb")
+
+        # make the first entry older, then use it so the second is evicted
+        past = time.time() - 100
+        os.utime(tmp_path / first, (past, past))
+        os.utime(tmp_path / second, (past + 1, past + 1))
+        assert cache.get(first) == b"aaaa"
+
+        third = cache.put(b"cccc")
+
+        assert cache.get(first) == b"aaaa"
+        assert cache.get(second) is None
+        assert cache.get(third) == b"cccc"
+
+    def test_cache_directory_is_only_scanned_once_it_is_full(
+        self, tmp_path, monkeypatch: pytest.MonkeyPatch
+    ):
+        cache = LocalResultCache(tmp_path, max_size=10)
+        scans = 0
+        scandir = os.scandir
+
+        def counting_scandir(path):
+            nonlocal scans
+            scans += 1
+            return scandir(path)
+
+        monkeypatch.setattr(os, "scandir", counting_scandir)
+
+        for content in (b"aa", b"bb", b"cc", b"dd", b"ee"):
+            cache.put(content)
+        assert scans == 1
+
+        cache.put(b"ff")
+        assert scans == 2
+        assert sum(entry.stat().st_size for entry in tmp_path.iterdir()) <= 9
+
+    def test_disabled_by_default(self):
+        assert get_local_result_cache() is None
+
+
+class TestTieredResultStore:
+    @pytest.fixture
+    def local_cache_path(self, tmp_path):
+        path = tmp_path / "result-cache"
+        with temporary_settings(
+            {
+                PREFECT_RESULTS_LOCAL_CACHE_ENABLED: True,
+                PREFECT_RESULTS_LOCAL_CACHE_PATH: path,
+            }
+        ):
+            yield path
+
+    @pytest.fixture
+    def remote_storage(self, tmp_path):
+        return RemoteFileSystem(basepath=f"memory://{tmp_path.name}")
+
+    def test_memory_cache_size_is_configurable(self):
+        with temporary_settings({PREFECT_RESULTS_MEMORY_CACHE_MAX_SIZE: 2}):
+            store = ResultStore()
+        assert store.cache.maxsize == 2
+
+    async def test_memory_cache_is_bounded_by_result_size(self, tmp_path):
+        with temporary_settings({PREFECT_RESULTS_MEMORY_CACHE_MAX_SIZE: 2500}):
+            store = ResultStore(
+                result_storage=LocalFileSystem(basepath=str(tmp_path)),
+                serializer=JSONSerializer(),
+            )
+
+        for key in ("first", "second", "third"):
+            record = store.create_result_record("x" * 1000, key=key)
+            await store.apersist_result_record(record)
+            assert record.metadata.size == 1002
+
+        assert [os.path.basename(key) for key in store.cache.keys()] == [
+            "second",
+            "third",
+        ]
+        assert store.cache.currsize == 2004
+
+    async def test_results_larger_than_the_memory_cache_are_not_cached(self, tmp_path):
+        with temporary_settings({PREFECT_RESULTS_MEMORY_CACHE_MAX_SIZE: 100}):
+            store = ResultStore(
+                result_storage=LocalFileSystem(basepath=str(tmp_path)),
+                serializer=JSONSerializer(),
+            )
+        record = store.create_result_record("x" * 1000, key="the-key")
+        await store.apersist_result_record(record)
+
+        assert len(store.cache) == 0
+        assert (await store.aread("the-key")).result == "x" * 1000
+
+    async def test_reads_from_remote_storage_are_cached_locally(
+        self, local_cache_path, remote_storage, monkeypatch: pytest.MonkeyPatch
+    ):
+        writer = ResultStore(result_storage=remote_storage)
+        record = writer.create_result_record("hello", key="the-key")
+        await writer.apersist_result_record(record)
+        assert record.metadata.checksum is not None
+
+        # simulate a cold cache on another process
+        for entry in local_cache_path.iterdir():
+            entry.unlink()
+
+        reader = ResultStore(
+            result_storage=remote_storage, cache_result_in_memory=False
+        )
+        assert (await reader.aread("the-key")).result == "hello"
+        assert (local_cache_path / record.metadata.checksum).exists()
+
+        # later reads only fetch the metadata from remote storage
+        read_paths = []
+        read_path = RemoteFileSystem.read_path
+
+        async def tracking_read_path(self, path):
+            read_paths.append(path)
+            return await read_path(self, path)
+
+        monkeypatch.setattr(RemoteFileSystem, "read_path", tracking_read_path)
+
+        assert (await reader.aread("the-key")).result == "hello"
+        assert read_paths == ["the-key.metadata"]
+
+    async def test_writes_to_remote_storage_are_cached_locally(
+        self, local_cache_path, remote_storage
+    ):
+        store = ResultStore(result_storage=remote_storage)
+        record = store.create_result_record("hello", key="the-key")
+        await store.apersist_result_record(record)
+
+        assert (local_cache_path / record.metadata.checksum).exists()
+
+    async def test_local_storage_is_not_cached(self, local_cache_path, tmp_path):
+        store = ResultStore(
+            result_storage=LocalFileSystem(basepath=str(tmp_path / "results"))
+        )
+        record = store.create_result_record("hello", key="the-key")
+        await store.apersist_result_record(record)
+
+        assert not local_cache_path.exists()
@@ -2,9 +2,9 @@ import pytest
 from pydantic import ValidationError
 
 from prefect._result_records import ResultRecord, ResultRecordMetadata
-from prefect.filesystems import NullFileSystem
+from prefect.filesystems import LocalFileSystem, NullFileSystem
 from prefect.results import ResultStore
-from prefect.serializers import JSONSerializer
+from prefect.serializers import ArrowSerializer, JSONSerializer, is_arrow_payload
 from prefect.settings import PREFECT_LOCAL_STORAGE_PATH
 
 
@@ -46,7 +46,9 @@ class TestResultRecord:
         store = ResultStore(
             metadata_storage=NullFileSystem(), serializer=JSONSerializer()
         )
-        result_record = store.create_result_record("The results are in...", "the-key")
+        result_record = store.create_result_record(
+            "The results are in...", "the-raw-key"
+        )
         await store.apersist_result_record(result_record)
 
         loaded = await ResultStore._from_metadata(result_record.metadata)
@@ -55,7 +57,130 @@ class TestResultRecord:
         # assert that the raw result was persisted without metadata
         assert (
             JSONSerializer().loads(
-                (PREFECT_LOCAL_STORAGE_PATH.value() / "the-key").read_bytes()
+                (PREFECT_LOCAL_STORAGE_PATH.value() / "the-raw-key").read_bytes()
             )
             == "The results are in..."
         )
+
+
+class TestSplitResultLayout:
+    @pytest.fixture
+    def store(self, tmp_path):
+        return ResultStore(
+            result_storage=LocalFileSystem(basepath=str(tmp_path)),
+            serializer=JSONSerializer(),
+            cache_result_in_memory=False,
+        )
+
+    async def test_persist_writes_metadata_sidecar(self, store, tmp_path):
+        record = store.create_result_record("The results are in...", "the-key")
+        await store.apersist_result_record(record)
+
+        assert (
+            JSONSerializer().loads((tmp_path / "the-key").read_bytes())
+            == "The results are in..."
+        )
+        metadata = ResultRecordMetadata.load_bytes(
+            (tmp_path / "the-key.metadata").read_bytes()
+        )
+        assert metadata.storage_key == str(tmp_path / "the-key")
+
+    async def test_exists_only_reads_metadata(self, store, tmp_path):
+        record = store.create_result_record("The results are in...", "the-key")
+        await store.apersist_result_record(record)
+
+        # corrupt the payload; exists should not need to read it
+        (tmp_path / "the-key").write_bytes(b"not json")
+        assert await store.aexists("the-key")
+
+    async def test_read_loads_payload_lazily(self, store, tmp_path):
+        record = store.create_result_record("The results are in...", "the-key")
+        await store.apersist_result_record(record)
+
+        loaded = await store.aread("the-key")
+        assert not loaded.is_loaded
+        assert loaded.metadata.storage_key == str(tmp_path / "the-key")
+
+        assert await loaded.aload_result() == "The results are in..."
+        assert loaded.is_loaded
+
+    def test_result_attribute_loads_payload(self, store):
+        record = store.create_result_record("The results are in...", "the-key")
+        store.persist_result_record(record)
+
+        loaded = store.read("the-key")
+        assert not loaded.is_loaded
+        assert loaded.result == "The results are in..."
+
+    async def test_reads_legacy_combined_records(self, store, tmp_path):
+        record = store.create_result_record("The results are in...", "the-key")
+        (tmp_path / "the-key").write_bytes(record.serialize())
+
+        assert await store.aexists("the-key")
+        loaded = await store.aread("the-key")
+        assert loaded.result == "The results are in..."
+
+    async def test_read_raises_errors_reading_the_metadata_sidecar(
+        self, store, tmp_path, monkeypatch
+    ):
+        record = store.create_result_record("The results are in...", "the-key")
+        await store.apersist_result_record(record)
+
+        async def aread_path(path: str) -> bytes:
+            raise PermissionError(path)
+
+        monkeypatch.setattr(store.result_storage, "aread_path", aread_path)
+
+        with pytest.raises(PermissionError):
+            await store.aread("the-key")
+
+
+class TestArrowResultRecord:
+    @pytest.fixture(autouse=True)
+    def pyarrow(self):
+        return pytest.importorskip("pyarrow")
+
+    def test_serialize_stores_metadata_alongside_data(self, pyarrow):
+        table = pyarrow.table({"x": [1, 2, 3]})
+        record = ResultRecord(
+            result=table,
+            metadata=ResultRecordMetadata(
+                storage_key="my-storage-key", serializer=ArrowSerializer()
+            ),
+        )
+
+        serialized = record.serialize()
+        assert is_arrow_payload(serialized)
+
+        deserialized = ResultRecord.deserialize(serialized)
+        assert deserialized.metadata.storage_key == "my-storage-key"
+        assert isinstance(deserialized.serializer, ArrowSerializer)
+        assert deserialized.result.equals(table)
+
+    async def test_local_results_are_memory_mapped(self, pyarrow, tmp_path):
+        table = pyarrow.table({"x": list(range(1000))})
+        store = ResultStore(
+            result_storage=LocalFileSystem(basepath=str(tmp_path)),
+            serializer=ArrowSerializer(),
+            cache_result_in_memory=False,
+        )
+        await store.awrite(table, key="the-key")
+
+        record = await store.aread("the-key")
+        assert record.result.equals(table)
+        assert isinstance(record.serializer, ArrowSerializer)
+
+    async def test_local_results_are_memory_mapped_with_metadata_storage(
+        self, pyarrow, tmp_path
+    ):
+        table = pyarrow.table({"x": list(range(1000))})
+        store = ResultStore(
+            result_storage=LocalFileSystem(basepath=str(tmp_path / "results")),
+            metadata_storage=LocalFileSystem(basepath=str(tmp_path / "metadata")),
+            serializer=ArrowSerializer(),
+            cache_result_in_memory=False,
+        )
+        await store.awrite(table, key="the-key")
+
+        record = await store.aread("the-key")
+        assert record.result.equals(table)
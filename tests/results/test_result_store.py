@@ -862,8 +862,8 @@ async def test_result_store_exists_with_no_metadata_storage(tmp_path):
     assert await result_store.aexists(key=key)
     assert result_store.exists(key=key)
 
-    # Remove the result file and check that the result is not found
-    (tmp_path / "results" / key).unlink()
+    # Remove the metadata sidecar and check that the result is not found
+    (tmp_path / "results" / f"{key}.metadata").unlink()
     assert not await result_store.aexists(key=key)
     assert not result_store.exists(key=key)
 
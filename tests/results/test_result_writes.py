@@ -0,0 +1,249 @@
+import asyncio
+import concurrent.futures
+import threading
+import time
+import uuid
+
+import pytest
+
+import prefect._result_writes
+from prefect import flow, task
+from prefect._result_writes import PendingResultWrite, ResultWritePipeline
+from prefect.filesystems import LocalFileSystem
+from prefect.flow_engine import (
+    _acrash_task_runs_for_failed_writes,
+    _crash_task_runs_for_failed_writes,
+)
+from prefect.results import ResultStore
+from prefect.settings import PREFECT_RESULTS_WRITE_BEHIND, temporary_settings
+from prefect.states import Completed, StateType
+
+
+@pytest.fixture
+def pipeline(monkeypatch: pytest.MonkeyPatch):
+    pipeline = ResultWritePipeline(max_pending=2, max_concurrency=2)
+    monkeypatch.setattr(prefect._result_writes, "_pipeline", pipeline)
+    yield pipeline
+    pipeline.shutdown()
+
+
+@pytest.fixture
+def write_behind(pipeline: ResultWritePipeline):
+    with temporary_settings({PREFECT_RESULTS_WRITE_BEHIND: True}):
+        yield pipeline
+
+
+@pytest.fixture
+async def store(tmp_path):
+    block = LocalFileSystem(basepath=str(tmp_path))
+    await block._save(is_anonymous=True)
+    return ResultStore(result_storage=block)
+
+
+class GatedStore:
+    def __init__(self):
+        self.gate = threading.Event()
+        self.written = []
+
+    def generate_default_holder(self) -> str:
+        return "holder"
+
+    def persist_result_record(self, result_record, holder):
+        self.gate.wait(5)
+        self.written.append(result_record)
+
+
+class TestResultWritePipeline:
+    def test_submit_blocks_while_pipeline_is_full(self, pipeline, store):
+        gated = GatedStore()
+        pipeline.submit(gated, store.create_result_record(1, key="a"))
+        pipeline.submit(gated, store.create_result_record(2, key="b"))
+
+        submitted = threading.Event()
+
+        def submit_third():
+            pipeline.submit(gated, store.create_result_record(3, key="c"))
+            submitted.set()
+
+        thread = threading.Thread(target=submit_third)
+        thread.start()
+        assert not submitted.wait(0.2)
+
+        gated.gate.set()
+        thread.join(5)
+        assert submitted.is_set()
+        assert pipeline.wait_for_writes() == []
+        assert len(gated.written) == 3
+
+    async def test_cancelled_asubmit_releases_its_slot(self, pipeline, store):
+        gated = GatedStore()
+        pipeline.submit(gated, store.create_result_record(1, key="a"))
+        pipeline.submit(gated, store.create_result_record(2, key="b"))
+
+        submitting = asyncio.create_task(
+            pipeline.asubmit(gated, store.create_result_record(3, key="c"))
+        )
+        await asyncio.sleep(0.1)
+        submitting.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await submitting
+
+        gated.gate.set()
+        assert await pipeline.await_for_writes() == []
+
+        # both slots are free again, even while new writes are still in progress
+        blocked = GatedStore()
+        pipeline.submit(blocked, store.create_result_record(4, key="d"))
+        await asyncio.wait_for(
+            pipeline.asubmit(blocked, store.create_result_record(5, key="e")), 2
+        )
+        blocked.gate.set()
+        assert await pipeline.await_for_writes() == []
+        assert len(blocked.written) == 2
+
+    async def test_reads_wait_for_pending_writes(
+        self, pipeline, store, monkeypatch: pytest.MonkeyPatch
+    ):
+        write_path = LocalFileSystem.write_path
+
+        def slow_write_path(self, path, content):
+            time.sleep(0.2)
+            return write_path(self, path, content, _sync=True)
+
+        monkeypatch.setattr(LocalFileSystem, "write_path", slow_write_path)
+
+        pipeline.submit(store, store.create_result_record("hello", key="the-key"))
+
+        assert await store.aexists("the-key")
+        assert (await store.aread("the-key")).result == "hello"
+
+    def test_wait_returns_failed_writes(
+        self, pipeline, store, monkeypatch: pytest.MonkeyPatch
+    ):
+        def fail(*args, **kwargs):
+            raise OSError("storage is unavailable")
+
+        monkeypatch.setattr(ResultStore, "persist_result_record", fail)
+
+        write = pipeline.submit(store, store.create_result_record(1, key="a"))
+
+        assert pipeline.wait_for_writes() == [write]
+        assert isinstance(write.exception(), OSError)
+
+
+class TestWriteBehind:
+    def test_task_results_are_persisted(self, write_behind, store, tmp_path):
+        @task(result_storage=store.result_storage, result_storage_key="the-result")
+        def my_task():
+            return 42
+
+        @flow
+        def my_flow():
+            return my_task(return_state=True)
+
+        state = my_flow()
+
+        assert state.is_completed()
+        assert write_behind.get_pending_write(str(tmp_path / "the-result")) is None
+        assert store.read("the-result").result == 42
+
+    async def test_async_task_results_are_persisted(self, write_behind, store):
+        @task(result_storage=store.result_storage, result_storage_key="the-result")
+        async def my_task():
+            return 42
+
+        @flow
+        async def my_flow():
+            return await my_task()
+
+        assert await my_flow() == 42
+        assert (await store.aread("the-result")).result == 42
+
+    async def test_failed_writes_crash_the_task_and_fail_the_flow(
+        self,
+        write_behind,
+        store,
+        prefect_client,
+        events_pipeline,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        def fail(*args, **kwargs):
+            raise OSError("storage is unavailable")
+
+        monkeypatch.setattr(ResultStore, "persist_result_record", fail)
+
+        @task(result_storage=store.result_storage, result_storage_key="the-result")
+        def my_task():
+            return 42
+
+        @flow
+        def my_flow():
+            return my_task(return_state=True)
+
+        flow_state = my_flow(return_state=True)
+        assert flow_state.is_failed()
+        with pytest.raises(OSError, match="storage is unavailable"):
+            await flow_state.result()
+
+        task_state = await flow_state.result(raise_on_failure=False)
+        assert isinstance(task_state, OSError)
+
+        await events_pipeline.process_events()
+        task_runs = await prefect_client.read_task_runs()
+        assert len(task_runs) == 1
+        assert task_runs[0].state.type == StateType.CRASHED
+        assert "storage is unavailable" in task_runs[0].state.message
+
+
+class TestCrashTaskRunsForFailedWrites:
+    @pytest.fixture
+    async def task_run(self, prefect_client):
+        @task
+        def my_task():
+            return 42
+
+        return await prefect_client.create_task_run(
+            task=my_task, flow_run_id=None, dynamic_key="0", state=Completed()
+        )
+
+    def failed_write(self, task_run) -> PendingResultWrite:
+        future = concurrent.futures.Future()
+        future.set_exception(OSError("storage is unavailable"))
+        return PendingResultWrite(
+            storage_key="the-result", future=future, task_run=task_run
+        )
+
+    async def test_task_runs_are_crashed(self, task_run, sync_prefect_client):
+        _crash_task_runs_for_failed_writes(
+            sync_prefect_client, [self.failed_write(task_run)]
+        )
+
+        state = sync_prefect_client.read_task_run(task_run.id).state
+        assert state.type == StateType.CRASHED
+        assert "storage is unavailable" in state.message
+
+    async def test_async_task_runs_are_crashed(self, task_run, prefect_client):
+        await _acrash_task_runs_for_failed_writes(
+            prefect_client, [self.failed_write(task_run)]
+        )
+
+        state = (await prefect_client.read_task_run(task_run.id)).state
+        assert state.type == StateType.CRASHED
+        assert "storage is unavailable" in state.message
+
+    async def test_unrecorded_task_runs_are_crashed_by_their_event(
+        self, task_run, prefect_client, asserting_events_worker
+    ):
+        unrecorded = task_run.model_copy(update={"id": uuid.uuid4()})
+
+        await _acrash_task_runs_for_failed_writes(
+            prefect_client, [self.failed_write(unrecorded)]
+        )
+
+        await asserting_events_worker.drain()
+        (event,) = [
+            event
+            for event in asserting_events_worker._client.events
+            if event.resource.id == f"prefect.task-run.{unrecorded.id}"
+        ]
+        assert event.event == "prefect.task-run.Crashed"
@@ -103,7 +103,8 @@ async def test_graceful_retries_reraise_last_error_while_retrieving_missing_resu
     shorter_result_retries: None,
     completed_state: State[str],
 ):
-    # if it strikes out 3 times, we should re-raise
+    # if it strikes out 3 times, we should re-raise; errors reading the metadata
+    # sidecar are raised, and a missing sidecar falls back to the result itself
     now = time.monotonic()
     with pytest.raises(FileNotFoundError):
         with mock.patch(
@@ -113,13 +114,14 @@ async def test_graceful_retries_reraise_last_error_while_retrieving_missing_resu
                     OSError,
                     TimeoutError,
                     FileNotFoundError,
+                    FileNotFoundError,
                 ]
             ),
         ) as m:
             await completed_state.result()
 
     # the loop should have failed three times, sleeping 0.01s per error
-    assert m.call_count == prefect.states.RESULT_READ_MAXIMUM_ATTEMPTS
+    assert m.call_count == prefect.states.RESULT_READ_MAXIMUM_ATTEMPTS + 1
     expected_sleep = (
         prefect.states.RESULT_READ_MAXIMUM_ATTEMPTS - 1
     ) * prefect.states.RESULT_READ_RETRY_DELAY
@@ -150,16 +152,19 @@ async def test_graceful_retries_eventually_succeed_while(
         "prefect.filesystems.LocalFileSystem.aread_path",
         new=mock.AsyncMock(
             side_effect=[
+                FileNotFoundError,
                 FileNotFoundError,
                 TimeoutError,
-                expected_record.serialize(),
+                expected_record.serialize_metadata(),
+                expected_record.serialize_result(),
             ]
         ),
     ) as m:
         assert await completed_state.result() == "test-graceful-retry"
 
-    # the loop should have failed twice, then succeeded, sleeping 0.01s per failure
-    assert m.call_count == prefect.states.RESULT_READ_MAXIMUM_ATTEMPTS
+    # the loop should have failed twice, then succeeded by reading the metadata
+    # sidecar and the result, sleeping 0.01s per failure
+    assert m.call_count == 5
     expected_sleep = 2 * prefect.states.RESULT_READ_RETRY_DELAY
     elapsed = time.monotonic() - now
     assert elapsed >= expected_sleep
@@ -3,6 +3,7 @@ Tests for the server-side orchestration API client, used by server-side services
 interact with the Prefect API.
 """
 
+from base64 import b64encode
 from typing import TYPE_CHECKING, AsyncGenerator, List
 from unittest import mock
 from uuid import uuid4
@@ -11,17 +12,25 @@ import httpx
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from prefect.server.api.clients import OrchestrationClient
+from prefect.server.api.clients import (
+    InProcessOrchestrationClient,
+    OrchestrationClient,
+)
 from prefect.server.api.server import create_app
 from prefect.server.models import deployments, flow_runs, flows
 from prefect.server.models.variables import create_variable
-from prefect.server.schemas.actions import VariableCreate
+from prefect.server.schemas.actions import (
+    DeploymentFlowRunCreate,
+    StateCreate,
+    VariableCreate,
+)
 from prefect.server.schemas.core import Deployment, Flow, FlowRun
 from prefect.server.schemas.responses import (
     DeploymentResponse,
+    OrchestrationResult,
     SetStateStatus,
 )
-from prefect.server.schemas.states import Paused, Suspended
+from prefect.server.schemas.states import Paused, StateType, Suspended
 from prefect.settings import (
     PREFECT_API_AUTH_STRING,
     PREFECT_SERVER_API_AUTH_STRING,
@@ -30,7 +39,11 @@ from prefect.settings import (
 )
 
 if TYPE_CHECKING:
-    from prefect.server.database.orm_models import ORMDeployment, ORMVariable
+    from prefect.server.database.orm_models import (
+        ORMDeployment,
+        ORMVariable,
+        ORMWorkQueue,
+    )
 
 
 @pytest.fixture
@@ -265,3 +278,107 @@ async def test_get_orchestration_client_after_create_app_final():
     #
     #    AttributeError: 'PrefectRouter' object has no attribute 'routes'. Did you mean: 'route'?
     OrchestrationClient()
+
+
+class TestInProcessOrchestrationClient:
+    @pytest.fixture
+    async def client(self) -> AsyncGenerator[InProcessOrchestrationClient, None]:
+        async with InProcessOrchestrationClient() as client:
+            # writes must never be sent through the ASGI application
+            client._http_client.send = mock.AsyncMock(side_effect=AssertionError)
+            yield client
+
+    async def test_pause_and_resume_deployment(
+        self,
+        client: InProcessOrchestrationClient,
+        deployment: "ORMDeployment",
+        session: AsyncSession,
+    ):
+        response = await client.pause_deployment(deployment.id)
+        assert response.status_code == 200
+
+        await session.refresh(deployment)
+        assert deployment.paused
+
+        response = await client.resume_deployment(deployment.id)
+        assert response.status_code == 200
+
+        await session.refresh(deployment)
+        assert not deployment.paused
+
+    async def test_http_errors_become_responses(
+        self, client: InProcessOrchestrationClient
+    ):
+        response = await client.pause_deployment(uuid4())
+        assert response.status_code == 404
+        assert response.json() == {"detail": "Deployment not found"}
+
+        with pytest.raises(httpx.HTTPStatusError):
+            response.raise_for_status()
+
+    async def test_unexpected_errors_become_internal_server_errors(
+        self, client: InProcessOrchestrationClient
+    ):
+        with mock.patch(
+            "prefect.server.api.deployments.models.deployments.read_deployment",
+            side_effect=ValueError("woops"),
+        ):
+            response = await client.pause_deployment(uuid4())
+
+        assert response.status_code == 500
+        assert response.json() == {"exception_message": "Internal Server Error"}
+
+    async def test_set_flow_run_state(
+        self, client: InProcessOrchestrationClient, paused_flow_run: FlowRun
+    ):
+        response = await client.set_flow_run_state(
+            paused_flow_run.id, StateCreate(type=StateType.CANCELLED)
+        )
+        assert response.status_code == 201
+
+        result = OrchestrationResult.model_validate(response.json())
+        assert result.status == SetStateStatus.ACCEPT
+        assert result.state and result.state.type == StateType.CANCELLED
+
+    async def test_created_flow_runs_record_the_automation(
+        self, deployment: "ORMDeployment"
+    ):
+        automation_id = uuid4()
+        async with InProcessOrchestrationClient(
+            additional_headers={
+                "Prefect-Automation-ID": str(automation_id),
+                "Prefect-Automation-Name": b64encode(b"my automation").decode(),
+            }
+        ) as client:
+            response = await client.create_flow_run(
+                deployment.id, DeploymentFlowRunCreate()
+            )
+
+        assert response.status_code == 201
+        assert response.json()["created_by"] == {
+            "id": str(automation_id),
+            "type": "AUTOMATION",
+            "display_value": "my automation",
+        }
+
+    async def test_pause_and_resume_work_queue(
+        self,
+        client: InProcessOrchestrationClient,
+        work_queue: "ORMWorkQueue",
+        session: AsyncSession,
+    ):
+        response = await client.pause_work_queue(work_queue.id)
+        assert response.status_code == 204
+
+        await session.refresh(work_queue)
+        assert work_queue.is_paused
+
+        response = await client.resume_work_queue(work_queue.id)
+        assert response.status_code == 204
+
+        await session.refresh(work_queue)
+        assert not work_queue.is_paused
+
+    async def test_pause_missing_work_pool(self, client: InProcessOrchestrationClient):
+        response = await client.pause_work_pool("not-a-pool")
+        assert response.status_code == 404
@@ -6,6 +6,8 @@ order. This is purely so that we can test sorting by flow run and
 task run ID with a stable order across test machines.
 """
 
+import gzip
+import json
 from datetime import timedelta
 from unittest import mock
 from unittest.mock import patch
@@ -92,6 +94,52 @@ class TestCreateLogs:
             == log_data[1]
         )
 
+    async def test_create_logs_with_gzip_encoded_body(
+        self, session, client, log_data, flow_run_id
+    ):
+        response = await client.post(
+            CREATE_LOGS_URL,
+            content=gzip.compress(json.dumps(log_data).encode()),
+            headers={"Content-Type": "application/json", "Content-Encoding": "gzip"},
+        )
+        assert response.status_code == 201
+
+        log_filter = LogFilter(flow_run_id={"any_": [flow_run_id]})
+        logs = await models.logs.read_logs(session=session, log_filter=log_filter)
+        assert len(logs) == 2
+
+    async def test_create_logs_with_invalid_gzip_encoded_body(self, client, log_data):
+        response = await client.post(
+            CREATE_LOGS_URL,
+            content=json.dumps(log_data).encode(),
+            headers={"Content-Type": "application/json", "Content-Encoding": "gzip"},
+        )
+        assert response.status_code == 400
+
+    async def test_create_logs_with_gzip_encoded_body_that_is_too_large(self, client):
+        # a "zip bomb", which is small until it's decompressed
+        body = gzip.compress(b"[" + b" " * (64 * 1024 * 1024) + b"]")
+        assert len(body) < 100 * 1024
+
+        response = await client.post(
+            CREATE_LOGS_URL,
+            content=body,
+            headers={"Content-Type": "application/json", "Content-Encoding": "gzip"},
+        )
+        assert response.status_code == 413
+
+    async def test_gzip_encoded_bodies_are_only_decompressed_for_creating_logs(
+        self, client
+    ):
+        response = await client.post(
+            READ_LOGS_URL,
+            content=gzip.compress(json.dumps({}).encode()),
+            headers={"Content-Type": "application/json", "Content-Encoding": "gzip"},
+        )
+        # the compressed body is passed through, and can't be parsed as JSON
+        assert response.status_code == 400
+        assert response.json()["detail"] == "There was an error parsing the body"
+
     async def test_database_failure(
         self, client_without_exceptions, session, flow_run_id, task_run_id, log_data
     ):
@@ -0,0 +1,177 @@
+import asyncio
+from typing import Any
+from unittest import mock
+from uuid import uuid4
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from prefect.server import models, schemas
+from prefect.server.api import read_cache
+from prefect.server.database import PrefectDBInterface, orm_models
+from prefect.settings import PREFECT_SERVER_API_READ_CACHE_TTL, temporary_settings
+
+
+class CountingRead:
+    def __init__(self):
+        self.calls = 0
+        self.release = asyncio.Event()
+        self.release.set()
+
+    async def __call__(self) -> int:
+        self.calls += 1
+        await self.release.wait()
+        return self.calls
+
+
+@pytest.fixture(autouse=True)
+def enable_caching():
+    with temporary_settings({PREFECT_SERVER_API_READ_CACHE_TTL: 2}):
+        yield
+
+
+@pytest.fixture
+def key() -> Any:
+    # a key of its own for each test, so that results never leak between them
+    return ("test", uuid4())
+
+
+async def test_results_are_cached(key: Any):
+    read = CountingRead()
+
+    assert await read_cache.read_through(key, ["flow"], read) == 1
+    assert await read_cache.read_through(key, ["flow"], read) == 1
+    assert read.calls == 1
+
+
+async def test_results_are_not_cached_by_default(key: Any):
+    read = CountingRead()
+
+    with temporary_settings(restore_defaults={PREFECT_SERVER_API_READ_CACHE_TTL}):
+        assert await read_cache.read_through(key, ["flow"], read) == 1
+        assert await read_cache.read_through(key, ["flow"], read) == 2
+
+
+async def test_writes_to_a_table_invalidate_results_read_from_it(
+    key: Any, session: AsyncSession
+):
+    read = CountingRead()
+    assert await read_cache.read_through(key, ["flow"], read) == 1
+
+    await models.deployments.create_deployment(
+        session=session,
+        deployment=schemas.core.Deployment(
+            name="my-deployment",
+            flow_id=(
+                await models.flows.create_flow(
+                    session=session, flow=schemas.core.Flow(name="my-flow")
+                )
+            ).id,
+        ),
+    )
+
+    # nothing changes until the write is committed
+    assert await read_cache.read_through(key, ["flow"], read) == 1
+    assert await read_cache.read_through(key, ["work_pool"], read) == 2
+
+    await session.commit()
+
+    assert await read_cache.read_through(key, ["flow"], read) == 3
+    assert await read_cache.read_through(key, ["work_pool"], read) == 2
+
+
+async def test_writes_by_statement_invalidate_results(
+    key: Any, session: AsyncSession, db: PrefectDBInterface, flow: orm_models.Flow
+):
+    read = CountingRead()
+    assert await read_cache.read_through(key, ["flow"], read) == 1
+
+    await session.execute(
+        db.Flow.__table__.update().where(db.Flow.id == flow.id).values(tags=["hello"])
+    )
+    await session.commit()
+
+    assert await read_cache.read_through(key, ["flow"], read) == 2
+
+
+async def test_results_expire(key: Any):
+    read = CountingRead()
+
+    with mock.patch.object(read_cache.time, "monotonic", return_value=100.0):
+        assert await read_cache.read_through(key, ["flow"], read) == 1
+
+    with mock.patch.object(read_cache.time, "monotonic", return_value=101.0):
+        assert await read_cache.read_through(key, ["flow"], read) == 1
+
+    with mock.patch.object(read_cache.time, "monotonic", return_value=102.0):
+        assert await read_cache.read_through(key, ["flow"], read) == 2
+
+
+async def test_concurrent_reads_share_one_query(key: Any):
+    read = CountingRead()
+    read.release.clear()
+
+    with temporary_settings({PREFECT_SERVER_API_READ_CACHE_TTL: 0}):
+        reads = [
+            asyncio.create_task(read_cache.read_through(key, ["flow"], read))
+            for _ in range(10)
+        ]
+        await asyncio.sleep(0)
+        read.release.set()
+
+        assert await asyncio.gather(*reads) == [1] * 10
+        assert read.calls == 1
+
+        # but nothing is cached once they are done
+        assert await read_cache.read_through(key, ["flow"], read) == 2
+
+
+async def test_cancelling_one_read_does_not_cancel_the_others(key: Any):
+    read = CountingRead()
+    read.release.clear()
+
+    first = asyncio.create_task(read_cache.read_through(key, ["flow"], read))
+    second = asyncio.create_task(read_cache.read_through(key, ["flow"], read))
+    await asyncio.sleep(0)
+
+    first.cancel()
+    read.release.set()
+
+    assert await second == 1
+    with pytest.raises(asyncio.CancelledError):
+        await first
+
+
+async def test_errors_are_not_cached(key: Any):
+    calls = 0
+
+    async def read() -> int:
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            raise ValueError("oops")
+        return calls
+
+    with pytest.raises(ValueError):
+        await read_cache.read_through(key, ["flow"], read)
+
+    assert await read_cache.read_through(key, ["flow"], read) == 2
+
+
+async def test_cached_deployment_counts_reflect_new_deployments(
+    client: AsyncClient, flow: orm_models.Flow
+):
+    request = {"flow_ids": [str(flow.id), str(uuid4())]}
+
+    response = await client.post("/ui/flows/count-deployments", json=request)
+    assert response.json()[str(flow.id)] == 0
+
+    response = await client.post(
+        "/deployments/",
+        json={"name": "my-deployment", "flow_id": str(flow.id)},
+    )
+    assert response.status_code == 201
+
+    response = await client.post("/ui/flows/count-deployments", json=request)
+    assert response.json()[str(flow.id)] == 1
@@ -1,6 +1,9 @@
 import contextlib
+import os
 import socket
 import sqlite3
+import sys
+import types
 from unittest.mock import MagicMock, patch
 from uuid import uuid4
 
@@ -12,17 +15,21 @@ import toml
 from fastapi import status
 from httpx import ASGITransport, AsyncClient
 
+from prefect.blocks.core import Block
 from prefect.client.constants import SERVER_API_VERSION
 from prefect.client.orchestration import get_client
 from prefect.flows import flow
 from prefect.server.api.server import (
     API_ROUTERS,
+    READY_FD_ENV_VAR,
     SQLITE_LOCKED_MSG,
     SubprocessASGIServer,
     _memoize_block_auto_registration,
+    _notify_ready,
     create_api_app,
     create_app,
 )
+from prefect.server.models.block_registration import block_registry_fingerprint
 from prefect.server.utilities.server import method_paths_from_routes
 from prefect.settings import (
     PREFECT_API_DATABASE_CONNECTION_URL,
@@ -35,6 +42,7 @@ from prefect.settings import (
     temporary_settings,
 )
 from prefect.testing.utilities import AsyncMock
+from prefect.utilities.hashing import hash_objects
 
 
 async def test_validation_error_handler_422(client):
@@ -366,6 +374,29 @@ class TestMemoizeBlockAutoRegistration:
 
         assert test_func.call_count == 2
 
+    def test_block_registry_fingerprint_is_stable(self):
+        assert hash_objects(block_registry_fingerprint()) is not None
+        assert hash_objects(block_registry_fingerprint()) == hash_objects(
+            block_registry_fingerprint()
+        )
+
+    def test_block_registry_fingerprint_changes_with_block_package_versions(
+        self, monkeypatch: pytest.MonkeyPatch
+    ):
+        package = types.ModuleType("my_block_package")
+        package.__version__ = "1.0.0"
+        monkeypatch.setitem(sys.modules, "my_block_package", package)
+
+        class MyVersionedBlock(Block):
+            __module__ = "my_block_package.blocks"
+
+            value: str = ""
+
+        fingerprint = hash_objects(block_registry_fingerprint())
+        monkeypatch.setattr(package, "__version__", "2.0.0")
+
+        assert hash_objects(block_registry_fingerprint()) != fingerprint
+
 
 class TestSubprocessASGIServer:
     def test_singleton_on_port(self):
@@ -406,6 +437,40 @@ class TestSubprocessASGIServer:
 
         assert popen_mock.call_count == 1
 
+    @pytest.mark.skipif(
+        sys.platform == "win32", reason="Readiness is polled on Windows"
+    )
+    def test_start_waits_for_ready_signal(self, monkeypatch):
+        def popen(args, env, pass_fds):
+            # the server passes its socket to uvicorn and signals once it is ready
+            assert args[args.index("--fd") + 1] == str(pass_fds[0])
+            os.write(int(env[READY_FD_ENV_VAR]), b"1")
+            return MagicMock()
+
+        popen_mock = MagicMock(side_effect=popen)
+        monkeypatch.setattr("prefect.server.api.server.subprocess.Popen", popen_mock)
+        monkeypatch.setattr(httpx.Client, "get", MagicMock(side_effect=AssertionError))
+        server = SubprocessASGIServer()
+        server.start()
+
+        assert popen_mock.call_count == 1
+        server.stop()
+
+    def test_notify_ready(self, monkeypatch):
+        read_fd, write_fd = os.pipe()
+        monkeypatch.setenv(READY_FD_ENV_VAR, str(write_fd))
+
+        _notify_ready()
+
+        assert os.read(read_fd, 1) == b"1"
+        assert READY_FD_ENV_VAR not in os.environ
+        os.close(read_fd)
+
+    def test_notify_ready_without_parent(self, monkeypatch):
+        monkeypatch.delenv(READY_FD_ENV_VAR, raising=False)
+
+        _notify_ready()
+
     def test_address_returns_correct_address(self):
         server = SubprocessASGIServer(port=8000)
         assert server.address == "http://127.0.0.1:8000"
@@ -1,3 +1,4 @@
+import json
 from unittest.mock import AsyncMock, patch
 from uuid import uuid4
 
@@ -5,6 +6,7 @@ import pytest
 
 from prefect.server.logs.messaging import (
     create_log_publisher,
+    logs_adapter,
     publish_logs,
 )
 from prefect.server.schemas.core import Log
@@ -85,12 +87,12 @@ async def test_publish_logs_when_enabled_single_log(sample_log):
 
             # Check the published data
             call_args = mock_publisher.publish_data.call_args
-            assert call_args[1]["data"] == sample_log.model_dump_json().encode()
-            assert call_args[1]["attributes"]["log_id"] == str(sample_log.id)
+            assert call_args[1]["data"] == logs_adapter.dump_json([sample_log])
+            assert call_args[1]["attributes"] == {"log_count": "1"}
 
 
 async def test_publish_logs_with_id_none_in_message():
-    """Test the case where log ID gets set to None in the message attributes"""
+    """Test that logs without an ID can still be published"""
     log = Log(
         name="test.logger",
         level=20,
@@ -106,13 +108,12 @@ async def test_publish_logs_with_id_none_in_message():
             mock_create.return_value.__aenter__.return_value = mock_publisher
             mock_create.return_value.__aexit__ = AsyncMock(return_value=None)
 
-            # Mock the log ID to be None for testing the attributes logic
             with patch.object(log, "id", None):
                 await publish_logs([log])
 
-                # Check that attributes are empty when ID is None
                 call_args = mock_publisher.publish_data.call_args
-                assert call_args[1]["attributes"] == {}
+                assert call_args[1]["attributes"] == {"log_count": "1"}
+                assert json.loads(call_args[1]["data"])[0]["id"] is None
 
 
 async def test_publish_logs_when_disabled(sample_logs):
@@ -147,15 +148,18 @@ async def test_publish_logs_when_enabled(sample_logs):
             await publish_logs(sample_logs)
 
             mock_create.assert_called_once()
-            # Should be called once for each log
-            assert mock_publisher.publish_data.call_count == len(sample_logs)
+            # Should publish all of the logs in a single message
+            mock_publisher.publish_data.assert_called_once()
+            call_args = mock_publisher.publish_data.call_args
+            assert logs_adapter.validate_json(call_args[1]["data"]) == sample_logs
+            assert call_args[1]["attributes"] == {"log_count": str(len(sample_logs))}
 
 
 class TestLogSchemaTypeValidation:
     """Tests for schema type validation in the messaging system"""
 
-    async def test_publish_logs_uses_log_id_in_attributes(self):
-        """Test that publish_logs uses the Log object's id field in message attributes"""
+    async def test_publish_logs_includes_log_id(self):
+        """Test that publish_logs includes the Log object's id field in the message"""
         log_full = Log(
             name="test.logger",
             level=20,
@@ -178,5 +182,6 @@ class TestLogSchemaTypeValidation:
                 call_args = mock_publisher.publish_data.call_args
 
                 # This was the key issue: messaging needs the log's ID (only available on Log, not LogCreate)
-                assert call_args[1]["attributes"]["log_id"] == str(log_full.id)
+                published_logs = logs_adapter.validate_json(call_args[1]["data"])
+                assert published_logs[0].id == log_full.id
                 assert log_full.id is not None
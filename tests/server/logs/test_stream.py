@@ -5,6 +5,7 @@ from uuid import uuid4
 
 import pytest
 
+from prefect.server.logs.messaging import logs_adapter
 from prefect.server.logs.stream import (
     LogDistributor,
     distributor,
@@ -225,6 +226,25 @@ async def test_distributor_message_handler(sample_log1, mock_subscriber):
         assert log.message == "Test message 1"
 
 
+@pytest.mark.asyncio
+async def test_distributor_message_handler_batched_logs(
+    sample_log1, sample_log2, mock_subscriber
+):
+    """Test the distributor handles messages containing a batch of logs"""
+    queue, filter = mock_subscriber
+
+    mock_message = Mock()
+    mock_message.data = logs_adapter.dump_json([sample_log1, sample_log2])
+    mock_message.attributes = {"log_count": "2"}
+
+    async with distributor() as handler:
+        await handler(mock_message)
+
+        assert (await queue.get()).message == "Test message 1"
+        assert (await queue.get()).message == "Test message 2"
+        assert queue.empty()
+
+
 @pytest.mark.asyncio
 async def test_distributor_message_handler_no_attributes():
     """Test distributor handles messages without attributes"""
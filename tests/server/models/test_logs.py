@@ -77,6 +77,22 @@ class TestCreateLogs:
                 == log_data[i]
             )
 
+    async def test_create_logs_sets_ids_and_timestamps(self, session, logs, db):
+        result = await session.execute(select(db.Log))
+        read_logs = result.scalars().unique().all()
+
+        assert len(read_logs) == 3
+        assert len({log.id for log in read_logs}) == 3
+        for log in read_logs:
+            assert log.created is not None
+            assert log.updated == log.created
+
+    async def test_create_no_logs(self, session, db):
+        await models.logs.create_logs(session=session, logs=[])
+
+        result = await session.execute(select(db.Log))
+        assert result.scalars().all() == []
+
 
 class TestReadLogs:
     async def test_read_logs_timestamp_after_inclusive(self, session, logs, log_data):
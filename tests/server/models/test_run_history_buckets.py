@@ -0,0 +1,365 @@
+from datetime import datetime, timedelta, timezone
+from typing import Any
+from unittest import mock
+
+import pytest
+import sqlalchemy as sa
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from prefect.server import models, schemas
+from prefect.server.api.run_history import run_history
+from prefect.server.database import PrefectDBInterface, orm_models
+from prefect.server.models import run_history_buckets
+from prefect.server.schemas.states import (
+    Completed,
+    Failed,
+    Pending,
+    Running,
+    Scheduled,
+    StateType,
+)
+
+dt = datetime(2024, 3, 1, tzinfo=timezone.utc)
+
+
+async def read_buckets(
+    session: AsyncSession, db: PrefectDBInterface
+) -> list[tuple[Any, ...]]:
+    result = await session.execute(
+        sa.select(db.RunHistoryBucket).where(db.RunHistoryBucket.count != 0)
+    )
+    return sorted(
+        (
+            bucket.run_type,
+            bucket.time_field,
+            bucket.bucket,
+            bucket.state_type,
+            bucket.state_name,
+            bucket.count,
+            bucket.sum_estimated_run_time,
+            bucket.sum_estimated_lateness,
+        )
+        for bucket in result.scalars()
+    )
+
+
+async def run_flow(
+    session: AsyncSession,
+    flow: orm_models.Flow,
+    expected: datetime,
+    lateness: timedelta,
+    duration: timedelta,
+    final: type[Completed] | type[Failed] | None = Completed,
+) -> orm_models.FlowRun:
+    flow_run = await models.flow_runs.create_flow_run(
+        session=session,
+        flow_run=schemas.core.FlowRun(
+            flow_id=flow.id, state=Scheduled(scheduled_time=expected)
+        ),
+    )
+    await models.flow_runs.set_flow_run_state(
+        session=session,
+        flow_run_id=flow_run.id,
+        state=Running(timestamp=expected + lateness),
+        force=True,
+    )
+    if final is not None:
+        await models.flow_runs.set_flow_run_state(
+            session=session,
+            flow_run_id=flow_run.id,
+            state=final(timestamp=expected + lateness + duration),
+            force=True,
+        )
+    return flow_run
+
+
+async def test_runs_are_bucketed_when_they_finish(
+    session: AsyncSession,
+    db: PrefectDBInterface,
+    flow: orm_models.Flow,
+):
+    expected = dt + timedelta(minutes=5, seconds=30)
+    flow_run = await run_flow(
+        session,
+        flow,
+        expected,
+        lateness=timedelta(seconds=10),
+        duration=timedelta(seconds=40),
+        final=None,
+    )
+    assert await read_buckets(session, db) == []
+
+    await models.flow_runs.set_flow_run_state(
+        session=session,
+        flow_run_id=flow_run.id,
+        state=Completed(timestamp=expected + timedelta(seconds=50)),
+        force=True,
+    )
+    assert await read_buckets(session, db) == [
+        (
+            "flow_run",
+            "expected_start_time",
+            dt + timedelta(minutes=5),
+            StateType.COMPLETED,
+            "Completed",
+            1,
+            40.0,
+            10.0,
+        )
+    ]
+
+
+async def test_runs_move_between_buckets_when_they_leave_a_terminal_state(
+    session: AsyncSession,
+    db: PrefectDBInterface,
+    flow: orm_models.Flow,
+):
+    flow_run = await run_flow(
+        session,
+        flow,
+        dt,
+        lateness=timedelta(0),
+        duration=timedelta(seconds=5),
+        final=Failed,
+    )
+    assert [bucket[3:6] for bucket in await read_buckets(session, db)] == [
+        (StateType.FAILED, "Failed", 1)
+    ]
+
+    await models.flow_runs.set_flow_run_state(
+        session=session,
+        flow_run_id=flow_run.id,
+        state=Pending(timestamp=dt + timedelta(minutes=1)),
+        force=True,
+    )
+    assert await read_buckets(session, db) == []
+
+    await models.flow_runs.set_flow_run_state(
+        session=session,
+        flow_run_id=flow_run.id,
+        state=Completed(timestamp=dt + timedelta(minutes=2)),
+        force=True,
+    )
+    assert [bucket[3:6] for bucket in await read_buckets(session, db)] == [
+        (StateType.COMPLETED, "Completed", 1)
+    ]
+
+
+async def test_task_runs_are_also_bucketed_by_start_time(
+    session: AsyncSession,
+    db: PrefectDBInterface,
+    flow_run: orm_models.FlowRun,
+):
+    task_run = await models.task_runs.create_task_run(
+        session=session,
+        task_run=schemas.core.TaskRun(
+            flow_run_id=flow_run.id,
+            task_key="my-task",
+            dynamic_key="0",
+            state=Pending(timestamp=dt),
+        ),
+    )
+    for state in [
+        Running(timestamp=dt + timedelta(minutes=2)),
+        Completed(timestamp=dt + timedelta(minutes=3)),
+    ]:
+        await models.task_runs.set_task_run_state(
+            session=session, task_run_id=task_run.id, state=state, force=True
+        )
+
+    assert [bucket[:4] for bucket in await read_buckets(session, db)] == [
+        ("task_run", "expected_start_time", dt, StateType.COMPLETED),
+        ("task_run", "start_time", dt + timedelta(minutes=2), StateType.COMPLETED),
+    ]
+
+
+async def test_deleting_runs_removes_them_from_buckets(
+    session: AsyncSession,
+    db: PrefectDBInterface,
+    flow: orm_models.Flow,
+):
+    flow_runs = [
+        await run_flow(
+            session,
+            flow,
+            dt + timedelta(minutes=i),
+            lateness=timedelta(0),
+            duration=timedelta(seconds=5),
+        )
+        for i in range(3)
+    ]
+    await models.task_runs.create_task_run(
+        session=session,
+        task_run=schemas.core.TaskRun(
+            flow_run_id=flow_runs[0].id,
+            task_key="my-task",
+            dynamic_key="0",
+            state=Completed(timestamp=dt),
+        ),
+    )
+    assert len(await read_buckets(session, db)) == 4
+
+    assert await models.flow_runs.delete_flow_run(session, flow_runs[0].id)
+    assert len(await read_buckets(session, db)) == 2
+
+    assert await models.flows.delete_flow(session, flow.id)
+    assert await read_buckets(session, db) == []
+
+
+class TestReadingHistoryFromBuckets:
+    @pytest.fixture
+    async def runs(
+        self,
+        session: AsyncSession,
+        flow: orm_models.Flow,
+    ):
+        for i in range(60):
+            flow_run = await run_flow(
+                session,
+                flow,
+                dt + timedelta(minutes=3 * i, seconds=7 * i % 60),
+                lateness=timedelta(seconds=i % 5),
+                duration=timedelta(seconds=10 + i),
+                final=[Completed, Failed, None][i % 3],
+            )
+            task_run = await models.task_runs.create_task_run(
+                session=session,
+                task_run=schemas.core.TaskRun(
+                    flow_run_id=flow_run.id,
+                    task_key="my-task",
+                    dynamic_key="0",
+                    state=Pending(timestamp=dt + timedelta(minutes=3 * i)),
+                ),
+            )
+            for state in [
+                Running(timestamp=dt + timedelta(minutes=3 * i, seconds=i + 1)),
+                [Completed, Failed, Pending][i % 3](
+                    timestamp=dt + timedelta(minutes=3 * i, seconds=2 * i + 2)
+                ),
+            ]:
+                await models.task_runs.set_task_run_state(
+                    session=session, task_run_id=task_run.id, state=state, force=True
+                )
+        await session.commit()
+
+    @staticmethod
+    def comparable(
+        history: list[schemas.responses.HistoryResponse],
+    ) -> list[tuple[Any, ...]]:
+        return [
+            (
+                interval.interval_start,
+                interval.interval_end,
+                sorted(
+                    (
+                        state.state_type,
+                        state.state_name,
+                        state.count_runs,
+                        round(state.sum_estimated_run_time.total_seconds()),
+                        round(state.sum_estimated_lateness.total_seconds()),
+                    )
+                    for state in interval.states
+                ),
+            )
+            for interval in history
+        ]
+
+    @pytest.mark.usefixtures("runs")
+    @pytest.mark.parametrize("run_type", ["flow_run", "task_run"])
+    @pytest.mark.parametrize(
+        "start, end, interval",
+        [
+            (dt, dt + timedelta(hours=3), timedelta(minutes=10)),
+            (dt, dt + timedelta(hours=3), timedelta(minutes=7, seconds=30)),
+            (
+                dt - timedelta(minutes=13, seconds=17),
+                dt + timedelta(hours=2, seconds=11),
+                timedelta(minutes=17, seconds=3),
+            ),
+            (dt, dt + timedelta(hours=3), timedelta(seconds=45)),
+        ],
+    )
+    async def test_history_from_buckets_matches_history_from_runs(
+        self,
+        session: AsyncSession,
+        run_type: run_history_buckets.RunType,
+        start: datetime,
+        end: datetime,
+        interval: timedelta,
+    ):
+        with mock.patch.object(
+            run_history_buckets,
+            "read_interval_counts",
+            wraps=run_history_buckets.read_interval_counts,
+        ) as read_interval_counts:
+            from_buckets = await run_history(session, run_type, start, end, interval)
+
+        assert read_interval_counts.called == (interval >= timedelta(minutes=1))
+
+        with mock.patch.object(
+            run_history_buckets, "answers_filters", return_value=False
+        ):
+            from_runs = await run_history(session, run_type, start, end, interval)
+
+        assert self.comparable(from_buckets) == self.comparable(from_runs)
+        assert sum(len(interval.states) for interval in from_buckets) > 0
+
+    @pytest.mark.usefixtures("runs")
+    @pytest.mark.parametrize(
+        "after, before",
+        [
+            (dt, dt + timedelta(hours=3)),
+            (dt + timedelta(minutes=4, seconds=10), dt + timedelta(hours=2, seconds=5)),
+        ],
+    )
+    async def test_dashboard_counts_from_buckets_match_counts_from_runs(
+        self,
+        client: AsyncClient,
+        after: datetime,
+        before: datetime,
+    ):
+        task_runs = schemas.filters.TaskRunFilter(
+            start_time=schemas.filters.TaskRunFilterStartTime(
+                after_=after, before_=before
+            )
+        )
+        request = {"task_runs": task_runs.model_dump(mode="json")}
+
+        with mock.patch.object(
+            run_history_buckets,
+            "read_interval_counts",
+            wraps=run_history_buckets.read_interval_counts,
+        ) as read_interval_counts:
+            from_buckets = await client.post(
+                "/ui/task_runs/dashboard/counts", json=request
+            )
+        read_interval_counts.assert_called_once()
+
+        with mock.patch.object(
+            run_history_buckets, "answers_filters", return_value=False
+        ):
+            from_runs = await client.post(
+                "/ui/task_runs/dashboard/counts", json=request
+            )
+
+        assert from_buckets.status_code == from_runs.status_code == 200
+        assert from_buckets.json() == from_runs.json()
+        assert sum(count["completed"] for count in from_buckets.json()) > 0
+
+    @pytest.mark.usefixtures("runs")
+    async def test_filtered_history_is_read_from_runs(self, session: AsyncSession):
+        with mock.patch.object(
+            run_history_buckets, "read_interval_counts"
+        ) as read_interval_counts:
+            await run_history(
+                session,
+                "flow_run",
+                dt,
+                dt + timedelta(hours=3),
+                timedelta(minutes=10),
+                flow_runs=schemas.filters.FlowRunFilter(
+                    tags=schemas.filters.FlowRunFilterTags(all_=["hello"])
+                ),
+            )
+        read_interval_counts.assert_not_called()
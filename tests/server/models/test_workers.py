@@ -872,6 +872,40 @@ class TestGetScheduledRuns:
         )
         assert len(runs) == 0
 
+    async def test_read_next_scheduled_start_times(
+        self, session, work_pools, work_queues
+    ):
+        empty_queue = await models.workers.create_work_queue(
+            session=session,
+            work_pool_id=work_pools["wp_a"].id,
+            work_queue=schemas.actions.WorkQueueCreate(name="empty"),
+        )
+        await session.commit()
+
+        runs = await models.workers.get_scheduled_flow_runs(
+            session=session,
+            work_queue_ids=[work_queues["wq_aa"].id, work_queues["wq_ba"].id],
+        )
+
+        next_start_times = await models.workers.read_next_scheduled_start_times(
+            session=session,
+            work_queue_ids=[
+                work_queues["wq_aa"].id,
+                work_queues["wq_ba"].id,
+                empty_queue.id,
+            ],
+        )
+
+        # queues without scheduled runs are left out
+        assert next_start_times == {
+            work_queue_id: min(
+                run.flow_run.next_scheduled_start_time
+                for run in runs
+                if run.work_queue_id == work_queue_id
+            )
+            for work_queue_id in [work_queues["wq_aa"].id, work_queues["wq_ba"].id]
+        }
+
 
 class TestDeleteWorker:
     async def test_delete_worker(self, session, work_pool):
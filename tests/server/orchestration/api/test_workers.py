@@ -1,6 +1,7 @@
 import uuid
 from datetime import datetime, timedelta, timezone
 from typing import List
+from unittest import mock
 
 import pytest
 from httpx import AsyncClient
@@ -2084,6 +2085,56 @@ class TestGetScheduledRuns:
         )
         assert len(data) == 0
 
+    async def test_polls_skip_getting_runs_until_one_is_due(
+        self, client, session, flow, work_pools
+    ):
+        work_queue = await models.workers.create_work_queue(
+            session=session,
+            work_pool_id=work_pools["wp_a"].id,
+            work_queue=schemas.actions.WorkQueueCreate(name="empty"),
+        )
+        await session.commit()
+
+        poll = dict(
+            work_queue_names=[work_queue.name],
+            scheduled_before=datetime.now(timezone.utc).isoformat(),
+        )
+
+        with mock.patch.object(
+            models.workers,
+            "get_scheduled_flow_runs",
+            wraps=models.workers.get_scheduled_flow_runs,
+        ) as get_scheduled_flow_runs:
+            response = await client.post(
+                f"/work_pools/{work_pools['wp_a'].name}/get_scheduled_flow_runs",
+                json=poll,
+            )
+            assert response.status_code == status.HTTP_200_OK, response.text
+            assert response.json() == []
+            get_scheduled_flow_runs.assert_not_called()
+
+            flow_run = await models.flow_runs.create_flow_run(
+                session=session,
+                flow_run=schemas.core.FlowRun(
+                    flow_id=flow.id,
+                    state=prefect.server.schemas.states.Scheduled(
+                        scheduled_time=datetime.now(timezone.utc) - timedelta(minutes=1)
+                    ),
+                    work_queue_id=work_queue.id,
+                ),
+            )
+            await session.commit()
+
+            response = await client.post(
+                f"/work_pools/{work_pools['wp_a'].name}/get_scheduled_flow_runs",
+                json=poll,
+            )
+            assert response.status_code == status.HTTP_200_OK, response.text
+            assert [run["flow_run"]["id"] for run in response.json()] == [
+                str(flow_run.id)
+            ]
+            get_scheduled_flow_runs.assert_called_once()
+
     async def test_updates_last_polled_on_a_single_work_queue(
         self, client, work_queues, work_pools
     ):
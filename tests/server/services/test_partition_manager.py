@@ -0,0 +1,316 @@
+from datetime import datetime, timedelta, timezone
+from typing import AsyncGenerator, Optional
+from uuid import UUID, uuid4
+
+import pytest
+import sqlalchemy as sa
+
+from prefect.server.database import PrefectDBInterface
+from prefect.server.services.partition_manager import (
+    PARTITIONED_TABLES,
+    Partition,
+    PartitionedTable,
+    PartitionManager,
+    create_partition,
+    drop_partition,
+    is_partitioned,
+    parse_partition_bounds,
+    partition_name,
+    partition_start,
+    partition_table,
+    read_partitions,
+)
+from prefect.settings import (
+    PREFECT_API_DATABASE_CONNECTION_URL,
+    PREFECT_SERVER_EVENTS_RETENTION_PERIOD,
+    PREFECT_SERVER_LOGS_RETENTION_PERIOD,
+    temporary_settings,
+)
+from prefect.settings.context import get_current_settings
+from prefect.types._datetime import now
+
+
+@pytest.mark.parametrize(
+    "timestamp, interval, expected",
+    [
+        (
+            datetime(2025, 3, 4, 15, 30, tzinfo=timezone.utc),
+            timedelta(days=1),
+            datetime(2025, 3, 4, tzinfo=timezone.utc),
+        ),
+        (
+            datetime(2025, 3, 4, 15, 30, tzinfo=timezone.utc),
+            timedelta(hours=6),
+            datetime(2025, 3, 4, 12, tzinfo=timezone.utc),
+        ),
+        (
+            datetime(2025, 3, 4, tzinfo=timezone.utc),
+            timedelta(days=1),
+            datetime(2025, 3, 4, tzinfo=timezone.utc),
+        ),
+        (
+            datetime(2025, 3, 4, 1, tzinfo=timezone(timedelta(hours=2))),
+            timedelta(days=1),
+            datetime(2025, 3, 3, tzinfo=timezone.utc),
+        ),
+    ],
+)
+def test_partition_start(timestamp, interval, expected):
+    assert partition_start(timestamp, interval) == expected
+
+
+def test_partition_name():
+    table = PartitionedTable("events", "occurred")
+
+    assert (
+        partition_name(table, datetime(2025, 3, 4, 12, tzinfo=timezone.utc))
+        == "events_p202503041200"
+    )
+
+
+class TestParsePartitionBounds:
+    def test_range(self):
+        assert parse_partition_bounds(
+            "FOR VALUES FROM ('2025-01-01 00:00:00+00') TO ('2025-01-02 00:00:00+00')"
+        ) == (
+            datetime(2025, 1, 1, tzinfo=timezone.utc),
+            datetime(2025, 1, 2, tzinfo=timezone.utc),
+        )
+
+    def test_unbounded_start(self):
+        assert parse_partition_bounds(
+            "FOR VALUES FROM (MINVALUE) TO ('2025-01-02 00:00:00+00')"
+        ) == (None, datetime(2025, 1, 2, tzinfo=timezone.utc))
+
+    def test_fractional_seconds(self):
+        start, _ = parse_partition_bounds(
+            "FOR VALUES FROM ('2025-01-01 00:00:00.5+00') TO (MAXVALUE)"
+        )
+        assert start == datetime(2025, 1, 1, 0, 0, 0, 500000, tzinfo=timezone.utc)
+
+    def test_unsupported_bounds(self):
+        with pytest.raises(ValueError, match="Unsupported partition bounds"):
+            parse_partition_bounds("FOR VALUES IN (1, 2)")
+
+
+def test_retention_periods():
+    with temporary_settings(
+        {
+            PREFECT_SERVER_EVENTS_RETENTION_PERIOD: timedelta(days=7),
+            PREFECT_SERVER_LOGS_RETENTION_PERIOD: timedelta(days=30),
+        }
+    ):
+        settings = get_current_settings()
+        retention_periods = {
+            table.name: table.retention_period(settings) for table in PARTITIONED_TABLES
+        }
+
+    assert retention_periods == {
+        "events": timedelta(days=7),
+        "event_resources": timedelta(days=7),
+        "log": timedelta(days=30),
+    }
+
+
+def test_logs_are_kept_by_default():
+    table = PartitionedTable("log", "timestamp")
+
+    assert table.retention_period(get_current_settings()) is None
+
+
+async def test_does_nothing_on_sqlite(monkeypatch: pytest.MonkeyPatch):
+    managed = []
+
+    async def manage_table(self, db, table):
+        managed.append(table)
+
+    monkeypatch.setattr(PartitionManager, "manage_table", manage_table)
+
+    with temporary_settings(
+        {PREFECT_API_DATABASE_CONNECTION_URL: "sqlite+aiosqlite:///:memory:"}
+    ):
+        await PartitionManager().start(loops=1)
+
+    assert managed == []
+
+
+class TestPartitioningOnPostgres:
+    """
+    Partitions a table shaped like the partitioned tables, with an index and a
+    foreign key, in the test database.
+    """
+
+    table = PartitionedTable("partition_test_rows", "occurred")
+    interval = timedelta(days=1)
+
+    @pytest.fixture(autouse=True)
+    async def rows_table(self, db: PrefectDBInterface) -> AsyncGenerator[None, None]:
+        if db.database_config.connection_url.startswith("sqlite"):
+            pytest.skip("Partitioning is only supported on PostgreSQL")
+
+        async with db.session_context(begin_transaction=True) as session:
+            await session.execute(
+                sa.text("CREATE TABLE partition_test_parents (id UUID PRIMARY KEY)")
+            )
+            await session.execute(
+                sa.text(
+                    "CREATE TABLE partition_test_rows ("
+                    " id UUID NOT NULL,"
+                    " occurred TIMESTAMP WITH TIME ZONE NOT NULL,"
+                    " parent_id UUID REFERENCES partition_test_parents (id),"
+                    " value TEXT NOT NULL DEFAULT 'default',"
+                    " CONSTRAINT pk_partition_test_rows PRIMARY KEY (id))"
+                )
+            )
+            await session.execute(
+                sa.text(
+                    "CREATE INDEX ix_partition_test_rows__value"
+                    " ON partition_test_rows (value)"
+                )
+            )
+        try:
+            yield
+        finally:
+            async with db.session_context(begin_transaction=True) as session:
+                await session.execute(
+                    sa.text("DROP TABLE IF EXISTS partition_test_rows")
+                )
+                await session.execute(
+                    sa.text("DROP TABLE IF EXISTS partition_test_parents")
+                )
+
+    async def insert(
+        self,
+        db: PrefectDBInterface,
+        occurred: datetime,
+        parent_id: Optional[UUID] = None,
+    ) -> UUID:
+        row_id = uuid4()
+        async with db.session_context(begin_transaction=True) as session:
+            await session.execute(
+                sa.text(
+                    "INSERT INTO partition_test_rows (id, occurred, parent_id)"
+                    " VALUES (:id, :occurred, :parent_id)"
+                ),
+                {"id": row_id, "occurred": occurred, "parent_id": parent_id},
+            )
+        return row_id
+
+    async def rows_by_partition(self, db: PrefectDBInterface) -> dict[UUID, str]:
+        async with db.session_context() as session:
+            result = await session.execute(
+                sa.text("SELECT id, tableoid::regclass::text FROM partition_test_rows")
+            )
+            return dict(result.all())
+
+    async def partitions(self, db: PrefectDBInterface) -> list[Partition]:
+        async with db.session_context(begin_transaction=True) as session:
+            return await read_partitions(session, self.table)
+
+    async def partition(self, db: PrefectDBInterface) -> None:
+        async with db.session_context(begin_transaction=True) as session:
+            await partition_table(session, self.table, self.interval)
+
+    async def test_partitions_a_populated_table(self, db: PrefectDBInterface):
+        parent_id = uuid4()
+        async with db.session_context(begin_transaction=True) as session:
+            await session.execute(
+                sa.text("INSERT INTO partition_test_parents VALUES (:id)"),
+                {"id": parent_id},
+            )
+        current_time = now("UTC")
+        old = await self.insert(db, current_time - timedelta(days=3), parent_id)
+        recent = await self.insert(db, current_time)
+
+        await self.partition(db)
+
+        async with db.session_context() as session:
+            assert await is_partitioned(session, self.table.name)
+        assert await self.rows_by_partition(db) == {
+            old: "partition_test_rows_legacy",
+            recent: "partition_test_rows_legacy",
+        }
+        assert await self.partitions(db) == [
+            Partition(
+                name="partition_test_rows_legacy",
+                start=None,
+                end=partition_start(current_time, self.interval) + self.interval,
+            )
+        ]
+
+        # the foreign key applies to new rows, which go to the default partition
+        future = current_time + timedelta(days=10)
+        assert await self.insert(db, future, parent_id)
+        with pytest.raises(sa.exc.IntegrityError):
+            await self.insert(db, future, uuid4())
+
+        async with db.session_context() as session:
+            result = await session.execute(
+                sa.text(
+                    "SELECT indexname FROM pg_indexes"
+                    " WHERE tablename = 'partition_test_rows'"
+                )
+            )
+            assert set(result.scalars()) == {
+                "pk_partition_test_rows",
+                "ix_partition_test_rows__value",
+            }
+
+    async def test_partitioning_a_partitioned_table_does_nothing(
+        self, db: PrefectDBInterface
+    ):
+        row = await self.insert(db, now("UTC"))
+        await self.partition(db)
+        partitions = await self.partitions(db)
+
+        await self.partition(db)
+
+        assert await self.partitions(db) == partitions
+        assert await self.rows_by_partition(db) == {row: "partition_test_rows_legacy"}
+
+    async def test_create_partition_moves_rows_from_the_default_partition(
+        self, db: PrefectDBInterface
+    ):
+        await self.partition(db)
+        start = partition_start(now("UTC"), self.interval) + 5 * self.interval
+        row = await self.insert(db, start + timedelta(hours=1))
+        assert await self.rows_by_partition(db) == {row: "partition_test_rows_default"}
+
+        for _ in range(2):
+            async with db.session_context(begin_transaction=True) as session:
+                await create_partition(
+                    session, self.table, start, start + self.interval
+                )
+
+        name = partition_name(self.table, start)
+        assert await self.rows_by_partition(db) == {row: name}
+        assert (await self.partitions(db))[-1] == Partition(
+            name=name, start=start, end=start + self.interval
+        )
+
+    async def test_drop_partition(self, db: PrefectDBInterface):
+        await self.partition(db)
+        start = partition_start(now("UTC"), self.interval) + 5 * self.interval
+        async with db.session_context(begin_transaction=True) as session:
+            await create_partition(session, self.table, start, start + self.interval)
+        await self.insert(db, start + timedelta(hours=1))
+        partition = (await self.partitions(db))[-1]
+
+        for _ in range(2):
+            async with db.session_context(begin_transaction=True) as session:
+                await drop_partition(session, partition)
+
+        assert partition not in await self.partitions(db)
+        assert await self.rows_by_partition(db) == {}
+
+    async def test_managing_a_table_again_changes_nothing(self, db: PrefectDBInterface):
+        row = await self.insert(db, now("UTC"))
+        manager = PartitionManager()
+
+        await manager.manage_table(db, self.table)
+        partitions = await self.partitions(db)
+        await manager.manage_table(db, self.table)
+
+        assert await self.partitions(db) == partitions
+        assert len(partitions) == manager.premake + 1
+        assert await self.rows_by_partition(db) == {row: "partition_test_rows_legacy"}
@@ -8,6 +8,7 @@ from prefect.server.services.base import RunInAllServers, Service
 from prefect.server.services.cancellation_cleanup import CancellationCleanup
 from prefect.server.services.foreman import Foreman
 from prefect.server.services.late_runs import MarkLateRuns
+from prefect.server.services.partition_manager import PartitionManager
 from prefect.server.services.pause_expirations import FailExpiredPauses
 from prefect.server.services.scheduler import RecentDeploymentsScheduler, Scheduler
 from prefect.server.services.task_run_recorder import TaskRunRecorder
@@ -24,6 +25,7 @@ def test_the_all_service_subset():
         FailExpiredPauses,
         Foreman,
         MarkLateRuns,
+        PartitionManager,
         RecentDeploymentsScheduler,
         Scheduler,
         TaskRunRecorder,
@@ -6,9 +6,12 @@ from typing import AsyncGenerator
 from uuid import UUID
 
 import pytest
+import sqlalchemy as sa
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from prefect.server.database import PrefectDBInterface
 from prefect.server.events.schemas.events import ReceivedEvent
+from prefect.server.models import run_history_buckets
 from prefect.server.models.flow_runs import create_flow_run
 from prefect.server.models.task_run_states import (
     read_task_run_state,
@@ -748,6 +751,133 @@ async def test_task_run_recorder_handles_all_out_of_order_permutations(
     assert state_types == {StateType.PENDING, StateType.RUNNING, StateType.COMPLETED}
 
 
+@pytest.mark.parametrize(
+    "event_order",
+    list(permutations(["PENDING", "RUNNING", "COMPLETED"])),
+    ids=lambda x: "->".join(x),
+)
+# SQLite versions before 3.35 do not support RETURNING
+@pytest.mark.parametrize("insert_returning", [True, False])
+async def test_task_run_recorder_keeps_run_history_buckets_up_to_date(
+    session: AsyncSession,
+    db: PrefectDBInterface,
+    pending_event: ReceivedEvent,
+    running_event: ReceivedEvent,
+    completed_event: ReceivedEvent,
+    task_run_recorder_handler: MessageHandler,
+    event_order: tuple[str, ...],
+    insert_returning: bool,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    engine = await db.engine()
+    monkeypatch.setattr(engine.dialect, "insert_returning", insert_returning)
+
+    base_time = datetime(2024, 1, 1, 0, 0, 0, 0, tzinfo=timezone.utc)
+    pending_event.occurred = base_time
+    running_event.occurred = base_time + timedelta(minutes=1)
+    completed_event.occurred = base_time + timedelta(minutes=2)
+
+    event_map = {
+        "PENDING": pending_event,
+        "RUNNING": running_event,
+        "COMPLETED": completed_event,
+    }
+    for event_name in event_order:
+        await task_run_recorder_handler(message(event_map[event_name]))
+
+    task_run = await read_task_run(
+        session=session,
+        task_run_id=UUID("aaaaaaaa-aaaa-aaaa-aaaa-aaaaaaaaaaaa"),
+    )
+    assert task_run
+
+    result = await session.execute(
+        sa.select(db.RunHistoryBucket).where(db.RunHistoryBucket.count != 0)
+    )
+    buckets = sorted(
+        (
+            {
+                "run_type": bucket.run_type,
+                "time_field": bucket.time_field,
+                "bucket": bucket.bucket,
+                "state_type": bucket.state_type,
+                "state_name": bucket.state_name,
+                "count": bucket.count,
+                "sum_estimated_run_time": bucket.sum_estimated_run_time,
+                "sum_estimated_lateness": bucket.sum_estimated_lateness,
+            }
+            for bucket in result.scalars()
+        ),
+        key=lambda bucket: bucket["time_field"],
+    )
+    expected = run_history_buckets.run_contributions("task_run", task_run)
+    assert buckets == sorted(expected, key=lambda bucket: bucket["time_field"])
+    if event_order == ("PENDING", "RUNNING", "COMPLETED"):
+        assert len(buckets) == 2
+
+
+async def test_records_states_coalesced_into_one_event(
+    session: AsyncSession,
+    completed_event: ReceivedEvent,
+    task_run_recorder_handler: MessageHandler,
+):
+    pending_transition_time = datetime(2024, 1, 1, 0, 0, 0, 0, tzinfo=timezone.utc)
+    running_transition_time = datetime(2024, 1, 1, 0, 1, 0, 0, tzinfo=timezone.utc)
+    completed_event.payload["previous_states"] = [
+        {
+            "id": "11111111-1111-1111-1111-111111111111",
+            "timestamp": pending_transition_time.isoformat(),
+            "type": "PENDING",
+            "name": "Pending",
+            "message": "Hi there!",
+            "state_details": {},
+        },
+        {
+            "id": "22222222-2222-2222-2222-222222222222",
+            "timestamp": running_transition_time.isoformat(),
+            "type": "RUNNING",
+            "name": "Running",
+            "message": "Weeeeeee look at me go!",
+            "state_details": {},
+        },
+    ]
+
+    await task_run_recorder_handler(message(completed_event))
+
+    task_run = await read_task_run(
+        session=session,
+        task_run_id=UUID("aaaaaaaa-aaaa-aaaa-aaaa-aaaaaaaaaaaa"),
+    )
+
+    assert task_run
+    assert task_run.state_id == UUID("33333333-3333-3333-3333-333333333333")
+    assert task_run.state_type == StateType.COMPLETED
+
+    states = await read_task_run_states(session, task_run.id)
+    assert [(state.id, state.type, state.timestamp) for state in states] == [
+        (
+            UUID("11111111-1111-1111-1111-111111111111"),
+            StateType.PENDING,
+            pending_transition_time,
+        ),
+        (
+            UUID("22222222-2222-2222-2222-222222222222"),
+            StateType.RUNNING,
+            running_transition_time,
+        ),
+        (
+            UUID("33333333-3333-3333-3333-333333333333"),
+            StateType.COMPLETED,
+            completed_event.occurred,
+        ),
+    ]
+    assert all(
+        state.state_details.task_run_id == task_run.id
+        and state.state_details.flow_run_id == task_run.flow_run_id
+        for state in states
+    )
+
+
 async def test_task_run_recorder_sends_repeated_failed_messages_to_dead_letter(
     pending_event: ReceivedEvent,
     tmp_path: Path,
@@ -1,7 +1,9 @@
+import asyncio
 import datetime
 import enum
 import math
 import sqlite3
+from decimal import Decimal
 from typing import Any, Optional, Union
 from unittest import mock
 
@@ -14,7 +16,11 @@ from sqlalchemy.ext.asyncio.engine import AsyncEngine
 from sqlalchemy.orm import Mapped, declarative_base, mapped_column
 
 from prefect.server.database import PrefectDBInterface
-from prefect.server.database.configurations import AioSqliteConfiguration
+from prefect.server.database.configurations import (
+    REPLICA_LAG,
+    AioSqliteConfiguration,
+    AsyncPostgresConfiguration,
+)
 from prefect.server.database.orm_models import AioSqliteORMConfiguration
 from prefect.server.database.query_components import AioSqliteQueryComponents
 from prefect.server.utilities.database import (
@@ -23,6 +29,10 @@ from prefect.server.utilities.database import (
     Timestamp,
     bindparams_from_clause,
 )
+from prefect.settings import (
+    PREFECT_SERVER_DATABASE_SQLITE_SINGLE_WRITER,
+    temporary_settings,
+)
 
 DBBase = declarative_base(type_annotation_map={datetime.datetime: Timestamp})
 
@@ -655,3 +665,186 @@ def test_bind_params_from_clause() -> None:
     bp = sa.bindparam("foo", 42, sa.Integer)
     statement = 17 < bp
     assert bindparams_from_clause(statement) == {"foo": bp}
+
+
+class TestSqliteSingleWriter:
+    @pytest.fixture
+    async def config(self, tmp_path) -> AioSqliteConfiguration:
+        config = AioSqliteConfiguration(
+            connection_url=f"sqlite+aiosqlite:///{tmp_path / 'single-writer.db'}"
+        )
+        engine = await config.engine()
+        async with engine.begin() as connection:
+            await connection.execute(sa.text("CREATE TABLE numbers (value INTEGER)"))
+
+        with temporary_settings({PREFECT_SERVER_DATABASE_SQLITE_SINGLE_WRITER: True}):
+            yield config
+
+    async def insert(self, config: AioSqliteConfiguration, value: int) -> None:
+        session = await config.session(await config.engine())
+        async with session:
+            async with config.begin_transaction(session):
+                await session.execute(
+                    sa.text("INSERT INTO numbers VALUES (:value)"), {"value": value}
+                )
+                if value < 0:
+                    raise ValueError("Negative numbers are not allowed")
+
+    async def numbers(self, config: AioSqliteConfiguration) -> list[int]:
+        engine = await config.engine()
+        async with engine.connect() as connection:
+            result = await connection.execute(
+                sa.text("SELECT value FROM numbers ORDER BY value")
+            )
+            return list(result.scalars())
+
+    async def test_concurrent_transactions_are_committed_together(
+        self, config: AioSqliteConfiguration
+    ):
+        writer = await config.writer()
+        commits: list[object] = []
+        sa.event.listen(writer.engine.sync_engine, "commit", commits.append)
+
+        await asyncio.gather(*(self.insert(config, value) for value in range(20)))
+
+        assert await self.numbers(config) == list(range(20))
+        assert len(commits) < 20
+
+    async def test_failed_transaction_does_not_affect_the_rest_of_its_batch(
+        self, config: AioSqliteConfiguration
+    ):
+        results = await asyncio.gather(
+            *(self.insert(config, value) for value in (1, -1, 2)),
+            return_exceptions=True,
+        )
+
+        assert results[0] is None
+        assert isinstance(results[1], ValueError)
+        assert results[2] is None
+        assert await self.numbers(config) == [1, 2]
+
+    async def test_nested_transactions_do_not_wait_for_the_writer(
+        self, config: AioSqliteConfiguration
+    ):
+        session = await config.session(await config.engine())
+        async with session:
+            async with config.begin_transaction(session):
+                await session.execute(sa.text("INSERT INTO numbers VALUES (1)"))
+                nested = await config.session(await config.engine())
+                async with nested:
+                    async with config.begin_transaction(nested):
+                        await asyncio.wait_for(
+                            nested.execute(sa.text("INSERT INTO numbers VALUES (2)")),
+                            timeout=5,
+                        )
+
+        assert await self.numbers(config) == [1, 2]
+
+    async def test_failed_nested_transactions_do_not_affect_the_outer_transaction(
+        self, config: AioSqliteConfiguration
+    ):
+        session = await config.session(await config.engine())
+        async with session:
+            async with config.begin_transaction(session):
+                await session.execute(sa.text("INSERT INTO numbers VALUES (1)"))
+                with pytest.raises(ValueError):
+                    await self.insert(config, -1)
+
+        assert await self.numbers(config) == [1]
+
+    async def test_transactions_fail_and_the_writer_reconnects_when_its_connection_fails(
+        self, config: AioSqliteConfiguration, monkeypatch: pytest.MonkeyPatch
+    ):
+        writer = await config.writer()
+        engine = mock.Mock(wraps=writer.engine)
+        engine.connect.side_effect = [
+            OSError("unable to open database file"),
+            writer.engine.connect(),
+        ]
+        monkeypatch.setattr(writer, "engine", engine)
+
+        with pytest.raises(OSError, match="unable to open database file"):
+            await asyncio.wait_for(self.insert(config, 1), timeout=5)
+        await asyncio.wait_for(self.insert(config, 2), timeout=5)
+
+        assert await self.numbers(config) == [2]
+
+
+class TestReadReplica:
+    @pytest.fixture(autouse=True)
+    def clear_replica_lag(self):
+        REPLICA_LAG.clear()
+        yield
+        REPLICA_LAG.clear()
+
+    @pytest.fixture
+    def config(self) -> AsyncPostgresConfiguration:
+        return AsyncPostgresConfiguration(
+            connection_url="postgresql+asyncpg://primary/prefect",
+            read_replica_connection_url="postgresql+asyncpg://replica/prefect",
+            read_replica_max_lag=5.0,
+        )
+
+    async def test_reads_from_the_replica_when_it_is_caught_up(
+        self, config: AsyncPostgresConfiguration, monkeypatch: pytest.MonkeyPatch
+    ):
+        monkeypatch.setattr(config, "replica_lag", mock.AsyncMock(return_value=1.0))
+
+        engine = await config.read_only_engine()
+
+        assert engine.url.host == "replica"
+
+    @pytest.mark.parametrize("lag", [10.0, None])
+    async def test_reads_fall_back_to_the_primary(
+        self,
+        config: AsyncPostgresConfiguration,
+        monkeypatch: pytest.MonkeyPatch,
+        lag: Optional[float],
+    ):
+        monkeypatch.setattr(config, "replica_lag", mock.AsyncMock(return_value=lag))
+
+        engine = await config.read_only_engine()
+
+        assert engine is await config.engine()
+        assert engine.url.host == "primary"
+
+    async def test_reads_from_the_primary_without_a_replica(self):
+        config = AsyncPostgresConfiguration(
+            connection_url="postgresql+asyncpg://primary/prefect"
+        )
+
+        assert await config.read_only_engine() is await config.engine()
+
+    async def test_unreachable_replica_is_checked_periodically(
+        self, config: AsyncPostgresConfiguration
+    ):
+        replica = mock.MagicMock()
+        replica.connect.side_effect = OSError("replica is down")
+
+        assert await config.replica_lag(replica) is None
+        assert await config.replica_lag(replica) is None
+        assert replica.connect.call_count == 1
+
+    @pytest.mark.parametrize("lag, expected", [(Decimal("1.5"), 1.5), (None, None)])
+    async def test_replica_lag_is_read_from_the_replica(
+        self,
+        config: AsyncPostgresConfiguration,
+        lag: Optional[Decimal],
+        expected: Optional[float],
+    ):
+        # a replica that isn't streaming from the primary can't know how far
+        # behind it is, so the check reports no lag at all
+        replica = mock.MagicMock()
+        connection = replica.connect.return_value.__aenter__.return_value
+        connection.execute = mock.AsyncMock(
+            return_value=mock.Mock(**{"scalar_one.return_value": lag})
+        )
+
+        assert await config.replica_lag(replica) == expected
+
+        (statement,), _ = connection.execute.call_args
+        assert "pg_stat_wal_receiver" in str(statement)
+
+    async def test_sqlite_reads_from_the_primary(self, db: PrefectDBInterface):
+        async with db.read_only_session_context() as session:
+            assert session.bind is await db.engine()
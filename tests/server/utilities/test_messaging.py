@@ -11,6 +11,7 @@ from typing import (
     Generator,
     Optional,
 )
+from unittest import mock
 
 import anyio
 import pytest
@@ -28,13 +29,18 @@ from prefect.server.utilities.messaging import (
     create_cache,
     create_consumer,
     create_publisher,
+    decode_message,
     ephemeral_subscription,
 )
 from prefect.server.utilities.messaging.memory import (
-    Consumer as MemoryConsumer,
+    METRICS,
+    MemoryMessage,
+    SpillSegment,
+    Subscription,
+    Topic,
 )
 from prefect.server.utilities.messaging.memory import (
-    MemoryMessage,
+    Consumer as MemoryConsumer,
 )
 from prefect.settings import (
     PREFECT_MESSAGING_BROKER,
@@ -535,6 +541,51 @@ async def test_can_be_used_as_event_publisher(broker: str, cache: Cache):
     assert captured_events == [emitted_event]
 
 
+async def test_events_are_decoded_once_for_all_consumers(broker: str, cache: Cache):
+    async with (
+        ephemeral_subscription("events") as first_kwargs,
+        ephemeral_subscription("events") as second_kwargs,
+    ):
+        captured_events: list[ReceivedEvent] = []
+
+        async def handler(message: Message):
+            captured_events.append(decode_message(message, ReceivedEvent))
+            raise StopConsumer(ack=True)
+
+        consumer_tasks = [
+            asyncio.create_task(create_consumer(**kwargs).run(handler))
+            for kwargs in (first_kwargs, second_kwargs)
+        ]
+
+        event = ReceivedEvent(
+            id=uuid.uuid4(),
+            occurred=datetime.now(tz=timezone.utc),
+            event="testing",
+            resource=Resource({"prefect.resource.id": "testing"}),
+        )
+        async with EventPublisher() as publisher:
+            await publisher.publish_event(event)
+        await asyncio.gather(*consumer_tasks)
+
+    assert captured_events == [event, event]
+    assert all(captured is event for captured in captured_events)
+
+
+def test_decode_message_validates_data_without_decoded_object():
+    event = ReceivedEvent(
+        id=uuid.uuid4(),
+        occurred=datetime.now(tz=timezone.utc),
+        event="testing",
+        resource=Resource({"prefect.resource.id": "testing"}),
+    )
+    message = MemoryMessage(event.model_dump_json().encode(), {})
+
+    decoded = decode_message(message, ReceivedEvent)
+
+    assert decoded == event
+    assert decoded is not event
+
+
 @pytest.mark.usefixtures("broker", "clear_topics")
 @pytest.mark.parametrize("concurrency,num_messages", [(2, 4), (4, 8)])
 async def test_concurrent_consumers_process_messages(
@@ -600,3 +651,133 @@ async def test_concurrent_consumers_process_messages(
         assert actual_indices == expected_indices, (
             f"Consumer {consumer_id} should process messages {expected_indices}"
         )
+
+
+async def test_full_subscription_blocks_publisher_until_consumed():
+    topic = Topic("bounded-topic")
+    subscription = topic.subscribe(capacity=1, overflow_policy="block")
+
+    await topic.publish(MemoryMessage(b"first", {}))
+    publishing = asyncio.create_task(topic.publish(MemoryMessage(b"second", {})))
+    await asyncio.sleep(0.1)
+    assert not publishing.done()
+
+    assert (await subscription.get()).data == b"first"
+    await asyncio.wait_for(publishing, timeout=1)
+    assert (await subscription.get()).data == b"second"
+
+
+async def test_full_subscription_drops_oldest_message():
+    topic = Topic("bounded-topic")
+    subscription = topic.subscribe(capacity=2, overflow_policy="drop_oldest")
+
+    for data in (b"first", b"second", b"third"):
+        await topic.publish(MemoryMessage(data, {}))
+
+    assert subscription.depth == 2
+    assert (await subscription.get()).data == b"second"
+    assert (await subscription.get()).data == b"third"
+
+
+async def test_full_subscription_spills_messages_to_disk_in_order(tmp_path: Path):
+    topic = Topic("bounded-topic")
+    subscription = topic.subscribe(
+        capacity=2, overflow_policy="spill", spill_path=tmp_path
+    )
+
+    for i in range(5):
+        await topic.publish(MemoryMessage(f"message-{i}".encode(), {"index": str(i)}))
+    assert subscription.depth == 5
+    assert len(list(tmp_path.glob("*.segment"))) == 1
+
+    # a message delivered while others are spilled waits behind them
+    received = [await subscription.get() for _ in range(3)]
+    await topic.publish(MemoryMessage(b"message-5", {"index": "5"}))
+    received += [await subscription.get() for _ in range(3)]
+
+    assert [message.attributes["index"] for message in received] == [
+        str(i) for i in range(6)
+    ]
+    assert subscription.depth == 0
+
+    topic.unsubscribe(subscription)
+    assert not list(tmp_path.glob("*.segment"))
+
+
+async def test_concurrent_reads_of_spilled_messages_receive_each_once(
+    tmp_path: Path,
+):
+    topic = Topic("bounded-topic")
+    subscription = topic.subscribe(
+        capacity=1, overflow_policy="spill", spill_path=tmp_path
+    )
+
+    for i in range(4):
+        await topic.publish(MemoryMessage(f"message-{i}".encode(), {"index": str(i)}))
+    received = await asyncio.wait_for(
+        asyncio.gather(*(subscription.get() for _ in range(4))), timeout=5
+    )
+
+    assert sorted(message.attributes["index"] for message in received) == [
+        str(i) for i in range(4)
+    ]
+    assert subscription.depth == 0
+
+
+async def test_handlers_publishing_to_their_own_full_subscription_do_not_block(
+    tmp_path: Path,
+):
+    topic = Topic.by_name("bounded-topic")
+    subscription = topic.subscribe(
+        capacity=1, overflow_policy="block", spill_path=tmp_path
+    )
+    consumer = MemoryConsumer("bounded-topic", subscription=subscription, concurrency=1)
+    received: list[str] = []
+
+    async def handler(message: Message):
+        received.append(message.attributes["name"])
+        if message.attributes["name"] == "first":
+            # the queue only has room for one of these, and this consumer is the
+            # only one that could make room for the other
+            await topic.publish(MemoryMessage(b"second", {"name": "second"}))
+            await topic.publish(MemoryMessage(b"third", {"name": "third"}))
+        elif len(received) == 3:
+            raise StopConsumer(ack=True)
+
+    try:
+        await topic.publish(MemoryMessage(b"first", {"name": "first"}))
+        await asyncio.wait_for(consumer.run(handler), timeout=5)
+    finally:
+        Topic.clear_all()
+
+    assert received == ["first", "second", "third"]
+
+
+async def test_messages_that_fail_to_spill_are_not_counted_as_published(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    topic = Topic("unspillable-topic")
+    subscription = topic.subscribe(
+        capacity=1, overflow_policy="spill", spill_path=tmp_path
+    )
+    monkeypatch.setattr(SpillSegment, "_write", mock.Mock(side_effect=OSError))
+    monkeypatch.delitem(METRICS, "unspillable-topic", raising=False)
+
+    await topic.publish(MemoryMessage(b"first", {}))
+    await topic.publish(MemoryMessage(b"second", {}))
+
+    assert subscription.depth == 1
+    assert METRICS["unspillable-topic"]["published"] == 1
+    assert METRICS["unspillable-topic"]["dropped"] == 1
+    assert (await subscription.get()).data == b"first"
+
+
+def test_clearing_a_topic_closes_every_subscription(tmp_path: Path):
+    topic = Topic("cleared-topic")
+    subscriptions = [topic.subscribe(spill_path=tmp_path) for _ in range(3)]
+
+    with mock.patch.object(Subscription, "close") as close:
+        topic.clear()
+
+    assert close.call_count == len(subscriptions)
+    assert not topic._subscriptions
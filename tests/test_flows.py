@@ -1,6 +1,7 @@
 import asyncio
 import datetime
 import enum
+import gc
 import inspect
 import os
 import signal
@@ -9,6 +10,7 @@ import threading
 import time
 import uuid
 import warnings
+import weakref
 from functools import partial
 from itertools import combinations
 from pathlib import Path
@@ -19,6 +21,7 @@ from unittest.mock import ANY, MagicMock, call, create_autospec
 from zoneinfo import ZoneInfo
 
 import anyio
+import cloudpickle
 import pydantic
 import pytest
 import regex as re
@@ -26,6 +29,7 @@ import regex as re
 import prefect
 import prefect.exceptions
 from prefect import flow, runtime, tags, task
+from prefect._internal.pydantic.v2_validated_func import V2ValidatedFunction
 from prefect._versioning import GitVersionInfo, VersionInfo, VersionType
 from prefect.blocks.core import Block
 from prefect.client.orchestration import PrefectClient, SyncPrefectClient, get_client
@@ -51,11 +55,13 @@ from prefect.exceptions import (
     ParameterTypeError,
     ReservedArgumentError,
     ScriptError,
+    SignatureMismatchError,
     UnfinishedRun,
 )
 from prefect.filesystems import LocalFileSystem
 from prefect.flows import (
     Flow,
+    get_parameter_validation,
     load_flow_arguments_from_entrypoint,
     load_flow_from_entrypoint,
     load_flow_from_flow_run,
@@ -66,6 +72,7 @@ from prefect.logging import get_run_logger
 from prefect.results import ResultRecord
 from prefect.runtime import flow_run as flow_run_ctx
 from prefect.schedules import Cron, Interval, RRule, Schedule
+from prefect.serializers import PickleSerializer
 from prefect.server.schemas.filters import FlowFilter, FlowRunFilter
 from prefect.server.schemas.sorting import FlowRunSort
 from prefect.settings import (
@@ -1815,6 +1822,81 @@ class TestFlowParameterTypes:
 
         assert my_flow(keys="hello") == "hello"
 
+    def test_flow_parameters_of_simple_types_skip_validation(self, monkeypatch):
+        init_model_instance = MagicMock()
+        monkeypatch.setattr(
+            V2ValidatedFunction, "init_model_instance", init_model_instance
+        )
+
+        @flow
+        def my_flow(x: int, y: str = "foo", z: float = 1.0):
+            return x, y, z
+
+        assert my_flow.validate_parameters({"x": 1, "z": 2.0}) == {"x": 1, "z": 2.0}
+        init_model_instance.assert_not_called()
+
+    @pytest.mark.parametrize(
+        "parameters, expected",
+        [
+            ({"x": "1"}, {"x": 1}),
+            ({"x": True}, {"x": 1}),
+            ({"x": 1.0, "y": "bar"}, {"x": 1, "y": "bar"}),
+        ],
+    )
+    def test_flow_parameters_of_other_types_are_validated(self, parameters, expected):
+        @flow
+        def my_flow(x: int, y: str = "foo"):
+            return x, y
+
+        assert my_flow.validate_parameters(parameters) == expected
+
+    @pytest.mark.parametrize(
+        "parameters, error",
+        [({}, ParameterTypeError), ({"x": 1, "extra": 2}, SignatureMismatchError)],
+    )
+    def test_flow_parameters_of_simple_types_still_check_signature(
+        self, parameters, error
+    ):
+        @flow
+        def my_flow(x: int):
+            return x
+
+        with pytest.raises(error):
+            my_flow.validate_parameters(parameters)
+
+    def test_parameter_validation_is_cached_per_function(self):
+        def my_function(x: int):
+            return x
+
+        validation = get_parameter_validation(my_function)
+        assert get_parameter_validation(my_function) is validation
+
+        my_function.__annotations__["x"] = float
+        assert get_parameter_validation(my_function) is not validation
+        validated = flow(my_function).validate_parameters({"x": 1})
+        assert validated == {"x": 1.0} and type(validated["x"]) is float
+
+    def test_parameter_validation_does_not_keep_functions_alive(self):
+        def my_function(x: int):
+            return x
+
+        get_parameter_validation(my_function).validated_function(my_function)
+        function_ref = weakref.ref(my_function)
+        del my_function
+        gc.collect()
+
+        assert function_ref() is None
+
+    def test_functions_with_cached_parameter_validation_can_be_pickled(self):
+        def my_function(x: int):
+            return x
+
+        get_parameter_validation(my_function).validated_function(my_function)
+        unpickled = cloudpickle.loads(cloudpickle.dumps(my_function))
+
+        assert unpickled(1) == 1
+        assert flow(unpickled).validate_parameters({"x": "1"}) == {"x": 1}
+
 
 class TestSubflowTaskInputs:
     async def test_subflow_with_one_upstream_task_future(self, prefect_client):
@@ -5457,7 +5539,7 @@ class TestTransactions:
         assert isinstance(val, ValueError)
         assert "does not exist" in str(val)
         content = result_storage.read_path("task1-result-A", _sync=True)
-        record = ResultRecord.deserialize(content)
+        record = ResultRecord.deserialize(content, backup_serializer=PickleSerializer())
         assert record.result == {"some": "data"}
 
     def test_commit_isnt_called_on_rollback(self):
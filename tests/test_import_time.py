@@ -0,0 +1,73 @@
+"""
+Guards against regressions in the time it takes to import Prefect.
+
+Imports are measured in a fresh interpreter, since this test session has already
+imported most of Prefect. Wall-clock import times vary too much between machines to
+assert on, so each import is instead budgeted by the number of modules it loads.
+"""
+
+import json
+import subprocess
+import sys
+
+import pytest
+
+# The number of modules each import may load, set just above what they load
+# today; raise a budget only when new modules are needed on the import path
+IMPORT_MODULE_BUDGETS = {
+    "import prefect": 5,
+    "from prefect import flow, task": 1200,
+}
+
+# Modules that are slow to import and only needed for specific features
+DEFERRED_MODULES = [
+    "prefect.server",
+    "prefect.deployments",
+    "prefect.cli",
+    "dateparser",
+    "griffe",
+    "pandas",
+]
+
+MEASURE_IMPORT = """
+import json
+import sys
+
+before = set(sys.modules)
+{statement}
+
+print(json.dumps(sorted(set(sys.modules) - before)))
+"""
+
+
+def measure_import(statement: str) -> list[str]:
+    """
+    Returns the modules loaded by the import statement.
+    """
+    output = subprocess.check_output(
+        [sys.executable, "-c", MEASURE_IMPORT.format(statement=statement)],
+        text=True,
+    )
+    return json.loads(output.strip().splitlines()[-1])
+
+
+@pytest.mark.parametrize("statement", IMPORT_MODULE_BUDGETS)
+def test_import_does_not_load_deferred_modules(statement: str):
+    modules = measure_import(statement)
+
+    loaded = [
+        module
+        for module in modules
+        for deferred in DEFERRED_MODULES
+        if module == deferred or module.startswith(f"{deferred}.")
+    ]
+    assert not loaded, f"{statement!r} imported deferred modules: {loaded}"
+
+
+@pytest.mark.parametrize("statement, budget", IMPORT_MODULE_BUDGETS.items())
+def test_import_loads_modules_within_budget(statement: str, budget: int):
+    loaded = len(measure_import(statement))
+
+    assert loaded <= budget, (
+        f"{statement!r} loaded {loaded} modules, which exceeds its budget of {budget}"
+    )
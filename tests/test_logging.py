@@ -39,6 +39,7 @@ from prefect.logging.formatters import JsonFormatter
 from prefect.logging.handlers import (
     APILogHandler,
     APILogWorker,
+    EncodedLog,
     PrefectConsoleHandler,
     WorkerAPILogHandler,
 )
@@ -64,6 +65,7 @@ from prefect.settings import (
     PREFECT_LOGGING_SETTINGS_PATH,
     PREFECT_LOGGING_TO_API_BATCH_INTERVAL,
     PREFECT_LOGGING_TO_API_BATCH_SIZE,
+    PREFECT_LOGGING_TO_API_COMPRESS,
     PREFECT_LOGGING_TO_API_ENABLED,
     PREFECT_LOGGING_TO_API_MAX_LOG_SIZE,
     PREFECT_LOGGING_TO_API_WHEN_MISSING_FLOW,
@@ -350,6 +352,14 @@ def mock_log_worker(monkeypatch: pytest.MonkeyPatch):
     return mock
 
 
+def sent_logs(mock_log_worker: MagicMock) -> list[dict[str, Any]]:
+    """The logs sent to the mocked log worker, decoded from their payloads"""
+    return [
+        json.loads(call.args[0].payload)
+        for call in mock_log_worker.instance().send.call_args_list
+    ]
+
+
 @pytest.mark.enable_api_log_handler
 class TestAPILogHandler:
     @pytest.fixture
@@ -442,9 +452,8 @@ class TestAPILogHandler:
             message="test-task",
         ).model_dump(mode="json")
         expected["timestamp"] = ANY  # Tested separately
-        expected["__payload_size__"] = ANY  # Tested separately
 
-        mock_log_worker.instance().send.assert_called_once_with(expected)
+        assert sent_logs(mock_log_worker) == [expected]
 
     def test_sends_flow_run_log_to_worker(
         self, logger: logging.Logger, mock_log_worker: MagicMock, flow_run: "FlowRun"
@@ -460,9 +469,8 @@ class TestAPILogHandler:
             message="test-flow",
         ).model_dump(mode="json")
         expected["timestamp"] = ANY  # Tested separately
-        expected["__payload_size__"] = ANY  # Tested separately
 
-        mock_log_worker.instance().send.assert_called_once_with(expected)
+        assert sent_logs(mock_log_worker) == [expected]
 
     @pytest.mark.parametrize("with_context", [True, False])
     def test_respects_explicit_flow_run_id(
@@ -489,9 +497,8 @@ class TestAPILogHandler:
             message="test-task",
         ).model_dump(mode="json")
         expected["timestamp"] = ANY  # Tested separately
-        expected["__payload_size__"] = ANY  # Tested separately
 
-        mock_log_worker.instance().send.assert_called_once_with(expected)
+        assert sent_logs(mock_log_worker) == [expected]
 
     @pytest.mark.parametrize("with_context", [True, False])
     def test_respects_explicit_task_run_id(
@@ -520,9 +527,8 @@ class TestAPILogHandler:
             message="test-task",
         ).model_dump(mode="json")
         expected["timestamp"] = ANY  # Tested separately
-        expected["__payload_size__"] = ANY  # Tested separately
 
-        mock_log_worker.instance().send.assert_called_once_with(expected)
+        assert sent_logs(mock_log_worker) == [expected]
 
     def test_does_not_emit_logs_below_level(
         self, logger: logging.Logger, mock_log_worker: MagicMock
@@ -556,7 +562,7 @@ class TestAPILogHandler:
             logger.info("test-flow")
 
         record = handler.emit.call_args[0][0]
-        log_dict = mock_log_worker.instance().send.call_args[0][0]
+        (log_dict,) = sent_logs(mock_log_worker)
         timestamp = log_dict["timestamp"]
 
         if sys.version_info < (3, 11):
@@ -588,7 +594,7 @@ class TestAPILogHandler:
         with FlowRunContext.model_construct(flow_run=flow_run):
             logger.info("test-flow")
 
-        log_dict = mock_log_worker.instance().send.call_args[0][0]
+        (log_dict,) = sent_logs(mock_log_worker)
 
         timestamp = log_dict["timestamp"]
 
@@ -781,7 +787,7 @@ class TestAPILogHandler:
         monkeypatch: pytest.MonkeyPatch,
     ):
         monkeypatch.setattr(
-            "prefect.logging.handlers.APILogHandler.prepare",
+            "prefect.logging.handlers.APILogHandler._prepare_log",
             MagicMock(side_effect=RuntimeError("Oh no!")),
         )
         # No error raised
@@ -824,6 +830,53 @@ class TestAPILogHandler:
         assert "ValueError" in output.err
         assert "is greater than the max size of 1" in output.err
 
+    def test_sends_logs_encoded_once(
+        self,
+        logger: logging.Logger,
+        mock_log_worker: MagicMock,
+        flow_run: "FlowRun",
+        task_run: "TaskRun",
+        handler: APILogHandler,
+    ):
+        handler.emit = MagicMock(side_effect=handler.emit)
+
+        logger.info(
+            "test-task \u2603",
+            extra={"flow_run_id": flow_run.id, "task_run_id": str(task_run.id)},
+        )
+
+        record = handler.emit.call_args[0][0]
+        # only the encoded log is queued
+        (log,) = mock_log_worker.instance().send.call_args[0]
+        assert isinstance(log, EncodedLog)
+        log_dict = json.loads(log.payload)
+
+        # the log matches the schema without being validated by it
+        assert log_dict == LogCreate(
+            flow_run_id=flow_run.id,
+            task_run_id=task_run.id,
+            name=logger.name,
+            level=logging.INFO,
+            message="test-task \u2603",
+            timestamp=from_timestamp(record.created),
+        ).model_dump(mode="json")
+        assert log.size == len(log.payload.encode())
+
+    def test_does_not_send_logs_with_malformed_run_ids(
+        self,
+        logger: logging.Logger,
+        mock_log_worker: MagicMock,
+        flow_run: "FlowRun",
+        capsys: pytest.CaptureFixture[str],
+    ):
+        logger.info(
+            "test-task",
+            extra={"flow_run_id": flow_run.id, "task_run_id": "not-a-uuid"},
+        )
+
+        mock_log_worker.instance().send.assert_not_called()
+        assert "validation error" in capsys.readouterr().err
+
     def test_handler_knows_how_large_logs_are(self):
         dict_log = {
             "name": "prefect.flow_runs",
@@ -837,7 +890,7 @@ class TestAPILogHandler:
         log_size = len(json.dumps(dict_log))
         assert log_size == 211
         handler = APILogHandler()
-        assert handler._get_payload_size(dict_log) == log_size  # type: ignore[reportPrivateUsage]
+        assert handler._encode_log(dict_log) == EncodedLog(json.dumps(dict_log), 211)  # type: ignore[reportPrivateUsage]
 
 
 WORKER_ID = uuid.uuid4()
@@ -934,8 +987,7 @@ class TestWorkerLogging:
 
         log_statement = [
             log
-            for call in mock_log_worker.instance().send.call_args_list
-            for log in call.args
+            for log in sent_logs(mock_log_worker)
             if log["name"] == worker._logger.name
             and log["message"] == "test-worker-log"
         ]
@@ -1038,21 +1090,24 @@ class TestAPILogWorker:
             "prefect.client.orchestration.PrefectClient.create_logs", mock_create_logs
         )
 
-        log_size = APILogHandler()._get_payload_size(log_dict)
+        log = APILogHandler()._encode_log(log_dict)  # type: ignore[reportPrivateUsage]
 
         with temporary_settings(
             updates={
-                PREFECT_LOGGING_TO_API_BATCH_SIZE: log_size + 1,
-                PREFECT_LOGGING_TO_API_MAX_LOG_SIZE: log_size,
+                PREFECT_LOGGING_TO_API_BATCH_SIZE: log.size + 1,
+                PREFECT_LOGGING_TO_API_MAX_LOG_SIZE: log.size,
             }
         ):
             worker = APILogWorker.instance()
-            worker.send(log_dict)
-            worker.send(log_dict)
-            worker.send(log_dict)
+            worker.send(log)
+            worker.send(log)
+            worker.send(log)
             await worker.drain()
 
+        # each batch holds one log, sent as it was encoded
         assert mock_create_logs.call_count == 3
+        for call in mock_create_logs.call_args_list:
+            assert call.args == ([log.payload],)
 
     async def test_logs_are_sent_immediately_when_stopped(
         self, log_dict: dict[str, Any], prefect_client: PrefectClient
@@ -1094,6 +1149,37 @@ class TestAPILogWorker:
         logs = await prefect_client.read_logs()
         assert len(logs) == 2
 
+    async def test_send_encoded_logs(
+        self,
+        prefect_client: PrefectClient,
+        worker: APILogWorker,
+        flow_run: "FlowRun",
+    ):
+        record = logging.LogRecord(
+            "test.logger", logging.INFO, __file__, 1, "hello", None, None
+        )
+        record.flow_run_id = flow_run.id
+
+        worker.send(APILogHandler().prepare(record))
+        await worker.drain()
+
+        logs = await prefect_client.read_logs()
+        assert len(logs) == 1
+        assert logs[0].flow_run_id == flow_run.id
+        assert logs[0].message == "hello"
+
+    async def test_send_compressed_logs(
+        self, log_dict: dict[str, Any], prefect_client: PrefectClient
+    ):
+        with temporary_settings(updates={PREFECT_LOGGING_TO_API_COMPRESS: True}):
+            worker = APILogWorker.instance()
+            worker.send(log_dict)
+            await worker.drain()
+
+        logs = await prefect_client.read_logs()
+        assert len(logs) == 1
+        assert logs[0].model_dump(include=log_dict.keys(), mode="json") == log_dict
+
     async def test_logs_include_worker_id_if_available(
         self, worker: APILogWorker, log_dict: dict[str, Any]
     ):
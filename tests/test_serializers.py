@@ -10,6 +10,7 @@ import pytest
 from pydantic import BaseModel, ValidationError, field_validator
 
 from prefect.serializers import (
+    ArrowSerializer,
     CompressedSerializer,
     JSONSerializer,
     PickleSerializer,
@@ -434,3 +435,58 @@ class TestCompressedSerializer:
         serializer = Serializer(type="compressed/json")
         assert isinstance(serializer, CompressedSerializer)
         assert isinstance(serializer.serializer, JSONSerializer)
+
+
+class TestArrowSerializer:
+    @pytest.fixture(autouse=True)
+    def pyarrow(self):
+        return pytest.importorskip("pyarrow")
+
+    @pytest.mark.parametrize("format", ["ipc", "parquet"])
+    def test_pyarrow_table_roundtrip(self, pyarrow, format):
+        table = pyarrow.table({"x": [1, 2, 3], "y": ["a", "b", "c"]})
+        serializer = ArrowSerializer(format=format)
+        assert serializer.loads(serializer.dumps(table)).equals(table)
+
+    @pytest.mark.parametrize("format", ["ipc", "parquet"])
+    def test_pandas_roundtrip(self, format):
+        pd = pytest.importorskip("pandas")
+        df = pd.DataFrame({"x": [1, 2, 3], "y": ["a", "b", "c"]}, index=[3, 4, 5])
+        serializer = ArrowSerializer(format=format)
+        assert serializer.loads(serializer.dumps(df)).equals(df)
+
+    def test_numpy_roundtrip_preserves_shape(self):
+        np = pytest.importorskip("numpy")
+        array = np.arange(12, dtype="float64").reshape(3, 4)
+        serializer = ArrowSerializer()
+        loaded = serializer.loads(serializer.dumps(array))
+        assert loaded.shape == (3, 4)
+        assert (loaded == array).all()
+
+    def test_compression(self, pyarrow):
+        table = pyarrow.table({"x": [1] * 10_000})
+        serializer = ArrowSerializer(compression="zstd")
+        blob = serializer.dumps(table)
+        assert len(blob) < len(ArrowSerializer().dumps(table))
+        assert serializer.loads(blob).equals(table)
+
+    def test_load_path_memory_maps_file(self, pyarrow, tmp_path):
+        table = pyarrow.table({"x": list(range(100))})
+        path = tmp_path / "data.arrow"
+        path.write_bytes(ArrowSerializer().dumps(table))
+        assert ArrowSerializer().load_path(path).equals(table)
+
+    def test_stores_metadata_alongside_data(self, pyarrow):
+        table = pyarrow.table({"x": [1, 2, 3]})
+        blob = ArrowSerializer().dumps_with_metadata(table, metadata=b"hello")
+        assert ArrowSerializer.read_result_record_metadata(blob) == b"hello"
+        # the metadata is not exposed on the loaded data
+        assert ArrowSerializer().loads(blob).equals(table)
+
+    def test_unsupported_type(self):
+        with pytest.raises(TypeError, match="Arrow serializer supports"):
+            ArrowSerializer().dumps({"foo": "bar"})
+
+    def test_arrow_shorthand(self):
+        serializer = Serializer(type="arrow")
+        assert isinstance(serializer, ArrowSerializer)
@@ -270,6 +270,7 @@ SUPPORTED_SETTINGS = {
     },
     "PREFECT_LOGGING_TO_API_BATCH_INTERVAL": {"test_value": 10.0},
     "PREFECT_LOGGING_TO_API_BATCH_SIZE": {"test_value": 5_000_000},
+    "PREFECT_LOGGING_TO_API_COMPRESS": {"test_value": True},
     "PREFECT_LOGGING_TO_API_ENABLED": {"test_value": True},
     "PREFECT_LOGGING_TO_API_MAX_LOG_SIZE": {"test_value": 10},
     "PREFECT_LOGGING_TO_API_WHEN_MISSING_FLOW": {"test_value": "ignore"},
@@ -280,8 +281,15 @@ SUPPORTED_SETTINGS = {
     "PREFECT_PROFILES_PATH": {"test_value": Path("/path/to/profiles.toml")},
     "PREFECT_RESULTS_DEFAULT_SERIALIZER": {"test_value": "serializer"},
     "PREFECT_RESULTS_DEFAULT_STORAGE_BLOCK": {"test_value": "block"},
+    "PREFECT_RESULTS_LOCAL_CACHE_ENABLED": {"test_value": True},
+    "PREFECT_RESULTS_LOCAL_CACHE_MAX_SIZE": {"test_value": 1024},
+    "PREFECT_RESULTS_LOCAL_CACHE_PATH": {"test_value": Path("/path/to/cache")},
     "PREFECT_RESULTS_LOCAL_STORAGE_PATH": {"test_value": Path("/path/to/storage")},
+    "PREFECT_RESULTS_MEMORY_CACHE_MAX_SIZE": {"test_value": 10},
     "PREFECT_RESULTS_PERSIST_BY_DEFAULT": {"test_value": True},
+    "PREFECT_RESULTS_WRITE_BEHIND": {"test_value": True},
+    "PREFECT_RESULTS_WRITE_BEHIND_MAX_CONCURRENCY": {"test_value": 8},
+    "PREFECT_RESULTS_WRITE_BEHIND_MAX_PENDING": {"test_value": 10},
     "PREFECT_RUNNER_HEARTBEAT_FREQUENCY": {"test_value": 30},
     "PREFECT_RUNNER_POLL_FREQUENCY": {"test_value": 10},
     "PREFECT_RUNNER_PROCESS_LIMIT": {"test_value": 10},
@@ -303,6 +311,7 @@ SUPPORTED_SETTINGS = {
     "PREFECT_SERVER_API_HOST": {"test_value": "host"},
     "PREFECT_SERVER_API_KEEPALIVE_TIMEOUT": {"test_value": 10},
     "PREFECT_SERVER_API_PORT": {"test_value": 4200},
+    "PREFECT_SERVER_API_READ_CACHE_TTL": {"test_value": 5.0},
     "PREFECT_SERVER_CORS_ALLOWED_HEADERS": {"test_value": "foo", "legacy": True},
     "PREFECT_SERVER_CORS_ALLOWED_METHODS": {"test_value": "foo", "legacy": True},
     "PREFECT_SERVER_CORS_ALLOWED_ORIGINS": {"test_value": "foo", "legacy": True},
@@ -320,6 +329,10 @@ SUPPORTED_SETTINGS = {
     "PREFECT_SERVER_DATABASE_NAME": {"test_value": "prefect"},
     "PREFECT_SERVER_DATABASE_PASSWORD": {"test_value": "password"},
     "PREFECT_SERVER_DATABASE_PORT": {"test_value": 5432},
+    "PREFECT_SERVER_DATABASE_READ_REPLICA_CONNECTION_URL": {
+        "test_value": "postgresql+asyncpg://replica/prefect"
+    },
+    "PREFECT_SERVER_DATABASE_READ_REPLICA_MAX_LAG": {"test_value": 10.0},
     "PREFECT_SERVER_DATABASE_SQLALCHEMY_CONNECT_ARGS_APPLICATION_NAME": {
         "test_value": "prefect"
     },
@@ -342,11 +355,13 @@ SUPPORTED_SETTINGS = {
     "PREFECT_SERVER_DATABASE_SQLALCHEMY_POOL_RECYCLE": {"test_value": 10},
     "PREFECT_SERVER_DATABASE_SQLALCHEMY_POOL_SIZE": {"test_value": 10},
     "PREFECT_SERVER_DATABASE_SQLALCHEMY_POOL_TIMEOUT": {"test_value": 10.0},
+    "PREFECT_SERVER_DATABASE_SQLITE_SINGLE_WRITER": {"test_value": True},
     "PREFECT_SERVER_DATABASE_TIMEOUT": {"test_value": 10.0},
     "PREFECT_SERVER_DATABASE_USER": {"test_value": "user"},
     "PREFECT_SERVER_DEPLOYMENTS_CONCURRENCY_SLOT_WAIT_SECONDS": {"test_value": 10.0},
     "PREFECT_SERVER_DEPLOYMENT_SCHEDULE_MAX_SCHEDULED_RUNS": {"test_value": 10},
     "PREFECT_SERVER_EPHEMERAL_ENABLED": {"test_value": True},
+    "PREFECT_SERVER_EPHEMERAL_FAST_START": {"test_value": True},
     "PREFECT_SERVER_EPHEMERAL_STARTUP_TIMEOUT_SECONDS": {"test_value": 10},
     "PREFECT_SERVER_EVENTS_EXPIRED_BUCKET_BUFFER": {
         "test_value": timedelta(seconds=60)
@@ -360,10 +375,15 @@ SUPPORTED_SETTINGS = {
     },
     "PREFECT_SERVER_EVENTS_MESSAGING_BROKER": {"test_value": "broker"},
     "PREFECT_SERVER_EVENTS_MESSAGING_CACHE": {"test_value": "cache"},
+    "PREFECT_SERVER_EVENTS_MESSAGING_OVERFLOW_POLICY": {"test_value": "spill"},
+    "PREFECT_SERVER_EVENTS_MESSAGING_QUEUE_CAPACITY": {"test_value": 10000},
     "PREFECT_SERVER_EVENTS_PROACTIVE_GRANULARITY": {"test_value": timedelta(seconds=5)},
     "PREFECT_SERVER_EVENTS_RELATED_RESOURCE_CACHE_TTL": {
         "test_value": timedelta(seconds=10)
     },
+    "PREFECT_SERVER_EVENTS_MINUTE_ROLLUP_RETENTION_PERIOD": {
+        "test_value": timedelta(hours=2)
+    },
     "PREFECT_SERVER_EVENTS_RETENTION_PERIOD": {"test_value": timedelta(hours=7)},
     "PREFECT_SERVER_EVENTS_STREAM_OUT_ENABLED": {"test_value": True},
     "PREFECT_SERVER_EVENTS_WEBSOCKET_BACKFILL_PAGE_SIZE": {"test_value": 250},
@@ -371,6 +391,7 @@ SUPPORTED_SETTINGS = {
     "PREFECT_SERVER_FLOW_RUN_GRAPH_MAX_NODES": {"test_value": 100},
     "PREFECT_SERVER_LOGGING_LEVEL": {"test_value": "INFO"},
     "PREFECT_SERVER_LOG_RETRYABLE_ERRORS": {"test_value": True},
+    "PREFECT_SERVER_LOGS_RETENTION_PERIOD": {"test_value": timedelta(days=30)},
     "PREFECT_SERVER_LOGS_STREAM_OUT_ENABLED": {"test_value": True},
     "PREFECT_SERVER_LOGS_STREAM_PUBLISHING_ENABLED": {"test_value": True},
     "PREFECT_SERVER_MEMO_STORE_PATH": {"test_value": Path("/path/to/memo")},
@@ -401,6 +422,12 @@ SUPPORTED_SETTINGS = {
     },
     "PREFECT_SERVER_SERVICES_LATE_RUNS_ENABLED": {"test_value": True},
     "PREFECT_SERVER_SERVICES_LATE_RUNS_LOOP_SECONDS": {"test_value": 10.0},
+    "PREFECT_SERVER_SERVICES_PARTITION_MANAGER_ENABLED": {"test_value": True},
+    "PREFECT_SERVER_SERVICES_PARTITION_MANAGER_LOOP_SECONDS": {"test_value": 60.0},
+    "PREFECT_SERVER_SERVICES_PARTITION_MANAGER_PARTITION_INTERVAL": {
+        "test_value": timedelta(hours=6)
+    },
+    "PREFECT_SERVER_SERVICES_PARTITION_MANAGER_PREMAKE_PARTITIONS": {"test_value": 5},
     "PREFECT_SERVER_SERVICES_PAUSE_EXPIRATIONS_ENABLED": {"test_value": True},
     "PREFECT_SERVER_SERVICES_PAUSE_EXPIRATIONS_LOOP_SECONDS": {"test_value": 10.0},
     "PREFECT_SERVER_SERVICES_SCHEDULER_DEPLOYMENT_BATCH_SIZE": {"test_value": 10},
@@ -419,6 +446,7 @@ SUPPORTED_SETTINGS = {
         "test_value": timedelta(minutes=10)
     },
     "PREFECT_SERVER_SERVICES_TASK_RUN_RECORDER_ENABLED": {"test_value": True},
+    "PREFECT_SERVER_SERVICES_TRIGGERS_ACTIONS_CONCURRENCY": {"test_value": 5},
     "PREFECT_SERVER_SERVICES_TRIGGERS_ENABLED": {"test_value": True},
     "PREFECT_SERVER_SERVICES_TRIGGERS_PG_NOTIFY_HEARTBEAT_INTERVAL_SECONDS": {
         "test_value": 5
@@ -442,6 +470,7 @@ SUPPORTED_SETTINGS = {
     "PREFECT_SILENCE_API_URL_MISCONFIGURATION": {"test_value": True},
     "PREFECT_SQLALCHEMY_MAX_OVERFLOW": {"test_value": 10, "legacy": True},
     "PREFECT_SQLALCHEMY_POOL_SIZE": {"test_value": 10, "legacy": True},
+    "PREFECT_TASKS_COALESCE_STATE_EVENTS": {"test_value": True},
     "PREFECT_TASKS_DEFAULT_NO_CACHE": {"test_value": True},
     "PREFECT_TASKS_DEFAULT_PERSIST_RESULT": {"test_value": True},
     "PREFECT_TASKS_DEFAULT_RETRIES": {"test_value": 10},
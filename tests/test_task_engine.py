@@ -5,7 +5,7 @@ import random
 import time
 from datetime import timedelta
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, List, Optional, cast
 from unittest import mock
 from unittest.mock import AsyncMock, MagicMock, call, patch
 from uuid import UUID, uuid4
@@ -14,9 +14,10 @@ import anyio
 import pytest
 
 from prefect import Task, flow, tags, task
+from prefect.assets import materialize
 from prefect.cache_policies import FLOW_PARAMETERS, INPUTS, TASK_SOURCE
 from prefect.client.orchestration import PrefectClient, SyncPrefectClient
-from prefect.client.schemas.objects import StateType
+from prefect.client.schemas.objects import StateType, TaskRunResult
 from prefect.concurrency.asyncio import concurrency as aconcurrency
 from prefect.concurrency.sync import concurrency
 from prefect.concurrency.v1._asyncio import (
@@ -29,12 +30,19 @@ from prefect.context import (
     TaskRunContext,
     get_run_context,
 )
+from prefect.events.clients import AssertingEventsClient
+from prefect.events.schemas.events import Event
+from prefect.events.worker import EventsWorker
 from prefect.exceptions import CrashedRun, MissingResult
 from prefect.filesystems import LocalFileSystem
 from prefect.logging import get_run_logger
 from prefect.results import ResultRecord, ResultStore
 from prefect.server.schemas.core import ConcurrencyLimitV2
-from prefect.settings import PREFECT_TASK_DEFAULT_RETRIES, temporary_settings
+from prefect.settings import (
+    PREFECT_TASK_DEFAULT_RETRIES,
+    PREFECT_TASKS_COALESCE_STATE_EVENTS,
+    temporary_settings,
+)
 from prefect.states import Completed, Failed, Pending, Running, State
 from prefect.task_engine import (
     AsyncTaskRunEngine,
@@ -2154,9 +2162,10 @@ class TestCachePolicy:
         assert result == 42
         assert await fs.read_path("tmp-first")
 
-        # delete record
+        # delete record, including its metadata sidecar
         path = fs._resolve_path("tmp-first")
         os.unlink(path)
+        os.unlink(f"{path}.metadata")
         with pytest.raises(ValueError, match="does not exist"):
             assert await fs.read_path("tmp-first")
 
@@ -3239,3 +3248,309 @@ class TestTransactionHooks:
             foo()
 
         spy.assert_called_once()
+
+
+class TestCoalescedStateEvents:
+    @pytest.fixture(autouse=True)
+    def coalesce_state_events(self):
+        with temporary_settings({PREFECT_TASKS_COALESCE_STATE_EVENTS: True}):
+            yield
+
+    @staticmethod
+    async def task_run_events(asserting_events_worker: EventsWorker) -> list[Event]:
+        await asserting_events_worker.drain()
+        client = cast(AssertingEventsClient, asserting_events_worker._client)
+        return [
+            event
+            for event in client.events
+            if event.event.startswith("prefect.task-run.")
+        ]
+
+    async def test_states_are_emitted_in_one_event(
+        self,
+        prefect_client: PrefectClient,
+        asserting_events_worker: EventsWorker,
+        events_pipeline,
+    ):
+        @task
+        def foo():
+            return TaskRunContext.get().task_run.id
+
+        task_run_id = run_task_sync(foo)
+
+        events = await self.task_run_events(asserting_events_worker)
+        assert [event.event for event in events] == ["prefect.task-run.Completed"]
+        assert [state["type"] for state in events[0].payload["previous_states"]] == [
+            "PENDING",
+            "RUNNING",
+        ]
+
+        await events_pipeline.process_events()
+
+        task_run = await prefect_client.read_task_run(task_run_id)
+        assert task_run.state_type == StateType.COMPLETED
+        assert task_run.run_count == 1
+
+        states = await prefect_client.read_task_run_states(task_run_id)
+        assert [state.type for state in states] == [
+            StateType.PENDING,
+            StateType.RUNNING,
+            StateType.COMPLETED,
+        ]
+        assert states[0].timestamp < states[1].timestamp < states[2].timestamp
+
+    async def test_states_are_emitted_in_one_event_async(
+        self,
+        prefect_client: PrefectClient,
+        asserting_events_worker: EventsWorker,
+        events_pipeline,
+    ):
+        @task
+        async def foo():
+            raise ValueError("woops!")
+
+        with pytest.raises(ValueError):
+            await run_task_async(foo)
+
+        events = await self.task_run_events(asserting_events_worker)
+        assert [event.event for event in events] == ["prefect.task-run.Failed"]
+
+        await events_pipeline.process_events()
+
+        task_run_id = events[0].resource.prefect_object_id("prefect.task-run")
+        states = await prefect_client.read_task_run_states(task_run_id)
+        assert [state.type for state in states] == [
+            StateType.PENDING,
+            StateType.RUNNING,
+            StateType.FAILED,
+        ]
+
+    async def test_immediate_retries_are_included_in_the_event(
+        self, asserting_events_worker: EventsWorker
+    ):
+        attempts = 0
+
+        @task(retries=1)
+        def foo():
+            nonlocal attempts
+            attempts += 1
+            if attempts == 1:
+                raise ValueError("woops!")
+
+        run_task_sync(foo)
+
+        events = await self.task_run_events(asserting_events_worker)
+        assert [event.event for event in events] == ["prefect.task-run.Completed"]
+        assert [state["name"] for state in events[0].payload["previous_states"]] == [
+            "Pending",
+            "Running",
+            "Retrying",
+        ]
+        assert events[0].resource["prefect.run-count"] == "2"
+
+    def test_deferred_states_are_emitted_when_the_run_ends(self):
+        @task
+        def foo():
+            pass
+
+        engine = SyncTaskRunEngine(task=foo)
+        with mock.patch(
+            "prefect.task_engine.emit_task_run_state_change_event"
+        ) as emit_event:
+            with engine.initialize_run():
+                engine.set_state(Pending(name="NotReady"), force=True)
+
+        emit_event.assert_called_once()
+        assert emit_event.call_args.kwargs["validated_state"].name == "NotReady"
+        assert [
+            state.name for state in emit_event.call_args.kwargs["previous_states"]
+        ] == ["Pending"]
+
+
+class TestLightweightTasks:
+    @staticmethod
+    async def task_run_events(asserting_events_worker: EventsWorker) -> list[Event]:
+        await asserting_events_worker.drain()
+        client = cast(AssertingEventsClient, asserting_events_worker._client)
+        return [
+            event
+            for event in client.events
+            if event.event.startswith("prefect.task-run.")
+        ]
+
+    async def test_task_runs_are_reported_when_the_flow_run_ends(
+        self,
+        prefect_client: PrefectClient,
+        asserting_events_worker: EventsWorker,
+        events_pipeline,
+    ):
+        @task(lightweight=True)
+        def extend(x: list[int], y: int) -> list[int]:
+            assert TaskRunContext.get() is None
+            return x + [y]
+
+        @flow
+        def foo():
+            numbers = extend(extend([1], 2), 3)
+            # the task runs are not reported until the flow run ends
+            assert len(FlowRunContext.get().lightweight_task_runs) == 2
+            return numbers
+
+        state = foo(return_state=True)
+        assert await state.result() == [1, 2, 3]
+
+        events = await self.task_run_events(asserting_events_worker)
+        assert [event.event for event in events] == [
+            "prefect.task-run.Completed",
+            "prefect.task-run.Completed",
+        ]
+
+        await events_pipeline.process_events()
+
+        task_runs = await prefect_client.read_task_runs()
+        assert len(task_runs) == 2
+        first, second = sorted(task_runs, key=lambda task_run: task_run.start_time)
+        assert (
+            first.flow_run_id == second.flow_run_id == state.state_details.flow_run_id
+        )
+        assert second.task_inputs["x"] == [TaskRunResult(id=first.id)]
+
+        states = await prefect_client.read_task_run_states(first.id)
+        assert [state.type for state in states] == [
+            StateType.PENDING,
+            StateType.RUNNING,
+            StateType.COMPLETED,
+        ]
+
+    async def test_lightweight_tasks_for_a_flow(self):
+        @task
+        async def add(x: int, y: int) -> int:
+            return x + y
+
+        @flow(lightweight_tasks=True)
+        async def foo():
+            state = await add(1, 2, return_state=True)
+            assert FlowRunContext.get().lightweight_task_runs[0][0].state is state
+            return state
+
+        state = await foo()
+        assert state.is_completed()
+        assert await state.result() == 3
+
+    async def test_failed_task_runs(self, asserting_events_worker: EventsWorker):
+        @task(lightweight=True)
+        def fail():
+            raise ValueError("woops!")
+
+        @flow
+        def foo():
+            state = fail(return_state=True)
+            assert state.is_failed()
+            fail()
+
+        with pytest.raises(ValueError, match="woops!"):
+            foo()
+
+        events = await self.task_run_events(asserting_events_worker)
+        assert [event.event for event in events] == [
+            "prefect.task-run.Failed",
+            "prefect.task-run.Failed",
+        ]
+
+    async def test_tasks_with_retries_are_orchestrated(self):
+        @task(lightweight=True, retries=1)
+        def foo():
+            return TaskRunContext.get().task_run.run_count
+
+        @flow
+        def bar():
+            result = foo()
+            assert not FlowRunContext.get().lightweight_task_runs
+            return result
+
+        assert bar() == 1
+
+    @pytest.mark.parametrize(
+        "options",
+        [
+            dict(tags=["db"]),
+            dict(log_prints=True),
+            dict(task_run_name="my-task-run"),
+            dict(cache_policy=INPUTS),
+            dict(persist_result=True),
+        ],
+    )
+    async def test_tasks_with_options_that_need_the_engine_are_orchestrated(
+        self, options: dict[str, Any]
+    ):
+        @task(lightweight=True, **options)
+        def foo():
+            return TaskRunContext.get() is not None
+
+        @flow
+        def bar():
+            result = foo()
+            assert not FlowRunContext.get().lightweight_task_runs
+            return result
+
+        assert bar()
+
+    async def test_tasks_in_flows_that_log_prints_are_orchestrated(self):
+        @task(lightweight=True)
+        def foo():
+            return TaskRunContext.get() is not None
+
+        @flow(log_prints=True)
+        def bar():
+            return foo()
+
+        assert bar()
+
+    async def test_tasks_called_with_tags_are_orchestrated(self):
+        @task(lightweight=True)
+        def foo():
+            return TaskRunContext.get() is not None
+
+        @flow
+        def bar():
+            with tags("db"):
+                return foo()
+
+        assert bar()
+
+    async def test_materializing_tasks_are_orchestrated(self):
+        @materialize("s3://bucket/data", lightweight=True)
+        def foo():
+            return TaskRunContext.get() is not None
+
+        @flow
+        def bar():
+            return foo()
+
+        assert bar()
+
+    async def test_async_tasks_wait_for_futures_passed_to_them(self):
+        @task
+        def slow_add(x: int, y: int) -> int:
+            time.sleep(0.1)
+            return x + y
+
+        @task(lightweight=True)
+        async def double(x: int) -> int:
+            return 2 * x
+
+        @flow
+        async def foo():
+            future = slow_add.submit(1, 2)
+            result = await double(future)
+            assert FlowRunContext.get().lightweight_task_runs
+            return result
+
+        assert await foo() == 6
+
+    async def test_tasks_outside_of_a_flow_are_orchestrated(self):
+        @task(lightweight=True)
+        def foo():
+            return TaskRunContext.get() is not None
+
+        assert foo()
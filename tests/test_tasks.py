@@ -2939,6 +2939,34 @@ class TestTaskInputs:
             name=[TaskRunResult(id=name_state.state_details.task_run_id)],
         )
 
+    async def test_task_inputs_populated_with_result_upstream_in_list_of_values(
+        self, sync_prefect_client, events_pipeline
+    ):
+        @task
+        def name():
+            return "Fred"
+
+        @task
+        def say_hi(names):
+            return f"Hi {' and '.join(names)}"
+
+        @flow
+        def test_flow():
+            my_name = name(return_state=True)
+            hi = say_hi(["Ginger", my_name.result()], return_state=True)
+            return my_name, hi
+
+        flow_state = test_flow(return_state=True)
+        name_state, hi_state = await flow_state.result()
+
+        await events_pipeline.process_events()
+
+        task_run = sync_prefect_client.read_task_run(hi_state.state_details.task_run_id)
+
+        assert task_run.task_inputs == dict(
+            names=[TaskRunResult(id=name_state.state_details.task_run_id)],
+        )
+
     async def test_task_inputs_populated_with_result_upstream_from_future(
         self, prefect_client, events_pipeline
     ):
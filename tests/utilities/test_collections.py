@@ -1,7 +1,7 @@
 import io
 import json
 import uuid
-from dataclasses import dataclass
+from dataclasses import dataclass, make_dataclass
 from typing import Any
 
 import numpy as np
@@ -679,6 +679,43 @@ class TestVisitCollection:
         assert "self" in result
         assert "self" in result["self"]
 
+    def test_visit_collection_subclasses_of_builtin_collections(self):
+        class MyList(list):
+            pass
+
+        class MyDict(dict):
+            pass
+
+        result = visit_collection(
+            MyDict(a=MyList([1, 2])), negative_even_numbers, return_data=True
+        )
+
+        assert result == {"a": [1, -2]}
+        assert type(result) is MyDict
+        assert type(result["a"]) is MyList
+
+    def test_visit_collection_does_not_visit_dataclass_types(self):
+        visited = []
+
+        def visit(expr):
+            visited.append(expr)
+            return expr
+
+        assert visit_collection(SimpleDataclass, visit, return_data=True) is (
+            SimpleDataclass
+        )
+        assert visited == [SimpleDataclass]
+
+    def test_visit_collection_dataclasses_defined_after_first_visit(self):
+        # field names are cached per type, so each new type must be inspected
+        for field_name in ("x", "y"):
+            Dataclass = make_dataclass("Dataclass", [field_name])
+            result = visit_collection(
+                Dataclass(2), negative_even_numbers, return_data=True
+            )
+
+            assert result == Dataclass(-2)
+
 
 class TestRemoveKeys:
     def test_remove_single_key(self):